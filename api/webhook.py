@@ -3,42 +3,183 @@
 Vercel 서버리스 함수 - 텔레그램 Webhook
 """
 
-# 가장 먼저 실행되는 로그 (모듈 임포트 시 즉시 실행)
 import sys
-sys.stderr.write("=" * 80 + "\n")
-sys.stderr.write("WEBHOOK.PY FILE LOADED - MODULE IMPORT STARTED\n")
-sys.stderr.write("=" * 80 + "\n")
-sys.stderr.flush()
-
 import json
 import os
 import asyncio
+import concurrent.futures
 import logging
+import threading
 from http.server import BaseHTTPRequestHandler
 
 # 프로젝트 루트를 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stderr)]
-)
+# 로깅 설정 (LOG_LEVEL 환경변수, 기본 INFO / stderr 핸들러 하나)
+from utils.chat_routing import get_chat_router
+from utils.debounce import Debouncer, LatestVersions
+from utils.log import configure_logging
+from utils.loop_thread import LoopThread
+from utils.reply_tracker import ReplyTracker
+configure_logging(fmt='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# 모듈 로드 시 로그 출력 (여러 방법으로 확실하게)
-sys.stderr.write("[WEBHOOK] Module loaded - stderr write\n")
-sys.stderr.flush()
-print("=" * 60, file=sys.stderr, flush=True)
-print("[WEBHOOK] Module loaded - print to stderr", file=sys.stderr, flush=True)
 logger.info("Webhook module initialized")
 
 # 전역 애플리케이션 인스턴스
 application = None
 
-# 전역 이벤트 루프
-_global_loop = None
+# 상주 이벤트 루프 스레드 (모듈 로드 시 시작)
+# 텔레그램 Application은 이 루프에서 한 번만 초기화되고, 모든 업데이트는 run_coroutine_threadsafe로 제출
+# (빠른 응답 모드의 워커 여러 개가 각자 제출하면 회신 대기 등 I/O는 루프에서 동시에 진행)
+_loop_thread = LoopThread(name="webhook-loop")
+_loop_thread.start()
+_initialize_lock = None
+
+# 업데이트 처리 완료를 기다리는 최대 시간(초)
+PROCESS_TIMEOUT = 25
+
+# 빠른 응답 모드: do_POST는 업데이트를 검증/적재하고 바로 200 응답, 처리는 워커 스레드가 수행
+# 응답 후에도 프로세스가 계속 실행되는 환경(상시 실행 서버)에서만 사용
+# (Vercel 등 서버리스는 응답 후 인스턴스가 멈출 수 있어 기본값은 사용 안 함)
+FAST_ACK = os.getenv("WEBHOOK_FAST_ACK", "").strip().lower() in ("1", "true", "yes", "on")
+UPDATE_QUEUE_WORKERS = int(os.getenv("WEBHOOK_WORKERS", "1"))
+UPDATE_QUEUE_SIZE = int(os.getenv("WEBHOOK_QUEUE_SIZE", "100"))
+# 빠른 응답 모드 큐는 채팅방별 대기열을 번갈아(CHAT_WEIGHTS 가중치) 처리 (한 채팅방에 메시지가 몰려도 다른 채팅방이 기다리지 않음)
+# 채팅방 대기열이 이만큼 쌓이면 더 받지 않고 "요청이 많음" 회신 (0이면 제한 없음)
+CHAT_BACKLOG = int(os.getenv("WEBHOOK_CHAT_BACKLOG", "20"))
+
+# 내구성 큐 모드: WEBHOOK_QUEUE_PATH(SQLite 파일)를 지정하면 업데이트를 디스크에 커밋한 뒤 200 응답하고
+# 워커 스레드(WEBHOOK_WORKERS개)가 꺼내 처리/확인 (처리 도중 프로세스가 종료되어도 재시작 후 다시 처리)
+# 상시 실행 서버 전용 (빠른 응답 모드의 메모리 큐 대신 사용)
+DURABLE_QUEUE_PATH = os.getenv("WEBHOOK_QUEUE_PATH", "").strip()
+DURABLE_QUEUE_VISIBILITY = float(os.getenv("WEBHOOK_QUEUE_VISIBILITY", "60"))
+DURABLE_QUEUE_MAX_ATTEMPTS = int(os.getenv("WEBHOOK_QUEUE_MAX_ATTEMPTS", "5"))
+DURABLE_QUEUE_FLUSH = int(os.getenv("WEBHOOK_QUEUE_FLUSH_MS", "0")) / 1000
+
+# 처리 대상 업데이트 종류
+MESSAGE_KEYS = ("message", "edited_message", "channel_post", "edited_channel_post")
+
+# 계산 대상 메시지 양식: 각 그룹에서 하나 이상 포함되어야 함
+# '성   명' 또는 '성명', '직   업' 또는 '직업', '거주여부'(정확히 일치)
+REQUIRED_KEYWORDS = (
+    ("성   명", "성명"),
+    ("직   업", "직업"),
+    ("거주여부",),
+)
+
+# 사전 필터(do_POST에서 텔레그램 객체 생성 전) 집계: 사유별 건너뛴 수 / 통과 수
+_prefilter_counts = {"passed": 0}
+_prefilter_lock = threading.Lock()
+
+_update_queue = None
+_update_queue_lock = threading.Lock()
+
+_durable_queue = None
+_durable_queue_lock = threading.Lock()
+
+# 중복 업데이트 제거 (텔레그램이 같은 update_id를 재전송하면 처리 없이 바로 200 응답)
+# WEBHOOK_DEDUP_SIZE=0이면 사용 안 함, WEBHOOK_DEDUP_PATH를 지정하면 파일(/tmp 등)에 기록해 프로세스 재시작 후에도 유지
+DEDUP_SIZE = int(os.getenv("WEBHOOK_DEDUP_SIZE", "10000"))
+DEDUP_TTL = float(os.getenv("WEBHOOK_DEDUP_TTL", "3600"))
+DEDUP_PATH = os.getenv("WEBHOOK_DEDUP_PATH", "").strip()
+
+_update_dedup = None
+_update_dedup_lock = threading.Lock()
+
+# 수정 메시지 디바운스 (초): 같은 메시지(chat_id, message_id)의 수정이 이 시간 안에 연달아 들어오면
+# 마지막 내용으로 한 번만 계산/회신 (처리 중인 이전 버전은 취소), 0이면 기다리지 않음
+# 동기 모드(Vercel 등)는 대기 시간만큼 요청이 열려 있으므로 기본 0, 응답 후 처리하는 빠른 응답/내구성 큐 모드만 기본 1500ms
+EDIT_DEBOUNCE = int(os.getenv("WEBHOOK_EDIT_DEBOUNCE_MS", "1500" if FAST_ACK or DURABLE_QUEUE_PATH else "0")) / 1000
+message_debouncer = Debouncer(window=EDIT_DEBOUNCE)
+
+# 빠른 응답/내구성 큐 모드는 큐에 넣기 전에 디바운스 (워커가 대기 시간 동안 붙잡히지 않도록)
+# - do_POST가 메시지별 최신 update_id를 기록하고, 수정 메시지는 대기 시간이 지난 뒤에 워커가 꺼낼 수 있게 적재
+# - 워커는 더 새 버전이 들어온 업데이트를 계산하지 않고 건너뜀
+DEBOUNCE_BEFORE_QUEUE = FAST_ACK or bool(DURABLE_QUEUE_PATH)
+edit_versions = LatestVersions()
+
+# 원본 메시지별 회신 기록: 수정된 메시지는 이전 회신을 그 자리에서 수정하고, 내용이 같으면 회신하지 않음
+# WEBHOOK_REPLY_MAP_SIZE=0이면 사용 안 함 (수정마다 새 회신)
+reply_tracker = ReplyTracker(max_entries=int(os.getenv("WEBHOOK_REPLY_MAP_SIZE", "1000")))
+
+
+def has_required_format(text):
+    """계산 대상 양식(성명, 직업, 거주여부)이 모두 포함되어 있는지 확인"""
+    return all(any(keyword in text for keyword in group) for group in REQUIRED_KEYWORDS)
+
+
+def get_body_message(body):
+    """요청 body(dict)의 메시지 (message / edited_message / channel_post / edited_channel_post, 없으면 None)"""
+    for key in MESSAGE_KEYS:
+        message = body.get(key)
+        if message is not None:
+            return message if isinstance(message, dict) else None
+    return None
+
+
+def get_message_key(message):
+    """메시지(dict)의 디바운스 키 (chat_id, message_id)"""
+    chat = message.get("chat")
+    return (chat.get("id") if isinstance(chat, dict) else None), message.get("message_id")
+
+
+def is_edited_body(body):
+    """요청 body(dict)가 수정된 메시지 업데이트인지 확인"""
+    return body.get("edited_message") is not None or body.get("edited_channel_post") is not None
+
+
+def prefilter_update(body):
+    """
+    요청 body(dict)만으로 처리 대상인지 확인 (텔레그램 Update/Application을 만들지 않음)
+    handle_message가 결국 버릴 업데이트(메시지 없음, 허용되지 않은 채팅방, 양식이 없는 텍스트)를 미리 걸러냄
+
+    - 명령어(/로 시작)와 텍스트가 없는 메시지(사진 등 - 안내 회신 대상)는 통과
+    
+    Returns:
+        건너뛸 사유 (처리 대상이면 None)
+    """
+    message = get_body_message(body)
+    if message is None:
+        return "no message"
+
+    chat = message.get("chat")
+    chat_id = chat.get("id") if isinstance(chat, dict) else None
+    if not get_chat_router().is_allowed(chat_id):
+        return "chat not allowed"
+
+    text = message.get("text")
+    if isinstance(text, str) and not text.startswith("/") and not has_required_format(text):
+        return "no form"
+    return None
+
+
+def count_prefilter(skipped):
+    """사전 필터 결과 집계 (skipped가 None이면 통과)"""
+    with _prefilter_lock:
+        key = skipped or "passed"
+        _prefilter_counts[key] = _prefilter_counts.get(key, 0) + 1
+
+
+def prefilter_stats():
+    """사전 필터 집계 (헬스체크용)"""
+    with _prefilter_lock:
+        counts = dict(_prefilter_counts)
+    skipped = sum(count for key, count in counts.items() if key != "passed")
+    return dict(counts, skipped=skipped, total=skipped + counts["passed"])
+
+
+def get_update_chat_id(update):
+    """업데이트에서 채팅방 ID 가져오기"""
+    if update.message:
+        return update.message.chat.id
+    elif update.edited_message:
+        return update.edited_message.chat.id
+    elif update.channel_post:
+        return update.channel_post.chat.id
+    elif update.edited_channel_post:
+        return update.edited_channel_post.chat.id
+    return None
 
 
 def get_application():
@@ -50,8 +191,7 @@ def get_application():
             Application, MessageHandler, CommandHandler, filters
         )
         from parsers.message_parser import MessageParser
-        from calculator.base_calculator import BaseCalculator
-        from utils.formatter import format_all_results
+        from calculator.result_cache import calculate_formatted_result
 
         # 환경변수에서 토큰 가져오기
         TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -61,86 +201,25 @@ def get_application():
             except ModuleNotFoundError:
                 raise ValueError("TELEGRAM_BOT_TOKEN 환경변수를 설정해주세요.")
 
-        # 허용된 채팅방 ID 가져오기 (1번방: banks, 2번방: loan)
-        ALLOWED_CHAT_IDS_BANKS_STR = os.getenv("ALLOWED_CHAT_IDS_BANKS")
-        ALLOWED_CHAT_IDS_LOAN_STR = os.getenv("ALLOWED_CHAT_IDS_LOAN")
-        
-        if not ALLOWED_CHAT_IDS_BANKS_STR:
-            try:
-                from config.telegram_config import ALLOWED_CHAT_IDS_BANKS  # type: ignore
-                ALLOWED_CHAT_IDS_BANKS_STR = ALLOWED_CHAT_IDS_BANKS
-            except (ModuleNotFoundError, ImportError):
-                ALLOWED_CHAT_IDS_BANKS_STR = None
-        
-        if not ALLOWED_CHAT_IDS_LOAN_STR:
-            try:
-                from config.telegram_config import ALLOWED_CHAT_IDS_LOAN  # type: ignore
-                ALLOWED_CHAT_IDS_LOAN_STR = ALLOWED_CHAT_IDS_LOAN
-            except (ModuleNotFoundError, ImportError):
-                ALLOWED_CHAT_IDS_LOAN_STR = None
-        
-        # 허용된 채팅방 ID 리스트로 변환
-        allowed_chat_ids_banks = []
-        if ALLOWED_CHAT_IDS_BANKS_STR:
-            allowed_chat_ids_banks = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS_BANKS_STR.split(",") if chat_id.strip()]
-        
-        allowed_chat_ids_loan = []
-        if ALLOWED_CHAT_IDS_LOAN_STR:
-            allowed_chat_ids_loan = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS_LOAN_STR.split(",") if chat_id.strip()]
-        
-        # 전체 허용된 채팅방 ID (둘 다 합침)
-        allowed_chat_ids = allowed_chat_ids_banks + allowed_chat_ids_loan
-        
-        print(f"[WEBHOOK] Application initializing - allowed_chat_ids_banks: {allowed_chat_ids_banks}, allowed_chat_ids_loan: {allowed_chat_ids_loan}", file=sys.stderr, flush=True)
-        logger.info(f"Application initialized - allowed_chat_ids_banks: {allowed_chat_ids_banks}, allowed_chat_ids_loan: {allowed_chat_ids_loan}")
+        # 채팅방 라우팅 테이블 (chat_id -> 채팅방 타입/상품군, 허용 목록)
+        router = get_chat_router()
+        logger.info("Application initializing - chat routes: %s", router.stats())
 
         application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
-        print("[WEBHOOK] Application initialized successfully", file=sys.stderr, flush=True)
-
-        def get_chat_id(update):
-            """업데이트에서 채팅방 ID 가져오기"""
-            if update.message:
-                return update.message.chat.id
-            elif update.edited_message:
-                return update.edited_message.chat.id
-            elif update.channel_post:
-                return update.channel_post.chat.id
-            elif update.edited_channel_post:
-                return update.edited_channel_post.chat.id
-            return None
-
-        def is_allowed_chat(chat_id):
-            """채팅방이 허용된 목록에 있는지 확인"""
-            if chat_id is None:
-                return False
-            if not allowed_chat_ids:  # 허용 목록이 비어있으면 모든 채팅방 허용
-                return True
-            return chat_id in allowed_chat_ids
-        
-        def get_chat_type(chat_id):
-            """채팅방 타입 반환: 'banks' 또는 'loan'"""
-            if chat_id in allowed_chat_ids_banks:
-                return "banks"
-            elif chat_id in allowed_chat_ids_loan:
-                return "loan"
-            return "banks"  # 기본값은 banks
+        logger.info("Application initialized successfully")
 
         async def start_command(update, context):
             message = update.message or update.channel_post or update.edited_message or update.edited_channel_post
             if not message:
                 return
             
-            chat_id = get_chat_id(update)
-            print(f"[WEBHOOK] start_command - chat_id: {chat_id}", file=sys.stderr, flush=True)
-            logger.info(f"start_command - chat_id: {chat_id}")
+            chat_id = get_update_chat_id(update)
+            logger.info("start_command - chat_id: %s", chat_id)
             
-            if not is_allowed_chat(chat_id):
-                print(f"[WEBHOOK] start_command - Chat {chat_id} is NOT allowed", file=sys.stderr, flush=True)
-                logger.warning(f"start_command - Chat {chat_id} is not allowed")
+            if not router.is_allowed(chat_id):
+                logger.warning("start_command - Chat %s is not allowed", chat_id)
                 return
             
-            print(f"[WEBHOOK] start_command - Chat {chat_id} is allowed", file=sys.stderr, flush=True)
-            
             welcome_message = (
                 "🏠 담보대출 계산기 봇에 오신 것을 환영합니다!\n\n"
                 "이 봇은 여러 금융사의 담보대출 한도와 금리를 계산해드립니다.\n\n"
@@ -160,32 +239,46 @@ def get_application():
             try:
                 await message.reply_text(welcome_message)
             except Exception as e:
-                logger.error(f"Error sending welcome message: {str(e)}", exc_info=True)
+                logger.error("Error sending welcome message: %s", e, exc_info=True)
 
         async def handle_message(update, context=None):
             message = update.message or update.channel_post or update.edited_message or update.edited_channel_post
             
             if not message:
-                print("[WEBHOOK] handle_message - No message found", file=sys.stderr, flush=True)
                 logger.warning("handle_message - No message found in update")
                 return
             
-            chat_id = get_chat_id(update)
-            print(f"[WEBHOOK] handle_message - chat_id: {chat_id}", file=sys.stderr, flush=True)
-            logger.info(f"handle_message - chat_id: {chat_id}")
+            chat_id = get_update_chat_id(update)
+            logger.info("handle_message - chat_id: %s", chat_id)
             
-            if not is_allowed_chat(chat_id):
-                print(f"[WEBHOOK] handle_message - Chat {chat_id} is NOT allowed", file=sys.stderr, flush=True)
-                logger.warning(f"handle_message - Chat {chat_id} is not allowed")
+            if not router.is_allowed(chat_id):
+                logger.warning("handle_message - Chat %s is not allowed", chat_id)
                 return
             
-            print(f"[WEBHOOK] handle_message - Chat {chat_id} is allowed, processing", file=sys.stderr, flush=True)
-            
-            # 채팅방 타입 확인 (banks 또는 loan)
-            chat_type = get_chat_type(chat_id)
-            print(f"[WEBHOOK] Chat type: {chat_type}", file=sys.stderr, flush=True)
-            logger.info(f"handle_message - chat_type: {chat_type}")
+            # 채팅방 타입 확인 (banks, loan 또는 라우팅 설정에서 추가한 타입)
+            chat_type = router.room_type(chat_id)
+            logger.info("handle_message - chat_type: %s", chat_type)
             
+            # 같은 메시지가 연달아 수정되면 마지막 내용으로 한 번만 처리 (이전 처리는 취소)
+            # 큐 모드는 대기 시간이 큐에 넣기 전에 끝났으므로 기다리지 않음 (워커를 붙잡지 않도록)
+            edited = update.edited_message is not None or update.edited_channel_post is not None
+            completed = await message_debouncer.run(
+                (chat_id, message.message_id),
+                lambda: reply_to_message(message, chat_type),
+                delay=EDIT_DEBOUNCE if edited and not DEBOUNCE_BEFORE_QUEUE else 0
+            )
+            if not completed:
+                logger.info("handle_message - Superseded by a newer edit (chat_id: %s, message_id: %s)", chat_id, message.message_id)
+
+        def compute_reply(message_text, chat_type):
+            """메시지 파싱 후 채팅방 타입에 따라 은행/대부 상품군 계산 (같은 내용이 다시 들어오면 캐시된 회신 사용)"""
+            parser = MessageParser()
+            property_data = parser.parse(message_text)
+            logger.info("handle_message - property_data parsed: kb_price=%s", property_data.get('kb_price'))
+            return calculate_formatted_result(property_data, chat_type)
+
+        async def reply_to_message(message, chat_type):
+            """양식 확인 후 계산 결과 회신"""
             message_text = message.text
             if not message_text:
                 logger.info("handle_message - No text in message")
@@ -196,64 +289,31 @@ def get_application():
                 )
                 return
             
-            # 특정 양식이 있는 메시지만 처리
-            # '성   명' 또는 '성명', '직   업' 또는 '직업', '거주여부' 모두 포함되어야 함
-            required_keywords = [
-                ['성   명', '성명'],  # 둘 중 하나만 있으면 됨
-                ['직   업', '직업'],  # 둘 중 하나만 있으면 됨
-                ['거주여부']  # 정확히 일치해야 함
-            ]
-            
-            # 각 키워드 그룹에서 최소 하나는 포함되어야 함
-            has_all_keywords = True
-            for keyword_group in required_keywords:
-                found = False
-                for keyword in keyword_group:
-                    if keyword in message_text:
-                        found = True
-                        break
-                if not found:
-                    has_all_keywords = False
-                    break
-            
-            if not has_all_keywords:
-                print(f"[WEBHOOK] Message does not contain required format, ignoring", file=sys.stderr, flush=True)
+            # 특정 양식(성명, 직업, 거주여부)이 있는 메시지만 처리
+            if not has_required_format(message_text):
                 logger.info("handle_message - Message does not contain required format (성명, 직업, 거주여부)")
                 # 양식이 없는 메시지는 무시 (회신하지 않음)
                 return
             
             try:
-                print(f"[WEBHOOK] Parsing message text...", file=sys.stderr, flush=True)
-                parser = MessageParser()
-                property_data = parser.parse(message_text)
-                print(f"[WEBHOOK] Parsed - kb_price: {property_data.get('kb_price')}", file=sys.stderr, flush=True)
-                logger.info(f"handle_message - property_data parsed: kb_price={property_data.get('kb_price')}")
-                
-                print(f"[WEBHOOK] Calculating results for chat_type: {chat_type}...", file=sys.stderr, flush=True)
-                # 채팅방 타입에 따라 다른 계산 함수 호출
-                if chat_type == "loan":
-                    results = BaseCalculator.calculate_all_loans(property_data)
-                else:  # banks 또는 None (기본값)
-                    results = BaseCalculator.calculate_all_banks(property_data)
-                print(f"[WEBHOOK] Results count: {len(results) if results else 0}", file=sys.stderr, flush=True)
-                logger.info(f"handle_message - results count: {len(results) if results else 0}")
-                
-                formatted_result = format_all_results(results)
-                print("[WEBHOOK] Sending reply message...", file=sys.stderr, flush=True)
-                await message.reply_text(formatted_result)
-                print("[WEBHOOK] Message sent successfully!", file=sys.stderr, flush=True)
-                logger.info("handle_message - Message sent successfully")
-                
+                # 파싱/계산은 스레드에서 실행 (계산 중에도 루프가 다른 업데이트를 처리하고,
+                # 그 사이 같은 메시지가 다시 수정되면 이 회신은 취소됨)
+                formatted_result = await asyncio.get_running_loop().run_in_executor(
+                    None, compute_reply, message_text, chat_type
+                )
             except Exception as e:
-                print(f"[WEBHOOK] Error in handle_message: {str(e)}", file=sys.stderr, flush=True)
-                logger.error(f"Error in handle_message: {str(e)}", exc_info=True)
-                try:
-                    await message.reply_text(
-                        f"계산 중 오류가 발생했습니다.\n\n"
-                        f"오류 내용: {str(e)}"
-                    )
-                except Exception as reply_error:
-                    logger.error(f"Failed to send error message: {str(reply_error)}", exc_info=True)
+                logger.error("Error in handle_message: %s", e, exc_info=True)
+                # 계산 오류는 다시 시도해도 같으므로 오류 내용을 회신하고 끝냄
+                # (회신 전송 실패는 dispatch_update로 전달 -> 내구성 큐 모드에서는 나중에 다시 시도)
+                await message.reply_text(
+                    f"계산 중 오류가 발생했습니다.\n\n"
+                    f"오류 내용: {str(e)}"
+                )
+                return
+
+            # 수정된 메시지면 이전 회신을 수정 (내용이 같으면 API 호출 없음)
+            outcome = await reply_tracker.reply(message, formatted_result)
+            logger.info("handle_message - Reply %s", outcome)
 
         # 핸들러 등록
         application.add_handler(CommandHandler("start", start_command))
@@ -266,15 +326,228 @@ def get_application():
     return application
 
 
+async def initialize_application(app):
+    """Application 초기화 (상주 루프에서 한 번만 수행)"""
+    global _initialize_lock
+    if app._initialized:
+        return
+    # 루프 스레드 안에서만 호출되므로 잠금 생성도 경쟁 없음
+    if _initialize_lock is None:
+        _initialize_lock = asyncio.Lock()
+    async with _initialize_lock:
+        if not app._initialized:
+            logger.info("Initializing application")
+            await app.initialize()
+
+
+def is_command_update(update):
+    """명령어(/start, /help 등) 메시지인지 확인 (MessageHandler의 ~filters.COMMAND와 같은 기준)"""
+    from telegram.ext import filters
+    return update.message is not None and filters.COMMAND.check_update(update)
+
+
+async def dispatch_update(app, update, raise_errors=False):
+    """
+    업데이트를 텔레그램 Application 핸들러로 전달
+
+    명령어가 아닌 메시지는 handle_message를 직접 호출 (회신은 reply_text 한 번뿐이라
+    Application 초기화(getMe 왕복)가 필요 없음 -> 콜드 스타트 후 첫 회신이 getMe만큼 빨라짐)
+    명령어는 CommandHandler로 보내야 하므로 초기화 후 process_update로 처리
+
+    Args:
+        raise_errors: 처리 중 오류를 기록 후 다시 발생 (내구성 큐 워커가 완료 처리하지 않고 재시도하도록)
+    """
+    try:
+        if not is_command_update(update) and hasattr(app, '_handle_message'):
+            logger.debug("Processing message directly with _handle_message")
+            await app._handle_message(update, None)
+        else:
+            logger.debug("Processing command with process_update")
+            await initialize_application(app)
+            await app.process_update(update)
+        
+        logger.info("Message processing completed")
+        
+    except Exception as e:
+        logger.error("Error in dispatch_update(): %s", e, exc_info=True)
+        if raise_errors:
+            raise
+
+
+def run_coroutine(coro_factory, timeout=PROCESS_TIMEOUT, raise_errors=False):
+    """
+    상주 루프 스레드에서 코루틴을 실행하고 완료까지 대기
+
+    Args:
+        coro_factory: 코루틴을 만드는 함수
+        timeout: 최대 대기 시간(초) - 넘으면 코루틴을 취소하고 반환
+            (재시도한 처리와 이전 처리가 겹쳐 같은 업데이트에 두 번 회신하지 않도록)
+        raise_errors: 시간 초과/오류를 기록만 하지 않고 다시 발생 (내구성 큐 워커가 재시도하도록)
+    """
+    future = _loop_thread.submit(coro_factory())
+    try:
+        future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        logger.error("Update processing timeout after %s seconds (cancelled)", timeout)
+        if raise_errors:
+            raise
+    except Exception as e:
+        logger.error("Event loop error: %s", e, exc_info=True)
+        if raise_errors:
+            raise
+
+
+def process_update_body(body, raise_errors=False):
+    """
+    텔레그램 업데이트 한 건 처리 (동기 모드는 do_POST에서, 빠른 응답/내구성 큐 모드는 워커 스레드에서 호출)
+    
+    Args:
+        body: 웹훅 요청 body (update_id가 있는 dict)
+        raise_errors: 처리 시간 초과/오류를 다시 발생 (run_coroutine 참고)
+    
+    Returns:
+        처리하지 않은 사유 (처리했으면 None)
+    """
+    # 큐에서 기다리는 동안 같은 메시지가 다시 수정되었으면 새 버전만 처리
+    message = get_body_message(body)
+    if message is not None and not edit_versions.is_latest(get_message_key(message), body.get("update_id")):
+        logger.info("Superseded by a newer edit - update_id: %s, skipping", body.get("update_id"))
+        return "superseded"
+
+    from telegram import Update
+    app = get_application()
+    update = Update.de_json(body, app.bot)
+    logger.info("Received update - update_id: %s", update.update_id)
+    
+    # 메시지가 없는 경우 무시
+    if not update.message and not update.edited_message and not update.channel_post and not update.edited_channel_post:
+        logger.warning("No message found, skipping")
+        return "no message"
+    
+    chat_id = get_update_chat_id(update)
+    
+    # 허용된 채팅방 확인 (라우팅 테이블이 비어 있으면 모든 채팅방 허용)
+    router = get_chat_router()
+    logger.info("chat_id: %s, room_type: %s", chat_id, router.room_type(chat_id))
+    
+    if not router.is_allowed(chat_id):
+        logger.warning("Chat %s is not in allowed list, ignoring update", chat_id)
+        return "chat not allowed"
+    
+    run_coroutine(lambda: dispatch_update(app, update, raise_errors), raise_errors=raise_errors)
+    return None
+
+
+def process_queued_update(payload):
+    """내구성 큐 워커: 커밋된 요청 body 처리 (예외가 나면 큐가 나중에 다시 시도)"""
+    process_update_body(json.loads(payload), raise_errors=True)
+
+
+def get_update_queue():
+    """빠른 응답 모드의 업데이트 처리 큐 (처음 호출 시 생성, 프로세스 공유)"""
+    global _update_queue
+    if _update_queue is None:
+        with _update_queue_lock:
+            if _update_queue is None:
+                from utils.fair_scheduler import FairWorkQueue
+                # 워커들이 동시에 Application을 만들지 않도록 큐 생성 전에 미리 생성
+                get_application()
+                _update_queue = FairWorkQueue(
+                    process_update_body,
+                    workers=UPDATE_QUEUE_WORKERS,
+                    max_depth=UPDATE_QUEUE_SIZE,
+                    max_backlog=CHAT_BACKLOG,
+                    weight=get_chat_router().weight,
+                    name="webhook-updates"
+                )
+    return _update_queue
+
+
+def send_busy_reply(message):
+    """채팅방 대기열이 가득 차 받지 않은 메시지에 "요청이 많음" 회신 (루프에 제출만 하고 기다리지 않음)"""
+    from utils.fair_scheduler import BUSY_MESSAGE
+    chat_id = message["chat"]["id"]
+    future = _loop_thread.submit(
+        get_application().bot.send_message(chat_id, BUSY_MESSAGE, reply_to_message_id=message.get("message_id"))
+    )
+
+    def log_error(done):
+        if done.exception() is not None:
+            logger.error("Failed to send busy reply - chat_id: %s: %s", chat_id, done.exception())
+    future.add_done_callback(log_error)
+
+
+def submit_delayed_edit(body):
+    """빠른 응답 모드: 디바운스 대기가 끝난 수정 메시지를 큐에 적재 (타이머 스레드, 그 사이 더 새 버전이 들어왔으면 버림)"""
+    from utils.fair_scheduler import CHAT_BUSY
+    message = get_body_message(body)
+    try:
+        if not edit_versions.is_latest(get_message_key(message), body["update_id"]):
+            logger.info("Superseded by a newer edit - update_id: %s, not queued", body["update_id"])
+            return
+        skipped = get_update_queue().submit(message["chat"]["id"], body)
+        if skipped == CHAT_BUSY:
+            send_busy_reply(message)
+        elif skipped:
+            # 이미 200 응답했으므로 텔레그램이 다시 보내지 않음
+            logger.error("Update queue full, edited message dropped - update_id: %s", body["update_id"])
+    except Exception as e:
+        logger.error("Delayed edit submit failed - update_id: %s: %s", body["update_id"], e, exc_info=True)
+
+
+def get_durable_queue():
+    """내구성 큐 (처음 호출 시 생성하고 워커 시작, 프로세스 공유 - 이전 실행에서 남은 업데이트도 처리)"""
+    global _durable_queue
+    if _durable_queue is None:
+        with _durable_queue_lock:
+            if _durable_queue is None:
+                from utils.durable_queue import DurableQueue
+                # 워커들이 동시에 Application을 만들지 않도록 워커 시작 전에 미리 생성
+                get_application()
+                durable_queue = DurableQueue(
+                    DURABLE_QUEUE_PATH,
+                    flush_interval=DURABLE_QUEUE_FLUSH,
+                    visibility_timeout=DURABLE_QUEUE_VISIBILITY,
+                    max_attempts=DURABLE_QUEUE_MAX_ATTEMPTS,
+                    name="webhook-durable"
+                )
+                durable_queue.start(process_queued_update, workers=UPDATE_QUEUE_WORKERS)
+                _durable_queue = durable_queue
+    return _durable_queue
+
+
+def get_update_dedup():
+    """최근 받은 update_id 집합 (처음 호출 시 생성, 프로세스 공유)"""
+    global _update_dedup
+    if _update_dedup is None:
+        with _update_dedup_lock:
+            if _update_dedup is None:
+                from utils.update_dedup import FileUpdateIdSet, UpdateIdSet
+                ttl = DEDUP_TTL if DEDUP_TTL > 0 else None
+                if DEDUP_PATH:
+                    _update_dedup = FileUpdateIdSet(DEDUP_PATH, max_entries=DEDUP_SIZE, ttl=ttl)
+                else:
+                    _update_dedup = UpdateIdSet(max_entries=DEDUP_SIZE, ttl=ttl)
+    return _update_dedup
+
+
+def update_queue_stats():
+    """업데이트 처리 큐 통계 (헬스체크용, 빠른 응답 모드가 아니면 모드만 표시)"""
+    if DURABLE_QUEUE_PATH:
+        return dict(get_durable_queue().stats(), durable=True)
+    if not FAST_ACK:
+        return {"fast_ack": False}
+    if _update_queue is None:
+        return {"fast_ack": True, "running": False}
+    return dict(_update_queue.stats(), fast_ack=True)
+
+
 class handler(BaseHTTPRequestHandler):
     """Vercel Python 서버리스 함수 핸들러"""
     
     def __init__(self, *args, **kwargs):
-        # 핸들러 초기화 시 즉시 로그 출력
-        sys.stderr.write("[HANDLER] Handler class initialized\n")
-        sys.stderr.flush()
-        print("[HANDLER] Handler __init__ called", file=sys.stderr, flush=True)
-        logger.info("Handler initialized")
+        logger.debug("Handler initialized")
         super().__init__(*args, **kwargs)
     
     def _send_response(self, status_code, data):
@@ -288,30 +561,38 @@ class handler(BaseHTTPRequestHandler):
     
     def do_GET(self):
         """GET 요청 처리 (헬스체크)"""
-        # 여러 방법으로 로그 출력
-        sys.stderr.write("[WEBHOOK] GET request received - stderr write\n")
-        sys.stderr.flush()
-        print("=" * 60, file=sys.stderr, flush=True)
-        print("[WEBHOOK] GET request received - print to stderr", file=sys.stderr, flush=True)
         logger.info("GET request - Health check")
-        self._send_response(200, {"ok": True, "message": "Webhook endpoint is active"})
+        from calculator.result_cache import result_cache_stats
+        self._send_response(200, {
+            "ok": True,
+            "message": "Webhook endpoint is active",
+            "result_cache": result_cache_stats(),
+            "update_queue": update_queue_stats(),
+            "update_dedup": get_update_dedup().stats(),
+            "edit_debounce": dict(message_debouncer.stats(), versions=edit_versions.stats()),
+            "reply_tracker": reply_tracker.stats(),
+            "prefilter": prefilter_stats(),
+            "chat_routes": get_chat_router().stats()
+        })
     
     def do_POST(self):
-        """POST 요청 처리 (텔레그램 웹훅)"""
-        # 여러 방법으로 로그 출력 (가장 먼저 실행)
-        sys.stderr.write("=" * 80 + "\n")
-        sys.stderr.write("[WEBHOOK] ===== POST REQUEST RECEIVED =====\n")
-        sys.stderr.write("=" * 80 + "\n")
-        sys.stderr.flush()
-        print("=" * 60, file=sys.stderr, flush=True)
-        print("[WEBHOOK] POST request received - print to stderr", file=sys.stderr, flush=True)
+        """
+        POST 요청 처리 (텔레그램 웹훅)
+        - 기본: 업데이트 처리(파싱/계산/회신)가 끝난 뒤 200 응답
+        - 빠른 응답 모드(WEBHOOK_FAST_ACK): 검증 후 채팅방별 대기열에 적재하고 바로 200 응답,
+          큐가 가득 차면 503 응답 (텔레그램이 나중에 다시 전송), 채팅방 대기열이 가득 차면 "요청이 많음" 회신 후 200 응답
+        - 내구성 큐 모드(WEBHOOK_QUEUE_PATH): 디스크에 커밋한 뒤 200 응답, 커밋 실패 시 503 응답
+        - 두 큐 모드 모두 수정 메시지는 디바운스 대기(WEBHOOK_EDIT_DEBOUNCE_MS)가 지난 뒤에 워커가 처리
+        - 이미 받은 update_id(텔레그램 재전송)는 처리 없이 바로 200 응답
+        """
         logger.info("POST request received")
+        update_id = None
         
         try:
             # 요청 body 읽기
             content_length = int(self.headers.get('Content-Length', 0))
             if content_length == 0:
-                print("[WEBHOOK] Empty body, skipping", file=sys.stderr, flush=True)
+                logger.info("Empty body, skipping")
                 self._send_response(200, {"ok": True, "skipped": "empty body"})
                 return
 
@@ -321,185 +602,95 @@ class handler(BaseHTTPRequestHandler):
 
             # 텔레그램 update 형식 검증
             if not isinstance(body, dict) or "update_id" not in body:
-                print("[WEBHOOK] Not a telegram update, skipping", file=sys.stderr, flush=True)
                 logger.warning("Not a telegram update, skipping")
                 self._send_response(200, {"ok": True, "skipped": "not telegram update"})
                 return
 
-            # 텔레그램 업데이트 처리
-            print("[WEBHOOK] Processing telegram update...", file=sys.stderr, flush=True)
-            from telegram import Update
-            app = get_application()
-            update = Update.de_json(body, app.bot)
-            print(f"[WEBHOOK] Update ID: {update.update_id}", file=sys.stderr, flush=True)
-            logger.info(f"Received update - update_id: {update.update_id}")
-
-            # 메시지가 없는 경우 무시
-            if not update.message and not update.edited_message and not update.channel_post and not update.edited_channel_post:
-                print("[WEBHOOK] No message found, skipping", file=sys.stderr, flush=True)
-                logger.warning("No message found, skipping")
-                self._send_response(200, {"ok": True, "skipped": "no message"})
+            # 처리 대상이 아닌 업데이트(일반 대화 등)는 텔레그램 객체를 만들지 않고 바로 응답
+            skipped = prefilter_update(body)
+            count_prefilter(skipped)
+            if skipped:
+                logger.info("Prefiltered update - update_id: %s, reason: %s", body["update_id"], skipped)
+                self._send_response(200, {"ok": True, "skipped": skipped})
                 return
 
-            # 채팅방 ID 확인
-            def get_chat_id_from_update(update):
-                if update.message:
-                    return update.message.chat.id
-                elif update.edited_message:
-                    return update.edited_message.chat.id
-                elif update.channel_post:
-                    return update.channel_post.chat.id
-                elif update.edited_channel_post:
-                    return update.edited_channel_post.chat.id
-                return None
-
-            chat_id = get_chat_id_from_update(update)
-            print(f"[WEBHOOK] Chat ID: {chat_id}", file=sys.stderr, flush=True)
-
-            # 허용된 채팅방 ID 확인 (1번방: banks, 2번방: loan)
-            ALLOWED_CHAT_IDS_BANKS_STR = os.getenv("ALLOWED_CHAT_IDS_BANKS")
-            ALLOWED_CHAT_IDS_LOAN_STR = os.getenv("ALLOWED_CHAT_IDS_LOAN")
-            
-            if not ALLOWED_CHAT_IDS_BANKS_STR:
-                try:
-                    from config.telegram_config import ALLOWED_CHAT_IDS_BANKS  # type: ignore
-                    ALLOWED_CHAT_IDS_BANKS_STR = ALLOWED_CHAT_IDS_BANKS
-                except (ModuleNotFoundError, ImportError):
-                    ALLOWED_CHAT_IDS_BANKS_STR = None
-            
-            if not ALLOWED_CHAT_IDS_LOAN_STR:
-                try:
-                    from config.telegram_config import ALLOWED_CHAT_IDS_LOAN  # type: ignore
-                    ALLOWED_CHAT_IDS_LOAN_STR = ALLOWED_CHAT_IDS_LOAN
-                except (ModuleNotFoundError, ImportError):
-                    ALLOWED_CHAT_IDS_LOAN_STR = None
-
-            allowed_chat_ids_banks = []
-            if ALLOWED_CHAT_IDS_BANKS_STR:
-                allowed_chat_ids_banks = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS_BANKS_STR.split(",") if chat_id.strip()]
-
-            allowed_chat_ids_loan = []
-            if ALLOWED_CHAT_IDS_LOAN_STR:
-                allowed_chat_ids_loan = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS_LOAN_STR.split(",") if chat_id.strip()]
-
-            # 전체 허용된 채팅방 ID (둘 다 합침)
-            allowed_chat_ids = allowed_chat_ids_banks + allowed_chat_ids_loan
-
-            print(f"[WEBHOOK] Allowed chat IDs - banks: {allowed_chat_ids_banks}, loan: {allowed_chat_ids_loan}", file=sys.stderr, flush=True)
-            logger.info(f"chat_id: {chat_id}, allowed_chat_ids_banks: {allowed_chat_ids_banks}, allowed_chat_ids_loan: {allowed_chat_ids_loan}")
-
-            # 허용된 채팅방이 설정되어 있고, 현재 채팅방이 허용 목록에 없으면 무시
-            if allowed_chat_ids and chat_id not in allowed_chat_ids:
-                print(f"[WEBHOOK] Chat {chat_id} is NOT in allowed list, ignoring", file=sys.stderr, flush=True)
-                logger.warning(f"Chat {chat_id} is not in allowed list, ignoring update")
-                self._send_response(200, {"ok": True, "skipped": "chat not allowed"})
+            # 재전송된 업데이트는 다시 계산/회신하지 않음
+            if get_update_dedup().seen(body["update_id"]):
+                logger.info("Duplicate update - update_id: %s, skipping", body["update_id"])
+                self._send_response(200, {"ok": True, "skipped": "duplicate"})
                 return
+            update_id = body["update_id"]
 
-            print(f"[WEBHOOK] Chat {chat_id} is allowed, processing message", file=sys.stderr, flush=True)
+            # 큐 모드: 메시지별 최신 버전 기록, 수정 메시지는 디바운스 대기 후에 처리
+            delay = 0
+            if DEBOUNCE_BEFORE_QUEUE:
+                edit_versions.note(get_message_key(get_body_message(body)), update_id)
+                if is_edited_body(body):
+                    delay = EDIT_DEBOUNCE
 
-            # 비동기 처리 함수
-            async def process():
+            if DURABLE_QUEUE_PATH:
                 try:
-                    print("[WEBHOOK] Starting async process", file=sys.stderr, flush=True)
-                    
-                    # 초기화되지 않았으면 초기화
-                    if not app._initialized:
-                        print("[WEBHOOK] Initializing application", file=sys.stderr, flush=True)
-                        await app.initialize()
-                    
-                    # channel_post, edited_message, edited_channel_post는 직접 처리
-                    if update.channel_post or update.edited_message or update.edited_channel_post:
-                        print("[WEBHOOK] Processing channel_post/edited_message directly", file=sys.stderr, flush=True)
-                        if hasattr(app, '_handle_message'):
-                            await app._handle_message(update, None)
-                        else:
-                            logger.warning("_handle_message not found, using process_update")
-                            await app.process_update(update)
-                    else:
-                        # 일반 메시지는 process_update로 처리
-                        print("[WEBHOOK] Processing regular message with process_update", file=sys.stderr, flush=True)
-                        await app.process_update(update)
-                    
-                    print("[WEBHOOK] Message processing completed", file=sys.stderr, flush=True)
-                    logger.info("Message processing completed")
-                    
+                    get_durable_queue().enqueue(body_str, delay=delay)
                 except Exception as e:
-                    print(f"[WEBHOOK] Error in process(): {str(e)}", file=sys.stderr, flush=True)
-                    logger.error(f"Error in process(): {str(e)}", exc_info=True)
-                    import traceback
-                    traceback.print_exc()
+                    logger.error("Durable enqueue failed - update_id: %s: %s", update_id, e, exc_info=True)
+                    get_update_dedup().forget(update_id)
+                    self._send_response(503, {"ok": False, "error": "update queue unavailable"})
+                    return
+                logger.info("Update committed - update_id: %s", update_id)
+                self._send_response(200, {"ok": True, "queued": True, "durable": True})
+                return
 
-            # 이벤트 루프 실행
-            global _global_loop
-            
-            try:
-                # 기존 루프 확인
-                try:
-                    loop = asyncio.get_running_loop()
-                    print("[WEBHOOK] Event loop already running, using thread", file=sys.stderr, flush=True)
-                    logger.info("Event loop already running, using thread")
-                    import threading
-                    
-                    def run_in_new_thread():
-                        global _global_loop
-                        try:
-                            if _global_loop is None or _global_loop.is_closed():
-                                new_loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(new_loop)
-                            else:
-                                new_loop = _global_loop
-                                asyncio.set_event_loop(new_loop)
-                            
-                            new_loop.run_until_complete(process())
-                            
-                            if not new_loop.is_closed():
-                                _global_loop = new_loop
-                        except Exception as e:
-                            print(f"[WEBHOOK] Thread error: {str(e)}", file=sys.stderr, flush=True)
-                            logger.error(f"Thread error: {str(e)}", exc_info=True)
-                    
-                    thread = threading.Thread(target=run_in_new_thread, daemon=False)
-                    thread.start()
-                    thread.join(timeout=25)
-                    
-                    if thread.is_alive():
-                        print("[WEBHOOK] Thread timeout", file=sys.stderr, flush=True)
-                        logger.error("Thread timeout after 25 seconds")
-                        
-                except RuntimeError:
-                    print("[WEBHOOK] No running loop, creating new one", file=sys.stderr, flush=True)
-                    logger.info("No running loop, creating new one")
-                    
-                    if _global_loop is None or _global_loop.is_closed():
-                        _global_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(_global_loop)
-                    
-                    try:
-                        _global_loop.run_until_complete(process())
-                    except Exception as e:
-                        print(f"[WEBHOOK] Error in process: {str(e)}", file=sys.stderr, flush=True)
-                        logger.error(f"Error in process: {str(e)}", exc_info=True)
-                    
-            except Exception as e:
-                print(f"[WEBHOOK] Event loop error: {str(e)}", file=sys.stderr, flush=True)
-                logger.error(f"Event loop error: {str(e)}", exc_info=True)
-                import traceback
-                traceback.print_exc()
+            if FAST_ACK:
+                from utils.fair_scheduler import CHAT_BUSY
+                if delay > 0:
+                    # 대기 시간이 지난 뒤 적재 (그 사이 같은 메시지가 다시 수정되면 마지막 버전만 적재)
+                    timer = threading.Timer(delay, submit_delayed_edit, args=(body,))
+                    timer.daemon = True
+                    timer.start()
+                    logger.info("Edited message delayed %ss - update_id: %s", delay, update_id)
+                    self._send_response(200, {"ok": True, "queued": True, "delayed": True})
+                    return
+                # 사전 필터를 통과했으므로 메시지와 채팅방이 있음
+                message = get_body_message(body)
+                skipped = get_update_queue().submit(message["chat"]["id"], body)
+                if skipped == CHAT_BUSY:
+                    # 채팅방 대기열이 가득 참: 계산하지 않고 "요청이 많음" 회신 (재전송되어도 다시 받지 않음)
+                    send_busy_reply(message)
+                    self._send_response(200, {"ok": True, "skipped": skipped})
+                    return
+                if skipped:
+                    # 재전송되면 다시 처리하도록 기록 삭제
+                    get_update_dedup().forget(update_id)
+                    self._send_response(503, {"ok": False, "error": "update queue full"})
+                    return
+                logger.info("Update queued - update_id: %s", body["update_id"])
+                self._send_response(200, {"ok": True, "queued": True})
+                return
 
-            print("[WEBHOOK] Sending 200 OK response", file=sys.stderr, flush=True)
+            # 텔레그램 업데이트 처리 (완료 후 응답)
+            skipped = process_update_body(body)
+            if skipped:
+                self._send_response(200, {"ok": True, "skipped": skipped})
+                return
+
+            logger.debug("Sending 200 OK response")
             self._send_response(200, {"ok": True})
 
         except json.JSONDecodeError:
-            print("[WEBHOOK] JSON decode error", file=sys.stderr, flush=True)
+            logger.warning("JSON decode error")
             self._send_response(200, {"ok": True, "skipped": "invalid JSON"})
         except Exception as e:
-            print(f"[WEBHOOK] Error processing update: {str(e)}", file=sys.stderr, flush=True)
-            logger.error(f"Error processing update: {str(e)}", exc_info=True)
-            import traceback
-            traceback.print_exc()
+            logger.error("Error processing update: %s", e, exc_info=True)
+            if update_id is not None:
+                get_update_dedup().forget(update_id)
             self._send_response(500, {"error": str(e)})
     
     def log_message(self, format, *args):
         """로그 메시지 출력"""
         message = f"{self.address_string()} - {format % args}"
         logger.info(message)
+
+
+# 내구성 큐 모드는 모듈 로드 시 워커 시작 (재시작 전에 커밋된 업데이트를 요청 없이도 바로 처리)
+if DURABLE_QUEUE_PATH:
+    get_durable_queue()
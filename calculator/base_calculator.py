@@ -6,142 +6,49 @@
 
 import json
 import os
-import sys
+import re
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 from utils.validators import validate_kb_price, extract_lower_bound_price, extract_kb_ai_price_from_special_notes
+from utils import regions
+from calculator.registry import get_registry
+from calculator.score_table import ScoreRangeTable
+from calculator.context import CalculationContext, DEFAULT_CONTEXT
 
-# Vercel 로그 출력을 위한 강력한 헬퍼 함수
-def log_print(*args, **kwargs):
-    """Vercel에서 확실하게 로그가 보이도록 하는 헬퍼"""
-    import time
-    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-    message = ' '.join(str(arg) for arg in args)
-    log_line = f"[{timestamp}] {message}\n"
-    
-    # stderr에 직접 쓰기 (가장 확실한 방법)
-    try:
-        sys.stderr.write(log_line)
-        sys.stderr.flush()
-    except:
-        pass
-    
-    # stdout에도 쓰기
-    try:
-        sys.stdout.write(log_line)
-        sys.stdout.flush()
-    except:
-        pass
+# 주소의 층수 (하한가 적용 조건 확인용)
+FLOOR_PATTERN = re.compile(r'(\d+)층')
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='[%(asctime)s] %(levelname)s - %(name)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stderr),
-        logging.StreamHandler(sys.stdout)
-    ],
-    force=True
-)
 logger = logging.getLogger(__name__)
 
-# 원본 print 함수를 래핑하여 모든 print가 stderr로도 출력되도록
-_original_print = print
-
-def _wrapped_print(*args, **kwargs):
-    """print 함수 래퍼 (stderr로도 출력)"""
-    # flush가 명시되지 않았으면 True로 설정
-    if 'flush' not in kwargs:
-        kwargs['flush'] = True
-    # stderr로도 출력 (Vercel 로그 캡처를 위해)
-    try:
-        _original_print(*args, file=sys.stderr, **kwargs)
-    except:
-        pass
-    # 원래 의도한 출력 스트림으로도 출력
-    _original_print(*args, **kwargs)
-
-# print 함수를 래핑된 버전으로 교체
-import builtins
-builtins.print = _wrapped_print
-
 
 class BaseCalculator:
     """
     금융사 계산기 베이스 클래스
     """
     
-    # 전체 지역 리스트 (메인 계산기 기준)
-    ALL_REGIONS = [
-        "서울특별시종로구", "서울특별시중구", "서울특별시용산구", "서울특별시성동구",
-        "서울특별시광진구", "서울특별시동대문구", "서울특별시중랑구", "서울특별시성북구",
-        "서울특별시강북구", "서울특별시도봉구", "서울특별시노원구", "서울특별시은평구",
-        "서울특별시서대문구", "서울특별시마포구", "서울특별시양천구", "서울특별시강서구",
-        "서울특별시구로구", "서울특별시금천구", "서울특별시영등포구", "서울특별시동작구",
-        "서울특별시관악구", "서울특별시서초구", "서울특별시강남구", "서울특별시송파구",
-        "서울특별시강동구",
-        "경기도성남시분당구", "경기도광명시", "경기도과천시", "경기도하남시",
-        "경기도수원시장안구", "경기도수원시권선구", "경기도수원시팔달구", "경기도수원시영통구",
-        "경기도성남시수정구", "경기도성남시중원구", "경기도안양시만안구", "경기도안양시동안구",
-        "경기도부천시소사구", "경기도부천시오정구", "경기도부천시원미구", "경기도고양시덕양구",
-        "경기도고양시일산동구", "경기도고양시일산서구", "인천광역시연수구", "인천광역시부평구",
-        "경기도의정부시", "경기도안산시상록구", "경기도안산시단원구", "경기도구리시",
-        "경기도남양주시", "경기도군포시", "경기도의왕시", "경기도용인시처인구",
-        "경기도용인시기흥구", "경기도용인시수지구", "경기도김포시", "경기도화성시",
-        "경기도평택시", "경기도동두천시", "경기도오산시", "경기도시흥시",
-        "경기도파주시", "경기도안성시", "경기도광주시", "경기도양주시",
-        "경기도이천시", "경기도포천시", "경기도여주시", "경기도연천군",
-        "경기도가평군", "경기도양평군",
-        "인천광역시중구", "인천광역시동구", "인천광역시남동구", "인천광역시계양구",
-        "인천광역시서구", "인천광역시미추홀구", "인천광역시강화군", "인천광역시옹진군",
-        "광주광역시동구", "광주광역시서구", "광주광역시남구", "광주광역시북구", "광주광역시광산구",
-        "대전광역시동구", "대전광역시중구", "대전광역시서구", "대전광역시유성구", "대전광역시대덕구",
-        "울산광역시중구", "울산광역시남구", "울산광역시동구", "울산광역시북구", "울산광역시울주군",
-        "세종특별자치시세종시",
-        "강원특별자치도춘천시", "강원특별자치도원주시", "강원특별자치도강릉시",
-        "강원특별자치도동해시", "강원특별자치도태백시", "강원특별자치도속초시", "강원특별자치도삼척시",
-        "강원특별자치도홍천군", "강원특별자치도횡성군", "강원특별자치도영월군", "강원특별자치도평창군",
-        "강원특별자치도정선군", "강원특별자치도철원군", "강원특별자치도화천군", "강원특별자치도양구군",
-        "강원특별자치도인제군", "강원특별자치도고성군", "강원특별자치도양양군",
-        "충청북도충주시", "충청북도제천시", "충청북도청주시상당구", "충청북도청주시서원구",
-        "충청북도청주시흥덕구", "충청북도청주시청원구", "충청북도보은군", "충청북도옥천군",
-        "충청북도영동군", "충청북도진천군", "충청북도괴산군", "충청북도음성군",
-        "충청북도단양군", "충청북도증평군",
-        "충청남도천안시동남구", "충청남도천안시서북구", "충청남도공주시", "충청남도보령시",
-        "충청남도아산시", "충청남도서산시", "충청남도논산시", "충청남도계룡시",
-        "충청남도당진시", "충청남도금산군", "충청남도부여군", "충청남도서천군",
-        "충청남도청양군", "충청남도홍성군", "충청남도예산군", "충청남도태안군",
-        "전북특별자치도전주시완산구", "전북특별자치도전주시덕진구", "전북특별자치도군산시",
-        "전북특별자치도익산시", "전북특별자치도정읍시", "전북특별자치도남원시", "전북특별자치도김제시",
-        "전북특별자치도완주군", "전북특별자치도진안군", "전북특별자치도무주군", "전북특별자치도장수군",
-        "전북특별자치도임실군", "전북특별자치도순창군", "전북특별자치도고창군", "전북특별자치도부안군",
-        "전라남도목포시", "전라남도여수시", "전라남도순천시", "전라남도나주시",
-        "전라남도광양시", "전라남도담양군", "전라남도곡성군", "전라남도구례군",
-        "전라남도고흥군", "전라남도보성군", "전라남도화순군", "전라남도장흥군",
-        "전라남도강진군", "전라남도해남군", "전라남도영암군", "전라남도무안군",
-        "전라남도함평군", "전라남도영광군", "전라남도장성군", "전라남도완도군",
-        "전라남도진도군", "전라남도신안군",
-        "경상북도포항시남구", "경상북도포항시북구", "경상북도경주시", "경상북도김천시",
-        "경상북도안동시", "경상북도구미시", "경상북도영주시", "경상북도영천시",
-        "경상북도상주시", "경상북도문경시", "경상북도경산시", "경상북도의성군",
-        "경상북도청송군", "경상북도영양군", "경상북도영덕군", "경상북도청도군",
-        "경상북도고령군", "경상북도성주군", "경상북도칠곡군", "경상북도예천군",
-        "경상북도봉화군", "경상북도울진군", "경상북도울릉군",
-        "경상남도진주시", "경상남도통영시", "경상남도사천시", "경상남도김해시",
-        "경상남도밀양시", "경상남도거제시", "경상남도양산시", "경상남도창원시의창구",
-        "경상남도창원시성산구", "경상남도창원시마산합포구", "경상남도창원시마산회원구",
-        "경상남도창원시진해구", "경상남도의령군", "경상남도함안군", "경상남도창녕군",
-        "경상남도고성군", "경상남도남해군", "경상남도하동군", "경상남도산청군",
-        "경상남도함양군", "경상남도거창군", "경상남도합천군",
-        "제주특별자치도제주시", "제주특별자치도서귀포시",
-        "부산광역시중구", "부산광역시서구", "부산광역시동구", "부산광역시영도구",
-        "부산광역시부산진구", "부산광역시동래구", "부산광역시남구", "부산광역시북구",
-        "부산광역시해운대구", "부산광역시사하구", "부산광역시금정구", "부산광역시강서구",
-        "부산광역시연제구", "부산광역시수영구", "부산광역시사상구", "부산광역시기장군",
-        "대구광역시중구", "대구광역시동구", "대구광역시서구", "대구광역시남구",
-        "대구광역시북구", "대구광역시수성구", "대구광역시달서구", "대구광역시달성군",
-        "대구광역시군위군"
-    ]
+    # 전체 지역 리스트 (메인 계산기 기준, 파서와 공유)
+    ALL_REGIONS = list(regions.ALL_REGIONS)
+    
+    # 광역 단위 키 (region_grades에서 제외)
+    METROPOLITAN_KEYS = frozenset(regions.METROPOLITAN_REGIONS)
+    
+    # 전체 지역 (공백 제거 버전) - 지역 검증용
+    VALID_REGIONS = frozenset(regions.normalize_region(region) for region in regions.ALL_REGIONS)
+    
+    # 특이사항 기본 불가 키워드 (추가 키워드는 설정의 additional_restricted_keywords)
+    RESTRICTED_KEYWORDS = ("압류", "가압류", "경매취하자금")
+    
+    # 대상 지역 약자 매핑 (target_regions의 약자를 실제 지역명으로 변환)
+    REGION_ABBREVIATIONS = {
+        "경북": "경상북도",
+        "경남": "경상남도",
+        "충북": "충청북도",
+        "충남": "충청남도",
+        "전북": "전라북도",
+        "전남": "전라남도",
+        "강원": "강원특별자치도"
+    }
     
     def __init__(self, config: Union[Dict[str, Any], str]):
         """
@@ -155,6 +62,68 @@ class BaseCalculator:
         
         self.config = config
         self.bank_name = config.get("bank_name", "Unknown")
+        self._build_region_indexes()
+        self._build_score_tables()
+    
+    @staticmethod
+    def _build_normalized_index(mapping) -> Dict[str, Any]:
+        """
+        공백 제거 키 -> 값 인덱스 생성
+        공백 제거 키가 원본 키로도 존재하면 그 값을 우선하고,
+        아니면 설정 파일 순서상 첫 번째 키의 값을 사용 (기존 순차 탐색과 동일한 결과)
+        """
+        index = {}
+        for key, value in mapping.items():
+            index.setdefault(key.replace(" ", ""), value)
+        for key, value in mapping.items():
+            if " " not in key:
+                index[key] = value
+        return index
+    
+    def _build_region_indexes(self):
+        """
+        설정 로드 시 지역 조회용 인덱스를 미리 생성
+        - 지역 -> 급지 (광역 단위 키, 값이 없는 키 제외)
+        - 지역 -> 기준 LTV 이하 지역 LTV
+        - 지역 -> 1급지 A/B 그룹의 max_ltv_by_grade 키
+        """
+        region_grades = self.config.get("region_grades", {})
+        valid_grades = {
+            key: grade for key, grade in region_grades.items()
+            if grade is not None and not self._is_metropolitan_key(key)
+        }
+        self._region_grade_exact = valid_grades
+        self._region_grade_index = self._build_normalized_index(valid_grades)
+        
+        below_standard_ltv_regions = self.config.get("below_standard_ltv_regions", {})
+        self._below_standard_ltv_exact = below_standard_ltv_regions
+        self._below_standard_ltv_index = self._build_normalized_index(below_standard_ltv_regions)
+        
+        # B 그룹을 먼저 넣고 A 그룹으로 덮어써서 A 그룹 우선
+        grade_1_groups = {}
+        for b_region in self.config.get("grade_1_group_b", []):
+            grade_1_groups[b_region.replace(" ", "")] = "1_b"
+        for a_region in self.config.get("grade_1_group_a", []):
+            grade_1_groups[a_region.replace(" ", "")] = "1"
+        self._grade_1_group_index = grade_1_groups
+    
+    def _build_score_tables(self):
+        """
+        설정 로드 시 신용점수 구간 테이블을 미리 컴파일
+        형식이 잘못되었거나 겹치는 구간이 있으면 ValueError (로드 실패)
+        """
+        self._credit_grade_table = ScoreRangeTable(
+            self.config.get("credit_score_to_grade", {}),
+            name=f"{self.bank_name} credit_score_to_grade"
+        )
+        # OK저축은행 등급 번호는 내림차순 구간(예: 1000-915)도 허용
+        self._credit_grade_number_table = ScoreRangeTable(
+            self.config.get("credit_score_range_to_grade_number", {}),
+            normalize_order=True,
+            name=f"{self.bank_name} credit_score_range_to_grade_number"
+        )
+        if self._credit_grade_table.inactive_keys:
+            logger.warning("%s: credit_score_to_grade의 내림차순 구간은 매칭되지 않습니다: %s", self.bank_name, list(self._credit_grade_table.inactive_keys))
     
     @staticmethod
     def round_down_to_hundred_thousand(amount: float) -> float:
@@ -181,6 +150,7 @@ class BaseCalculator:
                 - mortgages: 근저당권 설정 내역 리스트
                 - credit_score: 신용점수 (없으면 None)
                 - etc...
+            product_type: OK저축은행 상품 구분 ("household" 또는 "business")
         
         Returns:
             계산 결과 딕셔너리 또는 None (산출 불가 시)
@@ -203,16 +173,197 @@ class BaseCalculator:
                 "errors": []
             }
         """
-        # 모든 검증 오류를 수집
-        validation_errors = []
+        early_result, plan = self._prepare_calculation(property_data, product_type)
+        if plan is None:
+            return early_result
+        return self._complete_calculation(plan)
+    
+    def _prepare_calculation(self, property_data: Dict[str, Any], product_type: Optional[str] = None):
+        """
+        검증 및 계산 계획 수립 (calculate의 1단계)
         
+        Returns:
+            (early_result, plan) 튜플
+            - 검증 단계에서 결과가 확정되면 (결과 딕셔너리 또는 None, None)
+            - 아니면 (None, plan) - plan은 _complete_calculation에 전달
+        """
         # KB시세 검증
+        kb_price_raw, kb_price = self._resolve_kb_price(property_data)
+        
+        if kb_price is None:
+            logger.info("BaseCalculator.calculate - KB price is None, returning None")
+            return self._error_result(["KB시세 정보가 없어 취급 불가합니다"]), None
+        
+        # 모든 검증 오류를 수집 (검증 오류가 있으면 즉시 반환)
+        validation_errors = self._collect_validation_errors(property_data, kb_price)
+        if validation_errors:
+            return self._error_result(validation_errors), None
+        
+        # 하한가 적용 조건 확인
+        kb_price = self._apply_lower_bound_price(property_data, kb_price_raw, kb_price)
+        
+        # 지역 확인
+        region = property_data.get("region", "")
+        if not region:
+            logger.info("BaseCalculator.calculate - region is empty")
+            return None, None
+        
+        # 지역 및 급지 검증 오류가 있으면 반환
+        region_errors, grade = self._check_region(region)
+        if region_errors:
+            return self._error_result(region_errors), None
+        
+        # 면적 제한 확인 (BNK캐피탈 등 특정 금융사만)
+        area_error = self._check_area_limit(property_data, region)
+        if area_error:
+            return self._error_result([area_error]), None
+        
+        # 기준 LTV 이하 지역 확인
+        below_standard_ltv = self.get_below_standard_ltv(region)
+        is_below_standard = below_standard_ltv is not None
+        
+        # OK저축은행 가계자금인 경우 확인 (최대 LTV 계산 전에 먼저 확인)
+        is_ok_bank = self.is_ok_bank_name(self.bank_name)
+        is_household_for_ok = False
+        if is_ok_bank:
+            # product_type이 "household"이면 가계자금
+            is_household_for_ok = product_type == "household"
+        
+        # 최대 LTV 확인 (1급지인 경우 A/B 그룹 구분)
+        max_ltv = self._get_product_max_ltv(grade, region, property_data, is_household_for_ok)
+        logger.debug("BaseCalculator.calculate - grade: %s, max_ltv: %s, below_standard_ltv: %s", grade, max_ltv, below_standard_ltv)  # 추가
+        if max_ltv is None or max_ltv == 0:
+            logger.debug("BaseCalculator.calculate - max_ltv is None or 0 for grade %s, returning None", grade)  # 추가
+            return None, None
+        
+        # 기준 LTV 이하 지역인 경우 해당 LTV를 최대 LTV로 사용
+        if is_below_standard:
+            max_ltv = below_standard_ltv
+            logger.debug("BaseCalculator.calculate - 기준 LTV 이하 지역: %s, 적용 LTV: %s%%", region, max_ltv)
+        
+        # 기존 근저당권 총액 계산 (채권최고액 기준)
+        mortgages = property_data.get("mortgages", [])
+        
+        # 대환할 근저당권과 나머지 근저당권 구분
+        refinance_principal, refinance_institutions, other_mortgages = self._split_mortgages(
+            mortgages, property_data, is_household_for_ok
+        )
+        
+        # 나머지 근저당권의 채권최고액만 합산
+        total_mortgage = self._deductible_mortgage_total(other_mortgages)
+        
+        logger.debug("BaseCalculator.calculate - mortgages: %s", mortgages)  # 추가
+        logger.debug("BaseCalculator.calculate - refinance_principal(대환 원금 합계): %s만원, total_mortgage(차감할 금액): %s", refinance_principal, total_mortgage)  # 추가
+        
+        # BNK캐피탈인 경우 대환 요청이 있었는데 대환 가능한 기관이 없는지 확인
+        refinance_errors = self._check_refinanceable(mortgages, refinance_principal)
+        if refinance_errors:
+            return self._error_result(refinance_errors), None
+        
+        # 대환 여부 판단
+        is_refinance = refinance_principal > 0
+        
+        # 가계자금인 경우: 대환 요청된 금융사가 가계자금으로 대환 가능한 경우에만 산출
+        if is_household_for_ok:
+            # 대환 요청된 근저당권 중 가계자금으로 대환 가능한 것이 있는지 확인
+            # (refinance_institutions에 추가된 것들이 가계자금으로 대환 가능한 근저당권)
+            has_household_refinance = len(refinance_institutions) > 0
+            
+            # 가계자금으로 대환 가능한 근저당권이 없으면 가계자금 산출하지 않음 (None 반환하여 아무것도 표시하지 않음)
+            if not has_household_refinance:
+                logger.debug("BaseCalculator.calculate - 가계자금: 대환 요청된 금융사 중 가계자금으로 대환 가능한 것이 없어서 산출하지 않음")
+                return None, None
+            
+            # 가계자금으로 대환 가능한 근저당권이 있으면 산출 진행
+            if is_refinance:
+                logger.debug("BaseCalculator.calculate - 가계자금: 대환 요청 있음, 대환으로 진행 (대환 금융사: %s)", refinance_institutions)
+            else:
+                logger.debug("BaseCalculator.calculate - 가계자금: 대환할 근저당권 없음, 후순위로 산출")
+        
+        # OK 저축은행 사업자/가계 상품 구분
+        is_business_product, is_household_product = self._ok_product_kind(product_type)
+        
+        # 사업자 상품인 경우: business_product_names에 있는 기관만 대환 가능
+        if is_business_product and is_refinance:
+            refinance_institutions, business_refinance_errors = self._check_business_refinance(mortgages)
+            if business_refinance_errors:
+                return self._error_result(business_refinance_errors), None
+        
+        # 가계 상품: 빌라인 경우 선순위만 산출
+        if is_household_product:
+            property_type = property_data.get("property_type", "")
+            if property_type and "빌라" in property_type:
+                # 선순위만 산출 (기존 근저당권이 없어야 함)
+                if len(other_mortgages) > 0:
+                    logger.debug("BaseCalculator.calculate - OK 저축은행 가계 상품, 빌라인 경우 선순위만 산출 가능")
+                    return self._error_result(["빌라인 경우 선순위만 산출 가능"]), None
+        
+        # 신용점수/등급 확인
+        credit_score = property_data.get("credit_score")
+        credit_grade = self.credit_score_to_grade(credit_score)
+        
+        # 택시 관련 한도 제한 / 가계 상품 서울 수도권 한도 제한
+        max_amount_limit = self._max_amount_limit(property_data, region, is_household_product)
+        
+        # 가계자금인 경우 LTV 70% 고정
+        if is_household_for_ok:
+            max_ltv = 70
+            logger.debug("BaseCalculator.calculate - 가계자금: LTV 70%% 고정")
+        
+        # 필요자금이 있으면 LTV별 계산을 건너뛰고 필요자금 기준으로 역산 계산
+        # 택시/가계 한도 제한이 있으면 한도 기준으로 역산 계산
+        # 둘 다 없을 때만 LTV 단계별 계산 (ltv_steps)
+        required_amount = property_data.get("required_amount")
+        ltv_steps = None
+        if max_amount_limit is None and not required_amount:
+            ltv_steps = self._product_ltv_steps(max_ltv, is_household_for_ok, is_business_product)
+            logger.debug("BaseCalculator.calculate - max_ltv: %s, ltv_steps: %s", max_ltv, ltv_steps)  # 추가
+        
+        plan = {
+            "property_data": property_data,
+            "kb_price": kb_price,
+            "grade": grade,
+            "max_ltv": max_ltv,
+            "is_below_standard": is_below_standard,
+            "other_mortgages": other_mortgages,
+            "total_mortgage": total_mortgage,
+            "is_refinance": is_refinance,
+            "refinance_principal": refinance_principal,
+            "refinance_institutions": refinance_institutions,
+            "is_ok_bank": is_ok_bank,
+            "is_household_for_ok": is_household_for_ok,
+            "is_business_product": is_business_product,
+            "is_household_product": is_household_product,
+            "is_subordinate": len(other_mortgages) > 0,  # 후순위 여부
+            "credit_score": credit_score,
+            "credit_grade": credit_grade,
+            "max_amount_limit": max_amount_limit,
+            "required_amount": required_amount,
+            "ltv_steps": ltv_steps
+        }
+        return None, plan
+    
+    def _error_result(self, errors: List[str]) -> Dict[str, Any]:
+        """취급 불가 결과 (산출 결과 없이 오류 메시지만 포함)"""
+        return {
+            "bank_name": self.bank_name,
+            "results": [],
+            "conditions": list(self.config.get("conditions", [])),
+            "errors": errors,
+            "min_amount": self.config.get("min_amount", 3000)
+        }
+    
+    def _resolve_kb_price(self, property_data: Dict[str, Any]) -> tuple:
+        """
+        KB시세 검증 (빌라는 KB시세가 없으면 특이사항의 KB AI시세 사용)
+        
+        Returns:
+            (KB시세 원본, 검증된 KB시세 또는 None) - 원본은 하한가 추출에 사용
+        """
         kb_price_raw = property_data.get("kb_price")
-        log_print(f"DEBUG: BaseCalculator.calculate - kb_price_raw: {kb_price_raw}, type: {type(kb_price_raw)}")
-        logger.debug(f"BaseCalculator.calculate - kb_price_raw: {kb_price_raw}, type: {type(kb_price_raw)}")
+        logger.debug("BaseCalculator.calculate - kb_price_raw: %s, type: %s", kb_price_raw, type(kb_price_raw))
         kb_price = self.validate_kb_price(kb_price_raw)
-        log_print(f"DEBUG: BaseCalculator.calculate - kb_price after validation: {kb_price}")
-        logger.debug(f"BaseCalculator.calculate - kb_price after validation: {kb_price}")
+        logger.debug("BaseCalculator.calculate - kb_price after validation: %s", kb_price)
         
         # 빌라인 경우 KB시세가 없으면 특이사항에서 KB AI시세 추출 시도
         if kb_price is None:
@@ -221,22 +372,20 @@ class BaseCalculator:
                 special_notes = property_data.get("special_notes", "") or ""
                 kb_ai_price = extract_kb_ai_price_from_special_notes(special_notes)
                 if kb_ai_price is not None:
-                    log_print(f"DEBUG: BaseCalculator.calculate - 빌라인 경우 KB AI시세 추출: {kb_ai_price}만원")
-                    logger.info(f"BaseCalculator.calculate - 빌라인 경우 KB AI시세 추출: {kb_ai_price}만원")
+                    logger.info("BaseCalculator.calculate - 빌라인 경우 KB AI시세 추출: %s만원", kb_ai_price)
                     kb_price = kb_ai_price
                     kb_price_raw = f"KB AI시세: {kb_ai_price}만원"  # 원본도 업데이트 (하한가 추출 등에 사용)
         
-        if kb_price is None:
-            log_print(f"DEBUG: BaseCalculator.calculate - KB price is None, returning None")
-            logger.warning("BaseCalculator.calculate - KB price is None, returning None")
-            validation_errors.append("KB시세 정보가 없어 취급 불가합니다")
-            return {
-                "bank_name": self.bank_name,
-                "results": [],
-                "conditions": self.config.get("conditions", []),
-                "errors": validation_errors,
-                "min_amount": self.config.get("min_amount", 3000)
-            }
+        return kb_price_raw, kb_price
+    
+    def _collect_validation_errors(self, property_data: Dict[str, Any], kb_price: float) -> List[str]:
+        """
+        부동산 타입별 조건, 최소 KB시세, 특이사항 불가 키워드, 고객 나이 검증
+        
+        Returns:
+            검증 오류 메시지 리스트 (없으면 빈 리스트)
+        """
+        validation_errors = []
         
         # property_type_conditions 체크 (부동산 타입별 조건 확인)
         property_type_conditions = self.config.get("property_type_conditions", {})
@@ -250,15 +399,13 @@ class BaseCalculator:
                     if min_household_count is not None:
                         household_count = property_data.get("household_count")
                         if household_count is None or household_count < min_household_count:
-                            log_print(f"DEBUG: BaseCalculator.calculate - {prop_type} 세대수 {household_count} < min_household_count {min_household_count}, 취급 불가")
-                            logger.warning(f"BaseCalculator.calculate - {prop_type} 세대수 {household_count} < min_household_count {min_household_count}, 취급 불가")
+                            logger.info("BaseCalculator.calculate - %s 세대수 %s < min_household_count %s, 취급 불가", prop_type, household_count, min_household_count)
                             validation_errors.append(f"{prop_type}은(는) 최소 {min_household_count}세대 이상이어야 취급 가능합니다 (현재: {household_count or '정보없음'}세대)")
                     
                     # min_kb_price 체크 (property_type_conditions의 min_kb_price가 우선)
                     min_kb_price_for_type = conditions.get("min_kb_price")
                     if min_kb_price_for_type is not None and kb_price < min_kb_price_for_type:
-                        log_print(f"DEBUG: BaseCalculator.calculate - {prop_type} KB price {kb_price}만원 < min_kb_price {min_kb_price_for_type}만원, 취급 불가")
-                        logger.warning(f"BaseCalculator.calculate - {prop_type} KB price {kb_price}만원 < min_kb_price {min_kb_price_for_type}만원, 취급 불가")
+                        logger.info("BaseCalculator.calculate - %s KB price %s만원 < min_kb_price %s만원, 취급 불가", prop_type, kb_price, min_kb_price_for_type)
                         validation_errors.append(f"{prop_type}은(는) KB시세 {kb_price:,.0f}만원이 최소 {min_kb_price_for_type:,.0f}만원 이상이어야 취급 가능합니다 (현재: {kb_price:,.0f}만원, 부족: {min_kb_price_for_type - kb_price:,.0f}만원)")
                     break  # 첫 번째 매칭되는 타입만 체크
         
@@ -274,15 +421,13 @@ class BaseCalculator:
                         break
             
             if not already_checked and kb_price < min_kb_price:
-                log_print(f"DEBUG: BaseCalculator.calculate - KB price {kb_price}만원 < min_kb_price {min_kb_price}만원, 취급 불가")
-                logger.warning(f"BaseCalculator.calculate - KB price {kb_price}만원 < min_kb_price {min_kb_price}만원, 취급 불가")
+                logger.info("BaseCalculator.calculate - KB price %s만원 < min_kb_price %s만원, 취급 불가", kb_price, min_kb_price)
                 validation_errors.append(f"KB시세 {kb_price:,.0f}만원은 최소 {min_kb_price:,.0f}만원 이상이어야 취급 가능합니다 (현재: {kb_price:,.0f}만원, 부족: {min_kb_price - kb_price:,.0f}만원)")
         
         # 특이사항 검증: 불가 키워드 체크
         special_notes = property_data.get("special_notes", "") or ""
-        # 기본 불가 키워드
-        restricted_keywords = ["압류", "가압류", "경매취하자금"]
-        # 추가 불가 키워드 (미래하우스론 등 특정 상품용)
+        # 기본 불가 키워드 + 추가 불가 키워드 (미래하우스론 등 특정 상품용)
+        restricted_keywords = list(self.RESTRICTED_KEYWORDS)
         additional_restricted_keywords = self.config.get("additional_restricted_keywords", [])
         if additional_restricted_keywords:
             restricted_keywords.extend(additional_restricted_keywords)
@@ -291,8 +436,7 @@ class BaseCalculator:
         for keyword in restricted_keywords:
             if keyword in special_notes:
                 found_keywords.append(keyword)
-                log_print(f"DEBUG: BaseCalculator.calculate - 특이사항에 '{keyword}' 발견, 취급 불가")
-                logger.warning(f"BaseCalculator.calculate - 특이사항에 '{keyword}' 발견, 취급 불가")
+                logger.info("BaseCalculator.calculate - 특이사항에 '%s' 발견, 취급 불가", keyword)
         
         if found_keywords:
             validation_errors.append(f"특이사항에 '{', '.join(found_keywords)}'가 포함되어 취급 불가합니다")
@@ -305,182 +449,147 @@ class BaseCalculator:
                 try:
                     age_int = int(age)
                     if age_int > max_age:
-                        log_print(f"DEBUG: BaseCalculator.calculate - 나이 {age_int}세 > max_age {max_age}세, 취급 불가")
-                        logger.warning(f"BaseCalculator.calculate - 나이 {age_int}세 > max_age {max_age}세, 취급 불가")
+                        logger.info("BaseCalculator.calculate - 나이 %s세 > max_age %s세, 취급 불가", age_int, max_age)
                         validation_errors.append(f"고객 나이 {age_int}세는 {max_age}세 이하여야 취급 가능합니다 (초과: {age_int - max_age}세)")
                 except (ValueError, TypeError):
                     pass  # 나이가 숫자가 아니면 무시
         
-        # 검증 오류가 있으면 즉시 반환
-        if validation_errors:
-            return {
-                "bank_name": self.bank_name,
-                "results": [],
-                "conditions": self.config.get("conditions", []),
-                "errors": validation_errors,
-                "min_amount": self.config.get("min_amount", 3000)
-            }
+        return validation_errors
+    
+    def _lower_bound_floor(self, property_data: Dict[str, Any]) -> Optional[int]:
+        """
+        하한가 적용 조건 확인: 하한가 설정이 켜져 있고 아파트/주상복합 1층 또는 2층
         
-        # 하한가 적용 조건 확인
+        Returns:
+            조건을 만족하면 층수, 아니면 None
+        """
         lower_bound_config = self.config.get("lower_bound_price", {})
-        if lower_bound_config.get("enabled", False):
-            # 하한가 적용 조건 확인
-            property_type = property_data.get("property_type", "")
-            address = property_data.get("address", "")
-            
-            # 아파트/주상복합 확인
-            is_apartment_or_complex = property_type and ("아파트" in property_type or "주상복합" in property_type)
-            
-            # 1,2층 확인 (주소에서 층수 추출)
-            floor = None
-            if address:
-                import re
-                floor_match = re.search(r'(\d+)층', address)
-                if floor_match:
-                    floor = int(floor_match.group(1))
-            
-            # 하한가 적용 조건: 아파트/주상복합이고 1층 또는 2층
-            if is_apartment_or_complex and floor in [1, 2]:
-                lower_bound_price = extract_lower_bound_price(kb_price_raw)
-                if lower_bound_price is not None:
-                    log_print(f"DEBUG: BaseCalculator.calculate - 하한가 적용: 일반가 {kb_price}만원 -> 하한가 {lower_bound_price}만원 (아파트/주상복합 {floor}층)")
-                    logger.info(f"BaseCalculator.calculate - 하한가 적용: 일반가 {kb_price}만원 -> 하한가 {lower_bound_price}만원 (아파트/주상복합 {floor}층)")
-                    kb_price = lower_bound_price
-                else:
-                    log_print(f"DEBUG: BaseCalculator.calculate - 하한가 적용 조건 충족하지만 하한가 추출 실패")
-                    logger.warning("BaseCalculator.calculate - 하한가 적용 조건 충족하지만 하한가 추출 실패")
-        
-        # 지역 확인
-        region = property_data.get("region", "")
-        if not region:
-            log_print(f"DEBUG: BaseCalculator.calculate - region is empty")
-            logger.warning("BaseCalculator.calculate - region is empty")
+        if not lower_bound_config.get("enabled", False):
             return None
         
+        property_type = property_data.get("property_type", "")
+        address = property_data.get("address", "")
+        
+        # 아파트/주상복합 확인
+        is_apartment_or_complex = property_type and ("아파트" in property_type or "주상복합" in property_type)
+        
+        # 1,2층 확인 (주소에서 층수 추출)
+        floor = None
+        if address:
+            floor_match = FLOOR_PATTERN.search(address)
+            if floor_match:
+                floor = int(floor_match.group(1))
+        
+        if is_apartment_or_complex and floor in [1, 2]:
+            return floor
+        return None
+    
+    def _apply_lower_bound_price(self, property_data: Dict[str, Any], kb_price_raw: Any, kb_price: float) -> float:
+        """하한가 적용 조건을 만족하면 KB시세 원본에서 하한가를 추출하여 사용"""
+        floor = self._lower_bound_floor(property_data)
+        if floor is None:
+            return kb_price
+        
+        lower_bound_price = extract_lower_bound_price(kb_price_raw)
+        if lower_bound_price is not None:
+            logger.info("BaseCalculator.calculate - 하한가 적용: 일반가 %s만원 -> 하한가 %s만원 (아파트/주상복합 %s층)", kb_price, lower_bound_price, floor)
+            return lower_bound_price
+        logger.warning("BaseCalculator.calculate - 하한가 적용 조건 충족하지만 하한가 추출 실패")
+        return kb_price
+    
+    def _check_region(self, region: str) -> tuple:
+        """
+        지역 및 급지 검증
+        
+        Returns:
+            (지역 검증 오류 메시지 리스트, 급지)
+        """
         # 메인 계산기 전체 지역 리스트 기준 검증
         region_clean = region.replace(" ", "")
-        is_valid_region = False
-        for valid_region in self.ALL_REGIONS:
-            if valid_region.replace(" ", "") == region_clean:
-                is_valid_region = True
-                break
+        is_valid_region = region_clean in self.VALID_REGIONS
         
         # 지역 및 급지 검증 오류 수집
         region_errors = []
         
         if not is_valid_region:
-            print(f"DEBUG: BaseCalculator.calculate - Region {region} is not in ALL_REGIONS list, 취급 불가지역")
+            logger.debug("BaseCalculator.calculate - Region %s is not in ALL_REGIONS list, 취급 불가지역", region)
             region_errors.append(f"지역 '{region}'은(는) 취급 가능한 지역 목록에 없습니다")
         
         # 대상 지역 확인 (광역 단위로 체크)
         target_regions = self.config.get("target_regions", [])
         if target_regions:
             is_target_region = False
-            # 약자 매핑 (target_regions의 약자를 실제 지역명으로 변환)
-            region_abbreviation_map = {
-                "경북": "경상북도",
-                "경남": "경상남도",
-                "충북": "충청북도",
-                "충남": "충청남도",
-                "전북": "전라북도",
-                "전남": "전라남도",
-                "강원": "강원특별자치도"
-            }
-            
             for target in target_regions:
                 # 약자 매핑 적용
-                target_full = region_abbreviation_map.get(target, target)
+                target_full = self.REGION_ABBREVIATIONS.get(target, target)
                 if target_full in region or target in region:  # "서울" in "서울특별시광진구" 또는 "경상북도" in "경상북도구미시"
                     is_target_region = True
                     break
             if not is_target_region:
-                print(f"DEBUG: BaseCalculator.calculate - Region {region} is not in target regions: {target_regions}")
+                logger.debug("BaseCalculator.calculate - Region %s is not in target regions: %s", region, target_regions)
                 target_regions_str = ", ".join(target_regions)
                 region_errors.append(f"지역 '{region}'은(는) 취급 대상 지역({target_regions_str})에 해당하지 않습니다")
         
         # 급지 확인
         grade = self.get_region_grade(region)
-        print(f"DEBUG: BaseCalculator.calculate - region: {region}, grade: {grade}")
+        logger.debug("BaseCalculator.calculate - region: %s, grade: %s", region, grade)
         if grade is None:
-            print(f"DEBUG: BaseCalculator.calculate - grade is None for region: {region}, 취급 불가지역")
+            logger.debug("BaseCalculator.calculate - grade is None for region: %s, 취급 불가지역", region)
             region_errors.append(f"지역 '{region}'의 급지 정보가 없어 취급 불가합니다")
         
         # 6급지인 경우 취급 불가지역으로 처리
         if grade == 6:
-            print(f"DEBUG: BaseCalculator.calculate - grade 6 for region: {region}, 취급 불가지역")
+            logger.debug("BaseCalculator.calculate - grade 6 for region: %s, 취급 불가지역", region)
             region_errors.append(f"지역 '{region}'은(는) 6급지로 취급 불가합니다")
         
-        # 지역 검증 오류가 있으면 반환
-        if region_errors:
-            return {
-                "bank_name": self.bank_name,
-                "results": [],
-                "conditions": self.config.get("conditions", []),
-                "errors": region_errors,
-                "min_amount": self.config.get("min_amount", 3000)
-            }
+        return region_errors, grade
+    
+    def _check_area_limit(self, property_data: Dict[str, Any], region: str) -> Optional[str]:
+        """
+        면적 제한 확인 (area_limit 설정이 있는 금융사만)
         
-        # 면적 제한 확인 (BNK캐피탈 등 특정 금융사만)
+        Returns:
+            면적 초과 시 오류 메시지, 아니면 None
+        """
         area_limit_config = self.config.get("area_limit", {})
-        if area_limit_config.get("enabled", False):
-            area = property_data.get("area")
-            if area is not None:
-                max_area = area_limit_config.get("max_area", 135)
-                excluded_regions = area_limit_config.get("excluded_regions", [])
-                
-                # 제외 지역(서울 등)이 아니고 면적이 제한을 초과하면 불가
-                is_excluded_region = False
-                for excluded in excluded_regions:
-                    if excluded in region:
-                        is_excluded_region = True
-                        break
-                
-                if not is_excluded_region and area > max_area:
-                    print(f"DEBUG: BaseCalculator.calculate - area {area}㎡ > max_area {max_area}㎡ for region {region}, 취급 불가")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": [f"면적 {area}㎡는 서울지역 이외에서는 최대 {max_area}㎡까지 취급 가능합니다 (초과: {area - max_area}㎡)"],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
-        
-        # 기준 LTV 이하 지역 확인
-        below_standard_ltv = self.get_below_standard_ltv(region)
-        is_below_standard = below_standard_ltv is not None
-        
-        # OK저축은행 가계자금인 경우 확인 (최대 LTV 계산 전에 먼저 확인)
-        is_ok_bank = self.bank_name == "OK저축은행" or "OK저축은행" in self.bank_name or "오케이저축은행" in self.bank_name
-        is_household_for_ok = False
-        if is_ok_bank:
-            # product_type이 "household"이면 가계자금
-            is_household_for_ok = product_type == "household"
+        if not area_limit_config.get("enabled", False):
+            return None
         
-        # 최대 LTV 확인 (1급지인 경우 A/B 그룹 구분)
-        # OK저축은행인 경우 면적과 신용점수 등급을 고려
-        # property_data에 product_type 정보 추가 (get_max_ltv_by_grade에서 사용)
-        if is_household_for_ok:
-            property_data_with_type = property_data.copy()
-            property_data_with_type["_product_type"] = "household"
-            max_ltv = self.get_max_ltv_by_grade(grade, region, property_data_with_type)
-        else:
-            property_data_with_type = property_data.copy()
-            property_data_with_type["_product_type"] = "business"
-            max_ltv = self.get_max_ltv_by_grade(grade, region, property_data_with_type)
-        print(f"DEBUG: BaseCalculator.calculate - grade: {grade}, max_ltv: {max_ltv}, below_standard_ltv: {below_standard_ltv}")  # 추가
-        if max_ltv is None or max_ltv == 0:
-            print(f"DEBUG: BaseCalculator.calculate - max_ltv is None or 0 for grade {grade}, returning None")  # 추가
+        area = property_data.get("area")
+        if area is None:
             return None
         
-        # 기준 LTV 이하 지역인 경우 해당 LTV를 최대 LTV로 사용
-        if is_below_standard:
-            max_ltv = below_standard_ltv
-            print(f"DEBUG: BaseCalculator.calculate - 기준 LTV 이하 지역: {region}, 적용 LTV: {max_ltv}%")
+        max_area = area_limit_config.get("max_area", 135)
+        excluded_regions = area_limit_config.get("excluded_regions", [])
         
-        # 기존 근저당권 총액 계산 (채권최고액 기준)
-        mortgages = property_data.get("mortgages", [])
+        # 제외 지역(서울 등)이 아니고 면적이 제한을 초과하면 불가
+        is_excluded_region = False
+        for excluded in excluded_regions:
+            if excluded in region:
+                is_excluded_region = True
+                break
+        
+        if not is_excluded_region and area > max_area:
+            logger.debug("BaseCalculator.calculate - area %s㎡ > max_area %s㎡ for region %s, 취급 불가", area, max_area, region)
+            return f"면적 {area}㎡는 서울지역 이외에서는 최대 {max_area}㎡까지 취급 가능합니다 (초과: {area - max_area}㎡)"
+        return None
+    
+    def _get_product_max_ltv(self, grade: Union[int, str], region: str, property_data: Dict[str, Any], is_household_for_ok: bool) -> Optional[float]:
+        """
+        상품별 최대 LTV 조회
+        OK저축은행인 경우 면적과 신용점수 등급을 고려 (get_max_ltv_by_grade에 상품 구분 전달)
+        """
+        property_data_with_type = property_data.copy()
+        property_data_with_type["_product_type"] = "household" if is_household_for_ok else "business"
+        return self.get_max_ltv_by_grade(grade, region, property_data_with_type)
+    
+    def _split_mortgages(self, mortgages: List[Dict[str, Any]], property_data: Dict[str, Any], is_household_for_ok: bool) -> tuple:
+        """
+        대환할 근저당권과 나머지 근저당권 구분 (여러 개 대비하여 누적합으로 처리)
         
-        # 대환할 근저당권 찾기 (여러 개 대비하여 누적합으로 처리)
+        Returns:
+            (대환할 근저당권 원금 합계, 대환하는 금융사 이름 리스트(가계자금용), 나머지 근저당권 리스트)
+        """
         refinance_principal = 0.0  # 대환할 근저당권 원금 합계
         refinance_institutions = []  # 대환하는 금융사 이름 리스트 (가계자금용)
         other_mortgages = []  # 나머지 근저당권들
@@ -495,7 +604,7 @@ class BaseCalculator:
                 institution = mortgage.get("institution", "")
                 # 물상담보 체크
                 if "물상" in institution or "물상담보" in institution:
-                    print(f"DEBUG: BaseCalculator.calculate - 가계자금: 물상담보는 대환 불가 - {institution}")
+                    logger.debug("BaseCalculator.calculate - 가계자금: 물상담보는 대환 불가 - %s", institution)
                     other_mortgages.append(mortgage)
                     continue
                 
@@ -515,7 +624,7 @@ class BaseCalculator:
                         mortgage_amount = float(mortgage.get("amount", 0) or 0)
                         refinance_principal += mortgage_amount
                         refinance_institutions.append(institution)
-                        print(f"DEBUG: BaseCalculator.calculate - 가계자금 대환: priority={mortgage.get('priority')}, institution={institution}, principal={mortgage_amount}만원")
+                        logger.debug("BaseCalculator.calculate - 가계자금 대환: priority=%s, institution=%s, principal=%s만원", mortgage.get('priority'), institution, mortgage_amount)
                     else:
                         # 대환 요청이 없으면 후순위로 처리
                         other_mortgages.append(mortgage)
@@ -525,7 +634,7 @@ class BaseCalculator:
         else:
             # 일반 처리
             # BNK캐피탈인 경우 대환 가능 기관 체크
-            is_bnk = self.bank_name == "BNK캐피탈" or "BNK캐피탈" in self.bank_name or "비엔케이캐피탈" in self.bank_name
+            is_bnk = self.is_bnk_bank_name(self.bank_name)
             refinanceable_institutions = self.config.get("refinanceable_institutions", []) if is_bnk else []
             
             for mortgage in mortgages:
@@ -546,7 +655,7 @@ class BaseCalculator:
                         # 리스트에 없지만 '사업자금' 문자열이 있으면 대환 가능
                         if not can_refinance and "사업자금" in institution:
                             can_refinance = True
-                            print(f"DEBUG: BaseCalculator.calculate - BNK캐피탈: '{institution}'에 '사업자금' 포함되어 대환 가능")
+                            logger.debug("BaseCalculator.calculate - BNK캐피탈: '%s'에 '사업자금' 포함되어 대환 가능", institution)
                     else:
                         # BNK캐피탈이 아니면 대환 가능
                         can_refinance = True
@@ -554,174 +663,150 @@ class BaseCalculator:
                     if can_refinance:
                         mortgage_amount = float(mortgage.get("amount", 0) or 0)
                         refinance_principal += mortgage_amount
-                        print(f"DEBUG: BaseCalculator.calculate - 대환할 근저당권 발견: priority={mortgage.get('priority')}, institution={institution}, principal={mortgage_amount}만원")
+                        logger.debug("BaseCalculator.calculate - 대환할 근저당권 발견: priority=%s, institution=%s, principal=%s만원", mortgage.get('priority'), institution, mortgage_amount)
                     else:
                         # 대환 불가능한 기관은 후순위로 처리
-                        print(f"DEBUG: BaseCalculator.calculate - BNK캐피탈: '{institution}'는 대환 가능 기관이 아니므로 후순위로 처리")
+                        logger.debug("BaseCalculator.calculate - BNK캐피탈: '%s'는 대환 가능 기관이 아니므로 후순위로 처리", institution)
                         other_mortgages.append(mortgage)
                 else:
                     other_mortgages.append(mortgage)
         
-        # 나머지 근저당권의 채권최고액만 합산
+        return refinance_principal, refinance_institutions, other_mortgages
+    
+    def _deductible_mortgage_total(self, other_mortgages: List[Dict[str, Any]]) -> float:
+        """
+        가용 한도에서 차감할 기존 근저당권 금액 (대환 제외 나머지 근저당권의 채권최고액 합계)
+        OK저축은행이고 원금 기준 계산이 설정된 경우 원금 합계
+        """
         total_mortgage = self.calculate_total_mortgage(other_mortgages)
         
         # OK저축은행인 경우 원금 기준으로 차감하는지 확인
-        is_ok_bank = self.bank_name == "OK저축은행" or "OK저축은행" in self.bank_name or "오케이저축은행" in self.bank_name
         use_principal_for_ok = self.config.get("use_principal_for_calculation", False)  # 원금 기준 계산 여부
-        
-        if is_ok_bank and use_principal_for_ok:
+        if self.is_ok_bank_name(self.bank_name) and use_principal_for_ok:
             # OK저축은행이고 원금 기준 계산이 설정된 경우: 원금 합계 사용
             total_mortgage_principal = sum(float(m.get("amount", 0) or 0) for m in other_mortgages)
-            print(f"DEBUG: BaseCalculator.calculate - OK저축은행 원금 기준 계산: total_mortgage_principal={total_mortgage_principal}만원 (기존 채권최고액: {total_mortgage}만원)")
+            logger.debug("BaseCalculator.calculate - OK저축은행 원금 기준 계산: total_mortgage_principal=%s만원 (기존 채권최고액: %s만원)", total_mortgage_principal, total_mortgage)
             total_mortgage = total_mortgage_principal
         
-        print(f"DEBUG: BaseCalculator.calculate - mortgages: {mortgages}")  # 추가
-        print(f"DEBUG: BaseCalculator.calculate - refinance_principal(대환 원금 합계): {refinance_principal}만원, total_mortgage(차감할 금액): {total_mortgage}")  # 추가
+        return total_mortgage
+    
+    def _check_refinanceable(self, mortgages: List[Dict[str, Any]], refinance_principal: float) -> Optional[List[str]]:
+        """
+        BNK캐피탈: 대환 요청은 있었지만 대환 가능한 기관이 없는지 확인
         
-        # BNK캐피탈인 경우 대환 요청이 있었는데 대환 가능한 기관이 없는지 확인
-        is_bnk = self.bank_name == "BNK캐피탈" or "BNK캐피탈" in self.bank_name or "비엔케이캐피탈" in self.bank_name
-        if is_bnk:
-            # 대환 요청된 근저당권이 있는지 확인
-            has_refinance_request = any(m.get("is_refinance", False) for m in mortgages)
-            if has_refinance_request and refinance_principal == 0:
-                # 대환 요청은 있었지만 대환 가능한 기관이 없음
-                requested_institutions = []
-                for mortgage in mortgages:
-                    if mortgage.get("is_refinance", False):
-                        requested_institutions.append(mortgage.get("institution", ""))
-                
-                institutions_str = ", ".join(requested_institutions) if requested_institutions else "요청된 기관"
-                refinanceable_list = self.config.get("refinanceable_institutions", [])
-                refinanceable_str = ", ".join(refinanceable_list[:5]) + ("..." if len(refinanceable_list) > 5 else "")
-                
-                return {
-                    "bank_name": self.bank_name,
-                    "results": [],
-                    "conditions": self.config.get("conditions", []),
-                    "errors": [
-                        f"대환 요청된 기관({institutions_str})이 대환 가능 기관 목록에 없습니다",
-                        f"대환 가능 기관: {refinanceable_str}",
-                        f"참고: 기관명에 '사업자금'이 포함된 경우에도 대환 가능합니다"
-                    ],
-                    "min_amount": self.config.get("min_amount", 3000)
-                }
+        Returns:
+            대환 불가 시 오류 메시지 리스트, 아니면 None
+        """
+        if not self.is_bnk_bank_name(self.bank_name):
+            return None
         
-        # 대환 여부 판단
-        is_refinance = refinance_principal > 0
+        # 대환 요청된 근저당권이 있는지 확인
+        has_refinance_request = any(m.get("is_refinance", False) for m in mortgages)
+        if not has_refinance_request or refinance_principal != 0:
+            return None
         
-        # 가계자금인 경우: 대환 요청된 금융사가 가계자금으로 대환 가능한 경우에만 산출
-        if is_household_for_ok:
-            # 대환 요청된 근저당권 중 가계자금으로 대환 가능한 것이 있는지 확인
-            # (refinance_institutions에 추가된 것들이 가계자금으로 대환 가능한 근저당권)
-            has_household_refinance = len(refinance_institutions) > 0
-            
-            # 가계자금으로 대환 가능한 근저당권이 없으면 가계자금 산출하지 않음 (None 반환하여 아무것도 표시하지 않음)
-            if not has_household_refinance:
-                print(f"DEBUG: BaseCalculator.calculate - 가계자금: 대환 요청된 금융사 중 가계자금으로 대환 가능한 것이 없어서 산출하지 않음")
-                return None
-            
-            # 가계자금으로 대환 가능한 근저당권이 있으면 산출 진행
-            if is_refinance:
-                print(f"DEBUG: BaseCalculator.calculate - 가계자금: 대환 요청 있음, 대환으로 진행 (대환 금융사: {refinance_institutions})")
-            else:
-                print(f"DEBUG: BaseCalculator.calculate - 가계자금: 대환할 근저당권 없음, 후순위로 산출")
+        # 대환 요청은 있었지만 대환 가능한 기관이 없음
+        requested_institutions = []
+        for mortgage in mortgages:
+            if mortgage.get("is_refinance", False):
+                requested_institutions.append(mortgage.get("institution", ""))
+        
+        institutions_str = ", ".join(requested_institutions) if requested_institutions else "요청된 기관"
+        refinanceable_list = self.config.get("refinanceable_institutions", [])
+        refinanceable_str = ", ".join(refinanceable_list[:5]) + ("..." if len(refinanceable_list) > 5 else "")
+        
+        return [
+            f"대환 요청된 기관({institutions_str})이 대환 가능 기관 목록에 없습니다",
+            f"대환 가능 기관: {refinanceable_str}",
+            f"참고: 기관명에 '사업자금'이 포함된 경우에도 대환 가능합니다"
+        ]
+    
+    def _ok_product_kind(self, product_type: Optional[str]) -> tuple:
+        """
+        OK 저축은행 사업자/가계 상품 구분
         
-        # OK 저축은행 사업자/가계 상품 구분
-        is_ok_bank = self.bank_name == "OK저축은행" or "OK저축은행" in self.bank_name or "오케이저축은행" in self.bank_name
+        Returns:
+            (사업자 상품 여부, 가계 상품 여부) - OK저축은행이 아니면 (False, False)
+        """
         is_business_product = False
         is_household_product = False
         
-        if is_ok_bank:
-            # product_type 파라미터가 있으면 그것을 우선 사용
-            if product_type == "household":
+        if not self.is_ok_bank_name(self.bank_name):
+            return is_business_product, is_household_product
+        
+        # product_type 파라미터가 있으면 그것을 우선 사용
+        if product_type == "household":
+            is_household_product = True
+        elif product_type == "business":
+            is_business_product = True
+        else:
+            # bank_name이 사업자 상품명 리스트에 있는지 확인
+            business_product_names = self.config.get("business_product_names", [])
+            bank_name_clean = self.bank_name.replace(" ", "")
+            
+            # 사업자 상품명 확인 (현대캐피탈 가계/가계자금 제외)
+            for product_name in business_product_names:
+                product_name_clean = product_name.replace(" ", "")
+                if product_name_clean in bank_name_clean:
+                    # "가계" 또는 "가계자금"이 포함되어 있으면 가계 상품
+                    if "가계" in bank_name_clean or "가계자금" in bank_name_clean:
+                        is_household_product = True
+                    else:
+                        is_business_product = True
+                    break
+            
+            # OK저축은행이지만 사업자 상품명 리스트에 없으면 가계 상품으로 간주
+            if not is_business_product and not is_household_product:
                 is_household_product = True
-                is_household_for_ok = True
-            elif product_type == "business":
-                is_business_product = True
-                is_household_for_ok = False
-            else:
-                # bank_name이 사업자 상품명 리스트에 있는지 확인
-                business_product_names = self.config.get("business_product_names", [])
-                bank_name_clean = self.bank_name.replace(" ", "")
-                
-                # 사업자 상품명 확인 (현대캐피탈 가계/가계자금 제외)
+        
+        return is_business_product, is_household_product
+    
+    def _check_business_refinance(self, mortgages: List[Dict[str, Any]]) -> tuple:
+        """
+        OK 저축은행 사업자 상품: business_product_names에 있는 기관만 대환 가능
+        
+        Returns:
+            (대환하는 금융사 이름 리스트, 대환 불가 시 오류 메시지 리스트 또는 None)
+        """
+        # 대환할 근저당권이 business_product_names에 있는지 확인
+        business_product_names = self.config.get("business_product_names", [])
+        can_refinance = False
+        refinance_institutions = []
+        
+        for mortgage in mortgages:
+            if mortgage.get("is_refinance", False):
+                institution = mortgage.get("institution", "")
+                institution_clean = institution.replace(" ", "")
                 for product_name in business_product_names:
                     product_name_clean = product_name.replace(" ", "")
-                    if product_name_clean in bank_name_clean:
-                        # "가계" 또는 "가계자금"이 포함되어 있으면 가계 상품
-                        if "가계" in bank_name_clean or "가계자금" in bank_name_clean:
-                            is_household_product = True
-                        else:
-                            is_business_product = True
+                    if product_name_clean in institution_clean:
+                        can_refinance = True
+                        refinance_institutions.append(institution)
                         break
-                
-                # OK저축은행이지만 사업자 상품명 리스트에 없으면 가계 상품으로 간주
-                if not is_business_product and not is_household_product:
-                    is_household_product = True
-            
-            # 사업자 상품인 경우: business_product_names에 있는 기관만 대환 가능
-            if is_business_product and is_refinance:
-                # 대환할 근저당권이 business_product_names에 있는지 확인
-                business_product_names = self.config.get("business_product_names", [])
-                can_refinance = False
-                refinance_institutions = []
-                
-                for mortgage in mortgages:
-                    if mortgage.get("is_refinance", False):
-                        institution = mortgage.get("institution", "")
-                        institution_clean = institution.replace(" ", "")
-                        for product_name in business_product_names:
-                            product_name_clean = product_name.replace(" ", "")
-                            if product_name_clean in institution_clean:
-                                can_refinance = True
-                                refinance_institutions.append(institution)
-                                break
-                
-                if not can_refinance:
-                    print(f"DEBUG: BaseCalculator.calculate - OK 저축은행 사업자 상품: 대환 요청된 기관이 사업자 상품이 아님")
-                    # 대환 요청된 기관 목록 추출
-                    requested_institutions = []
-                    for mortgage in mortgages:
-                        if mortgage.get("is_refinance", False):
-                            requested_institutions.append(mortgage.get("institution", ""))
-                    
-                    institutions_str = ", ".join(requested_institutions) if requested_institutions else "요청된 기관"
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": [
-                            f"사업자 상품은 사업자금 기관만 대환 가능합니다",
-                            f"대환 요청된 기관({institutions_str})이 사업자 상품 대환 가능 기관 목록에 없습니다"
-                        ],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
         
-        # 사업자/가계 상품 정보를 인스턴스 변수로 저장 (get_interest_rate에서 사용)
-        self._is_business_product = is_business_product
-        self._is_household_product = is_household_product
-        self._is_subordinate = len(other_mortgages) > 0  # 후순위 여부
-        self._current_property_data = property_data
+        if can_refinance:
+            return refinance_institutions, None
         
-        # 가계 상품: 빌라인 경우 선순위만 산출
-        if is_household_product:
-            property_type = property_data.get("property_type", "")
-            if property_type and "빌라" in property_type:
-                # 선순위만 산출 (기존 근저당권이 없어야 함)
-                if len(other_mortgages) > 0:
-                    print(f"DEBUG: BaseCalculator.calculate - OK 저축은행 가계 상품, 빌라인 경우 선순위만 산출 가능")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": ["빌라인 경우 선순위만 산출 가능"],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
-        
-        # 신용점수/등급 확인
-        credit_score = property_data.get("credit_score")
-        credit_grade = self.credit_score_to_grade(credit_score)
+        logger.debug("BaseCalculator.calculate - OK 저축은행 사업자 상품: 대환 요청된 기관이 사업자 상품이 아님")
+        # 대환 요청된 기관 목록 추출
+        requested_institutions = []
+        for mortgage in mortgages:
+            if mortgage.get("is_refinance", False):
+                requested_institutions.append(mortgage.get("institution", ""))
+        
+        institutions_str = ", ".join(requested_institutions) if requested_institutions else "요청된 기관"
+        return refinance_institutions, [
+            f"사업자 상품은 사업자금 기관만 대환 가능합니다",
+            f"대환 요청된 기관({institutions_str})이 사업자 상품 대환 가능 기관 목록에 없습니다"
+        ]
+    
+    def _max_amount_limit(self, property_data: Dict[str, Any], region: str, is_household_product: bool) -> Optional[float]:
+        """
+        한도 제한 금액 (택시 관련 키워드 / 가계 상품 서울 수도권)
         
+        Returns:
+            한도 제한 금액 (만원) 또는 None (제한 없음)
+        """
         # 택시 관련 한도 제한 확인
         taxi_limit_config = self.config.get("taxi_limit", {})
         max_amount_limit = None
@@ -732,7 +817,7 @@ class BaseCalculator:
                 for keyword in keywords:
                     if keyword in special_notes:
                         max_amount_limit = taxi_limit_config.get("max_amount", 10000)  # 기본값 1억
-                        print(f"DEBUG: BaseCalculator.calculate - 택시 관련 키워드 '{keyword}' 발견, 한도 제한: {max_amount_limit}만원")
+                        logger.debug("BaseCalculator.calculate - 택시 관련 키워드 '%s' 발견, 한도 제한: %s만원", keyword, max_amount_limit)
                         break
         
         # 가계 상품: 서울 수도권 한도 제한 (1억)
@@ -750,20 +835,125 @@ class BaseCalculator:
                 # 기존 한도 제한이 없거나 더 큰 경우에만 적용
                 if max_amount_limit is None or max_amount_limit > household_limit_amount:
                     max_amount_limit = household_limit_amount
-                    print(f"DEBUG: BaseCalculator.calculate - OK 저축은행 가계 상품, 서울 수도권 한도 제한: {max_amount_limit}만원")
+                    logger.debug("BaseCalculator.calculate - OK 저축은행 가계 상품, 서울 수도권 한도 제한: %s만원", max_amount_limit)
         
-        # 가계자금인 경우 LTV 70% 고정
+        return max_amount_limit
+    
+    def _product_ltv_steps(self, max_ltv: float, is_household_for_ok: bool, is_business_product: bool) -> List[Any]:
+        """LTV 단계별 계산에 사용할 LTV 목록"""
+        # 가계자금인 경우 LTV 70%만 계산
         if is_household_for_ok:
-            max_ltv = 70
-            print(f"DEBUG: BaseCalculator.calculate - 가계자금: LTV 70% 고정")
+            return [70]
+        
+        all_ltv_steps = self.config.get("ltv_steps", [90, 85, 80, 75, 70, 65])
+        # 사업자금은 max_ltv_by_area_grade_credit에서 가능한 LTV만 사용
+        # max_ltv는 이미 get_max_ltv_by_grade에서 계산됨 -> ltv_steps에서 max_ltv 이하만 사용
+        if self.is_ok_bank_name(self.bank_name) and is_business_product:
+            ltv_steps = [ltv for ltv in all_ltv_steps if ltv <= max_ltv]
+            logger.debug("BaseCalculator.calculate - 사업자금: max_ltv=%s, filtered ltv_steps=%s", max_ltv, ltv_steps)
+            return ltv_steps
+        return all_ltv_steps
+    
+    def _evaluate_ltv_steps(self, plan: Dict[str, Any]) -> List[tuple]:
+        """
+        LTV 단계별 가용 한도 계산
+        
+        Args:
+            plan: _prepare_calculation이 만든 계산 계획
+        
+        Returns:
+            산출 가능한 LTV 단계의 (ltv, 금액, 전체 금액) 리스트 (100만 단위 절삭 후)
+        """
+        kb_price = plan["kb_price"]
+        max_ltv = plan["max_ltv"]
+        total_mortgage = plan["total_mortgage"]
+        is_refinance = plan["is_refinance"]
+        refinance_principal = plan["refinance_principal"]
+        is_ok_bank = plan["is_ok_bank"]
+        max_amount_limit = plan["max_amount_limit"]
+        
+        rows = []
+        for ltv in plan["ltv_steps"]:
+            # 최대 LTV를 초과하면 스킵
+            if ltv > max_ltv:
+                logger.debug("LTV %s > max_ltv %s, skipping", ltv, max_ltv)  # 추가
+                continue
+            
+            # 가용 한도 계산
+            # OK저축은행인 경우 특별한 계산 방식 적용
+            if is_ok_bank and not is_refinance:
+                # OK저축은행 후순위: 현재 LTV 한도에서 기존 근저당권이 차지하는 LTV 수준의 한도를 차감
+                # 기존 근저당권이 차지하는 LTV = total_mortgage / kb_price * 100
+                existing_ltv = (total_mortgage / kb_price) * 100 if kb_price > 0 else 0
+                # 기존 근저당권 LTV 수준의 한도 계산
+                existing_ltv_limit = kb_price * (existing_ltv / 100)
+                # 현재 LTV 한도에서 기존 근저당권 LTV 수준 한도를 차감
+                max_amount_principal = kb_price * (ltv / 100)
+                available_principal = max_amount_principal - existing_ltv_limit
+                amount_info = {
+                    "total_amount": max(0, available_principal),
+                    "available_amount": max(0, available_principal)
+                }
+                logger.debug("BaseCalculator.calculate - OK저축은행 특별 계산: ltv=%s%%, existing_ltv=%.2f%%, max_amount=%s, existing_limit=%s, available=%s", ltv, existing_ltv, max_amount_principal, existing_ltv_limit, available_principal)
+            else:
+                # 일반 계산 방식
+                amount_info = self.calculate_available_amount(
+                    kb_price, ltv, total_mortgage, is_refinance, refinance_principal
+                )
+            
+            logger.debug("LTV %s - amount_info: %s", ltv, amount_info)  # 추가
+            
+            # 가용 한도가 0 이하면 스킵 (대환인 경우는 마이너스여도 산출)
+            if not is_refinance and amount_info["available_amount"] <= 0:
+                logger.debug("LTV %s - available_amount <= 0, skipping", ltv)  # 추가
+                continue
+            
+            # 가계 상품 한도 제한 적용
+            final_amount = amount_info["available_amount"]
+            if max_amount_limit is not None and final_amount > max_amount_limit:
+                final_amount = max_amount_limit
+                logger.debug("BaseCalculator.calculate - 가계 상품 한도 제한 적용: %s만원 -> %s만원", amount_info['available_amount'], final_amount)
+            
+            # 100만 단위로 절삭
+            final_amount = self.round_down_to_hundred_thousand(final_amount)
+            final_total_amount = self.round_down_to_hundred_thousand(amount_info["total_amount"])
+            rows.append((ltv, final_amount, final_total_amount))
+        
+        return rows
+    
+    def _complete_calculation(self, plan: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        계산 계획(plan)으로 결과 생성 (calculate의 2단계)
+        
+        Args:
+            plan: _prepare_calculation이 만든 계산 계획
+        
+        Returns:
+            계산 결과 딕셔너리 또는 None (산출 불가 시)
+        """
+        kb_price = plan["kb_price"]
+        grade = plan["grade"]
+        max_ltv = plan["max_ltv"]
+        is_below_standard = plan["is_below_standard"]
+        other_mortgages = plan["other_mortgages"]
+        total_mortgage = plan["total_mortgage"]
+        is_refinance = plan["is_refinance"]
+        refinance_principal = plan["refinance_principal"]
+        refinance_institutions = plan["refinance_institutions"]
+        is_household_for_ok = plan["is_household_for_ok"]
+        credit_score = plan["credit_score"]
+        credit_grade = plan["credit_grade"]
+        max_amount_limit = plan["max_amount_limit"]
+        required_amount = plan["required_amount"]
+        
+        # 사업자/가계 상품 정보는 호출별 컨텍스트로 금리 조회에 전달 (계산기 인스턴스는 공유됨)
+        context = CalculationContext.from_plan(plan)
         
-        # 필요자금이 있으면 LTV별 계산을 건너뛰고 필요자금 기준으로 역산 계산
-        required_amount = property_data.get("required_amount")
         results = []
         
         # 택시 한도 제한이 적용되면 1억을 받기 위해 필요한 LTV를 역산
         if max_amount_limit is not None and not required_amount:
-            print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 적용, 1억을 받기 위한 LTV 역산")
+            logger.debug("BaseCalculator.calculate - 택시 한도 제한 적용, 1억을 받기 위한 LTV 역산")
             
             # 근저당권 채권최고액 계산 (대환할 근저당권 제외한 나머지만)
             mortgage_max_amount = 0.0
@@ -789,11 +979,11 @@ class BaseCalculator:
             required_total = limit_max_amount + mortgage_max_amount
             calculated_ltv = (required_total / kb_price) * 100
             
-            print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 LTV 역산: mortgage_max_amount(채권최고액)={mortgage_max_amount}만원, limit_max_amount={limit_max_amount}만원, required_total={required_total}만원, calculated_ltv={calculated_ltv:.2f}%")
+            logger.debug("BaseCalculator.calculate - 택시 한도 제한 LTV 역산: mortgage_max_amount(채권최고액)=%s만원, limit_max_amount=%s만원, required_total=%s만원, calculated_ltv=%.2f%%", mortgage_max_amount, limit_max_amount, required_total, calculated_ltv)
             
             # 계산된 LTV가 max_ltv를 초과하면 불가능
             if calculated_ltv > max_ltv:
-                print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 LTV {calculated_ltv:.2f}% > max_ltv {max_ltv}%, not possible")
+                logger.debug("BaseCalculator.calculate - 택시 한도 제한 LTV %.2f%% > max_ltv %s%%, not possible", calculated_ltv, max_ltv)
                 results = []
             else:
                 # 금리 조회를 위해 가장 가까운 ltv_steps 값 찾기
@@ -801,12 +991,12 @@ class BaseCalculator:
                 closest_ltv_for_rate = None
                 if ltv_steps:
                     closest_ltv_for_rate = min(ltv_steps, key=lambda x: abs(x - calculated_ltv))
-                    print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한, using closest LTV {closest_ltv_for_rate}% for rate lookup (calculated: {calculated_ltv:.2f}%)")
+                    logger.debug("BaseCalculator.calculate - 택시 한도 제한, using closest LTV %s%% for rate lookup (calculated: %.2f%%)", closest_ltv_for_rate, calculated_ltv)
                 else:
                     closest_ltv_for_rate = int(round(calculated_ltv))
                 
                 # 금리 조회
-                rate_info = self.get_interest_rate(credit_score, credit_grade, int(closest_ltv_for_rate), grade)
+                rate_info = self.get_interest_rate(credit_score, credit_grade, int(closest_ltv_for_rate), grade, context)
                 
                 # 결과 생성 (LTV는 정확히 계산된 값, 금액은 1억)
                 # 100만 단위로 절삭
@@ -827,10 +1017,10 @@ class BaseCalculator:
                 }
                 
                 results = [result]  # 하나의 결과만 반환
-                print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 결과 생성: LTV {calculated_ltv:.2f}%, amount {max_amount_limit}만원")
+                logger.debug("BaseCalculator.calculate - 택시 한도 제한 결과 생성: LTV %.2f%%, amount %s만원", calculated_ltv, max_amount_limit)
         
         elif required_amount:
-            print(f"DEBUG: BaseCalculator.calculate - required_amount: {required_amount}만원, calculating LTV from required amount (skipping LTV steps)")  # 추가
+            logger.debug("BaseCalculator.calculate - required_amount: %s만원, calculating LTV from required amount (skipping LTV steps)", required_amount)  # 추가
             
             # LTV 역산 공식 (채권최고액 기준):
             # 필요자금(원금)의 채권최고액 = 필요자금 * 1.2
@@ -861,11 +1051,11 @@ class BaseCalculator:
             required_total = required_max_amount + mortgage_max_amount
             calculated_ltv = (required_total / kb_price) * 100
             
-            print(f"DEBUG: BaseCalculator.calculate - mortgage_max_amount(채권최고액): {mortgage_max_amount}만원, required_max_amount(채권최고액): {required_max_amount}만원, required_total: {required_total}만원, calculated_ltv: {calculated_ltv:.2f}%")  # 추가
+            logger.debug("BaseCalculator.calculate - mortgage_max_amount(채권최고액): %s만원, required_max_amount(채권최고액): %s만원, required_total: %s만원, calculated_ltv: %.2f%%", mortgage_max_amount, required_max_amount, required_total, calculated_ltv)  # 추가
             
             # 계산된 LTV가 max_ltv를 초과하면 불가능
             if calculated_ltv > max_ltv:
-                print(f"DEBUG: BaseCalculator.calculate - calculated_ltv {calculated_ltv:.2f}% > max_ltv {max_ltv}%, not possible")  # 추가
+                logger.debug("BaseCalculator.calculate - calculated_ltv %.2f%% > max_ltv %s%%, not possible", calculated_ltv, max_ltv)  # 추가
                 results = []
             else:
                 # 계산된 정확한 LTV 사용 (ltv_steps에 없어도 됨)
@@ -875,12 +1065,12 @@ class BaseCalculator:
                 if ltv_steps:
                     # 계산된 LTV에 가장 가까운 ltv_steps 값 찾기
                     closest_ltv_for_rate = min(ltv_steps, key=lambda x: abs(x - calculated_ltv))
-                    print(f"DEBUG: BaseCalculator.calculate - using closest LTV {closest_ltv_for_rate}% for rate lookup (calculated: {calculated_ltv:.2f}%)")  # 추가
+                    logger.debug("BaseCalculator.calculate - using closest LTV %s%% for rate lookup (calculated: %.2f%%)", closest_ltv_for_rate, calculated_ltv)  # 추가
                 else:
                     closest_ltv_for_rate = int(round(calculated_ltv))
                 
                 # 금리 조회 (가장 가까운 ltv_steps 값 사용)
-                rate_info = self.get_interest_rate(credit_score, credit_grade, int(closest_ltv_for_rate), grade)
+                rate_info = self.get_interest_rate(credit_score, credit_grade, int(closest_ltv_for_rate), grade, context)
                 
                 # 택시 관련 한도 제한 적용
                 final_amount = required_amount
@@ -888,7 +1078,7 @@ class BaseCalculator:
                 if max_amount_limit is not None and final_amount > max_amount_limit:
                     final_amount = max_amount_limit
                     taxi_limit_applied = True
-                    print(f"DEBUG: BaseCalculator.calculate - 택시 한도 제한 적용: {required_amount}만원 -> {final_amount}만원")
+                    logger.debug("BaseCalculator.calculate - 택시 한도 제한 적용: %s만원 -> %s만원", required_amount, final_amount)
                 
                 # 대환인 경우 total_amount와 available_amount 구분
                 if is_refinance:
@@ -921,177 +1111,107 @@ class BaseCalculator:
                 }
                 
                 results = [result]  # 하나의 결과만 반환
-                print(f"DEBUG: BaseCalculator.calculate - created result with LTV {calculated_ltv:.2f}% and amount {final_amount}만원")  # 추가
+                logger.debug("BaseCalculator.calculate - created result with LTV %.2f%% and amount %s만원", calculated_ltv, final_amount)  # 추가
         else:
             # 필요자금이 없고 택시 한도 제한도 없으면 기존대로 LTV별 한도 계산
-            # 가계자금인 경우 LTV 70%만 계산
-            if is_household_for_ok:
-                ltv_steps = [70]
-            else:
-                # 사업자금인 경우 max_ltv_by_area_grade_credit에서 가능한 LTV만 사용
-                if is_ok_bank and is_business_product:
-                    # 사업자금은 max_ltv_by_area_grade_credit에서 가능한 LTV만 사용
-                    # max_ltv는 이미 get_max_ltv_by_grade에서 계산됨
-                    # ltv_steps에서 max_ltv 이하만 사용
-                    all_ltv_steps = self.config.get("ltv_steps", [90, 85, 80, 75, 70, 65])
-                    ltv_steps = [ltv for ltv in all_ltv_steps if ltv <= max_ltv]
-                    print(f"DEBUG: BaseCalculator.calculate - 사업자금: max_ltv={max_ltv}, filtered ltv_steps={ltv_steps}")
-                else:
-                    ltv_steps = self.config.get("ltv_steps", [90, 85, 80, 75, 70, 65])
-            
-            print(f"DEBUG: BaseCalculator.calculate - max_ltv: {max_ltv}, ltv_steps: {ltv_steps}")  # 추가
-            
-            for ltv in ltv_steps:
-                # 최대 LTV를 초과하면 스킵
-                if ltv > max_ltv:
-                    print(f"DEBUG: LTV {ltv} > max_ltv {max_ltv}, skipping")  # 추가
-                    continue
-                
-                # 가용 한도 계산
-                # OK저축은행인 경우 특별한 계산 방식 적용
-                if is_ok_bank and not is_refinance:
-                    # OK저축은행 후순위: 현재 LTV 한도에서 기존 근저당권이 차지하는 LTV 수준의 한도를 차감
-                    # 기존 근저당권이 차지하는 LTV = total_mortgage / kb_price * 100
-                    existing_ltv = (total_mortgage / kb_price) * 100 if kb_price > 0 else 0
-                    # 기존 근저당권 LTV 수준의 한도 계산
-                    existing_ltv_limit = kb_price * (existing_ltv / 100)
-                    # 현재 LTV 한도에서 기존 근저당권 LTV 수준 한도를 차감
-                    max_amount_principal = kb_price * (ltv / 100)
-                    available_principal = max_amount_principal - existing_ltv_limit
-                    amount_info = {
-                        "total_amount": max(0, available_principal),
-                        "available_amount": max(0, available_principal)
-                    }
-                    print(f"DEBUG: BaseCalculator.calculate - OK저축은행 특별 계산: ltv={ltv}%, existing_ltv={existing_ltv:.2f}%, max_amount={max_amount_principal}, existing_limit={existing_ltv_limit}, available={available_principal}")
-                else:
-                    # 일반 계산 방식
-                    amount_info = self.calculate_available_amount(
-                        kb_price, ltv, total_mortgage, is_refinance, refinance_principal
-                    )
-                
-                print(f"DEBUG: LTV {ltv} - amount_info: {amount_info}")  # 추가
-                
-                # 가용 한도가 0 이하면 스킵 (대환인 경우는 마이너스여도 산출)
-                if not is_refinance and amount_info["available_amount"] <= 0:
-                    print(f"DEBUG: LTV {ltv} - available_amount <= 0, skipping")  # 추가
-                    continue
-                
+            for ltv, final_amount, final_total_amount in self._evaluate_ltv_steps(plan):
                 # 금리 조회 (82% LTV의 경우 region_grade에 따라 다른 금리 적용)
-                rate_info = self.get_interest_rate(credit_score, credit_grade, ltv, grade)
-                
-                # 가계 상품 한도 제한 적용
-                final_amount = amount_info["available_amount"]
-                if max_amount_limit is not None and final_amount > max_amount_limit:
-                    final_amount = max_amount_limit
-                    print(f"DEBUG: BaseCalculator.calculate - 가계 상품 한도 제한 적용: {amount_info['available_amount']}만원 -> {final_amount}만원")
-                
-                # 100만 단위로 절삭
-                final_amount = self.round_down_to_hundred_thousand(final_amount)
-                final_total_amount = self.round_down_to_hundred_thousand(amount_info["total_amount"])
-                
-                result = {
-                    "ltv": ltv,
-                    "amount": final_amount,
-                    "interest_rate": rate_info.get("interest_rate"),
-                    "interest_rate_range": rate_info.get("interest_rate_range"),
-                    "type": "대환" if is_refinance else "후순위",
-                    "available_amount": final_amount,
-                    "total_amount": final_total_amount,
-                    "is_refinance": is_refinance,
-                    "credit_grade": rate_info.get("credit_grade"),
-                    "below_standard_ltv": is_below_standard,  # 기준 LTV 이하 지역 여부
-                    "fixed_rate_comment": rate_info.get("fixed_rate_comment"),  # 고정금리 코멘트
-                    "refinance_institutions": refinance_institutions if is_household_for_ok and is_refinance else None  # 가계자금 대환 시 대환하는 금융사 이름
-                }
-                
-                results.append(result)
+                rate_info = self.get_interest_rate(credit_score, credit_grade, ltv, grade, context)
+                results.append(self._step_result(plan, ltv, final_amount, final_total_amount, rate_info))
         
         # 결과가 없으면 에러 메시지와 함께 반환 (가용 한도 부족 등)
         if not results:
-            print(f"DEBUG: BaseCalculator.calculate - no results found for {self.bank_name}")
-            # 최대 LTV로 계산했을 때 가용 한도 확인
-            max_ltv_amount = kb_price * (max_ltv / 100)
-            
-            # 대환인 경우: 대환할 근저당권의 원금 + 나머지 근저당권의 채권최고액을 합산하여 체크
-            # 대환이 아닌 경우: 기존 근저당권의 채권최고액만 체크
-            if is_refinance:
-                # 대환할 근저당권의 원금을 채권최고액으로 추정 (원금 × 1.2)
-                refinance_max_amount = refinance_principal * 1.2
-                # 대환할 근저당권의 채권최고액 + 나머지 근저당권의 채권최고액
-                total_mortgage_for_check = refinance_max_amount + total_mortgage
-                print(f"DEBUG: BaseCalculator.calculate - 대환인 경우: refinance_principal={refinance_principal}만원, refinance_max_amount={refinance_max_amount}만원, total_mortgage={total_mortgage}만원, total_mortgage_for_check={total_mortgage_for_check}만원")
-                
-                if total_mortgage_for_check > max_ltv_amount:
-                    shortage = total_mortgage_for_check - max_ltv_amount
-                    print(f"DEBUG: BaseCalculator.calculate - 대환 시 기존 근저당권이 최대 LTV 한도를 초과: {shortage:.0f}만원 초과")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": [
-                            f"기존 근저당권 채권최고액({total_mortgage_for_check:,.0f}만원)이 최대 한도({max_ltv_amount:,.0f}만원, LTV {max_ltv}%)를 초과하여 추가 대출 불가능",
-                            f"초과 금액: {shortage:,.0f}만원 (기존 채권최고액 {total_mortgage_for_check:,.0f}만원 - 최대 한도 {max_ltv_amount:,.0f}만원)"
-                        ],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
-            else:
-                # 대환이 아닌 경우: 기존 로직 유지
-                if total_mortgage > max_ltv_amount:
-                    shortage = total_mortgage - max_ltv_amount
-                    print(f"DEBUG: BaseCalculator.calculate - 기존 근저당권이 최대 LTV 한도를 초과: {shortage:.0f}만원 초과")
-                    return {
-                        "bank_name": self.bank_name,
-                        "results": [],
-                        "conditions": self.config.get("conditions", []),
-                        "errors": [
-                            f"기존 근저당권 채권최고액({total_mortgage:,.0f}만원)이 최대 한도({max_ltv_amount:,.0f}만원, LTV {max_ltv}%)를 초과하여 추가 대출 불가능",
-                            f"초과 금액: {shortage:,.0f}만원 (기존 채권최고액 {total_mortgage:,.0f}만원 - 최대 한도 {max_ltv_amount:,.0f}만원)"
-                        ],
-                        "min_amount": self.config.get("min_amount", 3000)
-                    }
-            
-            print(f"DEBUG: BaseCalculator.calculate - no results found for {self.bank_name}, returning None")
-            return None
+            return self._no_results_result(plan)
         
-        print(f"DEBUG: BaseCalculator.calculate - {self.bank_name} found {len(results)} results")  # 추가
+        logger.debug("BaseCalculator.calculate - %s found %s results", self.bank_name, len(results))  # 추가
         return {
             "bank_name": self.bank_name,
             "results": results,
-            "conditions": self.config.get("conditions", []),
+            "conditions": list(self.config.get("conditions", [])),
             "errors": [],
             "min_amount": self.config.get("min_amount", 3000)  # 기본값 3000만원
         }
     
+    def _step_result(self, plan: Dict[str, Any], ltv: Any, final_amount: int, final_total_amount: int, rate_info: Dict[str, Any]) -> Dict[str, Any]:
+        """LTV 단계별 산출 결과 항목"""
+        is_refinance = plan["is_refinance"]
+        return {
+            "ltv": ltv,
+            "amount": final_amount,
+            "interest_rate": rate_info.get("interest_rate"),
+            "interest_rate_range": rate_info.get("interest_rate_range"),
+            "type": "대환" if is_refinance else "후순위",
+            "available_amount": final_amount,
+            "total_amount": final_total_amount,
+            "is_refinance": is_refinance,
+            "credit_grade": rate_info.get("credit_grade"),
+            "below_standard_ltv": plan["is_below_standard"],  # 기준 LTV 이하 지역 여부
+            "fixed_rate_comment": rate_info.get("fixed_rate_comment"),  # 고정금리 코멘트
+            "refinance_institutions": plan["refinance_institutions"] if plan["is_household_for_ok"] and is_refinance else None  # 가계자금 대환 시 대환하는 금융사 이름
+        }
+    
+    def _no_results_result(self, plan: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        산출 결과가 없을 때의 결과
+        기존 근저당권이 최대 LTV 한도를 초과하면 오류 메시지, 아니면 None
+        """
+        kb_price = plan["kb_price"]
+        max_ltv = plan["max_ltv"]
+        total_mortgage = plan["total_mortgage"]
+        is_refinance = plan["is_refinance"]
+        refinance_principal = plan["refinance_principal"]
+        
+        logger.debug("BaseCalculator.calculate - no results found for %s", self.bank_name)
+        # 최대 LTV로 계산했을 때 가용 한도 확인
+        max_ltv_amount = kb_price * (max_ltv / 100)
+        
+        # 대환인 경우: 대환할 근저당권의 원금 + 나머지 근저당권의 채권최고액을 합산하여 체크
+        # 대환이 아닌 경우: 기존 근저당권의 채권최고액만 체크
+        if is_refinance:
+            # 대환할 근저당권의 원금을 채권최고액으로 추정 (원금 × 1.2)
+            refinance_max_amount = refinance_principal * 1.2
+            # 대환할 근저당권의 채권최고액 + 나머지 근저당권의 채권최고액
+            total_mortgage_for_check = refinance_max_amount + total_mortgage
+            logger.debug("BaseCalculator.calculate - 대환인 경우: refinance_principal=%s만원, refinance_max_amount=%s만원, total_mortgage=%s만원, total_mortgage_for_check=%s만원", refinance_principal, refinance_max_amount, total_mortgage, total_mortgage_for_check)
+            
+            if total_mortgage_for_check > max_ltv_amount:
+                shortage = total_mortgage_for_check - max_ltv_amount
+                logger.debug("BaseCalculator.calculate - 대환 시 기존 근저당권이 최대 LTV 한도를 초과: %.0f만원 초과", shortage)
+                return self._error_result([
+                    f"기존 근저당권 채권최고액({total_mortgage_for_check:,.0f}만원)이 최대 한도({max_ltv_amount:,.0f}만원, LTV {max_ltv}%)를 초과하여 추가 대출 불가능",
+                    f"초과 금액: {shortage:,.0f}만원 (기존 채권최고액 {total_mortgage_for_check:,.0f}만원 - 최대 한도 {max_ltv_amount:,.0f}만원)"
+                ])
+        else:
+            # 대환이 아닌 경우: 기존 로직 유지
+            if total_mortgage > max_ltv_amount:
+                shortage = total_mortgage - max_ltv_amount
+                logger.debug("BaseCalculator.calculate - 기존 근저당권이 최대 LTV 한도를 초과: %.0f만원 초과", shortage)
+                return self._error_result([
+                    f"기존 근저당권 채권최고액({total_mortgage:,.0f}만원)이 최대 한도({max_ltv_amount:,.0f}만원, LTV {max_ltv}%)를 초과하여 추가 대출 불가능",
+                    f"초과 금액: {shortage:,.0f}만원 (기존 채권최고액 {total_mortgage:,.0f}만원 - 최대 한도 {max_ltv_amount:,.0f}만원)"
+                ])
+        
+        logger.debug("BaseCalculator.calculate - no results found for %s, returning None", self.bank_name)
+        return None
+    
     def credit_score_to_grade(self, credit_score: Optional[int]) -> Optional[int]:
         """
         신용점수를 등급으로 변환
         금융사별 설정 파일의 credit_score_to_grade를 사용하고,
         없으면 전역 설정을 fallback으로 사용
         """
-        print(f"DEBUG: credit_score_to_grade - credit_score: {credit_score}")  # 추가
+        logger.debug("credit_score_to_grade - credit_score: %s", credit_score)  # 추가
         if credit_score is None:
-            print(f"DEBUG: credit_score_to_grade - credit_score is None, returning None")  # 추가
+            logger.debug("credit_score_to_grade - credit_score is None, returning None")  # 추가
             return None
         
-        # 금융사별 설정 파일의 매핑 확인
-        score_map = self.config.get("credit_score_to_grade", {})
-        print(f"DEBUG: credit_score_to_grade - score_map: {score_map}")  # 추가
-        if score_map:
-            for range_str, grade in score_map.items():
-                # "920-1000" 형식을 파싱
-                parts = range_str.split("-")
-                if len(parts) == 2:
-                    try:
-                        min_score = int(parts[0])
-                        max_score = int(parts[1])
-                        print(f"DEBUG: credit_score_to_grade - checking range {range_str}: {min_score} <= {credit_score} <= {max_score}")  # 추가
-                        if min_score <= credit_score <= max_score:
-                            print(f"DEBUG: credit_score_to_grade - matched! returning grade: {grade}")  # 추가
-                            return grade
-                    except ValueError:
-                        continue
-        
-        print(f"DEBUG: credit_score_to_grade - no match found, returning None")  # 추가
+        # 금융사별 설정 파일의 매핑 확인 (로드 시 컴파일된 구간 테이블)
+        grade = self._credit_grade_table.lookup(credit_score)
+        if grade is not None:
+            logger.debug("credit_score_to_grade - matched! returning grade: %s", grade)  # 추가
+            return grade
+        
+        logger.debug("credit_score_to_grade - no match found, returning None")  # 추가
         return None
     
     def validate_kb_price(self, kb_price: Any) -> Optional[float]:
@@ -1099,9 +1219,9 @@ class BaseCalculator:
         KB시세 검증 및 변환
         시세가 없으면 None 반환 (산출 불가)
         """
-        print(f"DEBUG: BaseCalculator.validate_kb_price - input: {kb_price}, type: {type(kb_price)}")
+        logger.debug("BaseCalculator.validate_kb_price - input: %s, type: %s", kb_price, type(kb_price))
         result = validate_kb_price(kb_price)
-        print(f"DEBUG: BaseCalculator.validate_kb_price - output: {result}")
+        logger.debug("BaseCalculator.validate_kb_price - output: %s", result)
         return result
     
     def get_region_grade(self, region: str) -> Optional[int]:
@@ -1110,44 +1230,27 @@ class BaseCalculator:
         region_grades에 명시된 지역만 처리 (fallback 없음)
         명시되지 않은 지역은 None 반환하여 취급 불가지역으로 처리
         """
-        region_grades = self.config.get("region_grades", {})
-        
-        # 공백 제거 버전으로도 확인
-        region_clean = region.replace(" ", "")
-        
         # 1. 정확한 매칭 시도 (원본)
-        if region in region_grades:
-            grade = region_grades.get(region)
-            # 광역 단위 키(서울, 경기 등)는 제외 (구체적인 지역만 처리)
-            if grade is not None and not self._is_metropolitan_key(region):
-                print(f"DEBUG: get_region_grade - exact match: {region} -> grade {grade}")
-                return grade
+        grade = self._region_grade_exact.get(region)
+        if grade is not None:
+            logger.debug("get_region_grade - exact match: %s -> grade %s", region, grade)
+            return grade
         
         # 2. 공백 제거 버전으로 매칭 시도
-        if region_clean in region_grades:
-            grade = region_grades.get(region_clean)
-            if grade is not None and not self._is_metropolitan_key(region_clean):
-                print(f"DEBUG: get_region_grade - clean match: {region_clean} -> grade {grade}")
-                return grade
-        
-        # 3. 키의 공백 제거 버전과 비교
-        for key in region_grades.keys():
-            if key.replace(" ", "") == region_clean:
-                grade = region_grades.get(key)
-                if grade is not None and not self._is_metropolitan_key(key):
-                    print(f"DEBUG: get_region_grade - key clean match: {key} -> {region_clean} -> grade {grade}")
-                    return grade
-        
-        print(f"DEBUG: get_region_grade - no match found for region: {region} (취급 불가지역)")
+        region_clean = region.replace(" ", "")
+        grade = self._region_grade_index.get(region_clean)
+        if grade is not None:
+            logger.debug("get_region_grade - clean match: %s -> grade %s", region_clean, grade)
+            return grade
+        
+        logger.debug("get_region_grade - no match found for region: %s (취급 불가지역)", region)
         return None
     
     def _is_metropolitan_key(self, key: str) -> bool:
         """
         광역 단위 키인지 확인 (서울, 경기, 인천, 부산 등)
         """
-        metropolitan_keys = ["서울", "경기", "인천", "부산", "광주", "대전", "울산", "세종", 
-                            "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주", "대구"]
-        return key in metropolitan_keys
+        return key in self.METROPOLITAN_KEYS
     
     def get_max_ltv_by_grade(self, grade: Union[int, str], region: str = None, property_data: Dict[str, Any] = None) -> Optional[float]:
         """
@@ -1176,66 +1279,49 @@ class BaseCalculator:
         if is_ok_bank and property_data is not None and not is_household_for_ok:
             area = property_data.get("area")
             credit_score = property_data.get("credit_score")
-            print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 체크: area={area}, credit_score={credit_score}")
+            logger.debug("get_max_ltv_by_grade - OK저축은행 체크: area=%s, credit_score=%s", area, credit_score)
             
             if area is not None:
                 # 신용점수가 있는 경우
                 if credit_score is not None:
                     # 신용점수 범위 문자열을 등급 번호로 변환
                     credit_grade_number = self._get_ok_credit_grade_number(credit_score)
-                    print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 credit_grade_number: {credit_grade_number}")
+                    logger.debug("get_max_ltv_by_grade - OK저축은행 credit_grade_number: %s", credit_grade_number)
                     if credit_grade_number is not None:
                         # 면적별 급지별 LTV 조회
                         max_ltv = self._get_ok_max_ltv_by_area_grade_credit(area, grade, credit_grade_number)
-                        print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 _get_ok_max_ltv_by_area_grade_credit 결과: {max_ltv}")
+                        logger.debug("get_max_ltv_by_grade - OK저축은행 _get_ok_max_ltv_by_area_grade_credit 결과: %s", max_ltv)
                         if max_ltv is not None:
-                            print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 면적별 LTV: area={area}㎡, grade={grade}, credit_grade={credit_grade_number}등급 -> LTV {max_ltv}%")
+                            logger.debug("get_max_ltv_by_grade - OK저축은행 면적별 LTV: area=%s㎡, grade=%s, credit_grade=%s등급 -> LTV %s%%", area, grade, credit_grade_number, max_ltv)
                             return max_ltv
                 else:
                     # 신용점수가 없는 경우: 해당 급지의 최대 LTV 사용 (면적과 급지만 고려)
-                    print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 신용점수 없음, 면적과 급지만으로 최대 LTV 계산")
+                    logger.debug("get_max_ltv_by_grade - OK저축은행 신용점수 없음, 면적과 급지만으로 최대 LTV 계산")
                     max_ltv = self._get_ok_max_ltv_by_area_grade(area, grade)
                     if max_ltv is not None:
-                        print(f"DEBUG: get_max_ltv_by_grade - OK저축은행 면적별 LTV (신용점수 없음): area={area}㎡, grade={grade} -> LTV {max_ltv}%")
+                        logger.debug("get_max_ltv_by_grade - OK저축은행 면적별 LTV (신용점수 없음): area=%s㎡, grade=%s -> LTV %s%%", area, grade, max_ltv)
                         return max_ltv
         
         max_ltv_by_grade = self.config.get("max_ltv_by_grade", {})
-        print(f"DEBUG: get_max_ltv_by_grade - grade: {grade} (type: {type(grade)}), region: {region}, max_ltv_by_grade keys: {list(max_ltv_by_grade.keys())}")  # 추가
+        logger.debug("get_max_ltv_by_grade - grade: %s (type: %s), region: %s, max_ltv_by_grade keys: %s", grade, type(grade), region, max_ltv_by_grade.keys())
         
         # 문자 급지인 경우 (OK 저축은행 등)
         if isinstance(grade, str):
             result = max_ltv_by_grade.get(grade)
-            print(f"DEBUG: get_max_ltv_by_grade - 문자 급지: {grade} -> LTV {result}%")
+            logger.debug("get_max_ltv_by_grade - 문자 급지: %s -> LTV %s%%", grade, result)
             return result
         
         # 1급지인 경우 A/B 그룹 구분
         if grade == 1 and region:
-            region_clean = region.replace(" ", "")
-            grade_1_group_a = self.config.get("grade_1_group_a", [])
-            grade_1_group_b = self.config.get("grade_1_group_b", [])
-            
-            # A 그룹 확인
-            for a_region in grade_1_group_a:
-                if a_region.replace(" ", "") == region_clean:
-                    result = max_ltv_by_grade.get("1")
-                    print(f"DEBUG: get_max_ltv_by_grade - 1급지 A그룹: {region} -> LTV {result}%")
-                    return result
-            
-            # B 그룹 확인
-            for b_region in grade_1_group_b:
-                if b_region.replace(" ", "") == region_clean:
-                    result = max_ltv_by_grade.get("1_b")
-                    print(f"DEBUG: get_max_ltv_by_grade - 1급지 B그룹: {region} -> LTV {result}%")
-                    return result
-            
-            # 1급지이지만 A/B 그룹에 없으면 기본값 (A 그룹)
-            result = max_ltv_by_grade.get("1")
-            print(f"DEBUG: get_max_ltv_by_grade - 1급지 (기본값 A그룹): {region} -> LTV {result}%")
+            # A 그룹 -> "1", B 그룹 -> "1_b", 그룹에 없으면 기본값 (A 그룹)
+            ltv_key = self._grade_1_group_index.get(region.replace(" ", ""), "1")
+            result = max_ltv_by_grade.get(ltv_key)
+            logger.debug("get_max_ltv_by_grade - 1급지 (%s): %s -> LTV %s%%", ltv_key, region, result)
             return result
         
         # JSON 키는 문자열이므로 int를 문자열로 변환하여 조회
         result = max_ltv_by_grade.get(str(grade))
-        print(f"DEBUG: get_max_ltv_by_grade - result: {result}")  # 추가
+        logger.debug("get_max_ltv_by_grade - result: %s", result)  # 추가
         return result
     
     def _get_ok_credit_grade_number(self, credit_score: int) -> Optional[int]:
@@ -1248,26 +1334,12 @@ class BaseCalculator:
         Returns:
             등급 번호 (1~8) 또는 None
         """
-        score_range_to_grade = self.config.get("credit_score_range_to_grade_number", {})
-        if not score_range_to_grade:
-            return None
+        grade_number = self._credit_grade_number_table.lookup(credit_score)
+        if grade_number is not None:
+            logger.debug("_get_ok_credit_grade_number - credit_score: %s -> grade: %s", credit_score, grade_number)
+            return grade_number
         
-        for range_str, grade_number in score_range_to_grade.items():
-            parts = range_str.split("-")
-            if len(parts) == 2:
-                try:
-                    score1 = int(parts[0])
-                    score2 = int(parts[1])
-                    # 범위가 내림차순인 경우 (예: 1000-915)와 오름차순인 경우 모두 처리
-                    min_score = min(score1, score2)
-                    max_score = max(score1, score2)
-                    if min_score <= credit_score <= max_score:
-                        print(f"DEBUG: _get_ok_credit_grade_number - credit_score: {credit_score}, range: {range_str} -> grade: {grade_number}")
-                        return grade_number
-                except ValueError:
-                    continue
-        
-        print(f"DEBUG: _get_ok_credit_grade_number - credit_score: {credit_score}, no match found")
+        logger.debug("_get_ok_credit_grade_number - credit_score: %s, no match found", credit_score)
         return None
     
     def _get_ok_max_ltv_by_area_grade_credit(self, area: float, region_grade: Union[int, str], credit_grade_number: int) -> Optional[float]:
@@ -1301,7 +1373,7 @@ class BaseCalculator:
         # 4급지는 등급 상관없이 모두 동일한 LTV
         if grade_key == "4" and "all" in grade_config:
             result = grade_config["all"]
-            print(f"DEBUG: _get_ok_max_ltv_by_area_grade_credit - area: {area}㎡, grade: {grade_key}, credit_grade: {credit_grade_number}등급 -> LTV {result}% (4급지 전체)")
+            logger.debug("_get_ok_max_ltv_by_area_grade_credit - area: %s㎡, grade: %s, credit_grade: %s등급 -> LTV %s%% (4급지 전체)", area, grade_key, credit_grade_number, result)
             return result
         
         # 등급 범위별 LTV 조회
@@ -1316,12 +1388,12 @@ class BaseCalculator:
                     min_grade = int(parts[0])
                     max_grade = int(parts[1])
                     if min_grade <= credit_grade_number <= max_grade:
-                        print(f"DEBUG: _get_ok_max_ltv_by_area_grade_credit - area: {area}㎡, grade: {grade_key}, credit_grade: {credit_grade_number}등급, range: {grade_range} -> LTV {ltv}%")
+                        logger.debug("_get_ok_max_ltv_by_area_grade_credit - area: %s㎡, grade: %s, credit_grade: %s등급, range: %s -> LTV %s%%", area, grade_key, credit_grade_number, grade_range, ltv)
                         return ltv
                 except ValueError:
                     continue
         
-        print(f"DEBUG: _get_ok_max_ltv_by_area_grade_credit - area: {area}㎡, grade: {grade_key}, credit_grade: {credit_grade_number}등급, no match found")
+        logger.debug("_get_ok_max_ltv_by_area_grade_credit - area: %s㎡, grade: %s, credit_grade: %s등급, no match found", area, grade_key, credit_grade_number)
         return None
     
     def _get_ok_max_ltv_by_area_grade(self, area: float, region_grade: Union[int, str]) -> Optional[float]:
@@ -1355,7 +1427,7 @@ class BaseCalculator:
         # 4급지는 등급 상관없이 모두 동일한 LTV
         if grade_key == "4" and "all" in grade_config:
             result = grade_config["all"]
-            print(f"DEBUG: _get_ok_max_ltv_by_area_grade - area: {area}㎡, grade: {grade_key} -> LTV {result}% (4급지 전체)")
+            logger.debug("_get_ok_max_ltv_by_area_grade - area: %s㎡, grade: %s -> LTV %s%% (4급지 전체)", area, grade_key, result)
             return result
         
         # 신용등급 범위별 LTV 중 최대값 찾기
@@ -1367,9 +1439,9 @@ class BaseCalculator:
                 max_ltv = ltv
         
         if max_ltv is not None:
-            print(f"DEBUG: _get_ok_max_ltv_by_area_grade - area: {area}㎡, grade: {grade_key} -> 최대 LTV {max_ltv}% (신용점수 없음)")
+            logger.debug("_get_ok_max_ltv_by_area_grade - area: %s㎡, grade: %s -> 최대 LTV %s%% (신용점수 없음)", area, grade_key, max_ltv)
         else:
-            print(f"DEBUG: _get_ok_max_ltv_by_area_grade - area: {area}㎡, grade: {grade_key}, no match found")
+            logger.debug("_get_ok_max_ltv_by_area_grade - area: %s㎡, grade: %s, no match found", area, grade_key)
         
         return max_ltv
     
@@ -1383,29 +1455,17 @@ class BaseCalculator:
         Returns:
             기준 LTV 이하 지역인 경우 해당 LTV (float), 아니면 None
         """
-        below_standard_ltv_regions = self.config.get("below_standard_ltv_regions", {})
-        region_clean = region.replace(" ", "")
-        
         # 정확한 매칭 시도
-        if region in below_standard_ltv_regions:
-            ltv = below_standard_ltv_regions[region]
-            print(f"DEBUG: get_below_standard_ltv - exact match: {region} -> LTV {ltv}%")
+        if region in self._below_standard_ltv_exact:
+            ltv = self._below_standard_ltv_exact[region]
+            logger.debug("get_below_standard_ltv - exact match: %s -> LTV %s%%", region, ltv)
             return ltv
         
         # 공백 제거 버전으로 매칭 시도
-        if region_clean in below_standard_ltv_regions:
-            ltv = below_standard_ltv_regions[region_clean]
-            print(f"DEBUG: get_below_standard_ltv - clean match: {region_clean} -> LTV {ltv}%")
-            return ltv
-        
-        # 키의 공백 제거 버전과 비교
-        for key in below_standard_ltv_regions.keys():
-            if key.replace(" ", "") == region_clean:
-                ltv = below_standard_ltv_regions[key]
-                print(f"DEBUG: get_below_standard_ltv - key clean match: {key} -> LTV {ltv}%")
-                return ltv
-        
-        return None
+        ltv = self._below_standard_ltv_index.get(region.replace(" ", ""))
+        if ltv is not None:
+            logger.debug("get_below_standard_ltv - clean match: %s -> LTV %s%%", region, ltv)
+        return ltv
     
     def calculate_total_mortgage(self, mortgages: List[Dict[str, Any]]) -> float:
         """
@@ -1417,14 +1477,14 @@ class BaseCalculator:
             max_amount = mortgage.get("max_amount")
             if max_amount is not None and isinstance(max_amount, (int, float)):
                 total += max_amount
-                print(f"DEBUG: calculate_total_mortgage - using max_amount(채권최고액): {max_amount}만원")
+                logger.debug("calculate_total_mortgage - using max_amount(채권최고액): %s만원", max_amount)
             else:
                 # 채권최고액이 없으면 원금에 1.2를 곱해서 추정
                 amount = mortgage.get("amount", 0)
                 if isinstance(amount, (int, float)):
                     estimated_max = amount * 1.2
                     total += estimated_max
-                    print(f"DEBUG: calculate_total_mortgage - estimated max_amount from amount: {amount}만원 -> {estimated_max}만원")
+                    logger.debug("calculate_total_mortgage - estimated max_amount from amount: %s만원 -> %s만원", amount, estimated_max)
         return total
     
     def calculate_available_amount(
@@ -1453,8 +1513,8 @@ class BaseCalculator:
         """
         # LTV는 원금 기준이므로, 최대 대출 금액(원금) 계산
         max_amount_principal = kb_price * (ltv / 100)
-        print(f"DEBUG: calculate_available_amount - kb_price: {kb_price}, ltv: {ltv}, total_mortgage(나머지 채권최고액): {total_mortgage}, is_refinance: {is_refinance}, refinance_principal(대환 원금): {refinance_principal}")  # 추가
-        print(f"DEBUG: calculate_available_amount - max_amount_principal (kb_price * ltv/100): {max_amount_principal}")  # 추가
+        logger.debug("calculate_available_amount - kb_price: %s, ltv: %s, total_mortgage(나머지 채권최고액): %s, is_refinance: %s, refinance_principal(대환 원금): %s", kb_price, ltv, total_mortgage, is_refinance, refinance_principal)  # 추가
+        logger.debug("calculate_available_amount - max_amount_principal (kb_price * ltv/100): %s", max_amount_principal)  # 추가
         
         if is_refinance:
             # 대환인 경우:
@@ -1469,7 +1529,7 @@ class BaseCalculator:
                 "total_amount": total_refinance_amount,
                 "available_amount": available_principal
             }
-            print(f"DEBUG: calculate_available_amount - 대환: available_principal={available_principal}, total_refinance_amount={total_refinance_amount}, result={result}")  # 추가
+            logger.debug("calculate_available_amount - 대환: available_principal=%s, total_refinance_amount=%s, result=%s", available_principal, total_refinance_amount, result)  # 추가
             return result
         else:
             # 후순위인 경우: 채권최고액 기준으로 차감
@@ -1479,7 +1539,7 @@ class BaseCalculator:
                 "total_amount": max(0, available_principal),
                 "available_amount": max(0, available_principal)
             }
-            print(f"DEBUG: calculate_available_amount - 후순위: available_principal={available_principal}, result={result}")  # 추가
+            logger.debug("calculate_available_amount - 후순위: available_principal=%s, result=%s", available_principal, result)  # 추가
             return result
     
     def get_interest_rate(
@@ -1487,7 +1547,8 @@ class BaseCalculator:
         credit_score: Optional[int], 
         credit_grade: Optional[int],
         ltv: int,
-        region_grade: Optional[Union[int, str]] = None
+        region_grade: Optional[Union[int, str]] = None,
+        context: Optional[CalculationContext] = None
     ) -> Dict[str, Any]:
         """
         신용등급별 금리 조회
@@ -1498,6 +1559,8 @@ class BaseCalculator:
             credit_grade: 신용등급 (1-7) 또는 신용점수 범위 문자열 (OK 저축은행)
             ltv: LTV 비율
             region_grade: 지역 급지 (1, 2, 3, 4 또는 A, B, C, D)
+            context: 호출별 상품 정보 (사업자/가계 상품, 후순위 여부, 담보물건 정보)
+                     None이면 일반 상품으로 조회
         
         Returns:
             {
@@ -1509,14 +1572,13 @@ class BaseCalculator:
         # OK 저축은행인지 확인 (cofix_rate가 있으면 OK 저축은행)
         cofix_rate = self.config.get("cofix_rate")
         if cofix_rate is not None:
-            # 사업자/가계 상품 구분 (property_data에서 확인)
-            is_business_product = getattr(self, '_is_business_product', False)
-            is_household_product = getattr(self, '_is_household_product', False)
-            is_subordinate = getattr(self, '_is_subordinate', False)
-            property_data = getattr(self, '_current_property_data', None)
+            # 사업자/가계 상품 구분 (호출별 컨텍스트에서 확인)
+            if context is None:
+                context = DEFAULT_CONTEXT
             return self._get_ok_interest_rate(
                 credit_score, ltv, region_grade, cofix_rate,
-                is_business_product, is_household_product, is_subordinate, property_data
+                context.is_business_product, context.is_household_product,
+                context.is_subordinate, context.property_data
             )
         
         # 기준금리 + 가산금리 방식인지 확인
@@ -1533,10 +1595,10 @@ class BaseCalculator:
             else:
                 ltv_key = str(ltv)
             
-            print(f"DEBUG: get_interest_rate - 기준금리 방식: base_interest_rate={base_interest_rate}, ltv={ltv}, region_grade={region_grade}, ltv_key={ltv_key}")
+            logger.debug("get_interest_rate - 기준금리 방식: base_interest_rate=%s, ltv=%s, region_grade=%s, ltv_key=%s", base_interest_rate, ltv, region_grade, ltv_key)
             
             if ltv_key not in interest_rate_by_ltv_grade:
-                print(f"DEBUG: get_interest_rate - LTV {ltv_key} not found in interest_rate_by_ltv_grade")
+                logger.debug("get_interest_rate - LTV %s not found in interest_rate_by_ltv_grade", ltv_key)
                 return {
                     "interest_rate": None,
                     "interest_rate_range": None,
@@ -1544,23 +1606,23 @@ class BaseCalculator:
                 }
             
             grade_rates = interest_rate_by_ltv_grade[ltv_key]
-            print(f"DEBUG: get_interest_rate - grade_rates for LTV {ltv_key}: {grade_rates}")
+            logger.debug("get_interest_rate - grade_rates for LTV %s: %s", ltv_key, grade_rates)
             
             if credit_grade is not None:
                 # 신용등급이 있으면 해당 등급의 가산금리 사용
                 grade_key = str(credit_grade)
-                print(f"DEBUG: get_interest_rate - looking for grade_key: {grade_key}")
+                logger.debug("get_interest_rate - looking for grade_key: %s", grade_key)
                 if grade_key in grade_rates:
                     additional_rate = grade_rates[grade_key]
                     final_rate = base_interest_rate + additional_rate
-                    print(f"DEBUG: get_interest_rate - 기준금리 {base_interest_rate}% + 가산금리 {additional_rate}% = {final_rate}% for grade {credit_grade}")
+                    logger.debug("get_interest_rate - 기준금리 %s%% + 가산금리 %s%% = %s%% for grade %s", base_interest_rate, additional_rate, final_rate, credit_grade)
                     return {
                         "interest_rate": round(final_rate, 2),
                         "interest_rate_range": None,
                         "credit_grade": credit_grade
                     }
                 else:
-                    print(f"DEBUG: get_interest_rate - grade_key {grade_key} not found in grade_rates")
+                    logger.debug("get_interest_rate - grade_key %s not found in grade_rates", grade_key)
             
             # 신용등급이 없으면 최저~최고 금리 범위 반환
             all_additional_rates = [v for v in grade_rates.values() if isinstance(v, (int, float))]
@@ -1569,14 +1631,14 @@ class BaseCalculator:
                 max_additional = max(all_additional_rates)
                 min_rate = base_interest_rate + min_additional
                 max_rate = base_interest_rate + max_additional
-                print(f"DEBUG: get_interest_rate - no credit_grade, returning range: {min_rate}~{max_rate}")
+                logger.debug("get_interest_rate - no credit_grade, returning range: %s~%s", min_rate, max_rate)
                 return {
                     "interest_rate": None,
                     "interest_rate_range": (round(min_rate, 2), round(max_rate, 2)),
                     "credit_grade": None
                 }
             
-            print(f"DEBUG: get_interest_rate - no rates found, returning None")
+            logger.debug("get_interest_rate - no rates found, returning None")
             return {
                 "interest_rate": None,
                 "interest_rate_range": None,
@@ -1589,15 +1651,15 @@ class BaseCalculator:
         # 82% LTV이고 2급지인 경우 특별 처리
         if ltv == 82 and region_grade == 2:
             ltv_key = "82_2"
-            print(f"DEBUG: get_interest_rate - 82% LTV with region_grade 2, using key: {ltv_key}")  # 추가
+            logger.debug("get_interest_rate - 82%% LTV with region_grade 2, using key: %s", ltv_key)  # 추가
         else:
             ltv_key = str(ltv)
         
-        print(f"DEBUG: get_interest_rate - ltv: {ltv}, credit_score: {credit_score}, credit_grade: {credit_grade}, region_grade: {region_grade}")  # 추가
-        print(f"DEBUG: get_interest_rate - ltv_key: {ltv_key}, available ltv_keys: {list(ltv_rates.keys())}")  # 추가
+        logger.debug("get_interest_rate - ltv: %s, credit_score: %s, credit_grade: %s, region_grade: %s", ltv, credit_score, credit_grade, region_grade)  # 추가
+        logger.debug("get_interest_rate - ltv_key: %s, available ltv_keys: %s", ltv_key, ltv_rates.keys())
         
         if ltv_key not in ltv_rates:
-            print(f"DEBUG: get_interest_rate - LTV {ltv_key} not found in interest_rates_by_ltv")  # 추가
+            logger.debug("get_interest_rate - LTV %s not found in interest_rates_by_ltv", ltv_key)  # 추가
             return {
                 "interest_rate": None,
                 "interest_rate_range": None,
@@ -1605,36 +1667,36 @@ class BaseCalculator:
             }
         
         grade_rates = ltv_rates[ltv_key]
-        print(f"DEBUG: get_interest_rate - grade_rates for LTV {ltv_key}: {grade_rates}")  # 추가
+        logger.debug("get_interest_rate - grade_rates for LTV %s: %s", ltv_key, grade_rates)  # 추가
         
         if credit_grade is not None:
             # 신용등급이 있으면 해당 등급의 금리 반환
             grade_key = str(credit_grade)
-            print(f"DEBUG: get_interest_rate - looking for grade_key: {grade_key}")  # 추가
+            logger.debug("get_interest_rate - looking for grade_key: %s", grade_key)  # 추가
             if grade_key in grade_rates:
                 rate = grade_rates[grade_key]
-                print(f"DEBUG: get_interest_rate - found rate: {rate} for grade {credit_grade}")  # 추가
+                logger.debug("get_interest_rate - found rate: %s for grade %s", rate, credit_grade)  # 추가
                 return {
                     "interest_rate": rate,
                     "interest_rate_range": None,
                     "credit_grade": credit_grade
                 }
             else:
-                print(f"DEBUG: get_interest_rate - grade_key {grade_key} not found in grade_rates")  # 추가
+                logger.debug("get_interest_rate - grade_key %s not found in grade_rates", grade_key)  # 추가
         
         # 신용점수/등급이 없으면 최저~최고 금리 범위 반환
         all_rates = [v for v in grade_rates.values() if isinstance(v, (int, float))]
         if all_rates:
             min_rate = min(all_rates)
             max_rate = max(all_rates)
-            print(f"DEBUG: get_interest_rate - no credit_grade, returning range: {min_rate}~{max_rate}")  # 추가
+            logger.debug("get_interest_rate - no credit_grade, returning range: %s~%s", min_rate, max_rate)  # 추가
             return {
                 "interest_rate": None,
                 "interest_rate_range": (min_rate, max_rate),
                 "credit_grade": None
             }
         
-        print(f"DEBUG: get_interest_rate - no rates found, returning None")  # 추가
+        logger.debug("get_interest_rate - no rates found, returning None")  # 추가
         return {
             "interest_rate": None,
             "interest_rate_range": None,
@@ -1687,14 +1749,12 @@ class BaseCalculator:
             ltv_rates = self.config.get("interest_rates_by_ltv", {})
             grade_additional_rates = self.config.get("grade_additional_rates", {})
         
-        credit_score_to_grade = self.config.get("credit_score_to_grade", {})
-        
         ltv_key = str(ltv)
         
         # 사업자 상품: 70% 이하일 경우 70% 금리 사용
         if is_business_product and ltv_key not in ltv_rates and ltv <= 70:
             ltv_key = "70"
-            print(f"DEBUG: _get_ok_interest_rate - 사업자 상품, LTV {ltv}%는 70% 금리 적용")
+            logger.debug("_get_ok_interest_rate - 사업자 상품, LTV %s%%는 70%% 금리 적용", ltv)
         
         if ltv_key not in ltv_rates:
             return {
@@ -1737,24 +1797,13 @@ class BaseCalculator:
         
         # 신용점수가 있으면 해당 범위의 스프레드 금리 사용
         if credit_score is not None:
-            # 신용점수 범위 찾기
-            score_range = None
-            for range_str in credit_score_to_grade.keys():
-                parts = range_str.split("-")
-                if len(parts) == 2:
-                    try:
-                        min_score = int(parts[0])
-                        max_score = int(parts[1])
-                        if min_score <= credit_score <= max_score:
-                            score_range = range_str
-                            break
-                    except ValueError:
-                        continue
+            # 신용점수 범위 찾기 (credit_score_to_grade 구간 테이블)
+            score_range = self._credit_grade_table.lookup_key(credit_score)
             
             if score_range and score_range in score_rates:
                 spread_rate = score_rates[score_range]
                 final_rate = spread_rate + cofix_rate + additional_rate + household_adjustment
-                print(f"DEBUG: _get_ok_interest_rate - credit_score: {credit_score}, score_range: {score_range}, spread: {spread_rate}, cofix: {cofix_rate}, additional: {additional_rate}, household_adjustment: {household_adjustment}, final: {final_rate}")
+                logger.debug("_get_ok_interest_rate - credit_score: %s, score_range: %s, spread: %s, cofix: %s, additional: %s, household_adjustment: %s, final: %s", credit_score, score_range, spread_rate, cofix_rate, additional_rate, household_adjustment, final_rate)
                 
                 # 사업자 상품 고정금리 코멘트
                 fixed_rate_comment = None
@@ -1773,7 +1822,7 @@ class BaseCalculator:
         if all_rates:
             min_rate = min(all_rates)
             max_rate = max(all_rates)
-            print(f"DEBUG: _get_ok_interest_rate - no credit_score, returning range: {min_rate:.2f}~{max_rate:.2f}")
+            logger.debug("_get_ok_interest_rate - no credit_score, returning range: %.2f~%.2f", min_rate, max_rate)
             
             # 사업자 상품 고정금리 코멘트
             fixed_rate_comment = None
@@ -1794,137 +1843,167 @@ class BaseCalculator:
             "fixed_rate_comment": None
         }
     
+    @staticmethod
+    def is_ok_bank_name(bank_name: str) -> bool:
+        """OK저축은행 여부 (가계자금/사업자금을 각각 계산해야 하는 금융사)"""
+        return bank_name == "OK저축은행" or "OK저축은행" in bank_name or "오케이저축은행" in bank_name
+    
+    @staticmethod
+    def is_bnk_bank_name(bank_name: str) -> bool:
+        """BNK캐피탈 여부 (대환 가능 기관 목록을 확인하는 금융사)"""
+        return bank_name == "BNK캐피탈" or "BNK캐피탈" in bank_name or "비엔케이캐피탈" in bank_name
+    
     @classmethod
-    def calculate_all_banks(cls, property_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def product_types(cls, calculator) -> List[tuple]:
         """
-        모든 금융사에 대해 계산 수행
-        
-        Args:
-            property_data: 파싱된 담보물건 정보
+        계산기별로 계산할 상품 목록
         
         Returns:
-            계산 결과 리스트 (에러 메시지가 있는 경우도 포함)
+            (product_type, 결과에 표시할 bank_name) 리스트
+            OK저축은행은 가계자금/사업자금을 각각 계산, 일반 금융사는 [(None, None)]
         """
-        # data/banks 폴더 경로
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        banks_dir = os.path.join(current_dir, "..", "data", "banks")
+        if cls.is_ok_bank_name(calculator.bank_name):
+            return [("household", "OK저축은행 가계자금"), ("business", "OK저축은행 사업자금")]
+        return [(None, None)]
+    
+    @classmethod
+    def calculate_calculator(cls, calculator, property_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        계산기 하나에 대해 상품별 계산 수행
+        OK저축은행인 경우 가계자금과 사업자금을 각각 계산 (가계자금, 사업자금 순서)
         
-        if not os.path.exists(banks_dir):
-            return []
+        Returns:
+            계산 결과 리스트 (계산 중 예외가 나면 그 전까지의 결과)
+        """
+        results = []
+        try:
+            for product_type, bank_label in cls.product_types(calculator):
+                result = calculator.calculate(property_data, product_type=product_type)
+                if result is not None:
+                    # 취급 불가지역인 경우도 포함 (errors에 "취급 불가지역"이 있으면)
+                    if bank_label:
+                        result["bank_name"] = bank_label
+                    results.append(result)
+        except Exception as e:
+            logger.error("계산기 %s 에러: %s", calculator.bank_name, e)
+        return results
+    
+    @classmethod
+    def calculate_products(
+        cls,
+        calculators,
+        property_data: Dict[str, Any],
+        executor: Optional[Executor] = None,
+        product_set: Optional[str] = None,
+        workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        주어진 계산기들에 대해 계산 수행
         
-        calculators = []
+        Args:
+            calculators: 계산기 리스트 (레지스트리 순서 유지)
+            property_data: 파싱된 담보물건 정보
+            executor: 계산기별로 병렬 계산할 executor (None이면 순차 계산)
+                      - ThreadPoolExecutor 등: 계산기 객체를 그대로 공유
+                      - ProcessPoolExecutor: calculator.parallel.create_process_pool로 만든 풀,
+                        calculators는 product_set 레지스트리의 계산기여야 함
+            product_set: calculators의 상품군 이름 (프로세스 풀 사용 시 필요)
+            workers: executor의 워커 수 - 계산기를 이만큼의 구간으로 나눠 제출 (None이면 CPU 수)
         
-        # 모든 JSON 파일 찾기 및 계산기 생성
-        for filename in os.listdir(banks_dir):
-            if filename.endswith("_config.json") or filename.endswith(".json"):
-                config_path = os.path.join(banks_dir, filename)
-                try:
-                    calculator = cls(config_path)
-                    calculators.append(calculator)
-                except Exception as e:
-                    print(f"⚠️  계산기 로드 실패 ({filename}): {e}")
-                    continue
+        Returns:
+            계산 결과 리스트 (에러 메시지가 있는 경우도 포함, 순서는 executor와 무관하게 동일)
+        """
+        if executor is not None:
+            return cls._calculate_products_parallel(calculators, property_data, executor, product_set, workers)
         
-        # 모든 계산기 실행
+        return cls.calculate_calculators(calculators, property_data)
+    
+    @classmethod
+    def calculate_calculators(cls, calculators, property_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """여러 계산기에 대해 순서대로 calculate_calculator 수행 (병렬 계산의 작업 단위)"""
         results = []
         for calculator in calculators:
-            try:
-                # OK저축은행인 경우 가계자금과 사업자금을 각각 계산
-                is_ok_bank = calculator.bank_name == "OK저축은행" or "OK저축은행" in calculator.bank_name or "오케이저축은행" in calculator.bank_name
-                
-                if is_ok_bank:
-                    # 가계자금 계산
-                    household_result = calculator.calculate(property_data, product_type="household")
-                    if household_result is not None:
-                        household_result["bank_name"] = "OK저축은행 가계자금"
-                        results.append(household_result)
-                    
-                    # 사업자금 계산
-                    business_result = calculator.calculate(property_data, product_type="business")
-                    if business_result is not None:
-                        business_result["bank_name"] = "OK저축은행 사업자금"
-                        results.append(business_result)
-                else:
-                    # 일반 금융사는 기존대로 계산
-                    result = calculator.calculate(property_data)
-                    if result is not None:
-                        # 취급 불가지역인 경우도 포함 (errors에 "취급 불가지역"이 있으면)
-                        results.append(result)
-            except Exception as e:
-                print(f"계산기 {calculator.bank_name} 에러: {e}")
-                continue
+            results.extend(cls.calculate_calculator(calculator, property_data))
+        return results
+    
+    @classmethod
+    def _calculate_products_parallel(cls, calculators, property_data: Dict[str, Any], executor: Executor, product_set: Optional[str], workers: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        calculate_products의 병렬 경로
+        계산기를 워커 수만큼 연속 구간으로 나눠 제출하고, 제출 순서대로 결과를 모아 순차 계산과 같은 순서 유지
+        """
+        count = len(calculators)
+        # 작업 제출/결과 전달 비용을 줄이기 위해 워커당 한 구간 (워커 수를 전달받지 않으면 CPU 수)
+        chunk_count = max(1, min(workers or os.cpu_count() or 1, count))
+        bounds = [count * i // chunk_count for i in range(chunk_count + 1)]
+        
+        if isinstance(executor, ProcessPoolExecutor):
+            if product_set is None:
+                raise ValueError("프로세스 풀 계산에는 product_set이 필요합니다")
+            from calculator.parallel import calculate_in_worker
+            futures = [
+                executor.submit(calculate_in_worker, product_set, start, stop, property_data, cls)
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+        else:
+            futures = [
+                executor.submit(cls.calculate_calculators, calculators[start:stop], property_data)
+                for start, stop in zip(bounds, bounds[1:])
+            ]
         
+        results = []
+        for future in futures:
+            results.extend(future.result())
         return results
     
     @classmethod
-    def calculate_all_loans(cls, property_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def calculate_all_banks(cls, property_data: Dict[str, Any], executor: Optional[Executor] = None, workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        모든 대출 상품에 대해 계산 수행 (data/loan 폴더)
-        FSS 폴더와 Local 폴더 모두 처리
+        모든 금융사에 대해 계산 수행 (data/banks 폴더)
+        설정 파일은 프로세스당 한 번만 로드된 레지스트리를 사용
         
         Args:
             property_data: 파싱된 담보물건 정보
+            executor: 금융사별 병렬 계산 executor (None이면 순차 계산, calculate_products 참고)
+            workers: executor의 워커 수 (None이면 CPU 수)
         
         Returns:
             계산 결과 리스트 (에러 메시지가 있는 경우도 포함)
         """
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        loan_base_dir = os.path.join(current_dir, "..", "data", "loan")
+        registry = get_registry("banks", cls)
+        return cls.calculate_products(registry.calculators, property_data, executor=executor, product_set="banks", workers=workers)
+    
+    @classmethod
+    def calculate_all_loans(cls, property_data: Dict[str, Any], executor: Optional[Executor] = None, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        모든 대출 상품에 대해 계산 수행 (data/loan 폴더)
+        FSS 폴더와 Local 폴더 모두 처리
         
-        if not os.path.exists(loan_base_dir):
-            print(f"⚠️  data/loan 폴더가 없습니다: {loan_base_dir}")
-            return []
+        Args:
+            property_data: 파싱된 담보물건 정보
+            executor: 금융사별 병렬 계산 executor (None이면 순차 계산, calculate_products 참고)
+            workers: executor의 워커 수 (None이면 CPU 수)
         
-        calculators = []
+        Returns:
+            계산 결과 리스트 (에러 메시지가 있는 경우도 포함)
+        """
+        registry = get_registry("loan", cls)
+        return cls.calculate_products(registry.calculators, property_data, executor=executor, product_set="loan", workers=workers)
+    
+    @classmethod
+    def calculate_product_set(cls, product_set: str, property_data: Dict[str, Any], executor: Optional[Executor] = None, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        상품군 하나에 대해 계산 수행 (채팅방 타입별 상품군, registry.PRODUCT_SETS 키)
+        "banks" / "loan"은 calculate_all_banks / calculate_all_loans와 동일하고, 라우팅 설정에서 추가한 상품군도 계산
         
-        # FSS 폴더와 Local 폴더 모두 처리
-        subfolders = ["FSS", "Local"]
-        for subfolder in subfolders:
-            loan_dir = os.path.join(loan_base_dir, subfolder)
-            if not os.path.exists(loan_dir):
-                print(f"⚠️  {subfolder} 폴더가 없습니다: {loan_dir}")
-                continue
-            
-            # 각 폴더의 모든 JSON 파일 찾기 및 계산기 생성
-            for filename in os.listdir(loan_dir):
-                if filename.endswith("_config.json") or filename.endswith(".json"):
-                    config_path = os.path.join(loan_dir, filename)
-                    try:
-                        calculator = cls(config_path)
-                        calculators.append(calculator)
-                        print(f"✅ {subfolder}/{filename} 계산기 로드 완료")
-                    except Exception as e:
-                        print(f"⚠️  계산기 로드 실패 ({subfolder}/{filename}): {e}")
-                        continue
-        
-        # 모든 계산기 실행
-        results = []
-        for calculator in calculators:
-            try:
-                # OK저축은행인 경우 가계자금과 사업자금을 각각 계산
-                is_ok_bank = calculator.bank_name == "OK저축은행" or "OK저축은행" in calculator.bank_name or "오케이저축은행" in calculator.bank_name
-                
-                if is_ok_bank:
-                    # 가계자금 계산
-                    household_result = calculator.calculate(property_data, product_type="household")
-                    if household_result is not None:
-                        household_result["bank_name"] = "OK저축은행 가계자금"
-                        results.append(household_result)
-                    
-                    # 사업자금 계산
-                    business_result = calculator.calculate(property_data, product_type="business")
-                    if business_result is not None:
-                        business_result["bank_name"] = "OK저축은행 사업자금"
-                        results.append(business_result)
-                else:
-                    # 일반 금융사는 기존대로 계산
-                    result = calculator.calculate(property_data)
-                    if result is not None:
-                        # 취급 불가지역인 경우도 포함 (errors에 "취급 불가지역"이 있으면)
-                        results.append(result)
-            except Exception as e:
-                print(f"계산기 {calculator.bank_name} 에러: {e}")
-                continue
+        Args:
+            product_set: 상품군 이름
+            property_data: 파싱된 담보물건 정보
+            executor: 금융사별 병렬 계산 executor (None이면 순차 계산, calculate_products 참고)
+            workers: executor의 워커 수 (None이면 CPU 수)
         
-        return results
-
+        Returns:
+            계산 결과 리스트 (에러 메시지가 있는 경우도 포함)
+        """
+        registry = get_registry(product_set, cls)
+        return cls.calculate_products(registry.calculators, property_data, executor=executor, product_set=product_set, workers=workers)
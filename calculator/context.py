@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+계산 컨텍스트
+calculate 호출 1건에만 해당하는 상품 정보를 계산기 인스턴스가 아닌 별도 객체로 전달
+(계산기는 여러 요청/스레드가 공유하므로 인스턴스에 요청별 상태를 저장하지 않음)
+"""
+
+from typing import Any, Dict, Optional
+
+
+class CalculationContext:
+    """
+    calculate 호출별 상품 정보 (금리 조회에 사용, 생성 후 변경하지 않음)
+
+    Attributes:
+        is_business_product: OK저축은행 사업자 상품 여부
+        is_household_product: OK저축은행 가계 상품 여부
+        is_subordinate: 후순위 여부 (대환 제외 기존 근저당권이 있는 경우)
+        property_data: 담보물건 정보 (가계 상품 조정금리 확인용)
+    """
+
+    __slots__ = ("is_business_product", "is_household_product", "is_subordinate", "property_data")
+
+    def __init__(
+        self,
+        is_business_product: bool = False,
+        is_household_product: bool = False,
+        is_subordinate: bool = False,
+        property_data: Optional[Dict[str, Any]] = None
+    ):
+        self.is_business_product = is_business_product
+        self.is_household_product = is_household_product
+        self.is_subordinate = is_subordinate
+        self.property_data = property_data
+
+    @classmethod
+    def from_plan(cls, plan: Dict[str, Any]) -> "CalculationContext":
+        """BaseCalculator._prepare_calculation이 만든 계산 계획에서 생성"""
+        return cls(
+            is_business_product=plan["is_business_product"],
+            is_household_product=plan["is_household_product"],
+            is_subordinate=plan["is_subordinate"],
+            property_data=plan["property_data"]
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CalculationContext(business={self.is_business_product}, "
+            f"household={self.is_household_product}, subordinate={self.is_subordinate})"
+        )
+
+
+# 컨텍스트 없이 금리를 조회할 때 사용하는 기본값 (일반 상품)
+DEFAULT_CONTEXT = CalculationContext()
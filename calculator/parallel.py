@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 풀 병렬 계산
+계산기(읽기 전용 설정)는 pickle할 수 없으므로 풀 시작 시 워커마다 원본 설정을 한 번만 전달하고,
+작업에는 (상품군, 계산기 순번 구간, 담보물건 정보)만 전달
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from calculator.registry import ProductRegistry, PRODUCT_SETS, get_registry, install_registry
+
+
+def create_process_pool(
+    max_workers: Optional[int] = None,
+    product_sets: Sequence[str] = ("banks", "loan"),
+    calculator_cls: Optional[type] = None
+) -> ProcessPoolExecutor:
+    """
+    calculate_all_banks / calculate_all_loans의 executor로 사용할 프로세스 풀 생성
+
+    Args:
+        max_workers: 워커 프로세스 수 (None이면 CPU 수)
+        product_sets: 워커에 미리 전달할 상품군 (install_registry로 등록한 상품군도 가능)
+        calculator_cls: 계산기 클래스 (기본값: BaseCalculator)
+
+    Returns:
+        ProcessPoolExecutor (사용 후 shutdown 필요, with 문 사용 가능)
+    """
+    if calculator_cls is None:
+        from calculator.base_calculator import BaseCalculator
+        calculator_cls = BaseCalculator
+
+    # 현재 프로세스의 레지스트리 설정을 그대로 전달 -> 워커의 계산기 순번이 부모와 일치
+    configs = {
+        product_set: get_registry(product_set, calculator_cls).raw_configs()
+        for product_set in product_sets
+    }
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(configs, calculator_cls)
+    )
+
+
+def _init_worker(configs: Dict[str, List[Any]], calculator_cls: type):
+    """워커 초기화: 전달받은 설정으로 상품군 레지스트리 생성 (설정 파일을 다시 읽지 않음)"""
+    for product_set, product_configs in configs.items():
+        registry = ProductRegistry(
+            PRODUCT_SETS.get(product_set, ()), calculator_cls, name=product_set, configs=product_configs
+        )
+        install_registry(product_set, registry, calculator_cls)
+
+
+def calculate_in_worker(
+    product_set: str,
+    start: int,
+    stop: int,
+    property_data: Dict[str, Any],
+    calculator_cls: type
+) -> List[Dict[str, Any]]:
+    """워커에서 상품군의 [start, stop) 구간 계산기 결과 계산 (레지스트리 순서 유지)"""
+    calculators = get_registry(product_set, calculator_cls).calculators[start:stop]
+    return calculator_cls.calculate_calculators(calculators, property_data)
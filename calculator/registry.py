@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+금융 상품 레지스트리
+프로세스당 한 번만 설정 파일을 로드/검증하여 컴파일된 계산기로 보관
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# data 폴더 경로
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# 상품군별 설정 폴더 (data 폴더 기준 상대 경로)
+PRODUCT_SETS = {
+    "banks": ("banks",),
+    "loan": ("loan/FSS", "loan/Local"),
+}
+
+# 필수 설정 키와 타입
+REQUIRED_KEYS = {
+    "bank_name": str,
+    "region_grades": dict,
+    "max_ltv_by_grade": dict,
+}
+
+# 선택 설정 키와 타입 (있으면 타입 검증)
+OPTIONAL_KEYS = {
+    "target_regions": list,
+    "ltv_steps": list,
+    "interest_rates_by_ltv": dict,
+    "credit_score_to_grade": dict,
+    "conditions": list,
+    "min_amount": (int, float),
+    "min_kb_price": (int, float),
+}
+
+
+def freeze_config(value: Any) -> Any:
+    """
+    설정값을 읽기 전용 구조로 변환
+    dict -> MappingProxyType, list -> tuple (재귀)
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+
+def thaw_config(value: Any) -> Any:
+    """
+    읽기 전용 설정을 일반 dict/list로 되돌림 (freeze_config의 역변환)
+    프로세스 풀 워커에 설정을 전달할 때 사용 (MappingProxyType은 pickle 불가)
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: thaw_config(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_config(item) for item in value]
+    return value
+
+
+def validate_config(config: Any, source: str) -> None:
+    """
+    상품 설정 검증
+    잘못된 설정이면 ValueError 발생
+    """
+    if not isinstance(config, dict):
+        raise ValueError(f"{source}: 설정 최상위는 객체여야 합니다")
+
+    for key, expected_type in REQUIRED_KEYS.items():
+        if key not in config:
+            raise ValueError(f"{source}: 필수 키 '{key}'가 없습니다")
+        if not isinstance(config[key], expected_type):
+            raise ValueError(f"{source}: '{key}'의 타입이 올바르지 않습니다")
+
+    if not config["bank_name"].strip():
+        raise ValueError(f"{source}: bank_name이 비어있습니다")
+
+    for key, expected_type in OPTIONAL_KEYS.items():
+        if key in config and not isinstance(config[key], expected_type):
+            raise ValueError(f"{source}: '{key}'의 타입이 올바르지 않습니다")
+
+    for ltv in config.get("ltv_steps", []):
+        if not isinstance(ltv, (int, float)):
+            raise ValueError(f"{source}: ltv_steps에 숫자가 아닌 값이 있습니다 ({ltv!r})")
+
+
+class ProductRegistry:
+    """
+    상품군(banks, loan 등) 하나에 대한 계산기 레지스트리
+    설정 파일은 생성 시 한 번만 로드되고 이후에는 읽기 전용으로 공유됨
+    """
+
+    def __init__(
+        self,
+        config_dirs: Sequence[str],
+        calculator_cls: Optional[type] = None,
+        name: Optional[str] = None,
+        configs: Optional[Sequence[Tuple[str, Dict[str, Any]]]] = None
+    ):
+        """
+        Args:
+            config_dirs: 설정 폴더 리스트 (data 폴더 기준 상대 경로 또는 절대 경로)
+            calculator_cls: 계산기 클래스 (기본값: BaseCalculator)
+            name: 상품군 이름 (모니터링용)
+            configs: (출처, 설정 딕셔너리) 리스트 - 있으면 설정 폴더 대신 이 설정으로 생성
+                     (프로세스 풀 워커, 벤치마크용)
+        """
+        if calculator_cls is None:
+            from calculator.base_calculator import BaseCalculator
+            calculator_cls = BaseCalculator
+
+        self.name = name or ",".join(config_dirs)
+        self.config_dirs = tuple(config_dirs)
+        self.calculator_cls = calculator_cls
+        self.failed: Tuple[str, ...] = ()
+        self.loaded_at: float = 0.0
+        self.load_time: float = 0.0
+        self._calculators: Tuple[Any, ...] = ()
+        self._sources: Tuple[str, ...] = ()
+        self._config_hash: Optional[str] = None
+        self._load(configs)
+
+    def _iter_config_files(self):
+        """설정 폴더의 JSON 파일을 (출처, 설정 딕셔너리 또는 예외)로 순회"""
+        for config_dir in self.config_dirs:
+            dir_path = config_dir if os.path.isabs(config_dir) else os.path.join(DATA_DIR, config_dir)
+            if not os.path.exists(dir_path):
+                logger.warning("%s 폴더가 없습니다: %s", config_dir, dir_path)
+                continue
+
+            for filename in os.listdir(dir_path):
+                if not filename.endswith(".json"):
+                    continue
+                config_path = os.path.join(dir_path, filename)
+                source = f"{config_dir}/{filename}"
+                try:
+                    with open(config_path, "r", encoding="utf-8") as f:
+                        yield source, json.load(f)
+                except Exception as e:
+                    yield source, e
+
+    def _load(self, configs: Optional[Sequence[Tuple[str, Dict[str, Any]]]] = None):
+        """설정 폴더의 모든 JSON 파일(또는 전달된 설정) 로드 및 계산기 생성"""
+        started = time.perf_counter()
+        calculators = []
+        sources = []
+        failed = []
+
+        for source, config in (configs if configs is not None else self._iter_config_files()):
+            try:
+                if isinstance(config, Exception):
+                    raise config
+                validate_config(config, source)
+                calculators.append(self.calculator_cls(freeze_config(config)))
+                sources.append(source)
+            except Exception as e:
+                logger.warning("계산기 로드 실패 (%s): %s", source, e)
+                failed.append(source)
+                continue
+
+        self._calculators = tuple(calculators)
+        self._sources = tuple(sources)
+        self.failed = tuple(failed)
+        self.loaded_at = time.time()
+        self.load_time = time.perf_counter() - started
+        logger.info("%s 레지스트리 로드 완료: %d개 (%.1fms)", self.name, len(calculators), self.load_time * 1000)
+
+    @property
+    def calculators(self) -> Tuple[Any, ...]:
+        """로드된 계산기 (로드 순서 유지)"""
+        return self._calculators
+
+    def raw_configs(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """(출처, 일반 dict 설정) 리스트 (로드 순서 유지, pickle 가능)"""
+        return [
+            (source, thaw_config(calculator.config))
+            for source, calculator in zip(self._sources, self._calculators)
+        ]
+
+    @property
+    def config_hash(self) -> str:
+        """
+        로드된 설정 내용의 해시 (출처와 로드 순서 포함)
+        설정 파일이 바뀌어 레지스트리를 다시 로드하면 값이 달라짐 (결과 캐시 무효화용)
+        """
+        if self._config_hash is None:
+            payload = json.dumps(self.raw_configs(), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+            self._config_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return self._config_hash
+
+    @property
+    def config_count(self) -> int:
+        """로드된 설정 파일 수"""
+        return len(self._calculators)
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계"""
+        return {
+            "name": self.name,
+            "config_count": self.config_count,
+            "load_time_ms": round(self.load_time * 1000, 3),
+            "config_hash": self.config_hash[:12],
+            "loaded_at": self.loaded_at,
+            "sources": list(self._sources),
+            "failed": list(self.failed),
+        }
+
+
+_registries: Dict[Tuple[str, type], ProductRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(product_set: str, calculator_cls: Optional[type] = None) -> ProductRegistry:
+    """
+    상품군 레지스트리 조회 (프로세스당 한 번만 생성)
+
+    Args:
+        product_set: 상품군 이름 (PRODUCT_SETS 키)
+        calculator_cls: 계산기 클래스 (기본값: BaseCalculator)
+    """
+    if calculator_cls is None:
+        from calculator.base_calculator import BaseCalculator
+        calculator_cls = BaseCalculator
+
+    key = (product_set, calculator_cls)
+    registry = _registries.get(key)
+    if registry is not None:
+        return registry
+
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            if product_set not in PRODUCT_SETS:
+                raise ValueError(f"알 수 없는 상품군입니다: {product_set}")
+            registry = ProductRegistry(PRODUCT_SETS[product_set], calculator_cls, name=product_set)
+            _registries[key] = registry
+    return registry
+
+
+def register_product_set(product_set: str, config_dirs: Sequence[str]) -> None:
+    """
+    설정에서 정의한 상품군(채팅방 타입) 추가 (utils/chat_routing.py의 라우팅 설정)
+    이미 있는 상품군은 설정 폴더가 같아야 함
+
+    Args:
+        product_set: 상품군 이름
+        config_dirs: 설정 폴더 리스트 (data 폴더 기준 상대 경로 또는 절대 경로)
+    """
+    config_dirs = tuple(config_dirs)
+    with _registries_lock:
+        existing = PRODUCT_SETS.get(product_set)
+        if existing is not None and existing != config_dirs:
+            raise ValueError(f"상품군 {product_set}의 설정 폴더가 이미 다르게 정의되어 있습니다: {existing}")
+        PRODUCT_SETS[product_set] = config_dirs
+
+
+def install_registry(product_set: str, registry: ProductRegistry, calculator_cls: Optional[type] = None) -> None:
+    """
+    상품군 레지스트리를 직접 등록 (프로세스 풀 워커 초기화, 벤치마크용 합성 상품군)
+    이후 get_registry(product_set)는 설정 폴더를 읽지 않고 이 레지스트리를 반환
+    """
+    if calculator_cls is None:
+        calculator_cls = registry.calculator_cls
+    with _registries_lock:
+        _registries[(product_set, calculator_cls)] = registry
+
+
+def registry_stats() -> List[Dict[str, Any]]:
+    """로드된 모든 레지스트리 통계"""
+    return [registry.stats() for registry in list(_registries.values())]
+
+
+def reset_registries():
+    """레지스트리 초기화 (설정 파일 변경 후 다시 로드할 때 사용)"""
+    with _registries_lock:
+        _registries.clear()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+계산 결과 캐시
+같은 매물이 반복 게시되거나 메시지가 수정되어 같은 내용이 다시 들어오면
+금융사별 계산과 결과 포맷팅을 건너뛰고 포맷된 회신을 바로 반환
+
+- 키: 파싱된 담보물건 정보의 정규화 해시 + 채팅방 타입(상품군) + 상품군 설정 내용 해시
+  (설정이 바뀌어 레지스트리를 다시 로드하면 키가 달라지므로 이전 결과는 자연히 사용되지 않음)
+- 크기 제한(LRU) + 유효 시간(TTL), 스레드 안전 (여러 핸들러가 공유)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 크기 / 유효 시간(초) - RESULT_CACHE_SIZE / RESULT_CACHE_TTL 환경변수로 변경 (크기 0이면 캐시 사용 안 함)
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 600.0
+
+
+def canonical_hash(value: Any) -> str:
+    """
+    값의 정규화 해시 (딕셔너리 키 순서와 무관)
+    JSON으로 표현할 수 없는 값은 문자열로 변환
+    """
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    크기 제한 LRU + TTL 캐시 (스레드 안전)
+
+    Attributes:
+        hits / misses: 조회 적중 / 실패 수 (만료된 항목 조회는 실패로 집계)
+        evictions: 크기 제한으로 밀려난 항목 수
+        expirations: 유효 시간이 지나 제거된 항목 수
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (0 이하면 저장하지 않음)
+            ttl: 항목 유효 시간(초, None이면 만료 없음)
+            clock: 시간 함수 (테스트/벤치마크용)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (적중 시 최근 사용으로 갱신)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """캐시 저장 (크기 제한을 넘으면 가장 오래 사용되지 않은 항목 제거)"""
+        if self.max_entries <= 0:
+            return
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """모든 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """프로세스 공유 결과 캐시 (처음 호출 시 환경변수 설정으로 생성)"""
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                ttl = float(os.getenv("RESULT_CACHE_TTL", DEFAULT_TTL))
+                _result_cache = ResultCache(
+                    max_entries=int(os.getenv("RESULT_CACHE_SIZE", DEFAULT_MAX_ENTRIES)),
+                    ttl=ttl if ttl > 0 else None
+                )
+    return _result_cache
+
+
+def result_cache_stats() -> Dict[str, Any]:
+    """프로세스 공유 결과 캐시 통계"""
+    return get_result_cache().stats()
+
+
+def resolve_product_set(chat_type: str) -> str:
+    """채팅방 타입에 해당하는 상품군 (등록되지 않은 타입은 banks)"""
+    from calculator.registry import PRODUCT_SETS
+
+    return chat_type if chat_type in PRODUCT_SETS else "banks"
+
+
+def result_cache_key(property_data: Dict[str, Any], chat_type: str) -> tuple:
+    """(상품군, 설정 내용 해시, 담보물건 정보 해시) 캐시 키"""
+    from calculator.registry import get_registry
+
+    product_set = resolve_product_set(chat_type)
+    return (product_set, get_registry(product_set).config_hash, canonical_hash(property_data))
+
+
+def calculate_formatted_result(
+    property_data: Dict[str, Any],
+    chat_type: str = "banks",
+    cache: Optional[ResultCache] = None
+) -> str:
+    """
+    파싱된 담보물건 정보로 금융사별 계산 후 포맷된 회신 반환 (결과 캐시 사용)
+
+    Args:
+        property_data: 파싱된 담보물건 정보
+        chat_type: 채팅방 타입 (같은 이름의 상품군으로 계산, 등록되지 않은 타입은 은행 상품군)
+        cache: 사용할 캐시 (기본값: 프로세스 공유 캐시)
+
+    Returns:
+        format_all_results() 결과 문자열
+    """
+    from calculator.base_calculator import BaseCalculator
+    from utils.formatter import format_all_results
+
+    if cache is None:
+        cache = get_result_cache()
+
+    # 계산 중 property_data가 바뀌어도 키가 달라지지 않도록 계산 전에 키 생성
+    key = result_cache_key(property_data, chat_type)
+    formatted_result = cache.get(key)
+    if formatted_result is not None:
+        logger.debug("calculate_formatted_result - cache hit (%s)", key[0])
+        return formatted_result
+
+    results = BaseCalculator.calculate_product_set(key[0], property_data)
+    logger.info("calculate_formatted_result - results count: %d", len(results) if results else 0)
+
+    formatted_result = format_all_results(results)
+    cache.put(key, formatted_result)
+    return formatted_result
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+신용점수 구간 테이블
+"920-1000" 형식의 구간 키를 설정 로드 시 한 번만 파싱하여
+정렬된 경계 배열 + 이진 탐색으로 조회
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def parse_score_range(range_str: str) -> Tuple[int, int]:
+    """
+    "920-1000" 형식의 구간 키 파싱
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    parts = str(range_str).split("-")
+    if len(parts) != 2:
+        raise ValueError(f"신용점수 구간 형식이 올바르지 않습니다: '{range_str}'")
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError:
+        raise ValueError(f"신용점수 구간 형식이 올바르지 않습니다: '{range_str}'") from None
+
+
+class ScoreRangeTable:
+    """
+    신용점수 구간 -> 값 테이블
+
+    - 형식이 잘못된 키나 서로 겹치는 구간은 생성 시 ValueError
+    - normalize_order=True: "1000-915"처럼 내림차순 구간도 915~1000으로 처리
+    - normalize_order=False: 내림차순 구간은 어떤 점수와도 매칭되지 않음
+      (기존 `min <= score <= max` 비교와 동일) -> inactive_keys에 기록
+    """
+
+    def __init__(self, mapping: Dict[str, Any], normalize_order: bool = False, name: str = "credit_score"):
+        self.name = name
+        self.inactive_keys: Tuple[str, ...] = ()
+
+        intervals = []
+        inactive = []
+        for range_str, value in mapping.items():
+            low, high = parse_score_range(range_str)
+            if low > high:
+                if not normalize_order:
+                    inactive.append(range_str)
+                    continue
+                low, high = high, low
+            intervals.append((low, high, range_str, value))
+
+        intervals.sort(key=lambda interval: interval[0])
+        for previous, current in zip(intervals, intervals[1:]):
+            if current[0] <= previous[1]:
+                raise ValueError(
+                    f"{name}: 신용점수 구간이 겹칩니다 ('{previous[2]}', '{current[2]}')"
+                )
+
+        self._starts: List[int] = [interval[0] for interval in intervals]
+        self._ends: List[int] = [interval[1] for interval in intervals]
+        self._keys: List[str] = [interval[2] for interval in intervals]
+        self._values: List[Any] = [interval[3] for interval in intervals]
+        self.inactive_keys = tuple(inactive)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _find(self, score: Optional[float]) -> int:
+        """점수가 속한 구간 인덱스 (-1은 없음)"""
+        if score is None:
+            return -1
+        index = bisect_right(self._starts, score) - 1
+        if index >= 0 and score <= self._ends[index]:
+            return index
+        return -1
+
+    def lookup(self, score: Optional[float]) -> Optional[Any]:
+        """점수가 속한 구간의 값 (없으면 None)"""
+        index = self._find(score)
+        return self._values[index] if index != -1 else None
+
+    def lookup_key(self, score: Optional[float]) -> Optional[str]:
+        """점수가 속한 구간의 원본 키 (예: "920-999", 없으면 None)"""
+        index = self._find(score)
+        return self._keys[index] if index != -1 else None
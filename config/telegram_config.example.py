@@ -36,3 +36,30 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "YOUR_BOT_TOKEN_HERE")
 
 WEBHOOK_URL = os.getenv("WEBHOOK_URL", None)
 
+
+# ============================================
+# 채팅방 라우팅 설정 (채팅방 -> 상품군)
+# ============================================
+# 방법 1: 상품군별 허용 채팅방 ID (쉼표로 구분, 환경변수가 있으면 환경변수 우선)
+#   - ALLOWED_CHAT_IDS_BANKS: 은행 상품군으로 계산할 채팅방 (1번방)
+#   - ALLOWED_CHAT_IDS_LOAN: 대부 상품군으로 계산할 채팅방 (2번방)
+#   - 둘 다 비워두면 모든 채팅방에서 은행 상품군으로 계산
+#
+# 방법 2: CHAT_ROUTES (채팅방 타입 -> 채팅방 ID, 환경변수 CHAT_ROUTES에 JSON으로 지정 가능)
+#   - 설정하면 ALLOWED_CHAT_IDS_* 대신 사용
+#   - config_dirs를 지정하면 새 채팅방 타입(상품군) 추가 (data 폴더 기준 설정 폴더)
+#
+# CHAT_ROUTES = {
+#     "banks": "-1001111111111",
+#     "loan": ["-1002222222222"],
+#     "vip": {"chat_ids": ["-1003333333333"], "config_dirs": ["vip"]},
+# }
+
+ALLOWED_CHAT_IDS_BANKS = os.getenv("ALLOWED_CHAT_IDS_BANKS", "")
+ALLOWED_CHAT_IDS_LOAN = os.getenv("ALLOWED_CHAT_IDS_LOAN", "")
+
+# 채팅방 가중치 (선택, 환경변수 CHAT_WEIGHTS에 JSON으로 지정 가능)
+#   - 메시지가 몰릴 때 차례마다 연속으로 계산할 메시지 수 (기본 1 = 채팅방별로 번갈아 계산)
+#   - 키는 채팅방 타입 또는 채팅방 ID (채팅방 ID가 우선)
+#
+# CHAT_WEIGHTS = {"loan": 2, "-1001111111111": 3}
@@ -4,27 +4,61 @@
 """
 
 import asyncio
+import contextlib
 import logging
+import signal
 import sys
 import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
 
 # 프로젝트 루트를 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
-from config.telegram_config import TELEGRAM_BOT_TOKEN
 from parsers.message_parser import MessageParser
-from calculator.base_calculator import BaseCalculator
-from utils.formatter import format_all_results
-
-# 로깅 설정
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
+from calculator.result_cache import calculate_formatted_result
+from utils.chat_routing import get_chat_router
+from utils.fair_scheduler import BUSY_MESSAGE, FairGate
+from utils.log import configure_logging
+from utils.shard_workers import ShardedWorkerPool
+
+# 로깅 설정 (LOG_LEVEL 환경변수, 기본 INFO)
+configure_logging(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 동시에 처리할 업데이트 수 (1이면 기존처럼 한 번에 하나씩 순서대로 처리)
+# 동시 처리 시 같은 채팅방의 회신 순서는 메시지 순서와 다를 수 있음 (회신은 각 원본 메시지에 답장으로 표시)
+CONCURRENT_UPDATES = int(os.getenv("BOT_CONCURRENT_UPDATES", "8"))
+
+# 공정 스케줄링: 계산/회신은 채팅방별 대기열을 번갈아(CHAT_WEIGHTS 가중치) CONCURRENT_UPDATES개까지 동시에 처리
+# (한 채팅방에 메시지가 몰려도 다른 채팅방 메시지가 그 뒤에 줄 서지 않음, 0이면 사용 안 함 - 도착 순서대로)
+FAIR_SCHEDULING = os.getenv("BOT_FAIR_SCHEDULING", "1").strip().lower() not in ("0", "false", "no", "off")
+# 채팅방 대기열이 이만큼 쌓이면 더 받지 않고 "요청이 많음" 회신 (0이면 제한 없음)
+CHAT_BACKLOG = int(os.getenv("BOT_CHAT_BACKLOG", "20"))
+# 스케줄러 차례를 기다릴 수 있는 업데이트 수 (텔레그램 Application의 동시 처리 수)
+PENDING_UPDATES = int(os.getenv("BOT_PENDING_UPDATES", "256"))
+# 채팅방별 대기열 통계를 로그로 남기는 간격(초, 0이면 남기지 않음)
+SCHEDULER_STATS_INTERVAL = float(os.getenv("BOT_SCHEDULER_STATS_INTERVAL", "60"))
+
+# 파싱/계산을 실행할 executor: thread(기본, 스레드 풀) / process(프로세스 풀, CPU가 여러 개일 때) /
+# none(이벤트 루프에서 직접 실행 - 기존 방식, 계산 중에는 다른 업데이트가 멈춤)
+CALCULATION_EXECUTOR = os.getenv("BOT_EXECUTOR", "thread").strip().lower()
+CALCULATION_WORKERS = int(os.getenv("BOT_WORKERS", "0")) or None
+
+# 감독 모드: 워커 프로세스 수 (0이면 사용 안 함)
+# 이 프로세스는 getUpdates/회신만 하고 파싱/계산은 chat_id 기준으로 나눈 워커 프로세스가 수행
+# (같은 채팅방은 항상 같은 워커 + 채팅방별로 도착 순서대로 계산/회신, SIGHUP으로 워커 정상 재시작)
+SHARD_WORKERS = int(os.getenv("BOT_SHARD_WORKERS", "0"))
+# 감독 모드 워커별 큐 깊이를 로그로 남기는 간격(초, 0이면 남기지 않음)
+SHARD_STATS_INTERVAL = float(os.getenv("BOT_SHARD_STATS_INTERVAL", "60"))
+
+# bot_data에 executor / 워커 풀 / 스케줄러를 저장하는 키
+EXECUTOR_KEY = "calculation_executor"
+SHARD_POOL_KEY = "shard_pool"
+SCHEDULER_KEY = "scheduler"
+
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """봇 시작 명령어"""
@@ -44,54 +78,261 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "/help - 도움말 보기\n\n"
         "이제 담보물건 정보를 보내주시면 계산해드리겠습니다! 🚀"
     )
-    await update.message.reply_text(welcome_message)
+    await update.effective_message.reply_text(welcome_message)
+
+
+def compute_reply(message_text: str) -> str:
+    """메시지 파싱 후 계산 및 결과 포맷팅 (executor/워커 프로세스에서 실행, 같은 내용이 다시 들어오면 캐시된 회신 사용)"""
+    parser = MessageParser()
+    property_data = parser.parse(message_text)
+    return calculate_formatted_result(property_data, "banks")
+
+
+def warm_worker():
+    """감독 모드 워커 시작 시 상품 레지스트리 로드 (첫 계산이 설정 로드를 기다리지 않도록)"""
+    from calculator.registry import get_registry
+    get_registry("banks")
+
+
+@contextlib.asynccontextmanager
+async def scheduled(context: ContextTypes.DEFAULT_TYPE, chat_id):
+    """
+    스케줄러 차례를 받아 계산 + 회신 (스케줄러가 없으면 바로 처리)
+    차례를 받지 못하면(채팅방 대기열이 가득 참) 사유를 넘김, 감독 모드는 채팅방별 도착 순서대로 하나씩 처리
+    """
+    scheduler = context.bot_data.get(SCHEDULER_KEY)
+    if scheduler is None:
+        yield None
+        return
+    skipped = await scheduler.acquire(chat_id)
+    if skipped:
+        yield skipped
+        return
+    try:
+        yield None
+    finally:
+        scheduler.release(chat_id)
+
+
+async def run_calculation(context: ContextTypes.DEFAULT_TYPE, chat_id, message_text: str) -> str:
+    """감독 모드면 채팅방의 워커 프로세스, 아니면 executor(없으면 이벤트 루프)에서 계산"""
+    pool = context.bot_data.get(SHARD_POOL_KEY)
+    if pool is not None:
+        return await asyncio.wrap_future(pool.submit(chat_id, message_text))
+    executor = context.bot_data.get(EXECUTOR_KEY)
+    if executor is None:
+        return compute_reply(message_text)
+    return await asyncio.get_running_loop().run_in_executor(executor, compute_reply, message_text)
 
 
 async def calculate(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """담보대출 계산 처리"""
-    message_text = update.message.text
+    # 수정된 메시지(edited_message)도 같은 핸들러로 들어옴
+    message = update.effective_message
+    message_text = message.text
     
     if not message_text:
-        await update.message.reply_text("메시지가 비어있습니다.")
+        await message.reply_text("메시지가 비어있습니다.")
         return
     
-    try:
-        # 메시지 파싱
-        parser = MessageParser()
-        property_data = parser.parse(message_text)
-        
-        # 계산 수행
-        results = BaseCalculator.calculate_all_banks(property_data)
-        
-        # 결과 포맷팅
-        formatted_result = format_all_results(results)
-        
-        # 결과 전송
-        await update.message.reply_text(formatted_result)
-        
-    except Exception as e:
-        logger.error(f"계산 중 오류 발생: {e}", exc_info=True)
-        await update.message.reply_text(
-            f"계산 중 오류가 발생했습니다.\n\n"
-            f"오류 내용: {str(e)}\n\n"
-            f"메시지 형식을 확인해주세요."
+    # 채팅방별로 번갈아 차례를 받음 (감독 모드는 같은 채팅방의 회신이 메시지 순서대로 나가도록 하나씩)
+    async with scheduled(context, message.chat_id) as skipped:
+        if skipped:
+            logger.warning("채팅방 %s 대기열이 가득 차 계산하지 않습니다", message.chat_id)
+            await message.reply_text(BUSY_MESSAGE)
+            return
+        try:
+            # 파싱/계산은 executor/워커 프로세스에서 실행 (계산 중에도 이벤트 루프는 다른 업데이트의 회신 대기 등을 처리)
+            formatted_result = await run_calculation(context, message.chat_id, message_text)
+            
+            # 결과 전송
+            await message.reply_text(formatted_result)
+            
+        except Exception as e:
+            logger.error("계산 중 오류 발생: %s", e, exc_info=True)
+            await message.reply_text(
+                f"계산 중 오류가 발생했습니다.\n\n"
+                f"오류 내용: {str(e)}\n\n"
+                f"메시지 형식을 확인해주세요."
+            )
+
+
+def create_executor(kind: str = CALCULATION_EXECUTOR, workers: Optional[int] = CALCULATION_WORKERS) -> Optional[Executor]:
+    """
+    파싱/계산용 executor 생성
+
+    Args:
+        kind: thread / process / none
+        workers: 워커 수 (None이면 스레드 풀은 min(32, CPU 수 + 4), 프로세스 풀은 CPU 수)
+
+    Returns:
+        Executor (none이면 None - 이벤트 루프에서 직접 계산)
+
+    Raises:
+        ValueError: 알 수 없는 executor 종류
+    """
+    if kind == "none":
+        return None
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="calculate")
+    if kind == "process":
+        # 워커마다 상품 설정을 풀 시작 시 한 번만 전달 (결과 캐시는 워커 프로세스별)
+        from calculator.parallel import create_process_pool
+        return create_process_pool(workers)
+    raise ValueError(f"알 수 없는 executor입니다: {kind} (thread / process / none)")
+
+
+async def log_shard_stats(pool: ShardedWorkerPool, interval: float):
+    """감독 모드 워커별 큐 깊이를 주기적으로 로그에 기록"""
+    while True:
+        await asyncio.sleep(interval)
+        stats = pool.stats()
+        logger.info(
+            "워커 프로세스 상태 (재시작 %d, 비정상 종료 %d): %s", stats["restarts"], stats["crashes"],
+            ", ".join(
+                f"#{worker['index']} 깊이 {worker['depth']} (최대 {worker['high_watermark']}) 처리 {worker['processed']}"
+                for worker in stats["workers"]
+            )
         )
 
 
+async def log_scheduler_stats(scheduler: FairGate, interval: float):
+    """채팅방별 대기열 상태를 주기적으로 로그에 기록"""
+    while True:
+        await asyncio.sleep(interval)
+        stats = scheduler.stats()
+        if not stats["chats"]:
+            continue
+        logger.info(
+            "채팅방별 대기열 (처리 중 %d/%d, 대기 %d, 거절 %d): %s", stats["running"], stats["limit"], stats["depth"], stats["shed"],
+            ", ".join(
+                f"{chat_id} 깊이 {chat['depth']} (최대 {chat['high_watermark']}) 처리 {chat['processed']} "
+                f"거절 {chat['shed']} 평균 대기 {chat['wait_ms']['mean']:.0f}ms"
+                for chat_id, chat in stats["chats"].items()
+            )
+        )
+
+
+async def start_background_tasks(application: Application):
+    """봇 시작 시 스케줄러 통계 로그 작업과 감독 모드 처리 등록"""
+    scheduler = application.bot_data.get(SCHEDULER_KEY)
+    if scheduler is not None and SCHEDULER_STATS_INTERVAL > 0:
+        application.bot_data["scheduler_stats_task"] = asyncio.create_task(
+            log_scheduler_stats(scheduler, SCHEDULER_STATS_INTERVAL)
+        )
+    if SHARD_POOL_KEY in application.bot_data:
+        await start_supervisor(application)
+
+
+async def start_supervisor(application: Application):
+    """감독 모드 시작 시 워커 상태 로그 작업과 SIGHUP(워커 정상 재시작) 처리 등록"""
+    pool = application.bot_data[SHARD_POOL_KEY]
+    if SHARD_STATS_INTERVAL > 0:
+        application.bot_data["shard_stats_task"] = asyncio.create_task(log_shard_stats(pool, SHARD_STATS_INTERVAL))
+    if hasattr(signal, "SIGHUP"):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, pool.restart_all)
+
+
+async def shutdown_workers(application: Application):
+    """봇 종료 시 executor / 워커 프로세스 정리"""
+    executor = application.bot_data.pop(EXECUTOR_KEY, None)
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+    for task_key in ("shard_stats_task", "scheduler_stats_task"):
+        stats_task = application.bot_data.pop(task_key, None)
+        if stats_task is not None:
+            stats_task.cancel()
+    pool = application.bot_data.pop(SHARD_POOL_KEY, None)
+    if pool is not None:
+        pool.stop()
+
+
+def build_application(
+    token: str,
+    concurrent_updates: int = CONCURRENT_UPDATES,
+    executor: Optional[Executor] = None,
+    bot=None,
+    shard_pool: Optional[ShardedWorkerPool] = None,
+    fair_scheduling: bool = FAIR_SCHEDULING,
+    chat_backlog: int = CHAT_BACKLOG
+) -> Application:
+    """
+    텔레그램 봇 애플리케이션 생성 및 핸들러 등록
+
+    Args:
+        token: 봇 토큰
+        concurrent_updates: 동시에 처리할 업데이트 수 (1이면 순차 처리)
+        executor: 파싱/계산용 executor (None이면 이벤트 루프에서 직접 계산, 종료 시 shutdown)
+        bot: 사용할 Bot 객체 (부하 테스트용, 지정하면 token 대신 사용)
+        shard_pool: 감독 모드 워커 프로세스 풀 (지정하면 executor 대신 사용, 종료 시 stop)
+        fair_scheduling: 채팅방별 공정 스케줄링 사용 여부 (감독 모드는 항상 사용)
+        chat_backlog: 채팅방별 최대 대기 수 (넘으면 "요청이 많음" 회신, 0이면 제한 없음)
+
+    Returns:
+        Application
+    """
+    builder = Application.builder()
+    builder = builder.bot(bot) if bot is not None else builder.token(token)
+    scheduler = None
+    if fair_scheduling or shard_pool is not None:
+        # 동시 처리 수는 스케줄러가 제한하고, Application은 차례를 기다리는 업데이트까지 받아 둠
+        scheduler = FairGate(
+            max(1, concurrent_updates),
+            max_backlog=chat_backlog,
+            weight=get_chat_router().weight,
+            per_key_limit=1 if shard_pool is not None else 0
+        )
+        concurrent_updates = max(concurrent_updates, PENDING_UPDATES)
+    builder = builder.concurrent_updates(max(1, concurrent_updates)).post_shutdown(shutdown_workers)
+    builder = builder.post_init(start_background_tasks)
+    application = builder.build()
+    application.bot_data[EXECUTOR_KEY] = executor
+    if scheduler is not None:
+        application.bot_data[SCHEDULER_KEY] = scheduler
+    if shard_pool is not None:
+        application.bot_data[SHARD_POOL_KEY] = shard_pool
+    
+    # 핸들러 등록
+    application.add_handler(CommandHandler("start", start))
+    application.add_handler(CommandHandler("help", start))
+    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, calculate))
+    return application
+
+
+def load_bot_token() -> Optional[str]:
+    """봇 토큰 (환경변수, 없으면 config/telegram_config.py)"""
+    token = os.getenv("TELEGRAM_BOT_TOKEN")
+    if token:
+        return token
+    try:
+        from config.telegram_config import TELEGRAM_BOT_TOKEN  # type: ignore
+    except ModuleNotFoundError:
+        return None
+    return TELEGRAM_BOT_TOKEN
+
+
 def main():
     """메인 함수"""
-    if TELEGRAM_BOT_TOKEN == "YOUR_BOT_TOKEN_HERE":
+    token = load_bot_token()
+    if not token or token == "YOUR_BOT_TOKEN_HERE":
         print("⚠️  텔레그램 봇 토큰을 설정해주세요!")
         print("config/telegram_config.py 파일을 열어서 TELEGRAM_BOT_TOKEN을 입력하세요.")
         return
     
     # 텔레그램 봇 애플리케이션 생성
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
-    
-    # 핸들러 등록
-    application.add_handler(CommandHandler("start", start))
-    application.add_handler(CommandHandler("help", start))
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, calculate))
+    if SHARD_WORKERS > 0:
+        # 감독 모드: 워커 프로세스를 먼저 띄워 레지스트리를 로드해 둠
+        pool = ShardedWorkerPool(SHARD_WORKERS, compute_reply, initializer=warm_worker, name="calculate")
+        pool.start()
+        application = build_application(token, shard_pool=pool)
+        logger.info("감독 모드: 동시 처리 업데이트 %s개, 워커 프로세스 %s개", CONCURRENT_UPDATES, SHARD_WORKERS)
+    else:
+        application = build_application(token, executor=create_executor())
+        logger.info("동시 처리 업데이트 %s개, 계산 executor: %s (워커 %s)",
+                    CONCURRENT_UPDATES, CALCULATION_EXECUTOR, CALCULATION_WORKERS or "기본")
+    if FAIR_SCHEDULING or SHARD_WORKERS > 0:
+        logger.info("채팅방별 공정 스케줄링 (채팅방별 최대 대기 %s, 가중치 %s)",
+                    CHAT_BACKLOG or "제한 없음", get_chat_router().weights or "없음")
     
     # 봇 시작
     print("🤖 텔레그램 봇이 시작되었습니다...")
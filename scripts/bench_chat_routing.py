@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+채팅방 라우팅 벤치마크 (요청마다 설정 읽기 + 리스트 검색 vs 라우팅 테이블 dict 조회)
+기존 웹훅은 요청마다 ALLOWED_CHAT_IDS_BANKS / ALLOWED_CHAT_IDS_LOAN을 읽어 split/int 변환하고
+허용 여부와 채팅방 타입을 리스트 in 검색으로 결정했음 (legacy_* 함수에 그대로 보관)
+
+- 채팅방 수별 업데이트당 허용 여부 + 채팅방 타입 결정 시간(µs)
+- 두 방식의 판정(허용 여부, 채팅방 타입)이 같은지 확인
+- 채팅방 타입별 레지스트리 조회 (room type -> 상품군 레지스트리)
+
+사용법: python scripts/bench_chat_routing.py [조회 수] [채팅방 수,채팅방 수,...]
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.chat_routing import get_chat_router, reset_chat_router
+
+
+def legacy_load_allowed_chat_ids():
+    """기존 방식 - 요청마다 환경변수(없으면 config/telegram_config.py)를 읽어 변환"""
+    ALLOWED_CHAT_IDS_BANKS_STR = os.getenv("ALLOWED_CHAT_IDS_BANKS")
+    ALLOWED_CHAT_IDS_LOAN_STR = os.getenv("ALLOWED_CHAT_IDS_LOAN")
+
+    if not ALLOWED_CHAT_IDS_BANKS_STR:
+        try:
+            from config.telegram_config import ALLOWED_CHAT_IDS_BANKS  # type: ignore
+            ALLOWED_CHAT_IDS_BANKS_STR = ALLOWED_CHAT_IDS_BANKS
+        except (ModuleNotFoundError, ImportError):
+            ALLOWED_CHAT_IDS_BANKS_STR = None
+
+    if not ALLOWED_CHAT_IDS_LOAN_STR:
+        try:
+            from config.telegram_config import ALLOWED_CHAT_IDS_LOAN  # type: ignore
+            ALLOWED_CHAT_IDS_LOAN_STR = ALLOWED_CHAT_IDS_LOAN
+        except (ModuleNotFoundError, ImportError):
+            ALLOWED_CHAT_IDS_LOAN_STR = None
+
+    allowed_chat_ids_banks = []
+    if ALLOWED_CHAT_IDS_BANKS_STR:
+        allowed_chat_ids_banks = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS_BANKS_STR.split(",") if chat_id.strip()]
+
+    allowed_chat_ids_loan = []
+    if ALLOWED_CHAT_IDS_LOAN_STR:
+        allowed_chat_ids_loan = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS_LOAN_STR.split(",") if chat_id.strip()]
+
+    return allowed_chat_ids_banks, allowed_chat_ids_loan
+
+
+def legacy_route(chat_id):
+    """기존 방식 - (허용 여부, 채팅방 타입)"""
+    allowed_chat_ids_banks, allowed_chat_ids_loan = legacy_load_allowed_chat_ids()
+    allowed_chat_ids = allowed_chat_ids_banks + allowed_chat_ids_loan
+    allowed = chat_id is not None and (not allowed_chat_ids or chat_id in allowed_chat_ids)
+    if chat_id in allowed_chat_ids_banks:
+        return allowed, "banks"
+    elif chat_id in allowed_chat_ids_loan:
+        return allowed, "loan"
+    return allowed, "banks"
+
+
+def per_call_micros(route, chat_ids):
+    started = time.perf_counter()
+    results = [route(chat_id) for chat_id in chat_ids]
+    return (time.perf_counter() - started) / len(chat_ids) * 1e6, results
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    sizes = tuple(int(value) for value in sys.argv[2].split(",")) if len(sys.argv) > 2 else (2, 20, 200)
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(21)
+    os.environ.pop("CHAT_ROUTES", None)
+
+    print(f"업데이트 {lookups}건 - 허용 여부 + 채팅방 타입 결정 (허용되지 않은 채팅방 20%)")
+    for size in sizes:
+        banks = [-1001000000000 - index for index in range(size // 2)]
+        loan = [-1002000000000 - index for index in range(size - size // 2)]
+        os.environ["ALLOWED_CHAT_IDS_BANKS"] = ",".join(str(chat_id) for chat_id in banks)
+        os.environ["ALLOWED_CHAT_IDS_LOAN"] = ",".join(str(chat_id) for chat_id in loan)
+        chat_ids = [rng.choice(banks + loan) if rng.random() < 0.8 else -1009000000000 for _ in range(lookups)]
+
+        reset_chat_router()
+        router = get_chat_router()
+        legacy_us, legacy_results = per_call_micros(legacy_route, chat_ids)
+        router_us, results = per_call_micros(lambda chat_id: (router.is_allowed(chat_id), router.room_type(chat_id)), chat_ids)
+        same = "일치" if legacy_results == results else "불일치"
+        print(f"  채팅방 {size:4d}개: 기존 {legacy_us:7.2f} µs / 라우팅 테이블 {router_us:5.2f} µs ({legacy_us / router_us:5.1f}배, 판정 {same})")
+
+    # 채팅방 타입 -> 상품군 레지스트리 (프로세스당 한 번 로드, 이후 조회는 같은 객체)
+    started = time.perf_counter()
+    router.preload()
+    preload_ms = (time.perf_counter() - started) * 1000
+    registries = {
+        room_type: router.registry(next(chat_id for chat_id, value in router.table.items() if value == room_type))
+        for room_type in router.room_types
+    }
+    print(f"채팅방 타입별 레지스트리 미리 로드 {preload_ms:.1f}ms - "
+          + ", ".join(f"{room_type}: 설정 {registry.config_count}개" for room_type, registry in registries.items()))
+
+
+if __name__ == "__main__":
+    main()
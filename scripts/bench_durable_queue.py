@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+내구성 큐(utils/durable_queue.py) 처리량 벤치마크
+웹훅 요청 body 크기의 항목으로 적재(enqueue)와 꺼내기(claim + ack) 속도를 측정
+
+- 적재: 커밋마다 1건(요청마다 바로 커밋) / 그룹 커밋(enqueue, 생산자 스레드 수별 - 요청 스레드를 흉내) /
+  flush_interval로 더 모은 그룹 커밋 / enqueue_many 100건 묶음, synchronous NORMAL과 FULL(커밋마다 fsync)
+- 꺼내기: claim(1) + ack 1건씩 (워커 스레드 수별) / claim(100) + ack 100건 묶음
+- 모든 적재 항목이 한 번씩 꺼내졌는지 확인
+
+사용법: python scripts/bench_durable_queue.py [항목 수] [생산자 스레드 수,...]
+"""
+
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from bench_pipeline import load_corpus
+from utils.durable_queue import DurableQueue
+
+
+def make_payloads(count):
+    """웹훅 요청 body(JSON 문자열) 목록"""
+    forms = [entry["message"] for entry in load_corpus()]
+    return [
+        json.dumps({
+            "update_id": index,
+            "message": {"message_id": index, "date": 0, "chat": {"id": -1001, "type": "supergroup"}, "text": forms[index % len(forms)]},
+        }, ensure_ascii=False)
+        for index in range(count)
+    ]
+
+
+def measure_enqueue(directory, payloads, mode, producers=1, flush_interval=0.0, synchronous="NORMAL"):
+    """적재 처리량(건/s)과 커밋 수"""
+    queue = DurableQueue(os.path.join(directory, f"{mode}-{producers}-{flush_interval}-{synchronous}.db"),
+                         flush_interval=flush_interval, synchronous=synchronous)
+    started = time.perf_counter()
+    if mode == "single":
+        for payload in payloads:
+            queue.enqueue_many([payload])
+    elif mode == "many":
+        for start in range(0, len(payloads), 100):
+            queue.enqueue_many(payloads[start:start + 100])
+    else:
+        with ThreadPoolExecutor(max_workers=producers) as pool:
+            list(pool.map(queue.enqueue, payloads))
+    elapsed = time.perf_counter() - started
+    queue.close()
+    return len(payloads) / elapsed, queue.commits, queue
+
+
+def measure_claim(queue, workers, batch):
+    """꺼내기 + ack 처리량(건/s)과 꺼낸 항목 id 목록"""
+    claimed_ids = []
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            claimed = queue.claim(batch)
+            if not claimed:
+                return
+            queue.ack([item_id for item_id, _, _ in claimed])
+            with lock:
+                claimed_ids.extend(item_id for item_id, _, _ in claimed)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=work) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(claimed_ids) / (time.perf_counter() - started), claimed_ids
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    levels = tuple(int(value) for value in sys.argv[2].split(",")) if len(sys.argv) > 2 else (1, 8, 32)
+    logging.disable(logging.CRITICAL)
+    payloads = make_payloads(count)
+    directory = tempfile.mkdtemp(prefix="bench_durable_queue_")
+    print(f"항목 {count}건 (평균 {sum(len(payload.encode('utf-8')) for payload in payloads) / count:.0f}바이트), {directory}")
+
+    try:
+        print("적재 (enqueue) - 반환 시점에 커밋 완료")
+        queues = []
+        for synchronous in ("NORMAL", "FULL"):
+            scenarios = [("커밋마다 1건", "single", 1, 0.0)]
+            scenarios += [(f"그룹 커밋, 생산자 {producers}", "group", producers, 0.0) for producers in levels]
+            scenarios.append((f"그룹 커밋 + 2ms 모음, 생산자 {max(levels)}", "group", max(levels), 0.002))
+            scenarios.append(("enqueue_many 100건 묶음", "many", 1, 0.0))
+            for label, mode, producers, flush_interval in scenarios:
+                rate, commits, queue = measure_enqueue(directory, payloads, mode, producers, flush_interval, synchronous)
+                queues.append(queue)
+                print(f"  {synchronous:<6} {label:<28} {rate:9.0f}건/s  커밋 {commits:5d}회 (커밋당 {count / commits:6.1f}건)")
+
+        print("꺼내기 (claim + ack)")
+        for label, queue, workers, batch in (
+            ("1건씩, 워커 1", queues[0], 1, 1),
+            (f"1건씩, 워커 {max(levels) // 8 or 1}", queues[1], max(levels) // 8 or 1, 1),
+            ("100건 묶음, 워커 1", queues[2], 1, 100),
+        ):
+            rate, claimed_ids = measure_claim(queue, workers, batch)
+            complete = sorted(claimed_ids) == list(range(1, count + 1))
+            print(f"  {label:<20} {rate:9.0f}건/s  꺼낸 항목 {len(claimed_ids)}/{count} ({'누락/중복 없음' if complete else '누락 또는 중복'})  "
+                  f"남은 항목 {queue.counts()['ready'] + queue.counts()['delayed']}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
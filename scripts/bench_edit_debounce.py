@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+수정 메시지 디바운스 벤치마크
+같은 메시지를 짧은 간격으로 여러 번 수정(오타 수정)하는 상황을 api/webhook.py의 handler(로컬 HTTP 서버)에 재현해
+빠른 응답/내구성 큐 모드에서 디바운스 사용/미사용일 때 계산 횟수, 회신 횟수, 다른 채팅방 회신 지연을 비교
+
+- 채팅방 1의 메시지 여러 개가 동시에 원본 1건 + 수정 N건을 일정 간격으로 POST
+  (do_POST -> 큐 -> 워커 -> process_update_body -> handle_message 실제 경로, 워커 수는 WEBHOOK_WORKERS 기본값)
+- 0.2초 뒤 채팅방 2에서 새 메시지 1건 POST -> 회신까지 걸린 시간 (디바운스 대기가 워커를 붙잡으면 길어짐)
+- 계산은 실제 파싱/계산/포맷팅 (결과 캐시 사용 안 함), 회신(Bot API)만 지연을 흉내 낸 sleep으로 대체
+  (텔레그램 서버에 접속하지 않음)
+- 마지막 회신이 마지막 수정 내용으로 계산되었는지 확인
+
+사용법: python scripts/bench_edit_debounce.py [메시지 수] [수정 횟수] [수정 간격(ms)] [회신 지연(ms)]
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+# Application 생성에만 쓰는 토큰 (텔레그램 서버에 접속하지 않음)
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456:bench-token")
+# 큐 모드로 로드 (모드는 측정마다 바꿈)
+os.environ["WEBHOOK_FAST_ACK"] = "1"
+
+import calculator.result_cache as result_cache
+from bench_pipeline import load_corpus
+
+calculations = []
+_counter_lock = threading.Lock()
+_original_calculate = result_cache.calculate_formatted_result
+_no_cache = result_cache.ResultCache(max_entries=0)
+
+
+def counting_calculate(property_data, chat_type="banks", cache=None):
+    """계산 횟수를 집계하는 calculate_formatted_result (캐시 사용 안 함)"""
+    result = _original_calculate(property_data, chat_type, cache=_no_cache)
+    with _counter_lock:
+        calculations.append(property_data.get("kb_price"))
+    return result
+
+
+# get_application()이 계산 함수를 import하기 전에 교체
+result_cache.calculate_formatted_result = counting_calculate
+import api.webhook as webhook
+
+PROBE_CHAT = 2
+PROBE_AT = 0.2
+
+
+class RecordingReplies:
+    """webhook.reply_tracker 대신 회신을 (chat_id, message_id, 원본 내용, 시각)으로 기록 (Bot API 지연은 sleep)"""
+
+    def __init__(self, reply_delay):
+        self.reply_delay = reply_delay
+        self.replies = []
+        self._lock = threading.Lock()
+
+    async def reply(self, message, text):
+        await asyncio.sleep(self.reply_delay)
+        with self._lock:
+            self.replies.append((message.chat_id, message.message_id, message.text, time.perf_counter()))
+        return "sent"
+
+    def stats(self):
+        return {"replies": len(self.replies)}
+
+
+_update_ids = itertools.count(1)
+_update_id_lock = threading.Lock()
+
+
+def post_update(url, chat_id, message_id, text, edited):
+    """텔레그램 업데이트 형식으로 POST (update_id는 보낸 순서대로 증가)"""
+    with _update_id_lock:
+        update_id = next(_update_ids)
+    message = {"message_id": message_id, "date": 0, "chat": {"id": chat_id, "type": "group"}, "text": text}
+    if edited:
+        message["edit_date"] = 0
+    body = json.dumps({"update_id": update_id, "edited_message" if edited else "message": message}).encode("utf-8")
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        response.read()
+
+
+def edited_text(text, version):
+    """수정 버전별 메시지 내용 (수정마다 마지막 줄에 표시를 붙여 내용이 달라지도록)"""
+    return f"{text}\n(수정 {version})" if version else text
+
+
+def wait_idle(durable):
+    """큐에 남은 업데이트(디바운스 대기 포함)가 모두 처리될 때까지 대기"""
+    time.sleep(webhook.EDIT_DEBOUNCE + 0.1)
+    if durable:
+        queue = webhook.get_durable_queue()
+        while True:
+            counts = queue.counts()
+            if counts["ready"] + counts["delayed"] == 0:
+                return
+            time.sleep(0.05)
+    webhook.get_update_queue().join()
+
+
+def run_bursts(url, messages, edits, gap, durable):
+    """메시지별로 원본 + 수정 edits건을 gap초 간격으로 POST, 중간에 다른 채팅방 메시지 1건 (다른 채팅방 보낸 시각, 소요 시간(초))"""
+    def burst(message_id, text):
+        for version in range(edits + 1):
+            post_update(url, 1, message_id, edited_text(text, version), version > 0)
+            time.sleep(gap)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=burst, args=(index, text)) for index, text in enumerate(messages)]
+    for thread in threads:
+        thread.start()
+    time.sleep(PROBE_AT)
+    probe_sent = time.perf_counter()
+    post_update(url, PROBE_CHAT, 0, messages[0], False)
+    for thread in threads:
+        thread.join()
+    wait_idle(durable)
+    return probe_sent, time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    gap = (float(sys.argv[3]) if len(sys.argv) > 3 else 300.0) / 1000
+    reply_delay = (float(sys.argv[4]) if len(sys.argv) > 4 else 150.0) / 1000
+    logging.disable(logging.CRITICAL)
+
+    webhook.get_application()
+    messages = [entry["message"] for entry in load_corpus()[:count]]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), webhook.handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/webhook"
+    print(f"채팅방 1: 메시지 {count}개 x (원본 + 수정 {edits}회), 수정 간격 {gap * 1000:.0f}ms / "
+          f"채팅방 {PROBE_CHAT}: {PROBE_AT * 1000:.0f}ms에 새 메시지 1건 / 회신 지연 {reply_delay * 1000:.0f}ms / "
+          f"워커 {webhook.UPDATE_QUEUE_WORKERS}개")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("빠른 응답", "내구성 큐"):
+            durable = mode == "내구성 큐"
+            webhook.FAST_ACK = not durable
+            webhook.DURABLE_QUEUE_PATH = os.path.join(directory, "updates.sqlite3") if durable else ""
+            for window in (0.0, 1.5):
+                webhook.EDIT_DEBOUNCE = window
+                webhook.message_debouncer.window = window
+                recorder = RecordingReplies(reply_delay)
+                webhook.reply_tracker = recorder
+                calculations.clear()
+                superseded = webhook.edit_versions.superseded
+                probe_sent, elapsed = run_bursts(url, messages, edits, gap, durable)
+
+                last_replies = {}
+                probe_reply = None
+                for chat_id, message_id, text, replied_at in recorder.replies:
+                    if chat_id == PROBE_CHAT:
+                        probe_reply = replied_at - probe_sent
+                    else:
+                        last_replies[message_id] = text
+                latest = sum(
+                    1 for message_id, text in enumerate(messages) if last_replies.get(message_id) == edited_text(text, edits)
+                )
+                probe = f"{probe_reply * 1000:6.0f}ms" if probe_reply is not None else "   없음"
+                print(f"  {mode} 창 {window * 1000:4.0f}ms  계산(채팅방 {PROBE_CHAT} 포함) {len(calculations):3d}회  회신 {len(recorder.replies):3d}회  "
+                      f"건너뛴 이전 버전 {webhook.edit_versions.superseded - superseded:3d}  "
+                      f"마지막 수정 내용으로 회신 {latest}/{count}  채팅방 {PROBE_CHAT} 회신 {probe}  소요 {elapsed:5.2f}s")
+            if durable:
+                webhook.get_durable_queue().close()
+                webhook._durable_queue = None
+    print(f"  디바운서 누적 통계: {webhook.message_debouncer.stats()}")
+    print(f"  최신 버전 누적 통계: {webhook.edit_versions.stats()}")
+
+
+if __name__ == "__main__":
+    main()
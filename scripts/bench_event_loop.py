@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 이벤트 루프 실행 방식 비교
+기존 방식(요청 스레드에서 전역 루프 run_until_complete / 루프 실행 중이면 요청마다 새 스레드)과
+상주 루프 스레드(LoopThread + run_coroutine_threadsafe)의 요청당 오버헤드와 동시 요청 처리 결과를 비교
+
+- 요청당 오버헤드: 아무 일도 하지 않는 코루틴을 순차 실행했을 때 호출당 시간(µs)
+- 동시 요청: 요청 스레드 여러 개가 회신 대기(asyncio.sleep)를 흉내 낸 코루틴을 동시에 실행했을 때
+  전체 소요 시간과 오류 수 (기존 방식은 전역 루프를 잠금 없이 여러 스레드에서 실행)
+
+사용법: python scripts/bench_event_loop.py [순차 호출 수] [동시 요청 스레드 수] [회신 대기(ms)]
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.loop_thread import LoopThread
+
+_legacy_loop = None
+_legacy_lock = threading.Lock()
+
+
+def legacy_run_direct(coro_factory):
+    """기존 방식 - 요청 스레드에 실행 중인 루프가 없을 때 (전역 루프에서 run_until_complete)"""
+    global _legacy_loop
+    if _legacy_loop is None or _legacy_loop.is_closed():
+        _legacy_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_legacy_loop)
+    _legacy_loop.run_until_complete(coro_factory())
+
+
+def legacy_run_locked(coro_factory):
+    """기존 방식 + 잠금 - 전역 루프를 한 번에 한 스레드만 실행 (동시 요청은 직렬화됨)"""
+    with _legacy_lock:
+        legacy_run_direct(coro_factory)
+
+
+def legacy_run_thread(coro_factory):
+    """기존 방식 - 요청 스레드에 실행 중인 루프가 있을 때 (요청마다 새 스레드에서 전역 루프 실행)"""
+    errors = []
+
+    def run_in_new_thread():
+        global _legacy_loop
+        try:
+            if _legacy_loop is None or _legacy_loop.is_closed():
+                new_loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(new_loop)
+            else:
+                new_loop = _legacy_loop
+                asyncio.set_event_loop(new_loop)
+
+            new_loop.run_until_complete(coro_factory())
+
+            if not new_loop.is_closed():
+                _legacy_loop = new_loop
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run_in_new_thread, daemon=False)
+    thread.start()
+    thread.join(timeout=25)
+    if errors:
+        raise errors[0]
+
+
+def per_call_micros(run, calls):
+    """순차 호출 시 호출당 시간(µs)"""
+    async def noop():
+        await asyncio.sleep(0)
+
+    run(noop)  # 루프 생성은 측정에서 제외
+    started = time.perf_counter()
+    for _ in range(calls):
+        run(noop)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def concurrent_requests(run, threads, delay, per_thread=10):
+    """요청 스레드 threads개가 동시에 실행 - (전체 소요 시간(초), 성공 수, 오류 수)"""
+    async def reply():
+        await asyncio.sleep(delay)
+
+    def request(_):
+        try:
+            run(reply)
+            return True
+        except Exception:
+            return False
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(request, range(threads * per_thread)))
+    return time.perf_counter() - started, results.count(True), results.count(False)
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    delay = (float(sys.argv[3]) if len(sys.argv) > 3 else 50.0) / 1000
+
+    loop_thread = LoopThread(name="bench-loop")
+    loop_thread.start()
+
+    def run_on_loop_thread(coro_factory):
+        loop_thread.run(coro_factory(), timeout=25)
+
+    print(f"요청당 오버헤드 (빈 코루틴 {calls}회 순차 실행)")
+    for label, run in (
+        ("기존 - 전역 루프 직접 실행", legacy_run_direct),
+        ("기존 - 요청마다 새 스레드", legacy_run_thread),
+        ("상주 루프 스레드", run_on_loop_thread),
+    ):
+        print(f"  {label:<26} {per_call_micros(run, calls):8.1f} µs/요청")
+
+    # 기존 방식은 루프가 이미 실행 중이면 코루틴을 실행하지 못하고 버림 (never awaited 경고 생략)
+    warnings.simplefilter("ignore", RuntimeWarning)
+    print(f"동시 요청 (요청 스레드 {threads}개 x 10건, 회신 대기 {delay * 1000:.0f}ms)")
+    for label, run in (
+        ("기존 - 전역 루프 직접 실행", legacy_run_direct),
+        ("기존 + 잠금 (직렬화)", legacy_run_locked),
+        ("상주 루프 스레드", run_on_loop_thread),
+    ):
+        elapsed, succeeded, failed = concurrent_requests(run, threads, delay)
+        print(f"  {label:<26} {elapsed:6.2f}s  성공 {succeeded:4d}  오류 {failed:4d}")
+
+    loop_thread.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+로그 출력 오버헤드 벤치마크
+1) 로그 문 한 줄의 호출 비용: 기존 방식(f-string + print 래퍼로 stdout/stderr 이중 출력)과
+   로거 지연 포맷팅(레벨 비활성 / 활성)을 비교
+2) 메시지 한 건(파싱 + 은행/대부 계산)의 처리 시간과 로그 출력량을 로그 레벨별로 비교
+   (stdout/stderr는 파일 디스크립터 단위로 임시 파일에 기록 -> 실제 쓰기 비용 포함)
+
+사용법: python scripts/bench_logging.py [메시지 수]
+"""
+
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator.base_calculator import BaseCalculator
+from parsers.message_parser import MessageParser
+
+LEVELS = ("DEBUG", "INFO", "WARNING")
+
+REGIONS = ("서울특별시 광진구 자양동", "경기도 수원시 영통구", "부산광역시 해운대구 우동", "인천광역시 연수구")
+INSTITUTIONS = ("국민은행", "보성새마을금고", "MG캐피탈", "한국투자저축은행")
+
+
+def generate_messages(count, seed=11):
+    """담보물건 양식 메시지 생성 (개인정보 없는 합성 데이터)"""
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        kb_price = rng.choice([25000, 48000, 59400, 125000])
+        lines = [
+            f"성   명 : 홍길동 ({rng.randint(30, 70)})",
+            "직   업 : 직장인",
+            f"신용점수 : {rng.randint(600, 950)}",
+            "거주여부 : 본인거주",
+            f"주   소 : {rng.choice(REGIONS)} 래미안아파트 101동 {rng.randint(1, 20)}층 1501호",
+            f"면   적 : {rng.choice([59.9, 84.97, 112.3])}㎡",
+            "세대수 : 500세대",
+            "구   분 : 아파트",
+            f"KB시세 : 일반 {kb_price:,}만원",
+            f"하한 {int(kb_price * 0.95):,}만원",
+            "=========설정내역=========",
+        ]
+        for priority in range(1, rng.randint(1, 3) + 1):
+            max_amount = rng.choice([6000, 10800, 27000])
+            lines.append(f"{priority}순위 : {rng.choice(INSTITUTIONS)} {max_amount:,} ({int(max_amount / 1.2):,})만원")
+        lines.append("========================")
+        lines.append("특이사항 : ")
+        lines.append("요청사항 : " + rng.choice(["1순위 대환", "필요자금 5000만원", ""]))
+        messages.append("\n".join(lines))
+    return messages
+
+
+def configure_root(level):
+    """루트 로거를 stderr 핸들러 하나, 지정 레벨로 설정"""
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s - %(name)s - %(message)s"))
+    root.addHandler(handler)
+    root.setLevel(level)
+
+
+def bench_statement(number=20000):
+    """로그 문 한 줄의 호출 비용 (µs)"""
+    devnull = open(os.devnull, "w")
+    _print = print
+
+    def wrapped_print(*args, **kwargs):
+        # 기존 base_calculator의 print 래퍼와 같은 동작 (stderr + stdout, 매번 flush)
+        kwargs.setdefault("flush", True)
+        _print(*args, file=devnull, **kwargs)
+        _print(*args, file=devnull, **kwargs)
+
+    logger = logging.getLogger("bench_logging")
+    logger.propagate = False
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s - %(name)s - %(message)s"))
+    logger.addHandler(handler)
+
+    region, grade, ltv = "서울특별시광진구", 1, 83.5
+    cases = [
+        ("기존 print 래퍼 (이중 출력)",
+         lambda: wrapped_print(f"DEBUG: BaseCalculator.calculate - region: {region}, grade: {grade}, ltv: {ltv:.2f}")),
+    ]
+    results = []
+    for label, func in cases:
+        results.append((label, timeit.timeit(func, number=number) / number * 1e6))
+
+    for label, level in (("logger.debug (비활성, INFO)", logging.INFO), ("logger.debug (활성, DEBUG)", logging.DEBUG)):
+        logger.setLevel(level)
+        func = lambda: logger.debug("BaseCalculator.calculate - region: %s, grade: %s, ltv: %.2f", region, grade, ltv)
+        results.append((label, timeit.timeit(func, number=number) / number * 1e6))
+
+    logger.removeHandler(handler)
+    devnull.close()
+    return results
+
+
+def bench_messages(messages, level):
+    """메시지당 처리 시간(µs)과 출력 바이트"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+    with tempfile.TemporaryFile() as sink:
+        os.dup2(sink.fileno(), 1)
+        os.dup2(sink.fileno(), 2)
+        try:
+            configure_root(level)
+            parser = MessageParser()
+            started = time.perf_counter()
+            for message in messages:
+                data = parser.parse(message)
+                BaseCalculator.calculate_all_banks(data)
+                BaseCalculator.calculate_all_loans(data)
+            elapsed = time.perf_counter() - started
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os.dup2(saved_stdout, 1)
+            os.dup2(saved_stderr, 2)
+            os.close(saved_stdout)
+            os.close(saved_stderr)
+        written = os.fstat(sink.fileno()).st_size
+    return elapsed / len(messages) * 1e6, written / len(messages)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    messages = generate_messages(count)
+
+    # 레지스트리 로드는 측정에서 제외
+    bench_messages(messages[:1], "WARNING")
+
+    print("로그 문 한 줄 호출 비용")
+    for label, micros in bench_statement():
+        print(f"  {label:<28} {micros:8.2f} µs")
+
+    print(f"메시지 {count}건 (파싱 + 은행/대부 계산) - 메시지당")
+    print(f"  {'로그 레벨':<10} {'처리 시간(µs)':>14} {'출력(바이트)':>14}")
+    for level in LEVELS:
+        micros, written = bench_messages(messages, level)
+        print(f"  {level:<10} {micros:14.1f} {written:14.0f}")
+    configure_root("WARNING")
+
+
+if __name__ == "__main__":
+    main()
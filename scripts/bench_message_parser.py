@@ -0,0 +1,690 @@
+# -*- coding: utf-8 -*-
+"""
+메시지 파서 회귀 검증 / 처리량 벤치마크
+기존 파서(전체 텍스트 KB시세 선추출 + 줄 순회 + KB시세 재탐색, 정규식 즉석 생성)와
+MessageParser(줄 분류 디스패치 한 번 순회, 정규식 모듈 로드 시 컴파일)의
+파싱 결과가 repr 기준으로 완전히 같은지 확인하고 초당 처리 메시지 수를 비교
+
+회귀 코퍼스: 실제 양식을 흉내 낸 합성 메시지(개인정보 없음) + 줄 삭제/중복/콜론 제거 등 변형 메시지
+
+사용법: python scripts/bench_message_parser.py [메시지 수]
+"""
+
+import logging
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Dict, Optional
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsers.message_parser import MessageParser
+from utils.regions import ALL_REGIONS, REGION_MATCHER
+from utils.validators import validate_kb_price, validate_credit_score, parse_amount
+
+NAMES = ("홍길동", "김철수", "이영희", "박민수")
+JOBS = ("직장인(사업자보유)", "개인사업자", "개인택시", "무직", "법인대표")
+PROPERTY_TYPES = ("아파트", "빌라", "주상복합", "오피스텔", "단독주택", "")
+INSTITUTIONS = (
+    "보성새마을금고", "MG캐피탈", "OK저축은행", "국민은행", "도원캐피탈대부",
+    "전세입자", "물상담보 신한", "한국투자저축은행", "현대캐피탈 사업자금", "우리은행",
+)
+SPECIAL_NOTES = (
+    "*하우스머치 59,400(25.11.01) / 월250만 / 즉발보유", "개인택시 운영", "압류 있음",
+    "KB AI시세: 25,000만원", "", "가처분 있음", "6개월 변동금리 희망 거치식",
+)
+
+
+def kb_price_lines(rng):
+    """KB시세 표기 변형"""
+    base = rng.choice([3000, 8000, 15000, 25000, 48000, 59400, 125000, 175000, 320000])
+    low, high = int(base * 0.95), int(base * 1.05)
+    return rng.choice([
+        ["KB시세 : 시세없음"],
+        [f"KB시세 : 일반 {base:,}만원"],
+        [f"KB시세 : 일반 {base:,}만원", f"하한 {low:,}만원"],
+        [f"KB시세 : 일반 {base:,}만원 하한 {low:,}만원"],
+        [f"KB시세 일반 {base:,}만원", f"       하한 {low:,}만원", f"       상한 {high:,}만원"],
+        [f"KB 시세 : {base:,}만원"],
+        [f"KB시세 : {base:,}"],
+        [f"KB시세: 일반 {base:,}만원", f"하한 {low:,}만원 상한 {high:,}만원"],
+        ["KB시세 :", f"일반 {base:,}만원"],
+        ["KB시세", "", f"{base:,}만원"],
+        [f"kb시세 {base:,}"],
+        ["KB시세 : 없음", "확인 필요"],
+    ])
+
+
+def generate_message(rng, regions):
+    """담보물건 양식 메시지 한 건"""
+    region = rng.choice(regions) if rng.random() < 0.8 else rng.choice(["서울시 강남구", "경기 수원시", "알수없음시"])
+    address = region + rng.choice(["자양동842-1미산빌5차동 3층 301호", " 래미안아파트 101동 1층 102호", " 15층 1501호", "역삼동 123"])
+    lines = [
+        rng.choice(["성   명", "성명"]) + f" : {rng.choice(NAMES)} ({rng.randint(25, 82)})",
+        rng.choice(["직   업", "직업"]) + f" : {rng.choice(JOBS)}",
+        "신용점수 : " + rng.choice(["X", str(rng.randint(450, 1000)), "", "750점"]),
+        "거주여부 : " + rng.choice(["비거주(전세미동의)", "거주", "본인거주"]),
+        "소유현황 : 단독소유",
+        f"주   소 : {address}",
+    ]
+    if rng.random() < 0.9:
+        lines.append(f"면   적 : {rng.choice([25.95, 59.9, 84.97, 112.3])}㎡")
+    if rng.random() < 0.8:
+        lines.append(f"세대수 : {rng.choice([16, 150, 250, 1200])}세대 (1개동)")
+    lines.append(f"구   분 : {rng.choice(PROPERTY_TYPES)}")
+    kb_lines = kb_price_lines(rng)
+    kb_in_mortgages = rng.random() < 0.05
+    if not kb_in_mortgages:
+        lines += kb_lines
+
+    lines.append(rng.choice(["=========설정내역=========", "설정내역", "==========="]))
+    count = rng.randint(0, 4)
+    for priority in range(1, count + 1):
+        max_amount = rng.choice([6000, 10800, 27000, 44200, 2900, 31700])
+        principal = int(max_amount / 1.2) if rng.random() < 0.8 else max_amount
+        institution = rng.choice(INSTITUTIONS)
+        layout = rng.randint(0, 3)
+        if layout == 0:
+            lines += [f"{priority}순위 : {institution}", f"           {max_amount:,} ({principal:,})만원"]
+        elif layout == 1:
+            lines.append(f"{priority}순위 : {institution} {max_amount:,} ({principal:,})만원")
+        elif layout == 2:
+            lines += [f"{priority}순위 : {institution}", f"{max_amount:,}만원", "(채권최고액)", "메모", "추가 메모"]
+        else:
+            lines.append(f"{priority}순위 : {institution} 원금 {principal:,}만원")
+    if kb_in_mortgages:
+        lines += kb_lines
+    lines.append("========================")
+
+    lines.append(f"특이사항 : {rng.choice(SPECIAL_NOTES)}")
+    if rng.random() < 0.3:
+        lines.append(rng.choice(["월 : 250만", "선순위 말소 예정", "KB시세 일반 30,000만원"]))
+
+    requests = []
+    if count and rng.random() < 0.6:
+        priority = rng.randint(1, count)
+        requests.append(rng.choice([
+            f"{priority}순위 {rng.choice(INSTITUTIONS)} 대환", "전체 대환", "선순위 대환",
+            f"{rng.choice(INSTITUTIONS)} 대환조건", "가계자금 대환", "대환",
+        ]))
+    if rng.random() < 0.3:
+        requests.append(rng.choice(["필요자금 1억", "필요자금 5000만원", "필요자금 3,000", "필요자금 1.5억", "필요자금: 2억"]))
+    if rng.random() < 0.3:
+        requests.append("3순위 확인부탁드립니다")
+    if rng.random() < 0.5:
+        lines.append("요청사항 : " + " / ".join(requests))
+    else:
+        lines.append("요청사항")
+        lines += requests
+    return "\n".join(lines)
+
+
+def mutate(rng, message):
+    """줄 삭제/중복/순서 바꿈/콜론 제거/빈 줄 삽입/공백 추가 변형"""
+    lines = message.split("\n")
+    for _ in range(rng.randint(1, 4)):
+        if not lines:
+            break
+        index = rng.randrange(len(lines))
+        action = rng.randint(0, 6)
+        if action == 0:
+            del lines[index]
+        elif action == 1:
+            lines.insert(index, lines[index])
+        elif action == 2:
+            other = rng.randrange(len(lines))
+            lines[index], lines[other] = lines[other], lines[index]
+        elif action == 3:
+            lines[index] = lines[index].replace(":", " ", 1)
+        elif action == 4:
+            lines.insert(index, "")
+        elif action == 5:
+            lines[index] = "  " + lines[index] + "  "
+        else:
+            lines[index] = lines[index].upper()
+    return "\n".join(lines)
+
+
+def generate_corpus(count, seed=7):
+    """회귀 코퍼스 (양식 메시지와 변형 메시지 반반)"""
+    rng = random.Random(seed)
+    regions = sorted(ALL_REGIONS)
+    corpus = []
+    for index in range(count):
+        message = generate_message(rng, regions)
+        corpus.append(mutate(rng, message) if index % 2 else message)
+    return corpus
+
+
+class LegacyMessageParser:
+    """기존 MessageParser (여러 번 순회하는 방식, 로그 제외)"""
+    
+    def parse(self, message_text: str) -> Dict[str, Any]:
+        """
+        텔레그램 메시지를 파싱하여 구조화된 데이터로 변환
+        
+        Args:
+            message_text: 텔레그램 메시지 텍스트
+        
+        Returns:
+            파싱된 데이터 딕셔너리
+        """
+        lines = message_text.split("\n")
+        
+        data = {
+            "name": None,
+            "age": None,
+            "occupation": None,
+            "credit_score": None,
+            "residence": None,
+            "ownership": None,
+            "address": None,
+            "area": None,
+            "household_count": None,
+            "property_type": None,
+            "kb_price": None,
+            "mortgages": [],
+            "special_notes": None,
+            "requests": None,
+            "region": None,
+            "required_amount": None
+        }
+        
+        # 먼저 전체 텍스트에서 KB시세를 직접 추출 (가장 확실한 방법)
+        kb_price = self._extract_kb_price_from_text(message_text)
+        if kb_price:
+            data["kb_price"] = kb_price
+        
+        current_section = None
+        skip_next_line = False  # 다음 줄을 건너뛸지 여부
+        
+        i = 0
+        while i < len(lines):
+            # 이전 반복에서 이미 처리한 줄이면 건너뛰기
+            if skip_next_line:
+                skip_next_line = False
+                i += 1
+                continue
+                
+            line = lines[i].strip()
+            if not line:
+                i += 1
+                continue
+            
+            # 섹션 구분 (키:값 파싱보다 먼저 체크)
+            if "설정내역" in line or "=========" in line:
+                current_section = "mortgages"
+                i += 1
+                continue
+            elif "특이사항" in line:
+                current_section = "special_notes"
+                # "특이사항 : 내용" 형식인 경우 즉시 내용 추가
+                if ":" in line:
+                    parts = line.split(":", 1)
+                    if len(parts) == 2 and parts[1].strip():
+                        data["special_notes"] = parts[1].strip()
+                i += 1
+                continue
+            elif "요청사항" in line:
+                current_section = "requests"
+                # "요청사항 : 내용" 형식인 경우 즉시 내용 추가
+                if ":" in line:
+                    parts = line.split(":", 1)
+                    if len(parts) == 2 and parts[1].strip():
+                        data["requests"] = parts[1].strip()
+                i += 1
+                continue
+            elif ":" in line and current_section != "mortgages":
+                # 키:값 형식 파싱
+                key, value = self._parse_key_value(line)
+                if key and value:
+                    # KB시세인 경우 특별 처리
+                    if "kb시세" in key.lower() or ("시세" in key and "kb" in line.lower()):
+                        # 다음 줄이 있으면 추가 (하한, 상한 등) - 최대 2줄까지 확인
+                        for j in range(1, 3):  # 다음 1-2줄 확인
+                            if i + j < len(lines):
+                                next_line = lines[i + j].strip()
+                                # 다음 줄이 숫자로 시작하거나 "하한", "상한" 같은 키워드가 있으면 추가
+                                if next_line and (any(keyword in next_line for keyword in ["하한", "상한", "일반"]) or re.search(r'[\d,]+', next_line)):
+                                    value += " " + next_line
+                                    if j == 1:
+                                        skip_next_line = True  # 첫 번째 다음 줄은 건너뛰기
+                                else:
+                                    # 숫자가 없으면 더 이상 확인하지 않음
+                                    break
+                        # KB시세 직접 설정 (더 강력한 파싱)
+                        self._set_field(data, key, value)
+                    else:
+                        self._set_field(data, key, value)
+            elif "kb시세" in line.lower() and current_section != "mortgages":
+                # "KB시세"가 포함된 줄에서 직접 추출 (콜론이 없어도 처리)
+                # 예: "KB시세 일반 125,000만원" 또는 "KB시세: 일반 125,000만원"
+                kb_match = re.search(r'kb시세\s*:?\s*(.+)', line, re.IGNORECASE)
+                if kb_match:
+                    kb_value = kb_match.group(1).strip()
+                    # 다음 줄도 확인 - 최대 2줄까지 확인
+                    for j in range(1, 3):  # 다음 1-2줄 확인
+                        if i + j < len(lines):
+                            next_line = lines[i + j].strip()
+                            if next_line and (any(keyword in next_line for keyword in ["하한", "상한", "일반"]) or re.search(r'[\d,]+', next_line)):
+                                kb_value += " " + next_line
+                                if j == 1:
+                                    skip_next_line = True
+                            else:
+                                # 숫자가 없으면 더 이상 확인하지 않음
+                                break
+                    data["kb_price"] = kb_value
+            
+            # 설정 내역 파싱 (근저당권) - 여러 줄을 합쳐서 파싱
+            if current_section == "mortgages":
+                # "1순위 : 전세입자" 형태의 줄 찾기
+                if "순위" in line and ":" in line:
+                    # 현재 줄부터 다음 3줄까지 합쳐서 파싱 시도
+                    combined_lines = line
+                    for j in range(1, 4):
+                        if i + j < len(lines):
+                            next_line = lines[i + j].strip()
+                            if next_line and not any(kw in next_line for kw in ["순위", "특이사항", "요청사항", "==="]):
+                                combined_lines += " " + next_line
+                            else:
+                                break
+                    
+                    mortgage = self._parse_mortgage_line(combined_lines)
+                    if mortgage:
+                        data["mortgages"].append(mortgage)
+            
+            # 특이사항 파싱
+            elif current_section == "special_notes":
+                if data["special_notes"]:
+                    data["special_notes"] += "\n" + line
+                else:
+                    data["special_notes"] = line
+            
+            # 요청사항 파싱
+            elif current_section == "requests":
+                if data["requests"]:
+                    data["requests"] += "\n" + line
+                else:
+                    data["requests"] = line
+            
+            i += 1
+        
+        # 지역 추출 (주소에서)
+        if data["address"]:
+            data["region"] = self._extract_region(data["address"])
+        
+        # KB시세 검증 (전체 텍스트에서 추출한 것이 없으면 기존 방식 사용)
+        if not data["kb_price"]:
+            # 기존 방식으로 다시 시도
+            for i, line in enumerate(lines):
+                if "kb시세" in line.lower():
+                    # KB시세 줄과 다음 줄 모두 포함
+                    kb_value = line
+                    if i + 1 < len(lines):
+                        next_line = lines[i + 1].strip()
+                        if next_line:
+                            kb_value += " " + next_line
+                    # 콜론 뒤의 값만 추출
+                    if ":" in kb_value:
+                        kb_value = kb_value.split(":", 1)[1].strip()
+                    else:
+                        kb_value = re.sub(r'kb시세\s*', '', kb_value, flags=re.IGNORECASE).strip()
+                    data["kb_price"] = kb_value
+                    break
+        
+        if data["kb_price"]:
+            validated_price = validate_kb_price(data["kb_price"])
+            data["kb_price"] = validated_price
+        
+        # 신용점수 검증
+        if data["credit_score"]:
+            validated_score = validate_credit_score(data["credit_score"])
+            data["credit_score"] = validated_score
+        
+        # 필요자금 추출 (요청사항에서)
+        if data["requests"]:
+            
+            # "필요자금 1억" 또는 "필요자금 10000만원" 패턴 찾기
+            # 1. 억 단위 패턴
+            required_match = re.search(r'필요자금[:\s]*(\d+(?:[.,]\d+)?)\s*억', data["requests"])
+            if required_match:
+                # 억 단위를 만원으로 변환
+                amount_eok = float(required_match.group(1).replace(",", "").replace(".", ""))
+                data["required_amount"] = amount_eok * 10000  # 1억 = 10,000만원
+            else:
+                # 2. 만원 단위 패턴
+                required_match = re.search(r'필요자금[:\s]*(\d+(?:,\d+)*)\s*만', data["requests"])
+                if required_match:
+                    data["required_amount"] = float(required_match.group(1).replace(",", ""))
+                else:
+                    # 3. 단위 없이 숫자만 있는 경우 (만원으로 가정)
+                    required_match = re.search(r'필요자금[:\s]*(\d+(?:,\d+)*)', data["requests"])
+                    if required_match:
+                        data["required_amount"] = float(required_match.group(1).replace(",", ""))
+        
+        # 대환 정보 추출 (요청사항에서)
+        # 먼저 모든 근저당권의 is_refinance를 False로 초기화 (명시적으로 지정된 것만 True로 설정)
+        for mortgage in data["mortgages"]:
+            mortgage["is_refinance"] = False
+        
+        if data["requests"]:
+            
+            # 전체 대환 처리 (요청사항에 "전체 대환"이 포함된 경우)
+            if "전체 대환" in data["requests"]:
+                # 모든 근저당권을 대환하도록 설정
+                for mortgage in data["mortgages"]:
+                    mortgage["is_refinance"] = True
+            else:
+                # 선순위 확인 요청 처리 (요청사항에 "선순위"가 포함된 경우)
+                if "선순위" in data["requests"]:
+                    # 1순위인 모든 근저당권을 대환하도록 설정
+                    for mortgage in data["mortgages"]:
+                        if mortgage.get("priority") == 1:
+                            mortgage["is_refinance"] = True
+                
+                # 기존 대환 로직 (명시적으로 지정된 경우)
+                if "대환" in data["requests"]:
+                    # 패턴: "N순위 [기관명] 대환" 또는 "[기관명] 대환" 등
+                    # 1. "N순위 [기관명] 대환" 또는 "N순위 [기관명] 대환조건" 패턴
+                    # 정규식 개선: "대환"이라는 연속된 문자열 전까지 모든 문자를 캡처 (non-greedy)
+                    # 예: "2순위 도원캐피탈대부 대환조건" -> priority=2, institution="도원캐피탈대부"
+                    # [^대환]+?는 "대"나 "환" 문자가 나오면 멈추므로, "도원캐피탈대부"의 "대"에서 멈출 수 있음
+                    # 따라서 ".+?"를 사용하여 "대환" 전까지 모든 문자를 캡처
+                    refinance_match = re.search(r'(\d+)순위\s+(.+?)\s*대환', data["requests"])
+                    if refinance_match:
+                        priority = int(refinance_match.group(1))
+                        institution_keyword = refinance_match.group(2).strip()
+                        # 공백 제거 (기관명에 공백이 있을 수 있으므로)
+                        institution_keyword = institution_keyword.replace(" ", "")
+                        
+                        # 해당 순위의 근저당권 찾기
+                        for mortgage in data["mortgages"]:
+                            if mortgage.get("priority") == priority:
+                                institution = mortgage.get("institution", "")
+                                # 기관명에 키워드가 포함되어 있는지 확인 (양방향 확인)
+                                # "도원캐피탈대부"와 "도원캐피탈" 둘 다 매칭되도록
+                                if institution_keyword in institution or institution in institution_keyword or \
+                                   any(keyword in institution for keyword in institution_keyword.split() if len(keyword) > 2):
+                                    mortgage["is_refinance"] = True
+                                    break
+                        
+                    else:
+                        # 2. "[기관명] 대환" 패턴 (순위 없이) - 기관명이 명시된 경우만
+                        refinance_match = re.search(r'([가-힣a-zA-Z0-9]+(?:[가-힣a-zA-Z0-9\s]+)?)\s*대환', data["requests"])
+                        if refinance_match:
+                            institution_keyword = refinance_match.group(1).strip()
+                            # "대환"이라는 단어 자체는 제외
+                            if institution_keyword != "대환":
+                                
+                                # 기관명이 일치하는 근저당권 찾기
+                                for mortgage in data["mortgages"]:
+                                    institution = mortgage.get("institution", "")
+                                    if institution_keyword in institution or institution in institution_keyword or \
+                                       any(keyword in institution for keyword in institution_keyword.split() if len(keyword) > 2):
+                                        mortgage["is_refinance"] = True
+                                        break
+                                
+        
+        return data
+    
+    def _parse_key_value(self, line: str) -> tuple:
+        """키:값 형식 파싱"""
+        if ":" not in line:
+            return None, None
+        
+        parts = line.split(":", 1)
+        if len(parts) != 2:
+            return None, None
+        
+        key = parts[0].strip()
+        value = parts[1].strip()
+        
+        return key, value
+    
+    def _set_field(self, data: Dict[str, Any], key: str, value: str):
+        """필드 설정"""
+        # 키에서 공백 제거하여 비교 (더 안정적인 매칭)
+        key_clean = key.replace(" ", "").lower()
+        
+        if "성명" in key_clean or "이름" in key_clean:
+            # 성명에서 연령 추출 (예: "정종민 (68)")
+            match = re.search(r"\((\d+)\)", value)
+            if match:
+                data["age"] = int(match.group(1))
+                data["name"] = value.split("(")[0].strip()
+            else:
+                data["name"] = value
+        
+        elif "직업" in key_clean:
+            data["occupation"] = value
+        
+        elif "신용점수" in key_clean or "신용" in key_clean:
+            data["credit_score"] = value
+        
+        elif "거주여부" in key_clean:
+            data["residence"] = value
+        
+        elif "소유현황" in key_clean:
+            data["ownership"] = value
+        
+        elif "주소" in key_clean:  # 공백 제거된 키로 비교
+            data["address"] = value
+        
+        elif "면적" in key_clean:
+            # 면적에서 숫자 추출 (예: "25.95㎡")
+            match = re.search(r"([\d.]+)", value)
+            if match:
+                data["area"] = float(match.group(1))
+        
+        elif "세대수" in key_clean:
+            # 세대수에서 숫자 추출 (예: "16세대 (1개동)")
+            match = re.search(r"(\d+)", value)
+            if match:
+                data["household_count"] = int(match.group(1))
+        
+        elif "구분" in key_clean:
+            data["property_type"] = value
+        
+        elif "kb시세" in key_clean or "시세" in key_clean:
+            # KB시세는 여러 줄에 걸쳐 있을 수 있음 (일반, 하한 등)
+            # 첫 번째 값만 저장 (일반 가격)
+            data["kb_price"] = value
+    
+    def _parse_mortgage_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """근저당권 설정 내역 라인 파싱"""
+        # 순위 추출
+        priority_match = re.search(r"(\d+)순위", line)
+        if not priority_match:
+            return None
+        
+        priority = int(priority_match.group(1))
+        
+        # 채권최고액과 원금 추출
+        # 패턴: "44,200 (34,000)만원" 형식
+        # 괄호 밖의 금액 = 채권최고액, 괄호 안의 금액 = 원금
+        max_amount = None  # 채권최고액
+        amount = None  # 원금
+        
+        # 괄호 안의 금액 (원금) 추출
+        amount_match = re.search(r"\(([\d,]+)\)", line)
+        if amount_match:
+            amount_str = amount_match.group(1)
+            amount = parse_amount(amount_str)
+        
+        # 괄호 밖의 금액 (채권최고액) 추출
+        # "44,200 (34,000)만원" 형식에서 괄호 앞의 숫자 추출
+        # 패턴: 1~3자리 숫자로 시작하고, 쉼표와 3자리 숫자가 반복되는 형식 (예: "2,900", "31,700", "6,000")
+        max_amount_match = re.search(r"(\d{1,3}(?:,\d{3})*)\s*\([\d,]+\)", line)
+        if max_amount_match:
+            max_amount_str = max_amount_match.group(1)
+            max_amount = parse_amount(max_amount_str)
+        else:
+            # 괄호가 없으면 첫 번째 큰 숫자를 채권최고액으로 사용
+            amount_matches = re.findall(r"(\d{1,3}(?:,\d{3})*)", line)
+            if amount_matches:
+                max_amount_str = amount_matches[0]
+                max_amount = parse_amount(max_amount_str)
+                # 원금이 없으면 채권최고액을 원금으로도 사용
+                if amount is None:
+                    amount = max_amount
+        
+        if amount is None:
+            return None
+        
+        # 채권최고액이 없으면 원금에 1.2를 곱해서 추정 (기본값)
+        if max_amount is None:
+            max_amount = amount * 1.2
+        
+        # 기관명/유형 추출
+        institution_match = re.search(r":\s*([^0-9\n]+?)(?=\s*\d|\s*$)", line)
+        if institution_match:
+            institution = institution_match.group(1).strip()
+        else:
+            institution = None
+        
+        
+        is_refinance = False
+        
+        return {
+            "priority": priority,
+            "amount": amount,  # 원금 (기존 호환성 유지)
+            "max_amount": max_amount,  # 채권최고액 (새로 추가)
+            "institution": institution,
+            "is_refinance": is_refinance
+        }
+    
+    def _extract_kb_price_from_text(self, text: str) -> Optional[str]:
+        """
+        전체 텍스트에서 KB시세를 직접 추출
+        "KB시세 : 일반 125,000만원" 형식 등 다양한 형식 처리
+        """
+        lines = text.split('\n')
+        kb_value = None
+        
+        # KB시세가 포함된 줄 찾기
+        for i, line in enumerate(lines):
+            line_lower = line.lower()
+            if 'kb시세' in line_lower or ('kb' in line_lower and '시세' in line_lower):
+                # KB시세 줄에서 값 추출
+                # "KB시세 : 일반 125,000만원" 형식
+                if ':' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) == 2:
+                        kb_value = parts[1].strip()
+                else:
+                    # "KB시세 일반 125,000만원" 형식
+                    kb_match = re.search(r'kb시세\s+(.+)', line, re.IGNORECASE)
+                    if kb_match:
+                        kb_value = kb_match.group(1).strip()
+                
+                # 다음 줄도 확인 (하한, 상한 정보) - 최대 2줄까지 확인
+                for j in range(1, 3):  # 다음 1-2줄 확인
+                    if i + j < len(lines):
+                        next_line = lines[i + j].strip()
+                        if next_line:
+                            # 하한, 상한, 일반 키워드가 있거나 숫자가 있으면 추가
+                            if any(kw in next_line for kw in ['하한', '상한', '일반']) or re.search(r'[\d,]+', next_line):
+                                if kb_value:
+                                    kb_value += " " + next_line
+                                else:
+                                    kb_value = next_line
+                            else:
+                                # 숫자가 없으면 더 이상 확인하지 않음
+                                break
+                
+                if kb_value:
+                    return kb_value
+        
+        # 패턴 매칭으로 재시도 (더 강력한 패턴)
+        kb_patterns = [
+            r'kb시세\s*:?\s*일반\s*([\d,]+)\s*만원',  # KB시세 : 일반 125,000만원
+            r'kb시세\s*:?\s*([\d,]+)\s*만원',  # KB시세 : 125,000만원
+            r'kb시세\s*:?\s*일반\s*([\d,]+)',  # KB시세 : 일반 125,000
+            r'kb시세\s*:?\s*([\d,]+)',  # KB시세 : 125,000
+            r'kb시세[^:]*:?\s*일반\s*([\d,]+)',  # KB시세 일반 125,000
+            r'kb시세[^:]*:?\s*([\d,]+)',  # KB시세 125,000
+        ]
+        
+        for pattern in kb_patterns:
+            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            if match:
+                price_str = match.group(1).replace(",", "").strip()
+                if price_str:
+                    # 전체 컨텍스트를 찾아서 반환
+                    kb_context = re.search(r'kb시세[^:]*:?\s*(.+?)(?=\n|$)', text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+                    if kb_context:
+                        kb_value = kb_context.group(1).strip()
+                        # 다음 줄도 포함 (하한 정보 등)
+                        for i, line in enumerate(lines):
+                            if 'kb시세' in line.lower():
+                                for j in range(1, 3):  # 다음 1-2줄 확인
+                                    if i + j < len(lines):
+                                        next_line = lines[i + j].strip()
+                                        if next_line and (any(kw in next_line for kw in ['하한', '상한', '일반']) or re.search(r'[\d,]+', next_line)):
+                                            kb_value += " " + next_line
+                                break
+                        return kb_value
+        
+        return None
+    
+    def _extract_region(self, address: str) -> Optional[str]:
+        """주소에서 행정구역 추출 (구/시/군 단위까지)"""
+        if not address:
+            return None
+        
+        # 공유 지역 카탈로그로 만든 매처로 한 번에 매칭
+        # (가장 긴 구/시/군 우선, 없으면 광역 단위로 fallback)
+        result = REGION_MATCHER.match(address)
+        if result:
+            return result
+        
+        return None
+
+
+def outcome(parser, message):
+    """파싱 결과 repr (예외가 나면 예외 종류와 메시지)"""
+    try:
+        return repr(parser.parse(message))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def bench(parser, corpus, rounds=3):
+    """초당 처리 메시지 수 (가장 빠른 회차 기준)"""
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for message in corpus:
+            try:
+                parser.parse(message)
+            except Exception:
+                pass
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(corpus) / best
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    corpus = generate_corpus(count)
+
+    legacy, parser = LegacyMessageParser(), MessageParser()
+    mismatches = [index for index, message in enumerate(corpus) if outcome(legacy, message) != outcome(parser, message)]
+    print(f"회귀 코퍼스 {len(corpus)}건 중 결과 불일치 {len(mismatches)}건")
+    for index in mismatches[:3]:
+        print(f"❌ 불일치 메시지 #{index}:\n{corpus[index]}\n  기존: {outcome(legacy, corpus[index])}\n  신규: {outcome(parser, corpus[index])}")
+
+    legacy_rate = bench(legacy, corpus)
+    rate = bench(parser, corpus)
+    print(f"  기존 파서        {legacy_rate:10.0f} 메시지/s")
+    print(f"  MessageParser    {rate:10.0f} 메시지/s ({rate / legacy_rate:.2f}배)")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+금융사별 병렬 계산(executor) 벤치마크
+실제 설정을 복제해 상품 설정 수를 늘려가며 순차 / 스레드 풀 / 프로세스 풀의
+메시지당 계산 시간을 비교하고, 병렬 계산 결과가 순차 계산과 같은지 확인
+
+사용법: python scripts/bench_parallel.py [워커 수] [메시지 수]
+"""
+
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator.base_calculator import BaseCalculator
+from calculator.parallel import create_process_pool
+from calculator.registry import ProductRegistry, get_registry, install_registry
+
+CONFIG_COUNTS = (3, 10, 30, 100, 300)
+
+PROPERTY_DATA = {
+    "kb_price": 55000.0,
+    "region": "서울특별시광진구",
+    "address": "서울특별시 광진구 자양동 842-1 래미안아파트 101동 15층 1501호",
+    "area": 84.97,
+    "credit_score": 820,
+    "age": 45,
+    "household_count": 500,
+    "property_type": "아파트",
+    "special_notes": "",
+    "requests": "1순위 대환",
+    "required_amount": None,
+    "mortgages": [
+        {"priority": 1, "institution": "국민은행", "max_amount": 10800, "amount": 9000.0, "is_refinance": True},
+        {"priority": 2, "institution": "보성새마을금고", "max_amount": 3600, "amount": 3000.0, "is_refinance": False},
+    ],
+}
+
+
+def install_synthetic_set(count):
+    """실제 설정(banks + loan)을 복제해 count개 상품 설정을 가진 상품군 등록"""
+    base_configs = get_registry("banks").raw_configs() + get_registry("loan").raw_configs()
+    configs = []
+    for index in range(count):
+        source, config = base_configs[index % len(base_configs)]
+        config = dict(config, bank_name=f"{config['bank_name']} #{index}")
+        configs.append((f"{source}#{index}", config))
+    product_set = f"bench_{count}"
+    install_registry(product_set, ProductRegistry((), BaseCalculator, name=product_set, configs=configs))
+    return product_set
+
+
+def measure(calculators, product_set, messages, executor=None, workers=None):
+    """메시지당 평균 계산 시간(ms)과 마지막 결과"""
+    started = time.perf_counter()
+    for _ in range(messages):
+        results = BaseCalculator.calculate_products(
+            calculators, PROPERTY_DATA, executor=executor, product_set=product_set, workers=workers
+        )
+    return (time.perf_counter() - started) * 1000 / messages, results
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    messages = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    # 계산 중 디버그 출력(워커 프로세스 포함)은 파일 디스크립터 단위로 숨김
+    sys.stdout.flush()
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    rows = []
+    failed = []
+    try:
+        product_sets = [install_synthetic_set(count) for count in CONFIG_COUNTS]
+        with ThreadPoolExecutor(max_workers=workers) as threads, \
+                create_process_pool(max_workers=workers, product_sets=product_sets) as processes:
+            for count, product_set in zip(CONFIG_COUNTS, product_sets):
+                calculators = get_registry(product_set).calculators
+                # 워커 시작/설정 전달은 측정에서 제외
+                measure(calculators, product_set, 1, processes, workers)
+
+                serial_ms, expected = measure(calculators, product_set, messages)
+                thread_ms, thread_results = measure(calculators, product_set, messages, threads, workers)
+                process_ms, process_results = measure(calculators, product_set, messages, processes, workers)
+                if thread_results != expected or process_results != expected:
+                    failed.append(count)
+                rows.append((count, len(expected), serial_ms, thread_ms, process_ms))
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(devnull)
+
+    print(f"워커 {workers}개, 메시지 {messages}건 평균 (메시지당 ms)")
+    print(f"{'설정 수':>8} {'결과 수':>8} {'순차':>10} {'스레드':>10} {'프로세스':>10}")
+    for count, result_count, serial_ms, thread_ms, process_ms in rows:
+        best = min((serial_ms, "순차"), (thread_ms, "스레드"), (process_ms, "프로세스"))[1]
+        print(f"{count:8d} {result_count:8d} {serial_ms:10.2f} {thread_ms:10.2f} {process_ms:10.2f}  <- {best}")
+
+    if failed:
+        print(f"❌ 병렬 계산 결과 불일치 (설정 수: {failed})")
+        sys.exit(1)
+    print("병렬 계산 결과가 순차 계산과 모두 일치 (순서 포함)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+전체 처리 경로(end-to-end) 지연 시간 벤치마크
+익명 담보물건 메시지 코퍼스(scripts/corpus/pipeline_messages.json)를
+MessageParser.parse -> BaseCalculator.calculate_all_banks / calculate_all_loans -> format_all_results
+순서로 실제와 같이 처리하면서 단계별 p50/p95/p99, 초당 처리 메시지 수, 최대 메모리를 측정하고
+결과를 JSON으로 저장 (이전 결과 JSON을 주면 단계별 변화율도 출력)
+
+- 결과 캐시(calculate_formatted_result)는 거치지 않음 -> 매번 실제 계산 비용 측정
+- 레지스트리 로드가 포함된 첫 메시지는 first_message_ms로 따로 기록하고 통계에서 제외
+- 로그는 LOG_LEVEL 레벨 그대로 포맷하되 출력은 버림 (운영과 같은 로그 비용)
+- 메모리: tracemalloc 최대 할당량(별도 1회 순회) + 프로세스 최대 RSS
+
+사용법: python scripts/bench_pipeline.py [반복 횟수] [이전 결과 JSON]
+결과 파일: bench_results/pipeline_<날짜_시각>.json
+"""
+
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# 프로젝트 루트를 경로에 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from calculator.base_calculator import BaseCalculator
+from calculator.registry import get_registry
+from parsers.message_parser import MessageParser
+from utils.formatter import format_all_results
+from utils.log import resolve_log_level
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CORPUS_PATH = os.path.join(ROOT_DIR, "scripts", "corpus", "pipeline_messages.json")
+RESULTS_DIR = os.path.join(ROOT_DIR, "bench_results")
+STAGES = ("parse", "calculate", "format", "total")
+PERCENTILES = (50, 95, 99)
+
+
+def load_corpus(path=CORPUS_PATH):
+    """코퍼스 메시지 목록 [{"id", "chat_type", "message"}, ...]"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["messages"]
+
+
+def process(parser, entry):
+    """
+    메시지 한 건 처리 (웹훅 handle_message와 같은 순서)
+
+    Returns:
+        (파싱, 계산, 포맷팅 단계별 소요 시간(초), 에러 여부)
+    """
+    started = time.perf_counter()
+    try:
+        property_data = parser.parse(entry["message"])
+    except Exception:
+        # 파싱 실패 메시지는 에러 회신으로 끝나므로 이후 단계 없음
+        return (time.perf_counter() - started, 0.0, 0.0), True
+    parsed = time.perf_counter()
+    if entry["chat_type"] == "loan":
+        results = BaseCalculator.calculate_all_loans(property_data)
+    else:
+        results = BaseCalculator.calculate_all_banks(property_data)
+    calculated = time.perf_counter()
+    format_all_results(results)
+    formatted = time.perf_counter()
+    return (parsed - started, calculated - parsed, formatted - calculated), False
+
+
+def percentile(sorted_values, q):
+    """최근접 순위 백분위수 (정렬된 값 목록)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-q * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(values):
+    """단계별 통계(ms)"""
+    ordered = sorted(value * 1000 for value in values)
+    summary = {f"p{q}": round(percentile(ordered, q), 4) for q in PERCENTILES}
+    summary["mean"] = round(sum(ordered) / len(ordered), 4) if ordered else 0.0
+    summary["max"] = round(ordered[-1], 4) if ordered else 0.0
+    return summary
+
+
+def run(corpus, rounds):
+    """단계별 소요 시간 목록, 처리 메시지 수, 에러 수, 전체 소요 시간(초)"""
+    parser = MessageParser()
+    timings = {stage: [] for stage in STAGES}
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for entry in corpus:
+            stage_times, failed = process(parser, entry)
+            errors += failed
+            for stage, elapsed in zip(STAGES, stage_times):
+                timings[stage].append(elapsed)
+            timings["total"].append(sum(stage_times))
+    return timings, rounds * len(corpus), errors, time.perf_counter() - started
+
+
+def measure_memory(corpus):
+    """코퍼스 1회 순회 동안 tracemalloc 최대 할당량(KB)"""
+    parser = MessageParser()
+    tracemalloc.start()
+    try:
+        for entry in corpus:
+            process(parser, entry)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def max_rss_kb():
+    """프로세스 최대 RSS(KB, 측정 불가면 None)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return rss / 1024 if sys.platform == "darwin" else rss
+
+
+def git_revision():
+    """현재 커밋 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, previous_path):
+    """이전 결과 대비 단계별 p50/p95 변화율 출력"""
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = json.load(f)
+    print(f"이전 결과 대비 ({previous_path}, {previous['meta'].get('git_revision')})")
+    for stage in STAGES:
+        for key in ("p50", "p95"):
+            before, after = previous["stages"][stage][key], report["stages"][stage][key]
+            change = (after - before) / before * 100 if before else 0.0
+            print(f"  {stage:<10} {key:<4} {before:10.3f} -> {after:10.3f} ms ({change:+6.1f}%)")
+    before, after = previous["messages_per_sec"], report["messages_per_sec"]
+    print(f"  메시지/s        {before:10.1f} -> {after:10.1f}    ({(after - before) / before * 100:+6.1f}%)")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    previous_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    # 로그 레벨은 운영과 같게, 출력은 버림
+    sink = open(os.devnull, "w", encoding="utf-8")
+    logging.basicConfig(level=resolve_log_level(), handlers=[logging.StreamHandler(sink)], force=True)
+
+    corpus = load_corpus()
+    started = time.perf_counter()
+    process(MessageParser(), corpus[0])
+    first_message_ms = (time.perf_counter() - started) * 1000
+    # 두 상품군 레지스트리 모두 로드된 상태에서 측정
+    get_registry("banks")
+    get_registry("loan")
+
+    timings, messages, errors, elapsed = run(corpus, rounds)
+    peak_traced_kb = measure_memory(corpus)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "log_level": logging.getLevelName(logging.getLogger().level),
+            "corpus": os.path.relpath(CORPUS_PATH, ROOT_DIR),
+            "corpus_messages": len(corpus),
+            "rounds": rounds,
+            "config_hash": {name: get_registry(name).config_hash[:12] for name in ("banks", "loan")},
+        },
+        "messages": messages,
+        "errors": errors,
+        "first_message_ms": round(first_message_ms, 3),
+        "messages_per_sec": round(messages / elapsed, 1),
+        "stages": {stage: summarize(timings[stage]) for stage in STAGES},
+        "memory": {
+            "peak_traced_kb": round(peak_traced_kb, 1),
+            "max_rss_kb": max_rss_kb(),
+        },
+    }
+    logging.basicConfig(level=logging.WARNING, force=True)
+    sink.close()
+
+    print(f"메시지 {len(corpus)}건 x {rounds}회 (LOG_LEVEL={report['meta']['log_level']}, 에러 {errors}건)")
+    print(f"  첫 메시지(레지스트리 로드 포함) {first_message_ms:.1f} ms")
+    print(f"  {'단계':<10} {'p50':>9} {'p95':>9} {'p99':>9} {'평균':>9} {'최대':>9}  (ms)")
+    for stage in STAGES:
+        summary = report["stages"][stage]
+        print(f"  {stage:<10} " + " ".join(f"{summary[key]:9.3f}" for key in ("p50", "p95", "p99", "mean", "max")))
+    print(f"  처리량 {report['messages_per_sec']:.1f} 메시지/s")
+    print(f"  최대 메모리: tracemalloc {peak_traced_kb:.1f} KB, RSS {report['memory']['max_rss_kb']} KB")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = os.path.join(RESULTS_DIR, f"pipeline_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {os.path.relpath(output_path, ROOT_DIR)}")
+
+    if previous_path:
+        compare(report, previous_path)
+
+
+if __name__ == "__main__":
+    main()
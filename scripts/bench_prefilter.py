@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 사전 필터 벤치마크
+일반 대화가 대부분인 그룹 채팅 트래픽을 흉내 내 do_POST가 업데이트를 거르는 비용을 비교
+
+- 기존: json.loads -> Update.de_json(Application 생성 포함) -> 허용 채팅방/양식 확인 (handle_message와 같은 기준)
+- 사전 필터: json.loads -> prefilter_update(dict만 확인)
+- 트래픽: 양식 메시지 비율(기본 10%), 허용되지 않은 채팅방 10%, 나머지는 일반 대화/명령어/사진
+- 콜드 스타트: 새 프로세스의 첫 업데이트가 일반 대화일 때 응답까지 걸린 시간과 텔레그램 import 여부
+
+사용법: python scripts/bench_prefilter.py [업데이트 수] [양식 메시지 비율(%)]
+"""
+
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+
+# Application 생성에만 쓰는 토큰 (텔레그램 서버에 접속하지 않음), 허용 채팅방은 1번
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456:bench-token")
+os.environ["ALLOWED_CHAT_IDS_BANKS"] = "1"
+os.environ.pop("ALLOWED_CHAT_IDS_LOAN", None)
+
+CHATTER = (
+    "네 확인했습니다", "감사합니다~", "이 건 오늘 중으로 가능할까요?", "잠시만요 확인해볼게요",
+    "서류 보내드렸습니다", "내일 오전에 다시 연락드릴게요", "ㅋㅋ 네네", "금리 조금 더 낮은 곳 있을까요",
+)
+
+COLD_START_CHILD = """
+import json, sys, time
+started = time.perf_counter()
+import api.webhook as webhook
+body = json.loads(sys.argv[1])
+skipped = webhook.prefilter_update(body) if sys.argv[2] == "prefilter" else webhook.process_update_body(body)
+print(json.dumps({"ms": (time.perf_counter() - started) * 1000, "skipped": skipped, "telegram": "telegram" in sys.modules}))
+"""
+
+
+def make_traffic(count, form_percent, seed=20):
+    """(요청 body bytes, 양식 메시지 여부) 목록"""
+    from bench_pipeline import load_corpus
+
+    rng = random.Random(seed)
+    forms = [entry["message"] for entry in load_corpus()]
+    traffic = []
+    for index in range(count):
+        roll = rng.random() * 100
+        chat_id = 1
+        message = {"message_id": index, "date": 0, "chat": {"id": chat_id, "type": "group"}}
+        if roll < form_percent:
+            message["text"] = rng.choice(forms)
+        elif roll < form_percent + 10:
+            message["chat"]["id"] = 2
+            message["text"] = rng.choice(forms)
+        elif roll < form_percent + 12:
+            message["text"] = "/start"
+        elif roll < form_percent + 15:
+            message["photo"] = [{"file_id": "x", "file_unique_id": "x", "width": 1, "height": 1}]
+        else:
+            message["text"] = rng.choice(CHATTER)
+        body = {"update_id": index, "message" if rng.random() < 0.8 else "edited_message": message}
+        traffic.append(json.dumps(body, ensure_ascii=False).encode("utf-8"))
+    return traffic
+
+
+def legacy_filter(raw, webhook, Update):
+    """기존 경로 - Update 객체를 만든 뒤 handle_message와 같은 기준으로 확인 (건너뛸 사유 반환)"""
+    body = json.loads(raw)
+    app = webhook.get_application()
+    update = Update.de_json(body, app.bot)
+    message = update.message or update.channel_post or update.edited_message or update.edited_channel_post
+    if not message:
+        return "no message"
+    if not webhook.get_chat_router().is_allowed(message.chat.id):
+        return "chat not allowed"
+    if message.text and not message.text.startswith("/") and not webhook.has_required_format(message.text):
+        return "no form"
+    return None
+
+
+def time_filter(filter_function, traffic, rounds=3):
+    """업데이트당 시간(µs)과 사유별 수"""
+    reasons = {}
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        results = [filter_function(raw) for raw in traffic]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    for reason in results:
+        reasons[reason or "passed"] = reasons.get(reason or "passed", 0) + 1
+    return best / len(traffic) * 1e6, reasons
+
+
+def cold_start(path, raw):
+    """새 프로세스에서 webhook import + 첫 업데이트 확인까지 걸린 시간"""
+    env = dict(os.environ, LOG_LEVEL="WARNING")
+    output = subprocess.check_output(
+        [sys.executable, "-c", COLD_START_CHILD, raw.decode("utf-8"), path], cwd=ROOT_DIR, env=env, text=True
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    form_percent = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    logging.disable(logging.CRITICAL)
+
+    import api.webhook as webhook
+    from telegram import Update
+
+    traffic = make_traffic(count, form_percent)
+    webhook.get_application()  # Application 생성은 측정에서 제외 (웜 인스턴스 기준)
+
+    print(f"업데이트 {count}건 (양식 메시지 {form_percent:.0f}%, 허용되지 않은 채팅방 10%) - 업데이트당 확인 시간")
+    legacy_us, legacy_reasons = time_filter(lambda raw: legacy_filter(raw, webhook, Update), traffic)
+    prefilter_us, reasons = time_filter(lambda raw: webhook.prefilter_update(json.loads(raw)), traffic)
+    print(f"  {'기존 (Update 생성 후 확인)':<26} {legacy_us:8.1f} µs  {legacy_reasons}")
+    print(f"  {'사전 필터 (dict 확인)':<26} {prefilter_us:8.1f} µs  {reasons}")
+    if legacy_reasons != reasons:
+        print("  경고: 기존 경로와 사전 필터의 판정이 다릅니다")
+    skipped = count - reasons.get("passed", 0)
+    print(f"  텔레그램 객체 없이 응답: {skipped}/{count}건 ({skipped / count * 100:.0f}%)")
+
+    chatter = json.dumps({
+        "update_id": 1, "message": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "group"}, "text": CHATTER[0]},
+    }, ensure_ascii=False).encode("utf-8")
+    print("콜드 스타트 - 새 프로세스의 첫 업데이트가 일반 대화인 경우 (webhook import 포함)")
+    for label, path in (("기존 (process_update_body)", "legacy"), ("사전 필터", "prefilter")):
+        result = cold_start(path, chatter)
+        print(f"  {label:<26} {result['ms']:8.1f} ms  사유 {result['skipped']}  텔레그램 import {result['telegram']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+주소 -> 지역 매칭 벤치마크
+기존 방식(매 호출마다 지역 리스트 정렬 후 부분 문자열 검사)과
+RegionMatcher(Aho-Corasick) 방식을 비교합니다.
+
+사용법: python scripts/bench_region_matcher.py [주소 개수]
+"""
+
+import random
+import sys
+import os
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.regions import ALL_REGIONS, METROPOLITAN_REGIONS, REGION_MATCHER
+
+
+def legacy_extract_region(address):
+    """기존 MessageParser._extract_region 매칭 로직 (로그 제외)"""
+    if not address:
+        return None
+    regions = list(ALL_REGIONS)
+    address_clean = address.replace(" ", "")
+    for region in sorted(regions, key=len, reverse=True):
+        if region in address_clean:
+            return region
+    for region in list(METROPOLITAN_REGIONS):
+        if region in address_clean:
+            return region
+    return None
+
+
+def split_region(region):
+    """'서울특별시광진구' -> '서울특별시 광진구' 형태로 띄어쓰기"""
+    for suffix in ("특별자치도", "특별자치시", "특별시", "광역시", "도"):
+        index = region.find(suffix)
+        if index != -1:
+            head = region[:index + len(suffix)]
+            return head + " " + region[len(head):]
+    return region
+
+
+def generate_addresses(count, seed=20240101):
+    """실제와 비슷한 주소 생성 (띄어쓰기, 약칭, 상세주소 포함)"""
+    rng = random.Random(seed)
+    dongs = ["자양동", "역삼동", "상계동", "중동", "신림동", "정자동", "연산동", "봉명동"]
+    buildings = ["미산빌5차", "래미안", "푸르지오", "e편한세상", "현대아파트", "한신빌라"]
+    addresses = []
+    for _ in range(count):
+        region = rng.choice(ALL_REGIONS)
+        style = rng.random()
+        if style < 0.4:
+            head = region
+        elif style < 0.8:
+            head = split_region(region)
+        else:
+            # 약칭 주소 (광역 단위 fallback 대상)
+            head = rng.choice(METROPOLITAN_REGIONS) + " " + region[-3:]
+        detail = f"{rng.choice(dongs)}{rng.randint(1, 999)}-{rng.randint(1, 99)} {rng.choice(buildings)} {rng.randint(101, 120)}동 {rng.randint(1, 30)}층 {rng.randint(101, 3002)}호"
+        addresses.append(f"{head} {detail}")
+    return addresses
+
+
+def bench(func, addresses, repeat=3):
+    """가장 빠른 반복의 총 소요시간(초) 반환"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for address in addresses:
+            func(address)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    addresses = generate_addresses(count)
+
+    mismatches = [a for a in addresses if legacy_extract_region(a) != REGION_MATCHER.match(a)]
+    if mismatches:
+        print(f"❌ 결과 불일치 {len(mismatches)}건 (예: {mismatches[0]})")
+        sys.exit(1)
+
+    legacy = bench(legacy_extract_region, addresses)
+    matcher = bench(REGION_MATCHER.match, addresses)
+
+    print(f"주소 {count}개, 결과 일치 확인 완료")
+    print(f"  기존 방식     : {legacy * 1000:8.1f}ms ({legacy / count * 1e6:7.1f}µs/건)")
+    print(f"  RegionMatcher : {matcher * 1000:8.1f}ms ({matcher / count * 1e6:7.1f}µs/건)")
+    print(f"  속도 향상     : {legacy / matcher:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+수정 메시지 회신 방식 비교 (새 회신 vs 이전 회신 수정 + 같은 내용이면 생략)
+메시지마다 원본 1건 + 수정 N건을 api/webhook.py의 handle_message로 차례로 처리하고 Bot API 호출 수를 셈
+
+- 홀수 번째 수정: 요청사항 줄만 수정 (계산 결과가 바뀌지 않는 수정 - 오타 수정 등)
+- 짝수 번째 수정: 신용점수 수정 (계산 결과가 바뀔 수 있는 수정)
+- Bot API는 호출 수만 세는 가짜 객체 (텔레그램 서버에 접속하지 않음), 디바운스 대기 없음
+- 마지막으로 보이는 회신(새로 보냈거나 수정된 회신)이 마지막 수정 내용의 계산 결과와 같은지 확인
+
+사용법: python scripts/bench_reply_edits.py [메시지 수] [수정 횟수]
+"""
+
+import logging
+import os
+import re
+import sys
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+# Application 생성에만 쓰는 토큰 (텔레그램 서버에 접속하지 않음)
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456:bench-token")
+
+import api.webhook as webhook
+from bench_pipeline import load_corpus
+from calculator.result_cache import calculate_formatted_result
+from parsers.message_parser import MessageParser
+from utils.reply_tracker import ReplyTracker
+
+
+class FakeBot:
+    """회신/수정 호출 수를 세고 채팅방에 보이는 회신 내용을 기록하는 가짜 Bot"""
+
+    def __init__(self):
+        self.reply_calls = 0
+        self.edit_calls = 0
+        self.visible = {}  # 회신 message_id -> 내용
+        self._next_id = 100000
+
+    async def send(self, text):
+        self.reply_calls += 1
+        self._next_id += 1
+        self.visible[self._next_id] = text
+        return SimpleNamespace(message_id=self._next_id)
+
+    async def edit_message_text(self, text, chat_id=None, message_id=None):
+        self.edit_calls += 1
+        self.visible[message_id] = text
+        return True
+
+
+def make_update(bot, message_id, text, edited, shown):
+    """handle_message가 쓰는 속성만 가진 가짜 업데이트 (보낸 회신 id는 shown[message_id]에 추가)"""
+    async def reply_text(reply):
+        sent = await bot.send(reply)
+        shown.setdefault(message_id, []).append(sent.message_id)
+        return sent
+
+    message = SimpleNamespace(
+        chat=SimpleNamespace(id=1), chat_id=1, message_id=message_id, text=text,
+        reply_text=reply_text, get_bot=lambda: bot
+    )
+    return SimpleNamespace(
+        message=None if edited else message, edited_message=message if edited else None,
+        channel_post=None, edited_channel_post=None
+    )
+
+
+def edited_text(text, version):
+    """수정 버전별 메시지 내용 (홀수: 요청사항만, 짝수: 신용점수)"""
+    if version == 0:
+        return text
+    if version % 2:
+        return f"{text} (수정 {version})"
+    return re.sub(r"신용점수\s*:[^\n]*", f"신용점수 : {600 + version * 20}", text, count=1)
+
+
+def run(app, messages, edits):
+    """모든 메시지를 원본 + 수정 순서로 처리, (가짜 Bot, 원본별 회신 id 목록)"""
+    bot = FakeBot()
+    shown = {}
+
+    async def run_all():
+        for message_id, text in enumerate(messages):
+            for version in range(edits + 1):
+                await app._handle_message(make_update(bot, message_id, edited_text(text, version), version > 0, shown), None)
+
+    webhook._loop_thread.run(run_all())
+    return bot, shown
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    logging.disable(logging.CRITICAL)
+
+    app = webhook.get_application()
+    webhook.EDIT_DEBOUNCE = 0
+    messages = [entry["message"] for entry in load_corpus()[:count]]
+    parser = MessageParser()
+    expected = [calculate_formatted_result(parser.parse(edited_text(text, edits)), "banks") for text in messages]
+    print(f"메시지 {count}개 x (원본 + 수정 {edits}회) - Bot API 호출 수")
+
+    for label, tracker in (("수정마다 새 회신", ReplyTracker(max_entries=0)), ("이전 회신 수정", ReplyTracker())):
+        webhook.reply_tracker = tracker
+        bot, shown = run(app, messages, edits)
+        latest = sum(
+            1 for message_id, text in enumerate(expected)
+            if shown.get(message_id) and bot.visible[shown[message_id][-1]] == text
+        )
+        noise = sum(len(reply_ids) for reply_ids in shown.values())
+        print(f"  {label:<16} 새 회신 {bot.reply_calls:4d}  수정 {bot.edit_calls:4d}  "
+              f"합계 {bot.reply_calls + bot.edit_calls:4d}  채팅방 회신 수 {noise:4d}  "
+              f"최신 결과 표시 {latest}/{count}")
+        print(f"  {'':<16} {tracker.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+상품 설정 수 확장 벤치마크 (10 -> 1000개)
+generate_configs.py로 만든 합성 설정을 임시 폴더에 JSON 파일로 쓰고, 설정 수별로 새 프로세스에서
+- 시작 시간: 설정 폴더 로드/검증/계산기 생성 (ProductRegistry 생성, 프로세스 시작과 import는 제외)
+- 메모리: 레지스트리 로드 전후 RSS 증가량, 측정 후 최대 RSS
+- 메시지당 시간: 익명 코퍼스(bench_pipeline.py) 메시지를 파싱한 뒤 금융사별 계산(calculate_products) / 포맷팅
+을 측정해 설정 수에 따라 어떻게 늘어나는지 비교 (금융사 1개당 시간이 일정하면 선형 확장)
+
+사용법: python scripts/bench_scaling.py [반복 횟수] [설정 수,설정 수,...]
+결과 파일: bench_results/scaling_<날짜_시각>.json
+"""
+
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+
+from bench_pipeline import RESULTS_DIR, git_revision, load_corpus, max_rss_kb, percentile
+from generate_configs import generate_configs, write_configs
+
+CONFIG_COUNTS = (10, 30, 100, 300, 1000)
+
+
+def current_rss_kb():
+    """현재 RSS(KB, /proc이 없으면 최대 RSS로 대체)"""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return max_rss_kb()
+
+
+def measure(config_dir, rounds):
+    """
+    설정 폴더 하나에 대해 시작 시간/메모리/메시지당 시간 측정 (자식 프로세스에서 실행)
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    from calculator.base_calculator import BaseCalculator
+    from calculator.registry import ProductRegistry
+    from parsers.message_parser import MessageParser
+    from utils.formatter import format_all_results
+
+    parser = MessageParser()
+    property_data = [parser.parse(entry["message"]) for entry in load_corpus()]
+
+    rss_before = current_rss_kb()
+    started = time.perf_counter()
+    registry = ProductRegistry((config_dir,), name="scaling")
+    startup_ms = (time.perf_counter() - started) * 1000
+    rss_after = current_rss_kb()
+    calculators = registry.calculators
+
+    calculate_times = []
+    format_times = []
+    for _ in range(rounds):
+        for data in property_data:
+            started = time.perf_counter()
+            results = BaseCalculator.calculate_products(calculators, data)
+            calculated = time.perf_counter()
+            format_all_results(results)
+            calculate_times.append((calculated - started) * 1000)
+            format_times.append((time.perf_counter() - calculated) * 1000)
+
+    calculate_times.sort()
+    format_times.sort()
+    calculate_p50 = percentile(calculate_times, 50)
+    return {
+        "configs": len(calculators),
+        "failed": len(registry.failed),
+        "startup_ms": round(startup_ms, 2),
+        "rss_growth_kb": rss_after - rss_before,
+        "max_rss_kb": max_rss_kb(),
+        "calculate_ms": {f"p{q}": round(percentile(calculate_times, q), 4) for q in (50, 95, 99)},
+        "format_ms": {f"p{q}": round(percentile(format_times, q), 4) for q in (50, 95, 99)},
+        "calculate_us_per_config": round(calculate_p50 * 1000 / max(1, len(calculators)), 2),
+    }
+
+
+def run_child(count, rounds, base_dir):
+    """설정 count개를 파일로 쓰고 새 프로세스에서 측정"""
+    config_dir = os.path.join(base_dir, f"configs_{count}")
+    write_configs(config_dir, generate_configs(count))
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), "--child", config_dir, str(rounds)],
+        cwd=ROOT_DIR, text=True
+    )
+    return json.loads(output)
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        logging.disable(logging.CRITICAL)
+        print(json.dumps(measure(sys.argv[2], int(sys.argv[3]))))
+        return
+
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    counts = tuple(int(value) for value in sys.argv[2].split(",")) if len(sys.argv) > 2 else CONFIG_COUNTS
+
+    rows = []
+    with tempfile.TemporaryDirectory() as base_dir:
+        for count in counts:
+            rows.append(run_child(count, rounds, base_dir))
+
+    print(f"코퍼스 메시지 {len(load_corpus())}건 x {rounds}회, 설정 수별 새 프로세스에서 측정")
+    print(f"  {'설정 수':>7} {'시작(ms)':>10} {'RSS 증가(KB)':>13} {'최대 RSS(KB)':>13} "
+          f"{'계산 p50':>10} {'계산 p95':>10} {'포맷 p50':>10} {'금융사당(µs)':>12}")
+    for row in rows:
+        print(f"  {row['configs']:>7} {row['startup_ms']:10.1f} {row['rss_growth_kb']:13} {row['max_rss_kb']:13} "
+              f"{row['calculate_ms']['p50']:10.3f} {row['calculate_ms']['p95']:10.3f} "
+              f"{row['format_ms']['p50']:10.3f} {row['calculate_us_per_config']:12.1f}")
+    print("  (계산/포맷 시간은 메시지당 ms)")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": rounds,
+        },
+        "rows": rows,
+    }
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = os.path.join(RESULTS_DIR, f"scaling_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {os.path.relpath(output_path, ROOT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
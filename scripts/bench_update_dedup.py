@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+update_id 중복 제거 벤치마크
+api/webhook.py의 handler를 로컬 HTTP 서버로 띄우고, 텔레그램 재전송을 흉내 내 같은 업데이트를 여러 번 보냈을 때
+실제 처리(파싱/계산/회신) 횟수와 POST 응답 시간을 중복 제거 사용/미사용으로 비교
+
+- 업데이트 처리는 bench_webhook_ack.py와 같이 실제 파싱/계산/포맷팅 + 회신 지연(sleep)으로 대체
+- 중복 확인 자체의 비용: 메모리 버전 / 파일 버전(임시 폴더) seen() 호출당 시간(µs)
+- 파일 버전은 새 인스턴스(프로세스 재시작)에서도 이전 기록으로 중복을 판정하는지 확인
+
+사용법: python scripts/bench_update_dedup.py [업데이트 수] [재전송 횟수] [회신 지연(ms)]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from bench_webhook_ack import make_processor, make_updates, report, send_all, webhook
+from utils.update_dedup import FileUpdateIdSet, UpdateIdSet
+
+
+def per_call_micros(dedup, calls):
+    """seen() 호출당 시간(µs) - 새 update_id와 중복을 번갈아 확인"""
+    started = time.perf_counter()
+    for index in range(calls):
+        dedup.seen(index // 2)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    redeliveries = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    reply_delay = (float(sys.argv[3]) if len(sys.argv) > 3 else 50.0) / 1000
+    logging.disable(logging.CRITICAL)
+
+    process = make_processor(reply_delay)
+    processed = []
+
+    def counting_process(body):
+        processed.append(body["update_id"])
+        return process(body)
+
+    webhook.process_update_body = counting_process
+    webhook.FAST_ACK = False
+    webhook.get_application()
+    updates = make_updates(count)
+    # 같은 업데이트를 (1 + 재전송 횟수)번 전송 (재전송은 원래 요청과 겹치도록 바로 뒤에 보냄)
+    deliveries = [body for body in updates for _ in range(1 + redeliveries)]
+
+    ThreadingHTTPServer.request_queue_size = 128
+    server = ThreadingHTTPServer(("127.0.0.1", 0), webhook.handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/webhook"
+
+    print(f"업데이트 {count}건 x {1 + redeliveries}회 전송, 회신 지연 {reply_delay * 1000:.0f}ms, 동시 요청 {1 + redeliveries}개")
+    for label, dedup in (
+        ("중복 제거 안 함", UpdateIdSet(max_entries=0)),
+        ("중복 제거 (메모리)", UpdateIdSet()),
+    ):
+        webhook._update_dedup = dedup
+        processed.clear()
+        report(label, *send_all(url, deliveries, 1 + redeliveries))
+        print(f"  {'':<22} 처리 {len(processed)}회, 중복 응답 {dedup.stats()['duplicates']}회")
+    server.shutdown()
+
+    calls = 100000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "update_ids.log")
+        print(f"seen() 호출당 시간 ({calls}회, 절반은 중복)")
+        print(f"  {'메모리':<10} {per_call_micros(UpdateIdSet(), calls):8.2f} µs")
+        print(f"  {'파일':<10} {per_call_micros(FileUpdateIdSet(path), calls):8.2f} µs")
+
+        # 프로세스 재시작: 새 인스턴스가 기록 파일을 읽어 중복 판정 (기억 개수만큼 최근 update_id)
+        restarted = FileUpdateIdSet(path)
+        recent = range(calls // 2 - restarted.max_entries, calls // 2)
+        duplicates = sum(restarted.seen(update_id) for update_id in recent)
+        print(f"  파일 버전 재시작 후 최근 update_id {len(recent)}개 중 중복 판정 {duplicates}개 "
+              f"(파일 {os.path.getsize(path) // 1024}KB)")
+
+
+if __name__ == "__main__":
+    main()
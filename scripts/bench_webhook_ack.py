@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 응답 시간 벤치마크 (동기 처리 vs 빠른 응답 모드)
+api/webhook.py의 handler를 로컬 HTTP 서버로 띄우고 텔레그램 업데이트 형식의 POST를 보내
+응답(200)까지 걸린 시간을 비교
+
+- 업데이트 처리는 실제 파싱/계산/포맷팅(calculate_formatted_result) + 회신 API 호출 지연(sleep)으로 대체
+  (텔레그램 서버에 접속하지 않음)
+- 빠른 응답 모드는 모든 업데이트 처리가 끝난 뒤 큐 통계(최대 깊이, 대기 시간, 처리 수)를 출력
+- 마지막으로 작은 큐에 한꺼번에 보내 큐가 가득 찰 때 503 응답과 dropped 집계를 확인
+
+사용법: python scripts/bench_webhook_ack.py [업데이트 수] [회신 지연(ms)] [동시 요청 수]
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+# Application 생성에만 쓰는 토큰 (텔레그램 서버에 접속하지 않음)
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456:bench-token")
+
+import api.webhook as webhook
+from bench_pipeline import load_corpus, percentile
+from calculator.result_cache import ResultCache, calculate_formatted_result
+from parsers.message_parser import MessageParser
+from utils.fair_scheduler import FairWorkQueue
+from utils.update_dedup import UpdateIdSet
+
+
+def make_processor(reply_delay):
+    """실제 파싱/계산 + 회신 지연으로 업데이트를 처리하는 함수"""
+    parser = MessageParser()
+    # 반복 전송되는 코퍼스 메시지가 캐시로 끝나지 않도록 캐시 사용 안 함
+    cache = ResultCache(max_entries=0)
+
+    def process(body):
+        property_data = parser.parse(body["message"]["text"])
+        calculate_formatted_result(property_data, "banks", cache=cache)
+        time.sleep(reply_delay)
+        return None
+    return process
+
+
+def make_updates(count):
+    """텔레그램 업데이트 형식 요청 body 목록"""
+    corpus = load_corpus()
+    return [
+        json.dumps({
+            "update_id": index,
+            "message": {
+                "message_id": index,
+                "date": 0,
+                "chat": {"id": 1, "type": "group"},
+                "text": corpus[index % len(corpus)]["message"],
+            },
+        }).encode("utf-8")
+        for index in range(count)
+    ]
+
+
+def post(url, body):
+    """POST 후 (응답 시간(ms), 상태 코드)"""
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return (time.perf_counter() - started) * 1000, status
+
+
+def send_all(url, updates, concurrency):
+    """동시 요청 수만큼 나눠 전송, (응답 시간 목록, 상태 코드별 수, 전체 소요 시간(초))"""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda body: post(url, body), updates))
+    elapsed = time.perf_counter() - started
+    statuses = {}
+    for _, status in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    return sorted(latency for latency, _ in results), statuses, elapsed
+
+
+def report(label, latencies, statuses, elapsed):
+    print(f"  {label:<22} p50 {percentile(latencies, 50):8.2f}  p95 {percentile(latencies, 95):8.2f}  "
+          f"p99 {percentile(latencies, 99):8.2f} ms  전송 {elapsed:6.2f}s  응답 {statuses}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    reply_delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 150.0) / 1000
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    logging.disable(logging.CRITICAL)
+
+    process = make_processor(reply_delay)
+    webhook.process_update_body = process
+    # 같은 업데이트를 모드별로 다시 보내므로 update_id 중복 제거는 사용 안 함
+    webhook._update_dedup = UpdateIdSet(max_entries=0)
+    webhook.get_application()
+    updates = make_updates(count)
+    process(json.loads(updates[0]))  # 레지스트리 로드는 측정에서 제외
+
+    # 동시 접속이 몰려도 연결이 끊기지 않도록 listen 대기열을 늘림
+    ThreadingHTTPServer.request_queue_size = 128
+    server = ThreadingHTTPServer(("127.0.0.1", 0), webhook.handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/webhook"
+
+    print(f"업데이트 {count}건, 회신 지연 {reply_delay * 1000:.0f}ms, 동시 요청 {concurrency}개 - POST 응답 시간")
+
+    webhook.FAST_ACK = False
+    report("동기 처리", *send_all(url, updates, concurrency))
+
+    webhook.FAST_ACK = True
+    report("빠른 응답 (큐 적재)", *send_all(url, updates, concurrency))
+    started = time.perf_counter()
+    webhook.get_update_queue().join()
+    stats = webhook.update_queue_stats()
+    print(f"  큐 처리 완료까지 추가 {time.perf_counter() - started:.2f}s - 최대 깊이 {stats['high_watermark']}, "
+          f"대기 p50 {stats['wait_ms']['p50']:.1f} / p95 {stats['wait_ms']['p95']:.1f} / 최대 {stats['wait_ms']['max']:.1f} ms, "
+          f"처리 {stats['processed']}, 실패 {stats['failed']}, 버림 {stats['dropped']}, "
+          f"채팅방 대기 초과(요청 많음 회신) {stats['shed']}")
+
+    # 큐가 가득 찬 경우: 워커 1개, 깊이 5인 큐에 한꺼번에 전송
+    webhook._update_queue = FairWorkQueue(process, workers=1, max_depth=5, name="webhook-updates-small")
+    report("빠른 응답 (큐 깊이 5)", *send_all(url, updates[:40], 20))
+    webhook._update_queue.join()
+    stats = webhook.update_queue_stats()
+    print(f"  작은 큐 - 처리 {stats['processed']}, 버림 {stats['dropped']} (버린 업데이트는 503 응답 -> 텔레그램이 재전송)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
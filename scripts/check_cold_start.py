@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+웹훅 콜드 스타트 점검
+새 프로세스에서 api/webhook.py import 시간(python -X importtime 누적값)을 재서 예산과 비교하고,
+import 시점/첫 메시지 처리 후에 무거운 모듈이 불필요하게 로드되지 않았는지 확인
+
+- import 예산: IMPORT_BUDGET_MS (여러 번 재서 중앙값 비교, 넘으면 종료 코드 1)
+- import 시점에 로드되면 안 되는 모듈: telegram, numpy, calculator.base_calculator
+  (텔레그램/계산기는 첫 업데이트에서 로드)
+- 첫 메시지 처리 후에도 로드되면 안 되는 모듈: numpy (계산은 numpy를 쓰지 않음)
+- 참고용 단계별 시간: webhook import -> Application 생성(텔레그램 import) -> 업데이트 변환 ->
+  첫 파싱 -> 첫 계산/포맷팅(상품 레지스트리 로드 포함), 텔레그램 서버에는 접속하지 않음
+
+사용법: python scripts/check_cold_start.py [측정 횟수]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+# 첫 메시지로 쓰는 익명 코퍼스 (bench_pipeline.py는 계산기를 import하므로 파일을 직접 읽음)
+CORPUS_PATH = os.path.join(SCRIPTS_DIR, "corpus", "pipeline_messages.json")
+
+# api.webhook import 예산(ms, -X importtime 누적값) - 대부분 asyncio/http.server 등 표준 라이브러리
+IMPORT_BUDGET_MS = 150
+
+# webhook import 시점에 로드되면 안 되는 모듈
+IMPORT_FORBIDDEN = ("telegram", "numpy", "calculator.base_calculator")
+
+# 첫 메시지 처리 후에도 로드되면 안 되는 모듈 (계산은 numpy를 쓰지 않음)
+FIRST_MESSAGE_FORBIDDEN = ("numpy",)
+
+
+def import_time_ms():
+    """새 프로세스에서 api.webhook import 누적 시간(ms)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import api.webhook"],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        env=dict(os.environ, LOG_LEVEL="WARNING")
+    )
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.rstrip().endswith("| api.webhook"):
+            return int(line.split("|")[1]) / 1000
+    raise RuntimeError("importtime 출력에서 api.webhook을 찾지 못했습니다")
+
+
+def loaded(modules):
+    """sys.modules에 로드된 모듈 (하위 모듈 포함)"""
+    return sorted(
+        name for name in modules
+        if name in sys.modules or any(key.startswith(name + ".") for key in sys.modules)
+    )
+
+
+def measure_stages():
+    """
+    새 프로세스에서 콜드 스타트 단계별 시간 측정 (자식 프로세스에서 실행)
+
+    Returns:
+        단계별 시간(ms)과 단계별 로드된 무거운 모듈
+    """
+    import logging
+    logging.disable(logging.CRITICAL)
+    # Application 생성에만 쓰는 토큰 (텔레그램 서버에 접속하지 않음)
+    os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456:cold-start-token")
+    with open(CORPUS_PATH, "r", encoding="utf-8") as f:
+        message = json.load(f)["messages"][0]["message"]
+
+    stages = {}
+    started = time.perf_counter()
+    import api.webhook as webhook
+    stages["import_webhook"] = time.perf_counter() - started
+    after_import = loaded(IMPORT_FORBIDDEN)
+
+    started = time.perf_counter()
+    app = webhook.get_application()
+    stages["get_application"] = time.perf_counter() - started
+
+    from telegram import Update
+    started = time.perf_counter()
+    update = Update.de_json({
+        "update_id": 1,
+        "message": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "group"}, "text": message},
+    }, app.bot)
+    stages["update_de_json"] = time.perf_counter() - started
+
+    from parsers.message_parser import MessageParser
+    started = time.perf_counter()
+    property_data = MessageParser().parse(update.message.text)
+    stages["first_parse"] = time.perf_counter() - started
+
+    from calculator.result_cache import calculate_formatted_result
+    started = time.perf_counter()
+    calculate_formatted_result(property_data, "banks")
+    stages["first_calculate"] = time.perf_counter() - started
+
+    return {
+        "stages_ms": {name: round(seconds * 1000, 2) for name, seconds in stages.items()},
+        "after_import": after_import,
+        "after_first_message": loaded(FIRST_MESSAGE_FORBIDDEN),
+    }
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        print(json.dumps(measure_stages()))
+        return 0
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    samples = sorted(import_time_ms() for _ in range(runs))
+    median = statistics.median(samples)
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), "--child"], cwd=ROOT_DIR, text=True
+    )
+    child = json.loads(output)
+
+    print(f"api.webhook import (-X importtime, {runs}회): 중앙값 {median:.1f}ms, "
+          f"최소 {samples[0]:.1f}ms, 최대 {samples[-1]:.1f}ms (예산 {IMPORT_BUDGET_MS}ms)")
+    print("콜드 스타트 단계별 시간 (새 프로세스 1회)")
+    for name, ms in child["stages_ms"].items():
+        print(f"  {name:<18} {ms:8.1f} ms")
+    print(f"  {'합계':<18} {sum(child['stages_ms'].values()):8.1f} ms")
+
+    failures = []
+    if median > IMPORT_BUDGET_MS:
+        failures.append(f"api.webhook import {median:.1f}ms > 예산 {IMPORT_BUDGET_MS}ms")
+    if child["after_import"]:
+        failures.append(f"webhook import 시점에 로드됨: {', '.join(child['after_import'])}")
+    if child["after_first_message"]:
+        failures.append(f"첫 메시지 처리 후 로드됨: {', '.join(child['after_first_message'])}")
+
+    for failure in failures:
+        print(f"실패: {failure}")
+    if not failures:
+        print("통과")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
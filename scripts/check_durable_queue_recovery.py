@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+내구성 큐(utils/durable_queue.py) 비정상 종료 복구 확인
+자식 프로세스에서 생산자 스레드가 적재하고 워커 스레드가 처리하는 도중 SIGKILL로 종료한 뒤,
+같은 파일을 다시 열어 가시성 제한 시간이 지난 항목까지 모두 꺼내 확인
+
+- 자식은 적재가 반환된 항목(C), 처리한 항목(P), ack한 항목(A)을 로그 파일에 기록 (한 줄씩 O_APPEND, SIGKILL에도 남음)
+- 처리의 5%는 예외(재시도 경로), 처리마다 2ms 대기
+- 확인: 적재가 반환된 항목은 모두 처리되었거나 다시 열었을 때 남아 있음 (유실 없음)
+        ack한 항목은 다시 꺼내지지 않음 / dead 없음
+        처리했지만 ack 전에 종료된 항목은 다시 꺼냄 (최소 한 번 처리 - 중복 수 표시)
+- 메모리 큐(빠른 응답 모드의 FairWorkQueue)였다면 잃었을 항목 수: 적재되었지만 종료 시점까지 처리(ack)되지 않은 항목
+
+사용법: python scripts/check_durable_queue_recovery.py [반복 횟수] [생산자 스레드 수] [워커 수]
+"""
+
+import logging
+import os
+import random
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+
+from utils.durable_queue import DurableQueue
+
+# 자식/부모가 같은 설정 사용 (가시성 제한 시간은 짧게)
+VISIBILITY_TIMEOUT = 0.5
+RETRY_DELAY = 0.05
+MAX_ATTEMPTS = 5
+FAILURE_RATE = 0.05
+PROCESS_SECONDS = 0.002
+
+
+def open_queue(path):
+    return DurableQueue(path, visibility_timeout=VISIBILITY_TIMEOUT, max_attempts=MAX_ATTEMPTS,
+                        retry_delay=RETRY_DELAY, name="recovery")
+
+
+def run_child(path, log_path, producers, workers):
+    """자식 프로세스: SIGKILL될 때까지 적재/처리"""
+    logging.disable(logging.CRITICAL)
+    log = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+
+    def write(line):
+        os.write(log, (line + "\n").encode())
+
+    class LoggingQueue(DurableQueue):
+        def ack(self, item_ids):
+            super().ack(item_ids)
+            for item_id in item_ids:
+                write(f"A {item_id}")
+
+    queue = LoggingQueue(path, visibility_timeout=VISIBILITY_TIMEOUT, max_attempts=MAX_ATTEMPTS,
+                         retry_delay=RETRY_DELAY, name="recovery")
+
+    def process(payload):
+        time.sleep(PROCESS_SECONDS)
+        if random.random() < FAILURE_RATE:
+            raise RuntimeError("처리 실패 (의도)")
+        write(f"P {payload}")
+
+    queue.start(process, workers)
+
+    def produce(producer):
+        for sequence in range(10 ** 9):
+            key = f"{producer}-{sequence}"
+            queue.enqueue(key)
+            write(f"C {key}")
+
+    threads = [threading.Thread(target=produce, args=(index,), daemon=True) for index in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def read_log(log_path):
+    committed, processed, acked = set(), [], set()
+    with open(log_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                continue
+            kind, value = line.split()
+            if kind == "C":
+                committed.add(value)
+            elif kind == "P":
+                processed.append(value)
+            else:
+                acked.add(int(value))
+    return committed, processed, acked
+
+
+def drain(path):
+    """다시 열어 남은 항목을 모두 꺼냄 -> (id, payload) 목록, 큐 통계"""
+    queue = open_queue(path)
+    time.sleep(VISIBILITY_TIMEOUT + 0.1)
+    drained = []
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        claimed = queue.claim(100)
+        if claimed:
+            queue.ack([item_id for item_id, _, _ in claimed])
+            drained.extend((item_id, payload) for item_id, payload, _ in claimed)
+            continue
+        counts = queue.counts()
+        if not counts["ready"] and not counts["delayed"]:
+            break
+        time.sleep(0.05)
+    return drained, queue.counts(), queue.redelivered
+
+
+def run_round(directory, round_index, producers, workers, rng):
+    path = os.path.join(directory, f"round{round_index}.db")
+    log_path = os.path.join(directory, f"round{round_index}.log")
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--child", path, log_path, str(producers), str(workers)])
+    time.sleep(rng.uniform(1.0, 2.5))
+    os.kill(child.pid, signal.SIGKILL)
+    child.wait()
+
+    committed, processed, acked = read_log(log_path)
+    drained, counts, redelivered = drain(path)
+    drained_keys = {payload for _, payload in drained}
+    drained_ids = {item_id for item_id, _ in drained}
+    processed_keys = set(processed)
+
+    lost = committed - processed_keys - drained_keys
+    acked_again = acked & drained_ids
+    duplicates = processed_keys & drained_keys
+    uncommitted = drained_keys - committed
+    # 메모리 큐였다면: 종료 시점에 처리되지 않은 적재 항목은 모두 사라짐
+    memory_lost = len(committed - processed_keys)
+    ok = not lost and not acked_again and not counts["dead"]
+    print(f"  {round_index + 1}회: 적재 {len(committed)}건, 종료 전 처리 {len(processed_keys)}건 (ack {len(acked)}건), "
+          f"다시 열어 꺼냄 {len(drained)}건 (처리 중이었거나 재시도 대기였던 항목 {redelivered}건)  "
+          f"유실 {len(lost)}건, ack 후 재전달 {len(acked_again)}건, dead {counts['dead']}건, "
+          f"중복 처리 {len(duplicates)}건, 적재 반환 전 종료 {len(uncommitted)}건  "
+          f"메모리 큐였다면 유실 {memory_lost}건  {'통과' if ok else '실패'}")
+    return ok
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3], int(sys.argv[4]), int(sys.argv[5]))
+        return
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    producers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    rng = random.Random(24)
+    directory = tempfile.mkdtemp(prefix="check_durable_queue_")
+    print(f"{rounds}회 반복 / 생산자 {producers} / 워커 {workers} / 가시성 제한 시간 {VISIBILITY_TIMEOUT}s / 처리 실패율 {FAILURE_RATE:.0%}")
+    try:
+        results = [run_round(directory, index, producers, workers, rng) for index in range(rounds)]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    print("통과" if all(results) else "실패")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
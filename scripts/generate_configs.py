@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+합성 상품 설정 생성기
+실제 설정(data/banks, data/loan)과 같은 키 구조를 가진 가상 금융사 설정을 만들어
+금융사 수가 늘어날 때의 로드 시간/메시지당 계산 시간/메모리 측정(bench_scaling.py)에 사용
+
+- 지역별 급지: 전국 지역 목록(ALL_REGIONS) 기준, 광역 단위별 급지 분포 (서울 1~2급지 ... 지방 4~6급지)
+- LTV 단계 / LTV별 신용등급별 금리 / 신용점수 -> 등급 구간 / 대환 가능 기관 등 실제 설정과 같은 형식
+- 금융사 이름은 실제 금융사 이름(BNK캐피탈, OK저축은행 등)과 겹치지 않음 -> 금융사별 특수 처리 없이 일반 경로로 계산
+- 같은 시드면 같은 설정 생성, 생성된 설정은 모두 validate_config 통과
+
+사용법: python scripts/generate_configs.py [설정 개수] [출력 폴더]
+"""
+
+import json
+import os
+import random
+import sys
+from typing import Any, Dict, List, Tuple
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator.registry import validate_config
+from utils.regions import ALL_REGIONS
+
+NAME_PREFIXES = ("한빛", "새솔", "누리", "다온", "미소", "가람", "온누리", "푸른", "하늘", "으뜸", "참빛", "나래")
+NAME_SUFFIXES = ("캐피탈", "저축은행", "파이낸셜", "대부", "신용금고")
+
+# 광역 단위별 급지 후보 (지역명 앞부분 기준)
+GRADE_CHOICES = (
+    ("서울", (1, 1, 2)),
+    ("경기", (2, 3, 3, 4)),
+    ("인천", (2, 3, 4)),
+    ("부산", (3, 4, 4)),
+    ("대구", (3, 4, 5)),
+    ("광주", (4, 5)),
+    ("대전", (3, 4, 5)),
+    ("울산", (4, 5)),
+    ("세종", (3, 4)),
+)
+DEFAULT_GRADE_CHOICES = (4, 5, 6, 6)
+
+TARGET_REGION_CHOICES = ("경기", "인천", "부산", "대구", "광주", "대전", "울산", "세종", "경북", "경남", "충북", "충남", "강원")
+
+INSTITUTION_POOL = (
+    "MG캐피탈", "애큐온저축은행", "JB우리캐피탈", "애큐온캐피탈", "우리금융캐피탈", "한국투자캐피탈",
+    "한국투자저축은행", "한국캐피탈", "NH농협캐피탈", "SBI저축은행", "IM캐피탈", "더블저축은행",
+    "오릭스캐피탈", "예가람저축은행", "스마트저축은행", "HB저축은행", "고려저축은행", "마스턴캐피탈",
+    "현대캐피탈", "롯데캐피탈", "KB캐피탈", "신한캐피탈", "하나캐피탈", "DB저축은행",
+)
+
+CONDITION_POOL = (
+    "사업자 등록된 3개월 이상 개인사업자",
+    "소유권 이전 3개월 미만 불가",
+    "대출 취급직전 1개월 이내 말소이력 있을 시 취급 불가",
+    "특이사항에 '압류', '가압류' 있으면 취급 불가",
+    "세입자 동의 필수",
+    "KB시세 1억 미만 아파트 불가",
+)
+
+RESTRICTED_KEYWORD_POOL = ("가등기", "가처분", "신탁", "경매", "임차권등기")
+
+CREDIT_SCORE_TO_GRADE = {
+    "920-999": 1, "880-919": 2, "850-879": 3, "810-849": 4, "765-809": 5, "710-764": 6, "656-709": 7,
+}
+
+
+def _region_grade(rng: random.Random, region: str) -> int:
+    """광역 단위 분포에 따른 지역 급지"""
+    for prefix, choices in GRADE_CHOICES:
+        if region.startswith(prefix):
+            return rng.choice(choices)
+    return rng.choice(DEFAULT_GRADE_CHOICES)
+
+
+def generate_config(rng: random.Random, index: int) -> Dict[str, Any]:
+    """
+    가상 금융사 설정 한 개 생성
+
+    Args:
+        rng: 난수 생성기
+        index: 설정 번호 (금융사 이름에 사용, 이름 중복 방지)
+
+    Returns:
+        data 폴더의 설정 JSON과 같은 형식의 딕셔너리
+    """
+    bank_name = f"{rng.choice(NAME_PREFIXES)}{rng.choice(NAME_SUFFIXES)} {index:04d}"
+
+    # 취급 지역: 서울 + 광역 단위 몇 곳, 지역 목록 일부는 급지 정보 없음
+    target_regions = ["서울"] + rng.sample(TARGET_REGION_CHOICES, rng.randint(2, 7))
+    region_grades = {
+        region: _region_grade(rng, region)
+        for region in sorted(ALL_REGIONS)
+        if rng.random() < 0.9
+    }
+
+    # 급지별 최대 LTV (급지가 낮을수록 높음, 6급지는 취급 불가)
+    top_ltv = rng.choice((80, 83, 85, 87, 90))
+    max_ltv_by_grade = {"1": top_ltv}
+    ltv = top_ltv
+    for grade in ("2", "3", "4", "5"):
+        ltv -= rng.choice((2, 3, 4, 5))
+        max_ltv_by_grade[grade] = ltv
+    max_ltv_by_grade["6"] = 0
+
+    # LTV 단계: 최대 LTV부터 65%까지 내림차순
+    ltv_steps = sorted({top_ltv, *max_ltv_by_grade.values(), *rng.sample(range(65, top_ltv), 3)} - {0}, reverse=True)
+
+    # LTV별 신용등급별 금리 (LTV가 높을수록, 등급이 낮을수록 높음)
+    base_rate = round(rng.uniform(5.5, 9.0), 2)
+    ltv_slope = rng.uniform(0.03, 0.08)
+    low_grade_spread = round(rng.uniform(0.5, 3.0), 2)
+    interest_rates_by_ltv = {}
+    for step in ltv_steps:
+        step_rate = base_rate + (step - 65) * ltv_slope
+        interest_rates_by_ltv[str(step)] = {
+            str(grade): round(step_rate + (low_grade_spread if grade >= 5 else 0.0) + grade * 0.05, 2)
+            for grade in range(1, 8)
+        }
+
+    config = {
+        "bank_name": bank_name,
+        "target_regions": target_regions,
+        "region_grades": region_grades,
+        "max_ltv_by_grade": max_ltv_by_grade,
+        "ltv_steps": ltv_steps,
+        "interest_rates_by_ltv": interest_rates_by_ltv,
+        "credit_score_to_grade": dict(CREDIT_SCORE_TO_GRADE),
+        "conditions": rng.sample(CONDITION_POOL, rng.randint(0, 4)),
+        "min_amount": rng.choice((1000, 2000, 3000)),
+        "min_kb_price": rng.choice((3000, 5000, 10000, 15000)),
+        "refinanceable_institutions": rng.sample(INSTITUTION_POOL, rng.randint(5, len(INSTITUTION_POOL))),
+    }
+    if rng.random() < 0.5:
+        config["max_age"] = rng.choice((70, 75, 80))
+    if rng.random() < 0.3:
+        config["additional_restricted_keywords"] = rng.sample(RESTRICTED_KEYWORD_POOL, rng.randint(1, 3))
+    if rng.random() < 0.3:
+        config["area_limit"] = {"enabled": True, "max_area": rng.choice((102, 135, 165)), "excluded_regions": ["서울"]}
+    if rng.random() < 0.2:
+        config["taxi_limit"] = {"enabled": True, "keywords": ["개인택시", "택시", "운수"], "max_amount": 10000}
+    if rng.random() < 0.2:
+        config["property_type_restrictions"] = {"enabled": True, "allowed_types": ["아파트", "주상복합", "빌라"]}
+        config["property_type_conditions"] = {
+            "아파트": {"min_household_count": rng.choice((100, 200)), "min_kb_price": 20000},
+            "빌라": {"min_kb_price": 20000},
+        }
+    return config
+
+
+def generate_configs(count: int, seed: int = 13) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    가상 금융사 설정 count개 생성 (ProductRegistry(configs=...)에 바로 전달 가능)
+
+    Returns:
+        (출처, 설정 딕셔너리) 리스트
+    """
+    rng = random.Random(seed)
+    configs = []
+    for index in range(count):
+        source = f"synthetic/synthetic_{index:04d}_config.json"
+        config = generate_config(rng, index)
+        validate_config(config, source)
+        configs.append((source, config))
+    return configs
+
+
+def write_configs(output_dir: str, configs: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """설정을 출력 폴더에 JSON 파일로 저장 (data 폴더 설정 파일과 같은 형식)"""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for source, config in configs:
+        path = os.path.join(output_dir, os.path.basename(source))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
+        paths.append(path)
+    return paths
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    output_dir = sys.argv[2] if len(sys.argv) > 2 else "synthetic_configs"
+    paths = write_configs(output_dir, generate_configs(count))
+    print(f"설정 {len(paths)}개 생성: {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
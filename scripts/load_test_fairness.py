@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+채팅방별 공정 스케줄링 부하 테스트
+한 채팅방(banks)에 양식 메시지가 한꺼번에 몰린 직후 다른 채팅방(loan)에 메시지가 들어올 때,
+다른 채팅방의 회신이 얼마나 기다리는지 비교
+
+폴링 모드 (main.build_application, load_test_polling.py의 가짜 Bot):
+- 기존: 도착 순서대로 처리 (BOT_FAIR_SCHEDULING=0)
+- 공정 스케줄링: 채팅방별 대기열을 번갈아 처리
+- 공정 스케줄링 + 채팅방별 최대 대기 수: 넘친 메시지는 "요청이 많음" 회신
+- 가중치: 두 채팅방에 똑같이 몰렸을 때 loan 가중치 3 -> 처음 회신 20건 중 채팅방별 비율
+웹훅 빠른 응답 모드 큐 (utils/fair_scheduler.py FairWorkQueue, 모든 작업을 한 대기열에 넣은 도착 순서 vs 채팅방별 대기열, 워커 스레드가 회신 지연만큼 대기)
+
+사용법: python scripts/load_test_fairness.py [몰린 메시지 수] [다른 채팅방 메시지 수] [회신 지연(ms)] [동시 처리 수] [채팅방별 최대 대기 수]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from bench_pipeline import load_corpus
+from load_test_polling import percentile, run_burst
+
+from utils.chat_routing import reset_chat_router
+from utils.fair_scheduler import BUSY_MESSAGE, FairWorkQueue
+
+BANKS_CHAT = -1001000000001
+LOAN_CHAT = -1001000000002
+
+
+def make_flood(flood, others):
+    """banks 채팅방 flood건 다음 loan 채팅방 others건 (chat_id, message_id, 메시지 내용, 수정 여부)"""
+    forms = [entry["message"] for entry in load_corpus()]
+    messages = [(BANKS_CHAT, index + 1, forms[index % len(forms)], False) for index in range(flood)]
+    messages += [(LOAN_CHAT, flood + index + 1, forms[index % len(forms)], False) for index in range(others)]
+    return messages
+
+
+def install_routes(weights=None):
+    """banks/loan 채팅방 라우팅 + 가중치 (main.build_application이 라우팅 테이블의 가중치 사용)"""
+    os.environ["CHAT_ROUTES"] = json.dumps({"banks": [BANKS_CHAT], "loan": [LOAN_CHAT]})
+    os.environ["CHAT_WEIGHTS"] = json.dumps(weights or {})
+    reset_chat_router()
+
+
+def chat_latencies(bot, finished):
+    """채팅방별 (계산 회신 완료 시각 목록, "요청이 많음" 회신 수)"""
+    result = {BANKS_CHAT: ([], 0), LOAN_CHAT: ([], 0)}
+    for (chat_id, message_id), done in zip(bot._order, finished):
+        latencies, busy = result[chat_id]
+        if bot._replies[(chat_id, message_id)] == BUSY_MESSAGE:
+            result[chat_id] = (latencies, busy + 1)
+        else:
+            latencies.append(done)
+    return result
+
+
+def report(label, elapsed, bot, finished):
+    result = chat_latencies(bot, finished)
+    line = f"  {label:<30} 전체 {elapsed:5.2f}s"
+    for name, chat_id in (("banks", BANKS_CHAT), ("loan", LOAN_CHAT)):
+        latencies, busy = result[chat_id]
+        line += (f"  {name}: 회신 {len(latencies):2d}건 p50 {percentile(latencies, 0.5) * 1000:5.0f}ms "
+                 f"최대 {max(latencies, default=0) * 1000:5.0f}ms 요청 많음 {busy:2d}건")
+    print(line)
+
+
+def run_queue(per_chat, messages, workers, latency):
+    """웹훅 큐에 한꺼번에 적재 -> 채팅방별 처리 완료 시각 목록 (per_chat이 False면 모두 한 대기열 = 도착 순서)"""
+    done = {BANKS_CHAT: [], LOAN_CHAT: []}
+    lock = threading.Lock()
+    started = time.perf_counter()
+
+    def process(item):
+        time.sleep(latency)
+        with lock:
+            done[item].append(time.perf_counter() - started)
+
+    queue = FairWorkQueue(process, workers=workers, max_depth=len(messages))
+    for chat_id, _, _, _ in messages:
+        queue.submit(chat_id if per_chat else None, chat_id)
+    queue.join()
+    queue.stop()
+    return done
+
+
+def main_load_test():
+    flood = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    others = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 100.0) / 1000
+    concurrency = int(sys.argv[4]) if len(sys.argv) > 4 else 4
+    backlog = int(sys.argv[5]) if len(sys.argv) > 5 else 10
+    logging.disable(logging.CRITICAL)
+    install_routes()
+
+    messages = make_flood(flood, others)
+    print(f"banks 채팅방 {flood}건 직후 loan 채팅방 {others}건 / 회신 지연 {latency * 1000:.0f}ms / 동시 처리 {concurrency}")
+    print("폴링 모드")
+    for label, fair, chat_backlog in (
+        ("기존 (도착 순서)", False, 0),
+        ("공정 스케줄링", True, 0),
+        (f"공정 스케줄링 + 최대 대기 {backlog}", True, backlog),
+    ):
+        elapsed, finished, bot, _ = asyncio.run(
+            run_burst(messages, concurrency, "thread", None, latency, fair_scheduling=fair, chat_backlog=chat_backlog)
+        )
+        report(label, elapsed, bot, finished)
+
+    # 두 채팅방에 똑같이 몰린 경우 가중치에 따른 비율
+    even = make_flood(flood, flood)
+    even = [message for pair in zip(even[:flood], even[flood:]) for message in pair]
+    for label, weights in (("라운드 로빈 (가중치 없음)", None), ("가중치 loan 3", {"loan": 3})):
+        install_routes(weights)
+        elapsed, finished, bot, _ = asyncio.run(run_burst(even, concurrency, "thread", None, latency))
+        first = bot._order[:20]
+        print(f"  {label:<30} 전체 {elapsed:5.2f}s  처음 회신 20건: banks {sum(1 for chat_id, _ in first if chat_id == BANKS_CHAT)}건 / "
+              f"loan {sum(1 for chat_id, _ in first if chat_id == LOAN_CHAT)}건")
+    install_routes()
+
+    print(f"웹훅 빠른 응답 모드 큐 (워커 {concurrency}개)")
+    for label, per_chat in (("한 대기열 (도착 순서)", False), ("채팅방별 대기열", True)):
+        done = run_queue(per_chat, messages, concurrency, latency)
+        print(f"  {label:<30} banks 완료 p50 {percentile(done[BANKS_CHAT], 0.5) * 1000:5.0f}ms  "
+              f"loan 완료 p50 {percentile(done[LOAN_CHAT], 0.5) * 1000:5.0f}ms 최대 {max(done[LOAN_CHAT], default=0) * 1000:5.0f}ms")
+
+
+if __name__ == "__main__":
+    main_load_test()
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+폴링 모드(main.py) 부하 테스트
+여러 채팅방에서 양식 메시지가 한꺼번에 들어왔을 때(버스트) 동시 처리 수와 계산 executor에 따른
+처리량을 비교 (main.build_application으로 만든 Application에 업데이트를 넣고 모두 처리될 때까지 측정)
+
+- 기존: 동시 처리 1 + 이벤트 루프에서 직접 계산 (run_polling 기본값과 같은 순차 처리, 공정 스케줄링 없음)
+- 스레드 풀: 동시 처리 수별 (BOT_CONCURRENT_UPDATES)
+- 프로세스 풀: 가장 큰 동시 처리 수 (CPU가 하나면 스레드 풀보다 빠르지 않음)
+- Bot API는 회신마다 지정한 지연(네트워크 왕복)만큼 기다리는 가짜 객체 (텔레그램 서버에 접속하지 않음)
+- 메시지 20%는 수정된 메시지(edited_message), 결과 캐시는 사용하지 않음 (매번 계산)
+- 상품 설정 수를 지정하면 실제 설정(banks + loan)을 복제해 banks 상품군을 그 개수로 늘림 (계산이 무거운 경우)
+- 회신 내용이 순차 계산 결과와 같은지, 이벤트 루프가 가장 오래 멈춘 시간(계산이 루프를 막은 시간)도 확인
+
+사용법: python scripts/load_test_polling.py [메시지 수] [채팅방 수] [회신 지연(ms)] [상품 설정 수] [동시 처리 수,...]
+"""
+
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+# 같은 메시지가 다시 들어와도 매번 계산하도록 결과 캐시 끔 (main import 전에 설정)
+os.environ["RESULT_CACHE_SIZE"] = "0"
+
+from telegram import Update, User
+from telegram.ext import ExtBot
+
+import main
+from bench_pipeline import load_corpus
+from calculator.base_calculator import BaseCalculator
+from calculator.registry import ProductRegistry, get_registry, install_registry
+
+TOKEN = "123456:load-test-token"
+
+
+class LoadTestBot(ExtBot):
+    """회신마다 지정한 지연만큼 기다리고 회신 내용을 기록하는 가짜 Bot (getMe도 접속하지 않음)"""
+
+    async def get_me(self, *args, **kwargs):
+        self._bot_user = User(id=123456, first_name="load-test", is_bot=True, username="load_test_bot")
+        return self._bot_user
+
+    async def send_message(self, chat_id, text, *args, reply_to_message_id=None, **kwargs):
+        await asyncio.sleep(self._latency)
+        self._replies[(chat_id, reply_to_message_id)] = text
+        self._order.append((chat_id, reply_to_message_id))
+        self._finished.append(time.perf_counter())
+        if self._finished_count_callback is not None:
+            self._finished_count_callback(len(self._finished))
+        return None
+
+
+def make_bot(latency):
+    bot = LoadTestBot(TOKEN)
+    bot._latency = latency
+    bot._replies = {}
+    bot._order = []
+    bot._finished = []
+    bot._finished_count_callback = None
+    return bot
+
+
+def install_synthetic_banks(count):
+    """실제 설정(banks + loan)을 복제해 banks 상품군을 count개 상품 설정으로 교체"""
+    base_configs = get_registry("banks").raw_configs() + get_registry("loan").raw_configs()
+    configs = []
+    for index in range(count):
+        source, config = base_configs[index % len(base_configs)]
+        configs.append((f"{source}#{index}", dict(config, bank_name=f"{config['bank_name']} #{index}")))
+    install_registry("banks", ProductRegistry((), BaseCalculator, name="banks", configs=configs))
+
+
+def make_messages(count, chats, seed=22):
+    """(chat_id, message_id, 메시지 내용, 수정 여부) 목록 - 채팅방을 섞어 버스트로 들어오는 순서"""
+    rng = random.Random(seed)
+    forms = [entry["message"] for entry in load_corpus()]
+    return [
+        (-1001000000000 - rng.randrange(chats), index + 1, forms[index % len(forms)], rng.random() < 0.2)
+        for index in range(count)
+    ]
+
+
+def make_update(bot, update_id, chat_id, message_id, text, edited):
+    message = {
+        "message_id": message_id, "date": 0, "chat": {"id": chat_id, "type": "supergroup"},
+        "from": {"id": 1, "is_bot": False, "first_name": "user"}, "text": text,
+    }
+    if edited:
+        message["edit_date"] = 1
+    return Update.de_json({"update_id": update_id, "edited_message" if edited else "message": message}, bot)
+
+
+async def run_burst(messages, concurrent_updates, executor_kind, workers, latency, shard_pool=None, on_reply=None,
+                    fair_scheduling=True, chat_backlog=0):
+    """
+    버스트 한 번 처리 -> (소요 시간, 회신 완료 시각 목록, 가짜 Bot, 루프 최대 멈춤 시간)
+    shard_pool을 지정하면 감독 모드(executor 대신 워커 프로세스), on_reply(회신 수)는 회신마다 호출
+    fair_scheduling/chat_backlog는 main.build_application 참고 (기본: 공정 스케줄링, "요청이 많음" 회신 없음)
+    """
+    bot = make_bot(latency)
+    bot._finished_count_callback = on_reply
+    executor = None if shard_pool is not None else main.create_executor(executor_kind, workers)
+    app = main.build_application(TOKEN, concurrent_updates, executor, bot=bot, shard_pool=shard_pool,
+                                 fair_scheduling=fair_scheduling, chat_backlog=chat_backlog)
+    await app.initialize()
+    await app.start()
+
+    max_lag = 0.0
+    running = True
+
+    async def heartbeat():
+        """10ms마다 깨어나 예정보다 늦은 시간 기록 (루프가 막힌 시간)"""
+        nonlocal max_lag
+        while running:
+            expected = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            max_lag = max(max_lag, time.perf_counter() - expected)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    updates = [make_update(bot, index, *message) for index, message in enumerate(messages)]
+    started = time.perf_counter()
+    for update in updates:
+        app.update_queue.put_nowait(update)
+    await app.update_queue.join()
+    elapsed = time.perf_counter() - started
+
+    running = False
+    await heartbeat_task
+    await app.stop()
+    await app.shutdown()
+    if executor is not None:
+        executor.shutdown()
+    return elapsed, [finished - started for finished in bot._finished], bot, max_lag
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def main_load_test():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    chats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 100.0) / 1000
+    config_count = int(sys.argv[4]) if len(sys.argv) > 4 else 0
+    levels = tuple(int(value) for value in sys.argv[5].split(",")) if len(sys.argv) > 5 else (1, 4, 16, 64)
+    logging.disable(logging.CRITICAL)
+    if config_count:
+        install_synthetic_banks(config_count)
+
+    messages = make_messages(count, chats)
+    expected = {(chat_id, message_id): main.compute_reply(text) for chat_id, message_id, text, _ in messages}
+    started = time.perf_counter()
+    for _, _, text, _ in messages:
+        main.compute_reply(text)
+    compute_ms = (time.perf_counter() - started) / count * 1000
+
+    print(f"메시지 {count}건 / 채팅방 {chats}개 / 회신 지연 {latency * 1000:.0f}ms / "
+          f"상품 설정 {get_registry('banks').config_count}개 (메시지당 계산 {compute_ms:.1f}ms) / CPU {os.cpu_count()}개")
+    scenarios = [("기존 (순차, 루프에서 계산)", 1, "none")]
+    scenarios += [(f"스레드 풀, 동시 {level}", level, "thread") for level in levels]
+    scenarios.append((f"프로세스 풀, 동시 {max(levels)}", max(levels), "process"))
+
+    baseline = None
+    for label, level, executor_kind in scenarios:
+        elapsed, finished, bot, max_lag = asyncio.run(
+            run_burst(messages, level, executor_kind, None, latency, fair_scheduling=executor_kind != "none")
+        )
+        throughput = count / elapsed
+        baseline = baseline or throughput
+        correct = sum(1 for key, text in expected.items() if bot._replies.get(key) == text)
+        print(f"  {label:<24} {elapsed:6.2f}s  {throughput:7.1f}건/s ({throughput / baseline:5.1f}배)  "
+              f"회신 p50 {percentile(finished, 0.5) * 1000:6.0f}ms  p95 {percentile(finished, 0.95) * 1000:6.0f}ms  "
+              f"루프 최대 멈춤 {max_lag * 1000:5.1f}ms  결과 일치 {correct}/{count}")
+
+
+if __name__ == "__main__":
+    main_load_test()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+폴링 감독 모드(BOT_SHARD_WORKERS) 부하 테스트
+load_test_polling.py와 같은 버스트(여러 채팅방, 가짜 Bot)를 스레드 풀 executor와 chat_id 기준 워커 프로세스로 처리해 비교
+
+- 처리량, 회신 p50/p95, 이벤트 루프 최대 멈춤 시간, 워커별 최대 큐 깊이
+- 채팅방별 회신 순서가 메시지 순서와 같은지 (감독 모드는 채팅방별 순서 보장)
+- 정상 재시작: 버스트 도중 모든 워커를 restart_all (새 워커가 준비되면 교체) -> 잃어버린 회신/순서 확인
+- 비정상 종료: 버스트 도중 워커 하나를 SIGKILL -> 실패 회신 수와 다시 시작된 워커가 이후 메시지를 처리하는지 확인
+- 워커는 spawn으로 시작하며 시작 시 레지스트리를 로드 (상품 설정 수를 지정하면 워커에서도 같은 합성 설정 사용)
+
+사용법: python scripts/load_test_shards.py [메시지 수] [채팅방 수] [회신 지연(ms)] [상품 설정 수] [워커 수,...]
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import sys
+import time
+
+# 프로젝트 루트를 경로에 추가
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from load_test_polling import install_synthetic_banks, make_messages, percentile, run_burst
+
+import main
+from calculator.registry import get_registry
+from utils.shard_workers import ShardedWorkerPool
+
+# 스레드 풀 / 감독 모드 모두 같은 동시 처리 수 사용
+CONCURRENT_UPDATES = 32
+
+
+def init_worker(config_count):
+    """워커 초기화: 부모와 같은 합성 설정 설치 후 레지스트리 로드"""
+    logging.disable(logging.CRITICAL)
+    if config_count:
+        install_synthetic_banks(config_count)
+    main.warm_worker()
+
+
+def start_pool(workers, config_count, warm_text):
+    pool = ShardedWorkerPool(workers, main.compute_reply, initializer=init_worker, initargs=(config_count,), name="load-test")
+    pool.start()
+    # 워커가 뜨고 레지스트리를 로드할 때까지 대기 (측정에서 제외)
+    for chat_id in range(workers * 4):
+        pool.submit(chat_id, warm_text).result()
+    return pool
+
+
+def ordered_chats(bot, messages):
+    """채팅방별 회신 순서가 메시지 순서와 같은 채팅방 수 / 전체 채팅방 수"""
+    sent = {}
+    for chat_id, message_id in bot._order:
+        sent.setdefault(chat_id, []).append(message_id)
+    expected = {}
+    for chat_id, message_id, _, _ in messages:
+        expected.setdefault(chat_id, []).append(message_id)
+    return sum(1 for chat_id, message_ids in expected.items() if sent.get(chat_id) == message_ids), len(expected)
+
+
+def report(label, messages, expected, elapsed, finished, bot, max_lag, pool=None):
+    count = len(messages)
+    correct = sum(1 for key, text in expected.items() if bot._replies.get(key) == text)
+    ordered, chats = ordered_chats(bot, messages)
+    line = (f"  {label:<22} {elapsed:6.2f}s  {count / elapsed:7.1f}건/s  회신 p50 {percentile(finished, 0.5) * 1000:5.0f}ms  "
+            f"p95 {percentile(finished, 0.95) * 1000:5.0f}ms  루프 최대 멈춤 {max_lag * 1000:5.1f}ms  "
+            f"결과 일치 {correct}/{count}  순서 유지 채팅방 {ordered}/{chats}")
+    if pool is not None:
+        stats = pool.stats()
+        line += "  워커별 최대 깊이 " + "/".join(str(worker["high_watermark"]) for worker in stats["workers"])
+    print(line)
+    return correct
+
+
+def main_load_test():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    chats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 50.0) / 1000
+    config_count = int(sys.argv[4]) if len(sys.argv) > 4 else 300
+    levels = tuple(int(value) for value in sys.argv[5].split(",")) if len(sys.argv) > 5 else (1, 2, 4)
+    logging.disable(logging.CRITICAL)
+    if config_count:
+        install_synthetic_banks(config_count)
+
+    messages = make_messages(count, chats)
+    expected = {(chat_id, message_id): main.compute_reply(text) for chat_id, message_id, text, _ in messages}
+    print(f"메시지 {count}건 / 채팅방 {chats}개 / 회신 지연 {latency * 1000:.0f}ms / "
+          f"상품 설정 {get_registry('banks').config_count}개 / 동시 처리 {CONCURRENT_UPDATES} / CPU {os.cpu_count()}개")
+
+    elapsed, finished, bot, max_lag = asyncio.run(run_burst(messages, CONCURRENT_UPDATES, "thread", None, latency))
+    report("스레드 풀 (단일 프로세스)", messages, expected, elapsed, finished, bot, max_lag)
+
+    for workers in levels:
+        pool = start_pool(workers, config_count, messages[0][2])
+        elapsed, finished, bot, max_lag = asyncio.run(
+            run_burst(messages, CONCURRENT_UPDATES, None, None, latency, shard_pool=pool)
+        )
+        report(f"감독 모드, 워커 {workers}개", messages, expected, elapsed, finished, bot, max_lag, pool)
+        pool.stop()
+
+    workers = max(levels)
+    print(f"워커 {workers}개 - 버스트 도중 재시작/비정상 종료")
+
+    pool = start_pool(workers, config_count, messages[0][2])
+    restarted = []
+
+    def restart_once(replies):
+        if replies == count // 3 and not restarted:
+            restarted.append(replies)
+            pool.restart_all()
+
+    elapsed, finished, bot, max_lag = asyncio.run(
+        run_burst(messages, CONCURRENT_UPDATES, None, None, latency, shard_pool=pool, on_reply=restart_once)
+    )
+    during = pool.stats()["restarts"]
+    deadline = time.monotonic() + 30
+    while (pool.stats()["starting"] or pool.stats()["draining"]) and time.monotonic() < deadline:
+        time.sleep(0.1)
+    report("정상 재시작 (restart_all)", messages, expected, elapsed, finished, bot, max_lag, pool)
+    print(f"    버스트 중 교체 {during}회 / 전체 교체 {pool.stats()['restarts']}회, 남은 이전 워커 {len(pool.stats()['draining'])}개")
+    pool.stop()
+
+    pool = start_pool(workers, config_count, messages[0][2])
+    killed = []
+
+    def kill_once(replies):
+        if replies == count // 3 and not killed:
+            victim = pool.stats()["workers"][0]
+            killed.append(victim)
+            os.kill(victim["pid"], signal.SIGKILL)
+
+    elapsed, finished, bot, max_lag = asyncio.run(
+        run_burst(messages, CONCURRENT_UPDATES, None, None, latency, shard_pool=pool, on_reply=kill_once)
+    )
+    correct = report("비정상 종료 (SIGKILL)", messages, expected, elapsed, finished, bot, max_lag, pool)
+    errors = sum(1 for text in bot._replies.values() if text.startswith("계산 중 오류가 발생했습니다"))
+    time.sleep(0.1)
+    after = pool.submit(killed[0]["index"], messages[0][2]).result(timeout=30)
+    stats = pool.stats()
+    print(f"    종료된 워커 #{killed[0]['index']} 처리 중 작업 {killed[0]['depth']}개 -> 오류 회신 {errors}건, "
+          f"정상 회신 {correct}/{count}, 다시 시작 {stats['crashes']}회, 이후 계산 {'정상' if after == expected[messages[0][:2]] else '불일치'}")
+    pool.stop()
+
+
+if __name__ == "__main__":
+    main_load_test()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+공유 계산기 동시 호출 스트레스 검증
+레지스트리의 계산기(프로세스 전체 공유)로 여러 스레드가 동시에 calculate를 호출해도
+순차 계산과 같은 결과가 나오는지 확인
+(OK저축은행 가계/사업자 상품을 섞어 호출 -> 상품 정보가 호출 간에 섞이면 금리가 달라짐)
+
+사용법: python scripts/stress_concurrent_calculate.py [레코드 개수] [스레드 수] [반복 횟수]
+"""
+
+import contextlib
+import io
+import logging
+import random
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator.base_calculator import BaseCalculator
+from calculator.registry import get_registry
+
+
+def generate_records(count, seed=7):
+    """
+    대부분 산출 결과가 나오는 담보물건 레코드 생성
+    (OK저축은행 가계자금 대환/후순위, 사업자금, 가계 조정금리 키워드가 섞이도록)
+    """
+    rng = random.Random(seed)
+    ok_calculator = next(
+        calculator for calculator in get_registry("banks", BaseCalculator).calculators
+        if BaseCalculator.is_ok_bank_name(calculator.bank_name)
+    )
+    regions = [region for region, grade in ok_calculator.config["region_grades"].items() if grade in (1, 2, 3, 4)]
+    records = []
+    for _ in range(count):
+        mortgages = [{
+            "priority": 1,
+            "institution": rng.choice(["국민은행", "우리은행", "MG캐피탈", "보성새마을금고"]),
+            "max_amount": None,
+            "amount": float(rng.choice([5000, 9000, 15000])),
+            "is_refinance": rng.random() < 0.7,
+        }]
+        if rng.random() < 0.5:
+            mortgages.append({
+                "priority": 2,
+                "institution": rng.choice(["한국투자저축은행", "도원캐피탈대부"]),
+                "max_amount": 3600,
+                "amount": 3000.0,
+                "is_refinance": False,
+            })
+        region = rng.choice(regions)
+        records.append({
+            "kb_price": float(rng.randint(300, 1500) * 100),
+            "region": region,
+            "address": region + " 15층 1501호",
+            "area": rng.choice([59.9, 84.97, 112.3]),
+            "credit_score": rng.choice([None, rng.randint(600, 950)]),
+            "age": rng.randint(30, 70),
+            "household_count": 500,
+            "property_type": "아파트",
+            "special_notes": rng.choice(["", "6개월 변동금리 희망", "거치식 희망"]),
+            "requests": rng.choice(["가계자금 대환", "1순위 대환", ""]),
+            "required_amount": None,
+            "mortgages": mortgages,
+        })
+    return records
+
+
+def build_jobs(records):
+    """(계산기, 상품, 레코드) 작업 목록 - 레지스트리의 모든 상품"""
+    jobs = []
+    for product_set in ("banks", "loan"):
+        for calculator in get_registry(product_set, BaseCalculator).calculators:
+            for product_type, _ in BaseCalculator.product_types(calculator):
+                for index in range(len(records)):
+                    jobs.append((calculator, product_type, index))
+    return jobs
+
+
+def run_job(records, job):
+    calculator, product_type, index = job
+    try:
+        return calculator.calculate(records[index], product_type=product_type)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    records = generate_records(count)
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        jobs = build_jobs(records)
+        expected = [run_job(records, job) for job in jobs]
+    produced = sum(1 for result in expected if isinstance(result, dict) and result["results"])
+    print(f"작업 {len(jobs)}건 중 산출 결과 {produced}건 (순차 계산 기준)")
+
+    # 스레드 전환을 자주 일으켜 경쟁 상태가 드러나도록 함
+    sys.setswitchinterval(1e-6)
+    mismatches = 0
+    started = time.perf_counter()
+    for round_index in range(rounds):
+        order = list(range(len(jobs)))
+        random.Random(round_index).shuffle(order)
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda i: (i, run_job(records, jobs[i])), order))
+        for i, result in results:
+            if result != expected[i]:
+                mismatches += 1
+                if mismatches <= 3:
+                    calculator, product_type, index = jobs[i]
+                    print(f"❌ 불일치: {calculator.bank_name} / {product_type} / 레코드 {index}")
+    elapsed = time.perf_counter() - started
+
+    total = len(jobs) * rounds
+    print(f"작업 {total}건 (스레드 {workers}개, {rounds}회), {elapsed:.2f}s")
+    if mismatches:
+        print(f"❌ 동시 호출 결과 불일치 {mismatches}건")
+        sys.exit(1)
+    print("동시 호출 결과가 순차 계산과 모두 일치")
+
+
+if __name__ == "__main__":
+    main()
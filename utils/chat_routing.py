@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+채팅방 라우팅
+chat_id -> 채팅방 타입(상품군) 라우팅 테이블을 프로세스 시작 후 한 번만 만들고,
+업데이트마다 dict 조회 한 번으로 허용 여부와 상품군을 결정
+
+설정 (위에서부터 우선):
+1. CHAT_ROUTES (환경변수 JSON 또는 config/telegram_config.py의 dict)
+   {"banks": "-100111,-100222", "loan": [-100333], "vip": {"chat_ids": [-100444], "config_dirs": ["vip"]}}
+   - 값은 채팅방 ID 목록(쉼표 구분 문자열/리스트) 또는 {"chat_ids", "config_dirs"} 객체
+   - config_dirs를 지정하면 그 이름의 상품군을 추가 (data 폴더 기준 설정 폴더)
+2. 상품군(registry.PRODUCT_SETS)마다 ALLOWED_CHAT_IDS_<상품군 대문자> (환경변수, 없으면 config/telegram_config.py)
+   - 기존 ALLOWED_CHAT_IDS_BANKS / ALLOWED_CHAT_IDS_LOAN
+
+채팅방 가중치 (선택, 공정 스케줄러에서 차례마다 연속으로 처리할 메시지 수, 기본 1):
+CHAT_WEIGHTS (환경변수 JSON 또는 config/telegram_config.py의 dict) {"loan": 2, "-100111": 3}
+   - 키는 채팅방 타입 또는 채팅방 ID (채팅방 ID가 우선)
+
+라우팅 테이블이 비어 있으면 모든 채팅방을 허용하고 기본 타입(banks)으로 계산
+"""
+
+import json
+import logging
+import os
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from calculator.registry import PRODUCT_SETS, get_registry, register_product_set
+
+logger = logging.getLogger(__name__)
+
+# 라우팅 테이블에 없는 채팅방(허용 목록이 비어 있을 때)의 채팅방 타입
+DEFAULT_ROOM_TYPE = "banks"
+
+
+def parse_chat_ids(value: Any) -> Tuple[int, ...]:
+    """채팅방 ID 목록 변환 (쉼표 구분 문자열, 정수, 리스트)"""
+    if value is None:
+        return ()
+    if isinstance(value, int):
+        return (value,)
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(int(str(chat_id).strip()) for chat_id in value if str(chat_id).strip())
+
+
+class ChatRouter:
+    """
+    chat_id -> 채팅방 타입 라우팅 테이블 (생성 후 읽기 전용, 스레드 안전)
+
+    Attributes:
+        table: chat_id -> 채팅방 타입 (읽기 전용)
+        room_types: 설정된 채팅방 타입 (설정 순서)
+    """
+
+    def __init__(
+        self,
+        routes: Mapping[str, Iterable[int]],
+        default_room_type: str = DEFAULT_ROOM_TYPE,
+        weights: Optional[Mapping[str, int]] = None
+    ):
+        """
+        Args:
+            routes: 채팅방 타입 -> 채팅방 ID 목록 (채팅방 타입은 PRODUCT_SETS에 있어야 함)
+            default_room_type: 테이블에 없는 채팅방의 채팅방 타입 (허용 목록이 비어 있을 때)
+            weights: 채팅방 타입 또는 채팅방 ID(문자열) -> 공정 스케줄러 가중치 (없으면 1)
+
+        Raises:
+            ValueError: 등록되지 않은 채팅방 타입
+        """
+        table: Dict[int, str] = {}
+        for room_type, chat_ids in routes.items():
+            if room_type not in PRODUCT_SETS:
+                raise ValueError(f"알 수 없는 채팅방 타입입니다: {room_type} (상품군: {', '.join(PRODUCT_SETS)})")
+            for chat_id in chat_ids:
+                existing = table.get(chat_id)
+                if existing is not None and existing != room_type:
+                    # 기존 get_chat_type과 같이 먼저 설정된 타입 사용 (banks -> loan 순)
+                    logger.warning("채팅방 %s가 %s와 %s에 모두 설정되어 있습니다 (%s 사용)", chat_id, existing, room_type, existing)
+                    continue
+                table[chat_id] = room_type
+        self.table = MappingProxyType(table)
+        self.room_types = tuple(routes)
+        self.default_room_type = default_room_type
+        self.weights = MappingProxyType({str(key): max(1, int(value)) for key, value in (weights or {}).items()})
+
+    def is_allowed(self, chat_id: Optional[int]) -> bool:
+        """허용된 채팅방인지 확인 (테이블이 비어 있으면 모든 채팅방 허용)"""
+        if chat_id is None:
+            return False
+        return not self.table or chat_id in self.table
+
+    def room_type(self, chat_id: Optional[int]) -> str:
+        """채팅방 타입 (테이블에 없으면 기본 타입)"""
+        return self.table.get(chat_id, self.default_room_type)
+
+    def weight(self, chat_id: Optional[int]) -> int:
+        """공정 스케줄러 가중치 (채팅방 ID, 채팅방 타입 순으로 찾고 없으면 1)"""
+        if not self.weights:
+            return 1
+        return self.weights.get(str(chat_id)) or self.weights.get(self.room_type(chat_id), 1)
+
+    def registry(self, chat_id: Optional[int], calculator_cls: Optional[type] = None):
+        """채팅방 타입의 상품 레지스트리 (프로세스당 한 번만 로드)"""
+        return get_registry(self.room_type(chat_id), calculator_cls)
+
+    def preload(self) -> None:
+        """설정된 모든 채팅방 타입의 레지스트리를 미리 로드 (상시 실행 서버 시작 시)"""
+        for room_type in self.room_types or (self.default_room_type,):
+            get_registry(room_type)
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계 (채팅방 타입별 채팅방 수)"""
+        counts = {room_type: 0 for room_type in self.room_types}
+        for room_type in self.table.values():
+            counts[room_type] += 1
+        return {
+            "default_room_type": self.default_room_type,
+            "chats": len(self.table),
+            "room_types": counts,
+            "weights": dict(self.weights),
+        }
+
+
+def _config_value(name: str) -> Any:
+    """config/telegram_config.py의 설정값 (파일이나 값이 없으면 None)"""
+    try:
+        import config.telegram_config as telegram_config  # type: ignore
+    except ImportError:
+        return None
+    return getattr(telegram_config, name, None)
+
+
+def load_routes() -> Dict[str, Tuple[int, ...]]:
+    """
+    라우팅 설정 읽기 (CHAT_ROUTES, 없으면 상품군별 ALLOWED_CHAT_IDS_<상품군>)
+    CHAT_ROUTES에서 config_dirs를 지정한 채팅방 타입은 상품군으로 등록
+
+    Returns:
+        채팅방 타입 -> 채팅방 ID 목록 (ID가 없는 타입은 제외)
+    """
+    raw_routes = os.getenv("CHAT_ROUTES")
+    if raw_routes:
+        raw_routes = json.loads(raw_routes)
+    else:
+        raw_routes = _config_value("CHAT_ROUTES")
+
+    routes: Dict[str, Tuple[int, ...]] = {}
+    if raw_routes:
+        for room_type, route in raw_routes.items():
+            if isinstance(route, dict):
+                if route.get("config_dirs"):
+                    register_product_set(room_type, route["config_dirs"])
+                route = route.get("chat_ids")
+            chat_ids = parse_chat_ids(route)
+            if chat_ids:
+                routes[room_type] = chat_ids
+        return routes
+
+    for room_type in PRODUCT_SETS:
+        name = f"ALLOWED_CHAT_IDS_{room_type.upper()}"
+        chat_ids = parse_chat_ids(os.getenv(name) or _config_value(name))
+        if chat_ids:
+            routes[room_type] = chat_ids
+    return routes
+
+
+def load_weights() -> Dict[str, int]:
+    """채팅방 가중치 설정 읽기 (CHAT_WEIGHTS, 없으면 빈 dict)"""
+    raw_weights = os.getenv("CHAT_WEIGHTS")
+    if raw_weights:
+        return json.loads(raw_weights)
+    return dict(_config_value("CHAT_WEIGHTS") or {})
+
+
+_chat_router: Optional[ChatRouter] = None
+_chat_router_lock = threading.Lock()
+
+
+def get_chat_router() -> ChatRouter:
+    """프로세스 공유 라우팅 테이블 (처음 호출 시 설정을 읽어 생성)"""
+    global _chat_router
+    if _chat_router is None:
+        with _chat_router_lock:
+            if _chat_router is None:
+                _chat_router = ChatRouter(load_routes(), weights=load_weights())
+                logger.info("채팅방 라우팅 테이블 생성: %s", _chat_router.stats())
+    return _chat_router
+
+
+def reset_chat_router() -> None:
+    """라우팅 테이블 초기화 (설정 변경 후 다시 읽을 때, 벤치마크용)"""
+    global _chat_router
+    with _chat_router_lock:
+        _chat_router = None
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+키별 디바운스 (asyncio)
+같은 메시지가 짧은 시간에 여러 번 수정되면(오타 수정 등) 마지막 내용으로 한 번만 계산/회신하도록 사용
+
+- 같은 키로 새 작업이 들어오면 이전 작업은 취소 (창 안에서 대기 중이면 실행하지 않고, 실행 중이면 다음 await에서 중단)
+- 작업은 delay초 기다린 뒤 실행 (delay 0이면 바로 실행하되 이후 같은 키의 작업이 들어오면 취소 대상)
+- 하나의 이벤트 루프 안에서만 사용 (스레드 안전하지 않음, 통계 조회는 다른 스레드에서도 가능)
+
+LatestVersions: 큐에 넣기 전에 디바운스하는 경우(웹훅 빠른 응답/내구성 큐 모드)용 키별 최신 버전 기록 (스레드 안전)
+- 받을 때 note(key, 버전)로 기록하고, 처리 직전 is_latest(key, 버전)로 확인해 더 새 버전이 있으면 건너뜀
+- 워커가 디바운스 대기 시간 동안 붙잡혀 있지 않음 (대기는 큐에 넣기 전/꺼낼 수 있게 되기 전에 끝남)
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# LatestVersions 기본 기억 개수
+DEFAULT_MAX_KEYS = 10000
+
+
+class Debouncer:
+    """
+    키별 마지막 작업만 실행하는 디바운서
+
+    Attributes:
+        submitted: 받은 작업 수
+        completed: 끝까지 실행된 작업 수
+        superseded: 같은 키의 새 작업에 밀려 실행하지 않거나 중간에 취소된 작업 수
+        failed: 실행 중 예외가 발생한 작업 수
+    """
+
+    def __init__(self, window: float = 1.5):
+        """
+        Args:
+            window: 기본 대기 시간(초) - 이 시간 안에 같은 키로 들어온 작업은 마지막 것만 실행
+        """
+        self.window = window
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.submitted = 0
+        self.completed = 0
+        self.superseded = 0
+        self.failed = 0
+
+    async def run(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable[Any]],
+        delay: Optional[float] = None
+    ) -> bool:
+        """
+        key의 이전 작업을 취소하고 delay초 뒤 coro_factory()를 실행, 끝날 때까지 대기
+
+        Args:
+            key: 디바운스 키 (예: (chat_id, message_id))
+            coro_factory: 실행할 코루틴을 만드는 함수
+            delay: 대기 시간(초, None이면 window)
+
+        Returns:
+            끝까지 실행되었으면 True, 같은 키의 새 작업에 밀려 취소되었으면 False
+
+        Raises:
+            작업에서 발생한 예외 (failed 증가)
+        """
+        delay = self.window if delay is None else delay
+        previous = self._tasks.get(key)
+        if previous is not None and not previous.done():
+            logger.debug("Debouncer - 이전 작업 취소: %s", key)
+            previous.cancel()
+
+        task = asyncio.ensure_future(self._delayed(delay, coro_factory))
+        self._tasks[key] = task
+        self.submitted += 1
+        try:
+            await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            # 호출한 쪽이 취소된 경우 작업도 취소
+            task.cancel()
+            raise
+        finally:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+
+        if task.cancelled():
+            self.superseded += 1
+            return False
+        if task.exception() is not None:
+            self.failed += 1
+            raise task.exception()
+        self.completed += 1
+        return True
+
+    @staticmethod
+    async def _delayed(delay: float, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        await asyncio.sleep(delay)
+        return await coro_factory()
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계"""
+        return {
+            "window": self.window,
+            "pending": len(self._tasks),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "superseded": self.superseded,
+            "failed": self.failed,
+        }
+
+
+class LatestVersions:
+    """
+    키별로 받은 가장 새 버전 기록 (크기 제한 LRU, 스레드 안전)
+
+    Attributes:
+        noted: 기록한 버전 수
+        superseded: is_latest에서 더 새 버전이 있어 건너뛰게 한 수
+        evictions: 크기 제한으로 밀려난 키 수
+    """
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS):
+        """
+        Args:
+            max_keys: 최대 키 수 (밀려난 키는 모든 버전이 최신으로 처리됨)
+        """
+        self.max_keys = max_keys
+        self._versions: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.noted = 0
+        self.superseded = 0
+        self.evictions = 0
+
+    def note(self, key: Hashable, version: Any) -> None:
+        """key의 버전 기록 (이미 더 새 버전이 기록되어 있으면 그대로 둠)"""
+        with self._lock:
+            self.noted += 1
+            latest = self._versions.get(key)
+            if latest is None or version > latest:
+                self._versions[key] = version
+            self._versions.move_to_end(key)
+            while len(self._versions) > self.max_keys:
+                self._versions.popitem(last=False)
+                self.evictions += 1
+
+    def is_latest(self, key: Hashable, version: Any) -> bool:
+        """version이 key의 가장 새 버전인지 확인 (기록이 없으면 True, 아니면 superseded 증가)"""
+        with self._lock:
+            latest = self._versions.get(key)
+            if latest is None or version >= latest:
+                return True
+            self.superseded += 1
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계"""
+        with self._lock:
+            return {
+                "keys": len(self._versions),
+                "noted": self.noted,
+                "superseded": self.superseded,
+                "evictions": self.evictions,
+            }
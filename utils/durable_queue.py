@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite(WAL) 기반 내구성 작업 큐 + 워커 스레드
+웹훅이 업데이트를 디스크에 기록(커밋)한 뒤 200을 응답하고, 워커가 꺼내 처리/확인(ack)하도록 사용
+(프로세스가 처리 도중 종료되어도 업데이트가 남아 재시작 후 다시 처리, 메모리보다 큰 버스트도 적재 가능)
+
+- 적재(enqueue): 기록 스레드 하나가 모아서 한 트랜잭션으로 커밋 (그룹 커밋), 호출자는 자기 항목이 커밋될 때까지 대기
+- 꺼내기(claim): 처리 가능한 항목을 가시성 제한 시간(visibility_timeout) 동안 다른 워커에게 보이지 않게 표시
+  -> 시간 안에 ack하지 않으면(워커/프로세스 종료 등) 다시 꺼낼 수 있음
+- 실패(fail): 지수 백오프로 다시 시도, max_attempts번 꺼냈는데 처리되지 않으면 dead로 표시(삭제하지 않고 보관)
+- 처리는 최소 한 번(at-least-once): 처리 후 ack 전에 종료되면 같은 항목이 다시 처리될 수 있음
+- synchronous=NORMAL(기본): 프로세스 종료에는 안전, 전원 차단 시 마지막 커밋 일부가 사라질 수 있음 (FULL이면 커밋마다 fsync)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 가시성 제한 시간(초) / 최대 시도 횟수 / 첫 재시도 대기(초, 시도마다 2배)
+DEFAULT_VISIBILITY_TIMEOUT = 60.0
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DELAY = 1.0
+
+# flush_interval 동안 모으다가 이만큼 모이면 바로 커밋
+DEFAULT_BATCH_SIZE = 500
+
+# 워커가 처리할 항목이 없을 때 다시 확인하는 간격(초) - 같은 프로세스에서 적재되면 바로 깨어남
+POLL_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    dead INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS queue_ready ON queue (dead, available_at, id);
+"""
+
+
+class _Batch:
+    """기록 스레드가 한 번에 커밋할 항목 묶음 (커밋되면 done 설정)"""
+
+    def __init__(self):
+        self.items: List[Tuple[str, float]] = []
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class DurableQueue:
+    """
+    SQLite(WAL) 기반 내구성 작업 큐 (스레드 안전, 프로세스 여러 개가 같은 파일을 써도 됨)
+
+    Attributes:
+        enqueued: 커밋된 적재 항목 수
+        commits: 적재 커밋(트랜잭션) 수
+        claimed: 꺼낸 항목 수 (가시성 제한 시간이 지나 다시 꺼낸 경우 포함)
+        redelivered: 이전에 꺼냈지만 ack/fail되지 않아 다시 꺼낸 수
+        acked: 처리 완료(ack) 수
+        retried: 실패 후 재시도 예약 수
+        dead: 최대 시도 횟수를 넘어 dead로 표시한 수
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = 0.0,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        synchronous: str = "NORMAL",
+        name: str = "durable-queue",
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+            batch_size: flush_interval 동안 모으다가 이만큼 모이면 바로 커밋
+            flush_interval: 커밋 전에 항목을 더 모으는 시간(초, 0이면 모으지 않음 - 커밋 중에 들어온 항목은 다음 커밋에 함께 기록)
+            visibility_timeout: 꺼낸 항목이 다른 워커에게 보이지 않는 시간(초, 처리 시간보다 길어야 함)
+            max_attempts: 최대 시도(꺼내기) 횟수
+            retry_delay: 첫 재시도 대기(초, 시도마다 2배)
+            synchronous: SQLite synchronous 설정 (NORMAL / FULL)
+            name: 큐 이름 (스레드 이름/로그용)
+            clock: 시간 함수 (프로세스 재시작 후에도 이어지는 벽시계 시간, 테스트용)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다")
+        if max_attempts < 1:
+            raise ValueError("max_attempts는 1 이상이어야 합니다")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.synchronous = synchronous
+        self.name = name
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pending = _Batch()
+        self._pending_ready = threading.Condition(self._lock)
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+        self.enqueued = 0
+        self.commits = 0
+        self.claimed = 0
+        self.redelivered = 0
+        self.acked = 0
+        self.retried = 0
+        self.dead = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결 (트랜잭션은 직접 BEGIN/COMMIT)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._local.connection = connection
+        return connection
+
+    def enqueue(self, payload: str, timeout: Optional[float] = 30.0, delay: float = 0.0) -> None:
+        """
+        항목 적재 (커밋될 때까지 대기 - 반환되면 프로세스가 종료되어도 남아 있음)
+
+        Args:
+            delay: 이 시간(초)이 지난 뒤에 꺼낼 수 있음 (디바운스 등, 워커는 POLL_INTERVAL 간격으로 확인)
+
+        Raises:
+            TimeoutError: 시간 안에 커밋되지 않음
+            sqlite3.Error: 커밋 실패
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} 큐가 닫혔습니다")
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name=f"{self.name}-writer", daemon=True)
+                self._writer.start()
+            batch = self._pending
+            now = self._clock()
+            batch.items.append((payload, now, now + delay))
+            if len(batch.items) == 1 or len(batch.items) >= self.batch_size:
+                self._pending_ready.notify()
+        if not batch.done.wait(timeout):
+            raise TimeoutError(f"{self.name} 커밋 대기 시간 초과")
+        if batch.error is not None:
+            raise batch.error
+
+    def enqueue_many(self, payloads: Sequence[str]) -> None:
+        """항목 여러 개를 한 트랜잭션으로 바로 적재 (기록 스레드를 거치지 않음)"""
+        now = self._clock()
+        self._insert([(payload, now, now) for payload in payloads])
+
+    def _insert(self, items: Sequence[Tuple[str, float, float]]) -> None:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("INSERT INTO queue (payload, enqueued_at, available_at) VALUES (?, ?, ?)", items)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.enqueued += len(items)
+            self.commits += 1
+        self._wakeup.set()
+
+    def _write_loop(self) -> None:
+        """기록 스레드: 모인 항목을 한 트랜잭션으로 커밋"""
+        while True:
+            with self._lock:
+                while not self._pending.items and not self._closed:
+                    self._pending_ready.wait()
+                if not self._pending.items:
+                    return
+                if self.flush_interval > 0 and len(self._pending.items) < self.batch_size:
+                    # 더 모으기 (batch_size개가 모이면 notify로 바로 깨어남)
+                    self._pending_ready.wait(self.flush_interval)
+                batch, self._pending = self._pending, _Batch()
+            try:
+                self._insert(batch.items)
+            except BaseException as e:
+                logger.error("%s 커밋 실패 (%d개): %s", self.name, len(batch.items), e, exc_info=True)
+                batch.error = e
+            batch.done.set()
+
+    def claim(self, limit: int = 1) -> List[Tuple[int, str, int]]:
+        """
+        처리 가능한 항목 꺼내기 (id 순, 가시성 제한 시간 동안 다른 워커에게 보이지 않음)
+        이미 max_attempts번 꺼냈는데 ack되지 않은 항목은 꺼내지 않고 dead로 표시
+
+        Returns:
+            (id, payload, 시도 횟수 - 이번 포함) 목록
+        """
+        now = self._clock()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                "SELECT id, payload, attempts FROM queue WHERE dead = 0 AND available_at <= ? ORDER BY id LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            claimed = [(item_id, payload, attempts + 1) for item_id, payload, attempts in rows if attempts < self.max_attempts]
+            exhausted = [item_id for item_id, _, attempts in rows if attempts >= self.max_attempts]
+            if claimed:
+                connection.executemany(
+                    "UPDATE queue SET available_at = ?, attempts = attempts + 1 WHERE id = ?",
+                    [(now + self.visibility_timeout, item_id) for item_id, _, _ in claimed]
+                )
+            if exhausted:
+                connection.executemany(
+                    "UPDATE queue SET dead = 1, last_error = COALESCE(last_error, '가시성 제한 시간 안에 처리되지 않음') WHERE id = ?",
+                    [(item_id,) for item_id in exhausted]
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.claimed += len(claimed)
+            self.redelivered += sum(1 for _, _, attempts in claimed if attempts > 1)
+            self.dead += len(exhausted)
+        for item_id in exhausted:
+            logger.error("%s 항목 %s: %d번 꺼냈지만 처리되지 않아 dead로 표시합니다", self.name, item_id, self.max_attempts)
+        return claimed
+
+    def ack(self, item_ids: Sequence[int]) -> None:
+        """처리 완료 항목 삭제"""
+        if not item_ids:
+            return
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("DELETE FROM queue WHERE id = ?", [(item_id,) for item_id in item_ids])
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.acked += len(item_ids)
+
+    def fail(self, item_id: int, attempts: int, error: str) -> bool:
+        """
+        처리 실패 기록 (남은 시도가 있으면 retry_delay * 2^(시도 - 1)초 뒤 재시도, 없으면 dead)
+
+        Returns:
+            재시도 예약 여부
+        """
+        retry = attempts < self.max_attempts
+        connection = self._connection()
+        if retry:
+            connection.execute(
+                "UPDATE queue SET available_at = ?, last_error = ? WHERE id = ?",
+                (self._clock() + self.retry_delay * 2 ** (attempts - 1), error, item_id)
+            )
+        else:
+            connection.execute("UPDATE queue SET dead = 1, last_error = ? WHERE id = ?", (error, item_id))
+        with self._lock:
+            if retry:
+                self.retried += 1
+            else:
+                self.dead += 1
+        if not retry:
+            logger.error("%s 항목 %s: %d번 실패해 dead로 표시합니다 (%s)", self.name, item_id, attempts, error)
+        return retry
+
+    def start(self, process: Callable[[str], Any], workers: int = 1) -> None:
+        """
+        워커 스레드 시작 (이미 시작되었으면 무시)
+        워커는 항목을 하나씩 꺼내 process(payload)를 호출하고, 예외 없이 끝나면 ack / 예외면 fail
+        """
+        with self._lock:
+            if self._workers:
+                return
+            for index in range(workers):
+                thread = threading.Thread(target=self._work_loop, args=(process,), name=f"{self.name}-{index}", daemon=True)
+                thread.start()
+                self._workers.append(thread)
+        logger.info("%s 워커 %d개 시작 (%s)", self.name, workers, self.path)
+
+    def _work_loop(self, process: Callable[[str], Any]) -> None:
+        """워커 스레드 본체"""
+        while not self._closed:
+            try:
+                claimed = self.claim(1)
+            except sqlite3.Error as e:
+                logger.error("%s 꺼내기 실패: %s", self.name, e, exc_info=True)
+                time.sleep(POLL_INTERVAL)
+                continue
+            if not claimed:
+                self._wakeup.wait(POLL_INTERVAL)
+                self._wakeup.clear()
+                continue
+            item_id, payload, attempts = claimed[0]
+            try:
+                process(payload)
+            except Exception as e:
+                logger.error("%s 항목 %s 처리 실패 (%d번째 시도): %s", self.name, item_id, attempts, e, exc_info=True)
+                self.fail(item_id, attempts, str(e) or type(e).__name__)
+                continue
+            self.ack([item_id])
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """남은 적재 항목을 커밋하고 기록/워커 스레드 종료 (처리 중인 항목은 다음 실행에서 다시 꺼냄)"""
+        with self._lock:
+            self._closed = True
+            self._pending_ready.notify_all()
+            writer, workers = self._writer, self._workers
+            self._workers = []
+        self._wakeup.set()
+        if writer is not None:
+            writer.join(timeout)
+        for thread in workers:
+            thread.join(timeout)
+
+    def counts(self) -> Dict[str, Any]:
+        """파일 기준 항목 수 (ready: 바로 꺼낼 수 있음 / delayed: 처리 중이거나 재시도 대기 / dead)"""
+        now = self._clock()
+        ready, delayed, dead, oldest = self._connection().execute(
+            "SELECT"
+            " COALESCE(SUM(dead = 0 AND available_at <= ?), 0),"
+            " COALESCE(SUM(dead = 0 AND available_at > ?), 0),"
+            " COALESCE(SUM(dead = 1), 0),"
+            " MIN(CASE WHEN dead = 0 THEN enqueued_at END)"
+            " FROM queue",
+            (now, now)
+        ).fetchone()
+        return {
+            "ready": ready,
+            "delayed": delayed,
+            "dead": dead,
+            "oldest_age": round(now - oldest, 3) if oldest is not None else None,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계 (파일 기준 항목 수 + 이 프로세스의 처리 수)"""
+        counts = self.counts()
+        with self._lock:
+            return dict(
+                counts,
+                path=self.path,
+                workers=len(self._workers),
+                pending_commit=len(self._pending.items),
+                enqueued=self.enqueued,
+                commits=self.commits,
+                claimed=self.claimed,
+                redelivered=self.redelivered,
+                acked=self.acked,
+                retried=self.retried,
+                dead_marked=self.dead,
+            )
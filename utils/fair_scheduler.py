@@ -0,0 +1,454 @@
+# -*- coding: utf-8 -*-
+"""
+채팅방별 공정 스케줄러
+채팅방(키)마다 대기열을 두고 가중 라운드 로빈으로 꺼내, 한 채팅방에 메시지가 몰려도
+다른 채팅방의 메시지가 그 뒤에 줄 서지 않도록 함
+
+- 가중치: 차례가 오면 가중치만큼 연속으로 꺼내고 다음 채팅방으로 (모두 1이면 라운드 로빈)
+- 전체 동시 처리 수 제한 (워커 스레드 수 / FairGate limit), 채팅방별 동시 처리 수 제한(per_key_limit, 1이면 채팅방별 순서 보장)
+- 채팅방 대기열이 max_backlog개면 더 받지 않고 CHAT_BUSY 반환 (호출자가 "요청이 많음" 회신)
+- 모니터링: 전체 대기 시간(평균/백분위수/최대), 채팅방별 대기열 깊이/최대 깊이, 처리 중/처리/거절 수, 대기 시간
+
+FairWorkQueue는 워커 스레드용(웹훅 빠른 응답 모드), FairGate는 asyncio용(폴링 모드 핸들러)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 적재하지 않은 사유
+CHAT_BUSY = "chat busy"
+QUEUE_FULL = "queue full"
+
+# 채팅방 대기열이 가득 찼을 때 보내는 회신
+BUSY_MESSAGE = "⏳ 요청이 많아 이 메시지는 계산하지 않았습니다.\n잠시 후 다시 보내주세요."
+
+# 대기 시간 백분위수 계산에 쓰는 최근 표본 수
+WAIT_SAMPLE_SIZE = 1024
+
+# 통계를 유지할 최대 채팅방 수 (넘으면 대기열이 빈 채팅방의 통계부터 정리)
+MAX_TRACKED_KEYS = 1024
+
+
+class _KeyState:
+    """채팅방 하나의 대기열과 통계"""
+
+    __slots__ = ("items", "weight", "credit", "active", "running", "high_watermark",
+                 "submitted", "processed", "shed", "wait_total", "wait_max")
+
+    def __init__(self, weight: int):
+        self.items: deque = deque()
+        self.weight = weight
+        self.credit = 0
+        self.active = False
+        self.running = 0
+        self.high_watermark = 0
+        self.submitted = 0
+        self.processed = 0
+        self.shed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+
+class FairQueue:
+    """
+    키별 FIFO 대기열 + 가중 라운드 로빈 선택 (잠금 없음 - FairWorkQueue/FairGate가 잠금/이벤트 루프 안에서 사용)
+
+    Attributes:
+        depth: 전체 대기 항목 수
+        running: 꺼낸 뒤 done()하지 않은 항목 수
+        started: 꺼낸 항목 수
+        full: 전체 대기열이 가득 차 거절한 수
+    """
+
+    def __init__(
+        self,
+        max_backlog: int = 0,
+        max_depth: int = 0,
+        weight: Optional[Callable[[Any], int]] = None,
+        per_key_limit: int = 0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_backlog: 키별 최대 대기 항목 수 (0이면 제한 없음)
+            max_depth: 전체 최대 대기 항목 수 (0이면 제한 없음)
+            weight: 키 -> 가중치 (None이면 모두 1)
+            per_key_limit: 키별 최대 동시 처리 수 (0이면 제한 없음)
+            clock: 시간 함수 (테스트/벤치마크용)
+        """
+        self.max_backlog = max_backlog
+        self.max_depth = max_depth
+        self.per_key_limit = per_key_limit
+        self._weight = weight
+        self._clock = clock
+        self._keys: Dict[Any, _KeyState] = {}
+        self._ring: deque = deque()
+        self._waits: deque = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self.depth = 0
+        self.running = 0
+        self.started = 0
+        self.full = 0
+
+    def push(self, key: Any, item: Any) -> Optional[str]:
+        """
+        항목 적재
+
+        Returns:
+            적재하지 않은 사유 (CHAT_BUSY / QUEUE_FULL, 적재했으면 None)
+        """
+        state = self._keys.get(key)
+        if state is None:
+            # 새 키를 넣기 전에 정리 (넣은 뒤 정리하면 방금 만든 키의 상태가 지워질 수 있음)
+            self._prune()
+            state = self._keys[key] = _KeyState(max(1, int(self._weight(key))) if self._weight else 1)
+        if self.max_backlog and len(state.items) >= self.max_backlog:
+            state.shed += 1
+            return CHAT_BUSY
+        if self.max_depth and self.depth >= self.max_depth:
+            self.full += 1
+            return QUEUE_FULL
+        state.items.append((self._clock(), item))
+        state.submitted += 1
+        state.high_watermark = max(state.high_watermark, len(state.items))
+        self.depth += 1
+        if not state.active:
+            state.active = True
+            state.credit = state.weight
+            self._ring.append(key)
+        return None
+
+    def pop(self) -> Optional[Tuple[Any, Any, float]]:
+        """
+        다음 항목 꺼내기 (차례인 키부터, 동시 처리 제한에 걸린 키는 건너뜀)
+
+        Returns:
+            (키, 항목, 대기 시간(초)) / 꺼낼 항목이 없으면 None
+        """
+        for _ in range(len(self._ring)):
+            key = self._ring[0]
+            state = self._keys[key]
+            if self.per_key_limit and state.running >= self.per_key_limit:
+                self._ring.rotate(-1)
+                continue
+            enqueued_at, item = state.items.popleft()
+            wait = self._clock() - enqueued_at
+            state.wait_total += wait
+            state.wait_max = max(state.wait_max, wait)
+            self._waits.append(wait)
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self.started += 1
+            state.running += 1
+            state.credit -= 1
+            self.depth -= 1
+            self.running += 1
+            if not state.items:
+                self._ring.popleft()
+                state.active = False
+            elif state.credit <= 0:
+                # 가중치만큼 꺼냈으면 다음 키 차례
+                state.credit = state.weight
+                self._ring.rotate(-1)
+            return key, item, wait
+        return None
+
+    def done(self, key: Any) -> None:
+        """꺼낸 항목 처리 완료 (동시 처리 수 반환)"""
+        state = self._keys[key]
+        state.running -= 1
+        state.processed += 1
+        self.running -= 1
+
+    def discard(self, key: Any, item: Any) -> bool:
+        """
+        꺼내기 전의 항목 제거 (대기 중에 취소된 항목 - 채팅방 대기 수/전체 깊이에서 빠짐)
+
+        Returns:
+            제거 여부 (이미 꺼냈으면 False)
+        """
+        state = self._keys.get(key)
+        if state is None:
+            return False
+        for index, (_, queued) in enumerate(state.items):
+            if queued is item:
+                del state.items[index]
+                break
+        else:
+            return False
+        self.depth -= 1
+        if not state.items:
+            self._ring.remove(key)
+            state.active = False
+        return True
+
+    def _prune(self) -> None:
+        """추적하는 키가 너무 많으면 대기/처리 중인 항목이 없는 키의 통계 정리"""
+        if len(self._keys) < MAX_TRACKED_KEYS:
+            return
+        for key in [key for key, state in self._keys.items() if not state.active and not state.running]:
+            del self._keys[key]
+            if len(self._keys) <= MAX_TRACKED_KEYS // 2:
+                break
+
+    def wait_stats(self) -> Dict[str, float]:
+        """전체 대기 시간 통계 (ms, 백분위수는 최근 표본 기준)"""
+        waits = sorted(self._waits)
+        return {
+            "mean": round(self._wait_total / self.started * 1000, 3) if self.started else 0.0,
+            "p50": round(waits[len(waits) // 2] * 1000, 3) if waits else 0.0,
+            "p95": round(waits[min(len(waits) - 1, len(waits) * 95 // 100)] * 1000, 3) if waits else 0.0,
+            "max": round(self._wait_max * 1000, 3),
+        }
+
+    def key_stats(self) -> Dict[str, Dict[str, Any]]:
+        """키별 통계 (대기 시간은 ms)"""
+        return {
+            str(key): {
+                "weight": state.weight,
+                "depth": len(state.items),
+                "running": state.running,
+                "high_watermark": state.high_watermark,
+                "submitted": state.submitted,
+                "processed": state.processed,
+                "shed": state.shed,
+                "wait_ms": {
+                    "mean": round(state.wait_total / (state.processed + state.running) * 1000, 3)
+                    if state.processed + state.running else 0.0,
+                    "max": round(state.wait_max * 1000, 3),
+                },
+            }
+            for key, state in self._keys.items()
+        }
+
+
+class FairWorkQueue:
+    """
+    채팅방별 대기열 + 고정 개수 워커 스레드 (스레드 안전)
+    워커 수가 전체 동시 처리 수 제한
+
+    Attributes:
+        processed: 처리 완료된 작업 수 (예외로 끝난 작업 포함)
+        failed: 처리 중 예외가 발생한 작업 수
+    """
+
+    def __init__(
+        self,
+        process: Callable[[Any], Any],
+        workers: int = 1,
+        max_depth: int = 100,
+        max_backlog: int = 0,
+        weight: Optional[Callable[[Any], int]] = None,
+        per_key_limit: int = 0,
+        name: str = "fair-queue",
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            process: 작업 하나를 처리하는 함수 (워커 스레드에서 호출)
+            workers: 워커 스레드 수 (전체 동시 처리 수)
+            max_depth: 전체 최대 대기 작업 수 (처리 중인 작업 제외)
+            max_backlog: 채팅방별 최대 대기 작업 수 (0이면 제한 없음)
+            weight: 채팅방 -> 가중치 (None이면 라운드 로빈)
+            per_key_limit: 채팅방별 최대 동시 처리 수 (0이면 제한 없음)
+            name: 큐 이름 (스레드 이름/로그용)
+            clock: 시간 함수 (테스트/벤치마크용)
+        """
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다")
+        if max_depth < 1:
+            raise ValueError("max_depth는 1 이상이어야 합니다")
+        self.process = process
+        self.workers = workers
+        self.name = name
+        self._queue = FairQueue(max_backlog, max_depth, weight, per_key_limit, clock)
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+        self.high_watermark = 0
+        self.processed = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """워커 스레드 시작 (이미 시작되었으면 무시)"""
+        with self._condition:
+            if self._threads:
+                return
+            self._stopping = False
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"{self.name}-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        logger.info("%s 워커 %d개 시작 (전체 최대 깊이 %d, 채팅방별 최대 깊이 %s)",
+                    self.name, self.workers, self._queue.max_depth, self._queue.max_backlog or "제한 없음")
+
+    def submit(self, key: Any, item: Any) -> Optional[str]:
+        """
+        작업 적재 (블로킹하지 않음)
+
+        Returns:
+            적재하지 않은 사유 (채팅방 대기열이 가득 참: CHAT_BUSY / 전체 대기열이 가득 참: QUEUE_FULL, 적재했으면 None)
+        """
+        if not self._threads:
+            self.start()
+        with self._condition:
+            skipped = self._queue.push(key, item)
+            if skipped is None:
+                self.high_watermark = max(self.high_watermark, self._queue.depth)
+                self._condition.notify()
+        if skipped is not None:
+            logger.warning("%s 채팅방 %s 작업을 받지 않습니다 (%s)", self.name, key, skipped)
+        return skipped
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        적재된 작업이 모두 처리될 때까지 대기
+
+        Returns:
+            시간 안에 모두 처리되었는지 여부
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue.depth and not self._queue.running, timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """남은 작업을 처리한 뒤 워커 스레드 종료"""
+        with self._condition:
+            threads, self._threads = self._threads, []
+            self._stopping = True
+            self._condition.notify_all()
+        for thread in threads:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        """워커 스레드 본체"""
+        while True:
+            with self._condition:
+                entry = self._queue.pop()
+                while entry is None:
+                    if self._stopping:
+                        return
+                    self._condition.wait()
+                    entry = self._queue.pop()
+            key, item, _ = entry
+            try:
+                self.process(item)
+            except Exception as e:
+                with self._condition:
+                    self.failed += 1
+                logger.error("%s 작업 처리 중 오류: %s", self.name, e, exc_info=True)
+            finally:
+                with self._condition:
+                    self._queue.done(key)
+                    self.processed += 1
+                    # 채팅방별 동시 처리 제한으로 기다리던 작업이 있을 수 있음
+                    self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계 (대기 시간은 ms, 채팅방별 통계 포함)"""
+        with self._condition:
+            chats = self._queue.key_stats()
+            return {
+                "workers": self.workers,
+                "running": bool(self._threads),
+                "busy": self._queue.running,
+                "depth": self._queue.depth,
+                "max_depth": self._queue.max_depth,
+                "max_backlog": self._queue.max_backlog,
+                "high_watermark": self.high_watermark,
+                "submitted": sum(chat["submitted"] for chat in chats.values()),
+                "processed": self.processed,
+                "failed": self.failed,
+                "dropped": self._queue.full,
+                "shed": sum(chat["shed"] for chat in chats.values()),
+                "wait_ms": self._queue.wait_stats(),
+                "chats": chats,
+            }
+
+
+class FairGate:
+    """
+    asyncio 공정 게이트: 처리 전에 acquire(채팅방)로 차례를 받고 끝나면 release(채팅방)
+    전체 limit개까지 동시에 처리하고, 기다리는 채팅방들에 가중 라운드 로빈으로 차례를 줌 (한 이벤트 루프에서만 사용)
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        max_backlog: int = 0,
+        weight: Optional[Callable[[Any], int]] = None,
+        per_key_limit: int = 0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            limit: 전체 동시 처리 수
+            max_backlog: 채팅방별 최대 대기 수 (0이면 제한 없음)
+            weight: 채팅방 -> 가중치 (None이면 라운드 로빈)
+            per_key_limit: 채팅방별 최대 동시 처리 수 (0이면 제한 없음, 1이면 채팅방별 도착 순서대로 처리)
+            clock: 시간 함수 (테스트/벤치마크용)
+        """
+        if limit < 1:
+            raise ValueError("limit는 1 이상이어야 합니다")
+        self.limit = limit
+        self._queue = FairQueue(max_backlog, 0, weight, per_key_limit, clock)
+
+    async def acquire(self, key: Any) -> Optional[str]:
+        """
+        차례가 올 때까지 대기 (차례를 받았으면 처리 후 반드시 release)
+
+        Returns:
+            차례를 받지 못한 사유 (채팅방 대기열이 가득 참: CHAT_BUSY, 차례를 받았으면 None)
+        """
+        turn = asyncio.get_running_loop().create_future()
+        skipped = self._queue.push(key, turn)
+        if skipped is not None:
+            return skipped
+        self._dispatch()
+        try:
+            await turn
+        except asyncio.CancelledError:
+            if turn.done() and not turn.cancelled():
+                # 차례를 받은 직후 취소되었으면 반환
+                self.release(key)
+            else:
+                # 대기 중에 취소되었으면 대기열에서 제거 (채팅방 최대 대기 수/깊이에 남지 않도록)
+                self._queue.discard(key, turn)
+            raise
+        return None
+
+    def release(self, key: Any) -> None:
+        """처리 완료 (다음 차례 전달)"""
+        self._queue.done(key)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """빈 자리만큼 다음 차례 전달"""
+        while self._queue.running < self.limit:
+            entry = self._queue.pop()
+            if entry is None:
+                return
+            key, turn, _ = entry
+            if turn.cancelled():
+                self._queue.done(key)
+                continue
+            turn.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계 (채팅방별 통계 포함)"""
+        chats = self._queue.key_stats()
+        return {
+            "limit": self.limit,
+            "running": self._queue.running,
+            "depth": self._queue.depth,
+            "max_backlog": self._queue.max_backlog,
+            "shed": sum(chat["shed"] for chat in chats.values()),
+            "wait_ms": self._queue.wait_stats(),
+            "chats": chats,
+        }
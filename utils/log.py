@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+로깅 설정
+- 각 모듈은 logging.getLogger(__name__)로 로거를 만들고 logger.debug("... %s", value)처럼 기록
+  (메시지 포맷팅은 해당 레벨이 활성일 때만 수행됨 -> 비활성 레벨 로그는 인자 전달 비용만 발생)
+- 진입점(main.py, api/webhook.py)에서만 configure_logging()을 한 번 호출
+- 로그 레벨은 LOG_LEVEL 환경변수로 지정 (기본 INFO, 운영 조용한 모드는 WARNING, 상세 디버깅은 DEBUG)
+"""
+
+import logging
+import os
+import sys
+from typing import Optional, Union
+
+LOG_FORMAT = '[%(asctime)s] %(levelname)s - %(name)s - %(message)s'
+DEFAULT_LOG_LEVEL = "INFO"
+
+
+def resolve_log_level(level: Optional[Union[int, str]] = None) -> int:
+    """
+    로그 레벨 결정 (인자 -> LOG_LEVEL 환경변수 -> 기본값 순)
+    알 수 없는 레벨 이름이면 기본값 사용
+    """
+    if level is None:
+        level = os.getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL)
+    if isinstance(level, int):
+        return level
+    resolved = logging.getLevelName(str(level).strip().upper())
+    if isinstance(resolved, int):
+        return resolved
+    return logging.getLevelName(DEFAULT_LOG_LEVEL)
+
+
+def configure_logging(level: Optional[Union[int, str]] = None, fmt: str = LOG_FORMAT) -> int:
+    """
+    루트 로거에 stderr 핸들러 하나만 설치 (stdout으로 중복 출력하지 않음)
+    여러 번 호출해도 핸들러는 하나만 유지되고 레벨만 갱신됨
+
+    Args:
+        level: 로그 레벨 (None이면 LOG_LEVEL 환경변수)
+        fmt: 로그 포맷
+
+    Returns:
+        적용된 로그 레벨
+    """
+    resolved = resolve_log_level(level)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter(fmt))
+    logging.basicConfig(level=resolved, handlers=[handler], force=True)
+    return resolved
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+상주 이벤트 루프 스레드
+asyncio 이벤트 루프 하나를 전용 스레드에서 계속 실행하고, 다른 스레드(HTTP 요청 스레드, 큐 워커)는
+asyncio.run_coroutine_threadsafe로 코루틴을 넘겨 결과를 기다림
+
+- 요청마다 스레드를 만들거나 루프를 바꿔 가며 run_until_complete를 호출하지 않음
+- 루프는 항상 같은 스레드에서만 실행되므로 루프에 묶인 객체(텔레그램 Application 등)를 안전하게 공유
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoopThread:
+    """전용 스레드에서 계속 실행되는 asyncio 이벤트 루프"""
+
+    def __init__(self, name: str = "event-loop"):
+        """
+        Args:
+            name: 스레드 이름 (로그용)
+        """
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """루프 스레드 시작 (이미 실행 중이면 그대로 반환)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self.loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self.loop = loop
+            self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+        logger.info("%s 루프 스레드 시작", self.name)
+        return loop
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        루프에 코루틴 제출 (블로킹하지 않음)
+
+        Returns:
+            concurrent.futures.Future (result()로 완료 대기)
+        """
+        if not self.running:
+            self.start()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(f"{self.name} 루프 스레드 안에서는 완료를 기다릴 수 없습니다 (await 사용)")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        루프에서 코루틴을 실행하고 결과 반환 (완료까지 블로킹)
+
+        Raises:
+            concurrent.futures.TimeoutError: timeout초 안에 끝나지 않은 경우 (코루틴은 계속 실행됨)
+        """
+        return self.submit(coro).result(timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """루프 중지 및 스레드 종료 대기"""
+        with self._lock:
+            thread, loop = self._thread, self.loop
+            self._thread = None
+        if thread is None or loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+원본 메시지별 봇 회신 추적
+원본 메시지가 수정되면 새 회신을 보내지 않고 이전 회신을 그 자리에서 수정(edit_message_text)하고,
+새로 계산한 회신이 마지막으로 보낸 내용과 같으면 Bot API를 호출하지 않음
+
+- 키: (chat_id, 원본 message_id) -> (회신 message_id, 마지막으로 보낸 내용)
+- 크기 제한(LRU) + 유효 시간(TTL, 텔레그램은 48시간이 지난 메시지는 수정할 수 없음), 스레드 안전
+- 이전 회신을 수정할 수 없으면(삭제됨 등) 새 회신을 보내고 기록 갱신
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 기억 개수 / 유효 시간(초)
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL = 48 * 3600.0
+
+# ReplyTracker.reply() 결과
+SENT = "sent"
+EDITED = "edited"
+UNCHANGED = "unchanged"
+
+
+class ReplyTracker:
+    """
+    원본 메시지 -> 봇 회신 기록 (크기 제한 LRU + TTL, 스레드 안전)
+
+    Attributes:
+        sent: 새 회신을 보낸 수
+        edited: 이전 회신을 수정한 수
+        unchanged: 내용이 같아 API를 호출하지 않은 수
+        edit_failed: 이전 회신 수정에 실패해 새 회신으로 대체한 수
+        evictions: 크기 제한으로 밀려난 항목 수
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (0 이하면 기록하지 않음 - 항상 새 회신)
+            ttl: 항목 유효 시간(초, None이면 만료 없음)
+            clock: 시간 함수 (테스트/벤치마크용)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[Any, Any], tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.edited = 0
+        self.unchanged = 0
+        self.edit_failed = 0
+        self.evictions = 0
+
+    def lookup(self, chat_id: Any, message_id: Any) -> Optional[Tuple[Any, str]]:
+        """원본 메시지의 (회신 message_id, 마지막으로 보낸 내용), 없거나 만료되었으면 None"""
+        with self._lock:
+            entry = self._entries.get((chat_id, message_id))
+            if entry is None:
+                return None
+            expires_at, reply_message_id, text = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[(chat_id, message_id)]
+                return None
+            self._entries.move_to_end((chat_id, message_id))
+            return reply_message_id, text
+
+    def record(self, chat_id: Any, message_id: Any, reply_message_id: Any, text: str) -> None:
+        """보낸 회신 기록 (크기 제한을 넘으면 가장 오래 사용되지 않은 항목 제거)"""
+        if self.max_entries <= 0:
+            return
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[(chat_id, message_id)] = (expires_at, reply_message_id, text)
+            self._entries.move_to_end((chat_id, message_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    async def reply(self, message, text: str) -> str:
+        """
+        원본 메시지에 회신 (이전 회신이 있으면 수정, 내용이 같으면 호출하지 않음)
+
+        Args:
+            message: 원본 메시지 (telegram.Message)
+            text: 회신 내용
+
+        Returns:
+            SENT / EDITED / UNCHANGED
+        """
+        from telegram.error import BadRequest
+
+        chat_id, message_id = message.chat_id, message.message_id
+        previous = self.lookup(chat_id, message_id)
+        if previous is not None:
+            reply_message_id, previous_text = previous
+            if previous_text == text:
+                self._count("unchanged")
+                return UNCHANGED
+            try:
+                await message.get_bot().edit_message_text(text, chat_id=chat_id, message_id=reply_message_id)
+                self.record(chat_id, message_id, reply_message_id, text)
+                self._count("edited")
+                return EDITED
+            except BadRequest as e:
+                if "not modified" in str(e).lower():
+                    self.record(chat_id, message_id, reply_message_id, text)
+                    self._count("unchanged")
+                    return UNCHANGED
+                # 이전 회신이 삭제되었거나 수정할 수 없으면 새 회신으로 대체
+                logger.warning("이전 회신을 수정하지 못해 새로 보냅니다 (chat_id: %s, message_id: %s): %s", chat_id, message_id, e)
+                self._count("edit_failed")
+
+        sent = await message.reply_text(text)
+        self.record(chat_id, message_id, sent.message_id, text)
+        self._count("sent")
+        return SENT
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "sent": self.sent,
+                "edited": self.edited,
+                "unchanged": self.unchanged,
+                "edit_failed": self.edit_failed,
+                "evictions": self.evictions,
+            }
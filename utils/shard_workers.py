@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+키(chat_id) 기준 샤딩 워커 프로세스 풀
+폴링 프로세스(감독 프로세스)는 getUpdates와 회신만 담당하고, 파싱/계산은 워커 프로세스 N개가 나눠 수행 (GIL 우회)
+
+- 같은 키의 작업은 항상 같은 워커의 FIFO 큐로 전달 -> 키(채팅방)별 계산 순서 유지
+- 워커는 시작 시 initializer로 상품 레지스트리 등을 미리 로드(워밍)하고, 결과는 공용 결과 큐로 반환
+- 감독 프로세스의 수집 스레드가 결과를 받아 작업별 Future 완료 (asyncio.wrap_future로 대기 가능)
+- 정상 재시작(restart): 새 워커가 준비(워밍 완료)되면 이후 작업을 새 워커로 보내고, 이전 워커는 받은 작업을 모두 처리한 뒤 종료
+- 워커가 비정상 종료되면 처리 중이던 작업은 실패로 완료하고 같은 자리에 새 워커 시작
+- 모니터링: 워커별 큐 깊이(보냈지만 결과를 받지 못한 작업 수)/최대 깊이, 처리/실패 수, 재시작 수
+"""
+
+import itertools
+import logging
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 수집 스레드가 결과를 기다리다 워커 상태를 확인하는 간격(초)
+MONITOR_INTERVAL = 0.5
+
+
+class ShardWorkerError(RuntimeError):
+    """워커에서 작업 처리 중 예외 발생 또는 워커 비정상 종료 (메시지는 원래 예외 메시지)"""
+
+
+def _worker_main(token: int, jobs, results, handler: Callable, initializer: Optional[Callable], initargs: Sequence) -> None:
+    """워커 프로세스 본체 (준비되면 (None, True, token)을 보내고, None을 받으면 종료)"""
+    # Ctrl+C는 감독 프로세스가 받아 순서대로 종료시킴
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if initializer is not None:
+        initializer(*initargs)
+    results.put((None, True, token))
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        job_id, args = job
+        try:
+            results.put((job_id, True, handler(*args)))
+        except Exception as e:
+            results.put((job_id, False, str(e)))
+
+
+class _Worker:
+    """워커 프로세스 하나의 상태 (감독 프로세스 쪽)"""
+
+    def __init__(self, index: int, token: int, process, jobs):
+        self.index = index
+        self.token = token
+        self.process = process
+        self.jobs = jobs
+        self.pending: set = set()
+        self.high_watermark = 0
+        self.processed = 0
+        self.failed = 0
+        self.ready = False
+        self.draining = False
+
+
+class ShardedWorkerPool:
+    """
+    키 기준 샤딩 워커 프로세스 풀 (submit/restart/stats는 스레드 안전)
+
+    Attributes:
+        workers: 워커(샤드) 수
+        restarts: 정상 재시작 수
+        crashes: 비정상 종료 후 다시 시작한 수
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        handler: Callable,
+        initializer: Optional[Callable] = None,
+        initargs: Sequence = (),
+        start_method: str = "spawn",
+        name: str = "shard"
+    ):
+        """
+        Args:
+            workers: 워커 프로세스 수
+            handler: 작업 처리 함수 (모듈 최상위 함수 - pickle 가능해야 함, 반환값도 pickle 가능)
+            initializer: 워커 시작 시 한 번 호출할 함수 (레지스트리 워밍 등)
+            initargs: initializer 인자
+            start_method: multiprocessing 시작 방식 (기본 spawn - 감독 프로세스의 스레드/이벤트 루프와 무관하게 시작)
+            name: 워커 프로세스 이름 접두사 (로그용)
+        """
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다")
+        self.workers = workers
+        self.handler = handler
+        self.initializer = initializer
+        self.initargs = tuple(initargs)
+        self.name = name
+        self._context = multiprocessing.get_context(start_method)
+        self._results = None
+        self._slots: List[Optional[_Worker]] = [None] * workers
+        self._starting: Dict[int, _Worker] = {}  # 재시작 중 준비를 기다리는 새 워커 (token -> 워커)
+        self._draining: List[_Worker] = []
+        self._rolling: List[int] = []  # restart_all에서 차례를 기다리는 워커 번호
+        self._jobs: Dict[int, tuple] = {}  # job_id -> (워커, Future)
+        self._job_ids = itertools.count(1)
+        self._tokens = itertools.count(1)
+        self._lock = threading.Lock()
+        self._collector: Optional[threading.Thread] = None
+        self._stopping = False
+        self.restarts = 0
+        self.crashes = 0
+
+    def start(self) -> None:
+        """워커 프로세스와 결과 수집 스레드 시작 (이미 시작되었으면 무시)"""
+        with self._lock:
+            if self._collector is not None:
+                return
+            self._stopping = False
+            self._results = self._context.Queue()
+            for index in range(self.workers):
+                self._slots[index] = self._spawn(index)
+            self._collector = threading.Thread(target=self._collect, name=f"{self.name}-collector", daemon=True)
+            self._collector.start()
+        logger.info("%s 워커 프로세스 %d개 시작", self.name, self.workers)
+
+    def shard(self, key: Hashable) -> int:
+        """키가 배정되는 워커 번호 (같은 키는 항상 같은 워커)"""
+        return hash(key) % self.workers
+
+    def submit(self, key: Hashable, *args) -> Future:
+        """
+        키의 워커에 작업 전달 (블로킹하지 않음)
+
+        Returns:
+            handler(*args) 결과로 완료되는 Future (작업 실패/워커 종료 시 ShardWorkerError)
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._collector is None or self._stopping:
+                raise RuntimeError(f"{self.name} 워커 풀이 실행 중이 아닙니다")
+            worker = self._slots[self.shard(key)]
+            job_id = next(self._job_ids)
+            self._jobs[job_id] = (worker, future)
+            worker.pending.add(job_id)
+            worker.high_watermark = max(worker.high_watermark, len(worker.pending))
+            worker.jobs.put((job_id, args))
+        return future
+
+    def restart(self, index: int) -> None:
+        """
+        워커 하나를 정상 재시작 (설정 변경 반영 등)
+        새 워커가 준비될 때까지 이전 워커가 계속 작업을 받고, 준비되면 교체 (이전 워커는 받은 작업을 처리한 뒤 종료)
+        """
+        with self._lock:
+            if self._collector is None or self._stopping:
+                return
+            self._start_replacement(index)
+
+    def restart_all(self) -> None:
+        """모든 워커를 하나씩 차례로 정상 재시작 (앞 워커가 교체된 뒤 다음 워커 시작 - 워밍이 계산과 CPU를 덜 다툼)"""
+        with self._lock:
+            if self._collector is None or self._stopping:
+                return
+            self._rolling = list(range(self.workers))
+            self._restart_next()
+
+    def _start_replacement(self, index: int) -> None:
+        """교체할 새 워커 시작 (잠금 안에서 호출, 이미 준비 중이면 무시)"""
+        if any(worker.index == index for worker in self._starting.values()):
+            return
+        worker = self._spawn(index)
+        self._starting[worker.token] = worker
+        logger.info("%s-%d 재시작: 새 워커(pid %s) 준비 후 교체", self.name, index, worker.process.pid)
+
+    def _restart_next(self) -> None:
+        """restart_all의 다음 워커 재시작 (잠금 안에서 호출)"""
+        if self._rolling and not self._starting:
+            self._start_replacement(self._rolling.pop(0))
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """남은 작업을 처리한 뒤 워커 종료 (시간 안에 끝나지 않으면 강제 종료, 남은 작업은 실패 처리)"""
+        with self._lock:
+            if self._collector is None:
+                return
+            self._stopping = True
+            self._rolling = []
+            # 준비 중인 새 워커는 작업을 받은 적이 없으므로 바로 종료
+            for worker in self._starting.values():
+                worker.jobs.put(None)
+            workers = [worker for worker in self._slots if worker is not None] + self._draining + list(self._starting.values())
+            self._starting = {}
+            for worker in self._slots:
+                if worker is not None:
+                    worker.draining = True
+                    worker.jobs.put(None)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in workers:
+            worker.process.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                logger.warning("%s-%d가 시간 안에 끝나지 않아 강제 종료합니다 (pid %s)", self.name, worker.index, worker.process.pid)
+                worker.process.terminate()
+                worker.process.join()
+        # 수집 스레드는 남은 결과를 모두 받은 뒤 종료
+        collector, self._collector = self._collector, None
+        collector.join()
+        with self._lock:
+            for worker in workers:
+                self._fail_pending(worker, "워커 풀이 종료되었습니다")
+            self._slots = [None] * self.workers
+            self._draining = []
+        logger.info("%s 워커 프로세스 종료", self.name)
+
+    def _spawn(self, index: int) -> _Worker:
+        """워커 프로세스 하나 시작 (잠금 안에서 호출)"""
+        jobs = self._context.Queue()
+        token = next(self._tokens)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(token, jobs, self._results, self.handler, self.initializer, self.initargs),
+            name=f"{self.name}-{index}",
+            daemon=True
+        )
+        process.start()
+        return _Worker(index, token, process, jobs)
+
+    def _collect(self) -> None:
+        """결과 수집 스레드: 결과로 Future 완료, MONITOR_INTERVAL마다 워커 상태 확인"""
+        next_check = time.monotonic() + MONITOR_INTERVAL
+        while True:
+            try:
+                job_id, ok, value = self._results.get(timeout=MONITOR_INTERVAL)
+            except queue.Empty:
+                if not self._check_workers(idle=True):
+                    return
+                next_check = time.monotonic() + MONITOR_INTERVAL
+                continue
+            try:
+                if job_id is None:
+                    self._worker_ready(value)
+                    continue
+                with self._lock:
+                    entry = self._jobs.pop(job_id, None)
+                    if entry is not None:
+                        worker, future = entry
+                        worker.pending.discard(job_id)
+                        worker.processed += 1
+                        if not ok:
+                            worker.failed += 1
+                # 호출한 쪽에서 이미 취소한 Future(핸들러 취소 등)는 결과를 버림
+                if entry is not None and not future.done():
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(ShardWorkerError(value))
+                # 결과가 계속 들어와도 워커 상태는 주기적으로 확인
+                if time.monotonic() >= next_check:
+                    if not self._check_workers(idle=False):
+                        return
+                    next_check = time.monotonic() + MONITOR_INTERVAL
+            except Exception:
+                # 수집 스레드가 멈추면 이후 모든 작업이 완료되지 않으므로 기록만 하고 계속
+                logger.exception("%s 결과 처리 중 오류 (작업 %s)", self.name, job_id)
+
+    def _worker_ready(self, token: int) -> None:
+        """워커 준비 완료 (재시작 중인 새 워커면 이전 워커와 교체)"""
+        with self._lock:
+            worker = self._starting.pop(token, None)
+            if worker is None:
+                for worker in self._slots:
+                    if worker is not None and worker.token == token:
+                        worker.ready = True
+                return
+            worker.ready = True
+            old = self._slots[worker.index]
+            self._slots[worker.index] = worker
+            old.draining = True
+            old.jobs.put(None)
+            self._draining.append(old)
+            self.restarts += 1
+            self._restart_next()
+        logger.info("%s-%d 교체: 이전 워커(pid %s)는 남은 작업 %d개 처리 후 종료", self.name, worker.index, old.process.pid, len(old.pending))
+
+    def _check_workers(self, idle: bool) -> bool:
+        """
+        종료된 워커 정리 (정상 재시작한 이전 워커 제거, 비정상 종료한 워커는 다시 시작)
+
+        Args:
+            idle: 결과 큐가 비어 있는지 (종료된 워커가 보낸 결과가 더 남아 있지 않음)
+
+        Returns:
+            수집 스레드를 계속 실행할지 여부
+        """
+        with self._lock:
+            if self._stopping:
+                workers = [worker for worker in self._slots if worker is not None] + self._draining
+                if idle:
+                    for worker in workers:
+                        if not worker.process.is_alive():
+                            self._fail_pending(worker, "워커 프로세스가 종료되었습니다")
+                return any(worker.process.is_alive() or worker.pending for worker in workers)
+            for token, worker in list(self._starting.items()):
+                if not worker.process.is_alive():
+                    # 준비 전에 종료된 새 워커 (initializer 오류 등) - 이전 워커가 계속 처리
+                    logger.error("%s-%d 재시작 실패: 새 워커가 준비 전에 종료되었습니다 (exitcode %s)",
+                                 self.name, worker.index, worker.process.exitcode)
+                    del self._starting[token]
+                    self._restart_next()
+            for worker in list(self._draining):
+                if worker.process.is_alive():
+                    continue
+                # 정상 종료: 종료 직전에 보낸 결과를 모두 받은 뒤 제거
+                if worker.process.exitcode != 0 or idle or not worker.pending:
+                    self._fail_pending(worker, "워커 프로세스가 종료되었습니다")
+                    self._draining.remove(worker)
+            for index, worker in enumerate(self._slots):
+                if worker is not None and not worker.process.is_alive():
+                    logger.error("%s-%d가 비정상 종료되었습니다 (pid %s, exitcode %s, 처리 중 작업 %d개) - 다시 시작합니다",
+                                 self.name, index, worker.process.pid, worker.process.exitcode, len(worker.pending))
+                    self._fail_pending(worker, "워커 프로세스가 비정상 종료되었습니다")
+                    self._slots[index] = self._spawn(index)
+                    self.crashes += 1
+        return True
+
+    def _fail_pending(self, worker: _Worker, reason: str) -> None:
+        """워커가 처리하지 못한 작업을 실패로 완료 (잠금 안에서 호출)"""
+        for job_id in list(worker.pending):
+            _, future = self._jobs.pop(job_id)
+            if not future.done():
+                future.set_exception(ShardWorkerError(reason))
+        worker.failed += len(worker.pending)
+        worker.pending.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계 (워커별 큐 깊이 = 보냈지만 결과를 받지 못한 작업 수)"""
+        with self._lock:
+            return {
+                "workers": [
+                    {
+                        "index": worker.index,
+                        "pid": worker.process.pid,
+                        "alive": worker.process.is_alive(),
+                        "ready": worker.ready,
+                        "depth": len(worker.pending),
+                        "high_watermark": worker.high_watermark,
+                        "processed": worker.processed,
+                        "failed": worker.failed,
+                    }
+                    for worker in self._slots if worker is not None
+                ],
+                "draining": [
+                    {"index": worker.index, "pid": worker.process.pid, "depth": len(worker.pending)}
+                    for worker in self._draining
+                ],
+                "starting": len(self._starting),
+                "restarts": self.restarts,
+                "crashes": self.crashes,
+            }
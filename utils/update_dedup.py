@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+텔레그램 업데이트 중복 제거
+웹훅 응답이 늦으면 텔레그램이 같은 update_id를 다시 보내므로, 최근에 받은 update_id를 기억해
+재전송된 업데이트는 파싱/계산/회신 없이 바로 응답
+
+- 크기 제한 + 유효 시간(TTL), 스레드 안전 (첫 수신 시각 기준으로 만료, 가장 오래된 항목부터 제거)
+- 처리하지 못한 업데이트(큐 가득 참, 처리 오류)는 forget()으로 지워 재전송 시 다시 처리
+- 파일 버전(FileUpdateIdSet): /tmp 등 파일에 추가 기록해 같은 인스턴스에서 프로세스가 다시 시작되어도 유지
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 기억 개수 / 유효 시간(초) - 텔레그램 재전송은 보통 수 분 안에 끝남
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL = 3600.0
+
+
+class UpdateIdSet:
+    """
+    최근 받은 update_id 집합 (크기 제한 + TTL, 스레드 안전)
+
+    Attributes:
+        checked: 확인한 업데이트 수
+        duplicates: 중복으로 판정한 업데이트 수
+        evictions: 크기 제한으로 밀려난 항목 수
+        expirations: 유효 시간이 지나 제거된 항목 수
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (0 이하면 기억하지 않음 - 중복 제거 사용 안 함)
+            ttl: 항목 유효 시간(초, None이면 만료 없음)
+            clock: 시간 함수 (테스트/벤치마크용)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        # update_id -> 첫 수신 시각 (수신 순서 유지)
+        self._entries: "OrderedDict[int, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.duplicates = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def seen(self, update_id: int) -> bool:
+        """
+        update_id 확인 및 기록
+
+        Returns:
+            이미 받은 update_id면 True (duplicates 증가), 처음이면 기록하고 False
+        """
+        if self.max_entries <= 0:
+            return False
+        now = self._clock()
+        with self._lock:
+            self.checked += 1
+            self._expire(now)
+            if update_id in self._entries:
+                self.duplicates += 1
+                return True
+            self._entries[update_id] = now
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        self._recorded(update_id, now)
+        return False
+
+    def forget(self, update_id: int) -> None:
+        """기록 삭제 (처리하지 못한 업데이트가 재전송되면 다시 처리하도록)"""
+        with self._lock:
+            if self._entries.pop(update_id, None) is None:
+                return
+        self._recorded(update_id, None)
+
+    def _expire(self, now: float) -> None:
+        """유효 시간이 지난 항목 제거 (수신 순서이므로 앞에서부터, 잠금 안에서 호출)"""
+        if self.ttl is None:
+            return
+        while self._entries:
+            update_id, received_at = next(iter(self._entries.items()))
+            if received_at + self.ttl > now:
+                break
+            del self._entries[update_id]
+            self.expirations += 1
+
+    def _recorded(self, update_id: int, received_at: Optional[float]) -> None:
+        """기록/삭제 후 호출 (파일 버전에서 저장, received_at이 None이면 삭제)"""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "checked": self.checked,
+                "duplicates": self.duplicates,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class FileUpdateIdSet(UpdateIdSet):
+    """
+    파일에 기록하는 update_id 집합
+    프로세스가 다시 시작되어도 같은 인스턴스(/tmp 공유)라면 이전 기록으로 중복 판정
+
+    - 파일 형식: 한 줄에 "update_id 첫 수신 시각(epoch 초)", 삭제는 시각 대신 "-"
+    - 기록은 파일 끝에 한 줄 추가, 줄 수가 max_entries의 2배를 넘으면 살아 있는 항목만 다시 씀
+    - 시각은 프로세스 사이에서도 의미가 있도록 time.time 사용
+    - 파일은 생성 시에만 읽음 (동시에 실행 중인 다른 프로세스의 기록은 보지 않음)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            path: 기록 파일 경로 (예: /tmp/webhook_update_ids.log)
+            max_entries / ttl / clock: UpdateIdSet과 같음
+        """
+        super().__init__(max_entries=max_entries, ttl=ttl, clock=clock)
+        self.path = path
+        self._file_lock = threading.Lock()
+        self._lines = 0
+        self.write_errors = 0
+        self._load()
+
+    def _load(self) -> None:
+        """기록 파일 읽기 (없거나 깨진 줄은 무시)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._lines += 1
+                    parts = line.split()
+                    if len(parts) != 2:
+                        continue
+                    try:
+                        update_id = int(parts[0])
+                        if parts[1] == "-":
+                            self._entries.pop(update_id, None)
+                        elif update_id not in self._entries:
+                            self._entries[update_id] = float(parts[1])
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning("update_id 기록 파일을 읽지 못했습니다 (%s): %s", self.path, e)
+            return
+        self._expire(self._clock())
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        logger.info("update_id 기록 %d개 로드 (%s)", len(self._entries), self.path)
+
+    def _recorded(self, update_id: int, received_at: Optional[float]) -> None:
+        """기록 파일에 한 줄 추가 (필요하면 살아 있는 항목만 다시 씀)"""
+        line = f"{update_id} {'-' if received_at is None else repr(received_at)}\n"
+        with self._file_lock:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+                self._lines += 1
+                if self._lines > max(self.max_entries, 1) * 2:
+                    self._compact()
+            except OSError as e:
+                # 기록 실패는 중복 제거만 약해질 뿐이므로 처리는 계속
+                self.write_errors += 1
+                logger.warning("update_id 기록 파일에 쓰지 못했습니다 (%s): %s", self.path, e)
+
+    def _compact(self) -> None:
+        """살아 있는 항목만 임시 파일에 쓰고 교체 (파일 잠금 안에서 호출)"""
+        with self._lock:
+            entries = list(self._entries.items())
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".update_ids_")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(f"{update_id} {received_at!r}\n" for update_id, received_at in entries)
+            os.replace(temp_path, self.path)
+        except OSError:
+            os.unlink(temp_path)
+            raise
+        self._lines = len(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계 (기록 파일 경로/쓰기 실패 수 포함)"""
+        return dict(super().stats(), path=self.path, write_errors=self.write_errors)
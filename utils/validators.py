@@ -3,6 +3,25 @@
 데이터 검증 유틸리티
 """
 
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# KB시세 키워드 ("일반", "하한", "상한")와 숫자
+KB_PRICE_KEYWORD_PATTERN = re.compile(r'\s*(일반|하한|상한)\s*', re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+NUMBER_PATTERN = re.compile(r'[\d,]+')
+NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+LOWER_BOUND_PRICE_PATTERN = re.compile(r'하한\s*[:\s]*([\d,]+)', re.IGNORECASE)
+
+# 특이사항의 KB AI시세: "KB AI시세: 25,000만원", "KB AI시세 25,000만원", "KB AI 시세 25,000만원" 등
+KB_AI_PRICE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'KB\s*AI\s*시세\s*[:\s]*([\d,]+(?:\s*만원)?)',
+    r'KB\s*AI시세\s*[:\s]*([\d,]+(?:\s*만원)?)',
+    r'KB\s*AI\s*시세\s*[:\s]*([\d,]+)',
+))
+
 
 def validate_kb_price(kb_price):
     """
@@ -11,56 +30,55 @@ def validate_kb_price(kb_price):
     "일반 125,000만원" 형식도 처리
     """
     if kb_price is None or kb_price == "" or kb_price == "시세없음":
-        print(f"DEBUG: validate_kb_price - None or empty: {kb_price}")
+        logger.debug("validate_kb_price - None or empty: %s", kb_price)
         return None
     
     try:
         # 문자열로 변환
         price_str = str(kb_price).strip()
-        print(f"DEBUG: validate_kb_price - input: {price_str}")
+        logger.debug("validate_kb_price - input: %s", price_str)
         
         # "일반", "하한" 같은 키워드 제거 (공백 포함)
-        import re
-        price_str_clean = re.sub(r'\s*(일반|하한|상한)\s*', ' ', price_str, flags=re.IGNORECASE).strip()
+        price_str_clean = KB_PRICE_KEYWORD_PATTERN.sub(' ', price_str).strip()
         # 여러 공백을 하나로
-        price_str_clean = re.sub(r'\s+', ' ', price_str_clean)
+        price_str_clean = WHITESPACE_PATTERN.sub(' ', price_str_clean)
         
         # 숫자만 추출 (만원 단위)
         # 방법 1: 정규식으로 숫자 추출 (쉼표 포함) - 첫 번째 큰 숫자 사용
-        numbers = re.findall(r'[\d,]+', price_str_clean)
+        numbers = NUMBER_PATTERN.findall(price_str_clean)
         if numbers:
             # 가장 큰 숫자 사용 (일반 가격이 보통 더 큼)
             # 또는 첫 번째 숫자 사용
             price_str_num = numbers[0].replace(",", "").strip()
             if price_str_num and len(price_str_num) >= 3:  # 최소 3자리 숫자
                 price = float(price_str_num)
-                print(f"DEBUG: validate_kb_price - extracted price (method 1): {price}")
+                logger.debug("validate_kb_price - extracted price (method 1): %s", price)
                 return price
         
         # 방법 2: "만원" 또는 "만" 제거 후 숫자 추출
         price_str_clean2 = price_str_clean.replace("만원", "").replace("만", "").strip()
-        numbers2 = re.findall(r'[\d,]+', price_str_clean2)
+        numbers2 = NUMBER_PATTERN.findall(price_str_clean2)
         if numbers2:
             price_str_num = numbers2[0].replace(",", "").strip()
             if price_str_num and len(price_str_num) >= 3:
                 price = float(price_str_num)
-                print(f"DEBUG: validate_kb_price - extracted price (method 2): {price}")
+                logger.debug("validate_kb_price - extracted price (method 2): %s", price)
                 return price
         
         # 방법 3: 직접 변환 시도
         price_str_final = price_str_clean.replace(",", "").replace("만원", "").replace("만", "").strip()
         # 숫자만 남기기
-        price_str_final = re.sub(r'[^\d]', '', price_str_final)
+        price_str_final = NON_DIGIT_PATTERN.sub('', price_str_final)
         if price_str_final and len(price_str_final) >= 3:
             price = float(price_str_final)
-            print(f"DEBUG: validate_kb_price - extracted price (method 3): {price}")
+            logger.debug("validate_kb_price - extracted price (method 3): %s", price)
             return price
         
-        print(f"DEBUG: validate_kb_price - all methods failed, input: {kb_price}")
+        logger.debug("validate_kb_price - all methods failed, input: %s", kb_price)
         return None
         
     except (ValueError, AttributeError, TypeError) as e:
-        print(f"DEBUG: validate_kb_price - error: {e}, input: {kb_price}, type: {type(kb_price)}")
+        logger.debug("validate_kb_price - error: %s, input: %s, type: %s", e, kb_price, type(kb_price))
         import traceback
         traceback.print_exc()
         return None
@@ -108,23 +126,22 @@ def extract_lower_bound_price(kb_price):
         return None
     
     try:
-        import re
         price_str = str(kb_price).strip()
         
         # "하한" 키워드가 포함된 부분 찾기
-        lower_match = re.search(r'하한\s*[:\s]*([\d,]+)', price_str, re.IGNORECASE)
+        lower_match = LOWER_BOUND_PRICE_PATTERN.search(price_str)
         if lower_match:
             price_str_num = lower_match.group(1).replace(",", "").strip()
             if price_str_num and len(price_str_num) >= 3:
                 price = float(price_str_num)
-                print(f"DEBUG: extract_lower_bound_price - extracted lower bound price: {price}")
+                logger.debug("extract_lower_bound_price - extracted lower bound price: %s", price)
                 return price
         
-        print(f"DEBUG: extract_lower_bound_price - no lower bound price found")
+        logger.debug("extract_lower_bound_price - no lower bound price found")
         return None
         
     except (ValueError, AttributeError, TypeError) as e:
-        print(f"DEBUG: extract_lower_bound_price - error: {e}, input: {kb_price}")
+        logger.debug("extract_lower_bound_price - error: %s, input: %s", e, kb_price)
         return None
 
 
@@ -137,32 +154,24 @@ def extract_kb_ai_price_from_special_notes(special_notes):
         return None
     
     try:
-        import re
         notes_str = str(special_notes).strip()
         
         # "KB AI시세" 또는 "KB AI 시세" 패턴 찾기
-        # 다양한 형식 지원: "KB AI시세: 25,000만원", "KB AI시세 25,000만원", "KB AI 시세 25,000만원" 등
-        patterns = [
-            r'KB\s*AI\s*시세\s*[:\s]*([\d,]+(?:\s*만원)?)',
-            r'KB\s*AI시세\s*[:\s]*([\d,]+(?:\s*만원)?)',
-            r'KB\s*AI\s*시세\s*[:\s]*([\d,]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, notes_str, re.IGNORECASE)
+        for pattern in KB_AI_PRICE_PATTERNS:
+            match = pattern.search(notes_str)
             if match:
                 price_str = match.group(1).strip()
                 # "만원" 제거 후 숫자만 추출
                 price_str_clean = price_str.replace("만원", "").replace("만", "").replace(",", "").strip()
                 if price_str_clean and len(price_str_clean) >= 3:
                     price = float(price_str_clean)
-                    print(f"DEBUG: extract_kb_ai_price_from_special_notes - extracted KB AI price: {price}만원")
+                    logger.debug("extract_kb_ai_price_from_special_notes - extracted KB AI price: %s만원", price)
                     return price
         
-        print(f"DEBUG: extract_kb_ai_price_from_special_notes - no KB AI price found in special_notes")
+        logger.debug("extract_kb_ai_price_from_special_notes - no KB AI price found in special_notes")
         return None
         
     except (ValueError, AttributeError, TypeError) as e:
-        print(f"DEBUG: extract_kb_ai_price_from_special_notes - error: {e}, input: {special_notes}")
+        logger.debug("extract_kb_ai_price_from_special_notes - error: %s, input: %s", e, special_notes)
         return None
 